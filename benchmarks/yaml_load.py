@@ -0,0 +1,63 @@
+"""Compare load times of multi-MB YAML documents with and without libyaml.
+
+Run from the repository root with ``python benchmarks/yaml_load.py``.
+
+"""
+
+import sys
+import timeit
+import tempfile
+from pathlib import Path
+import yaml
+from swak.io import YamlReader
+
+SIZES = 1, 4  # approximate size of the generated documents in MB
+REPEAT = 3
+
+
+def document(n_mb: int) -> str:
+    """Generate a nested YAML document of roughly the requested size."""
+    items = [
+        {
+            'name': f'item-{i}',
+            'values': list(range(10)),
+            'meta': {'label': 'x' * 20, 'weight': i * 1.5, 'flags': [True]}
+        }
+        for i in range(6000 * n_mb)
+    ]
+    return yaml.dump({'items': items}, Dumper=yaml.CDumper)
+
+
+def best(read: YamlReader, path: str) -> float:
+    """Fastest of several repeated reads in seconds after a warm-up."""
+    _ = read(path)
+    return min(timeit.repeat(lambda: read(path), number=1, repeat=REPEAT))
+
+
+def main() -> None:
+    """Print a table of load times for all loaders and document sizes."""
+    if not yaml.__with_libyaml__:
+        sys.exit('PyYaml was built without libyaml. Nothing to compare.')
+    readers = {
+        'Loader': YamlReader(loader=yaml.Loader),
+        'CLoader': YamlReader(loader=yaml.CLoader),
+        'CLoader (memo hit)': YamlReader(loader=yaml.CLoader, memo_size=1)
+    }
+    columns = 'document', 'loader', 'seconds', 'speed-up'
+    sys.stdout.write('{:>10} {:>20} {:>10} {:>10}\n'.format(*columns))
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_mb in SIZES:
+            path = Path(tmp) / f'{n_mb}.yml'
+            path.write_text(document(n_mb))
+            size = f'{path.stat().st_size / 1024 / 1024:.1f} MiB'
+            baseline = None
+            for name, read in readers.items():
+                seconds = best(read, str(path))
+                baseline = baseline or seconds
+                speedup = f'{baseline / seconds:.1f}x'
+                row = f'{size:>10} {name:>20} {seconds:>10.3f} {speedup:>10}'
+                sys.stdout.write(row + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -9,14 +9,30 @@ staging, and production environments.
 
 from .writer import Writer
 from .reader import Reader
-from .parquet import DataFrame2Parquet, Parquet2DataFrame
+from .cache import DiskCache
+from .aio import AsyncWriter, AsyncReader
+from .parquet import (
+    DataFrame2Parquet,
+    Parquet2DataFrame,
+    DataFrame2PartitionedParquet,
+    AsyncDataFrame2Parquet,
+    AsyncParquet2DataFrame
+)
+from .arrow import DataFrame2Arrow, Arrow2DataFrame
+from .npy import Array2Npy, Npy2Array
 from .csv import Csv2DataFrame
 from .excel import Excel2DataFrame
-from .toml import TomlWriter, TomlReader
-from .yaml import YamlWriter, YamlReader, YamlParser
-from .json import JsonWriter, JsonReader
-from .find import Find
-from .copy import Copy
+from .toml import TomlWriter, TomlReader, AsyncTomlReader
+from .yaml import YamlWriter, YamlReader, YamlParser, AsyncYamlReader
+from .json import (
+    JsonWriter,
+    JsonReader,
+    AsyncJsonReader,
+    JsonLinesWriter,
+    JsonLinesReader
+)
+from .find import Find, AsyncFind, IncrementalFind, ParallelFind
+from .copy import Copy, AsyncCopy
 from .types import (
     Storage,
     LiteralStorage,
@@ -24,6 +40,8 @@ from .types import (
     Compression,
     Bears,
     LiteralBears,
+    JsonBackend,
+    LiteralJsonBackend,
     NotFound,
     LiteralNotFound
 )
@@ -31,25 +49,46 @@ from .types import (
 __all__ = [
     'Writer',
     'Reader',
+    'DiskCache',
+    'AsyncWriter',
+    'AsyncReader',
     'Find',
+    'AsyncFind',
+    'IncrementalFind',
+    'ParallelFind',
     'Copy',
+    'AsyncCopy',
     'Storage',
     'LiteralStorage',
     'Mode',
     'Compression',
     'Bears',
     'LiteralBears',
+    'JsonBackend',
+    'LiteralJsonBackend',
     'NotFound',
     'LiteralNotFound',
     'DataFrame2Parquet',
     'Parquet2DataFrame',
+    'DataFrame2PartitionedParquet',
+    'AsyncDataFrame2Parquet',
+    'AsyncParquet2DataFrame',
+    'DataFrame2Arrow',
+    'Arrow2DataFrame',
+    'Array2Npy',
+    'Npy2Array',
     'Csv2DataFrame',
     'Excel2DataFrame',
     'TomlWriter',
     'TomlReader',
+    'AsyncTomlReader',
     'YamlWriter',
     'YamlReader',
     'YamlParser',
+    'AsyncYamlReader',
     'JsonWriter',
-    'JsonReader'
+    'JsonReader',
+    'AsyncJsonReader',
+    'JsonLinesWriter',
+    'JsonLinesReader'
 ]
@@ -0,0 +1,358 @@
+import asyncio
+import posixpath
+import fsspec
+from collections.abc import AsyncGenerator, Mapping, Iterable
+from typing import Any, IO
+from io import BytesIO
+from pathlib import Path
+from functools import cached_property
+from contextlib import asynccontextmanager
+from fsspec.asyn import AsyncFileSystem
+from fsspec.implementations.asyn_wrapper import AsyncFileSystemWrapper
+from .reader import Reader
+from .writer import Writer, _Listing, _LISTING
+from .types import (
+    LiteralStorage,
+    Storage,
+    LiteralCompression,
+    Compression
+)
+from .codec import resolve_compression, compressed
+
+
+def async_filesystem(
+        storage: LiteralStorage | Storage,
+        storage_kws: Mapping[str, Any] | None = None
+) -> AsyncFileSystem:
+    """Instantiate an asynchronous fsspec file system of the given type.
+
+    File systems that are natively asynchronous (like "s3" or "gcs") are
+    instantiated in asynchronous mode. Synchronous file systems (like "file"
+    or "memory") are wrapped such that their blocking calls are deferred to
+    a separate thread.
+
+    Parameters
+    ----------
+    storage: str
+        The type of file system ("file", "s3", etc.). Use the
+        :class:`Storage` enum to avoid typos.
+    storage_kws: dict, optional
+        Passed on as keyword arguments to the constructor of the file system.
+        Defaults to ``None``.
+
+    Returns
+    -------
+    AsyncFileSystem
+        An asynchronous fsspec file system.
+
+    """
+    storage = str(Storage(storage))
+    storage_kws = {} if storage_kws is None else dict(storage_kws)
+    if fsspec.get_filesystem_class(storage).async_impl:
+        return fsspec.filesystem(storage, asynchronous=True, **storage_kws)
+    fs = fsspec.filesystem(storage, **storage_kws)
+    return AsyncFileSystemWrapper(fs, asynchronous=True)
+
+
+class AsyncReader(Reader):
+    """Base class for asynchronously reading objects from any filesystem.
+
+    Instead of opening a (buffered) file handle, the entire file is fetched
+    with a single, awaitable call to an asynchronous file system. Instances
+    of subclasses are, therefore, meant to be awaited when called, which
+    allows a single event loop to run many reads concurrently.
+
+    Parameters
+    ----------
+    path: str, optional
+        Directory under which the file is located or full path to the file.
+        Since it (or part of it) can also be provided later, when the callable
+        instance is called, it is optional here. Defaults to an empty string.
+    storage: str, optional
+        The type of file system to read from ("file", "s3", etc.).
+        Defaults to "file". Use the :class:`Storage` enum to avoid typos.
+    mode: str, optional
+        The mode to open the source file/object/blob in.
+        Defaults to "rb". Use the `Mode` enum to avoid typos.
+    chunk_size: float, optional
+        Chunk size to use when reading from the selected file system in MiB.
+        Defaults to 32 (MiB).
+    storage_kws: dict, optional
+        Passed on as keyword arguments to the constructor of the file system.
+    *args
+        Additional arguments are reflected in the representation of instances
+        but do not affect functionality in any way.
+    cache: DiskCache, optional
+        Local disk cache to read remote files through. Ignored for the
+        local file system. Defaults to ``None``.
+    **kwargs
+        Additional keyword arguments are reflected in the representation of
+        instances but do not affect functionality in any way.
+
+    Raises
+    ------
+    TypeError
+        If `path` is not a string, `chunk_size` is not a float, or if
+        `storage_kws` is not a dictionary.
+    ValueError
+        If `storage` is not among the currently supported file-system
+        schemes, `mode` not among the supported file-mode options, the
+        `chunk_size` is smaller than 1 (MiB), or if `storage_kws` is not
+        a dictionary.
+
+    See Also
+    --------
+    Reader
+    Storage
+    Mode
+
+    Notes
+    -----
+    Natively asynchronous file systems bind to the event loop they are first
+    used in. Use instances within one and the same event loop.
+
+    """
+
+    @cached_property
+    def fs(self) -> AsyncFileSystem:
+        """Fresh asynchronous file system on first use, same thereafter."""
+        return async_filesystem(self.storage, self.storage_kws)
+
+    @asynccontextmanager
+    async def _managed(
+            self,
+            uri: str,
+            compression: LiteralCompression | Compression | str | None = None
+    ) -> AsyncGenerator[IO]:
+        """Async context manager for reads from the given file system."""
+        compression = resolve_compression(uri, compression)
+        if self.cached:
+            local = await self.cache.afetch(self.fs, uri)
+            content = await asyncio.to_thread(Path(local).read_bytes)
+            file = BytesIO(content)
+        else:
+            file = BytesIO(await self.fs._cat_file(uri))
+        with compressed(file, compression, self.mode) as file:
+            yield file
+
+    async def _local(self, uri: str) -> str:
+        """Path to a local copy of the file to memory-map, if there is one."""
+        if self.storage == Storage.FILE:
+            return uri
+        if self.cached:
+            return await self.cache.afetch(self.fs, uri)
+        return ''
+
+
+class AsyncWriter(Writer):
+    """Base class for asynchronously writing objects to any filesystem.
+
+    Instead of streaming to a file handle, objects are serialized into an
+    in-memory buffer, which is then written to a temporary file with a single,
+    awaitable call to an asynchronous file system before being moved to its
+    final destination. Instances of subclasses are, therefore, meant to be
+    awaited when called, which allows a single event loop to run many writes
+    concurrently.
+
+    Parameters
+    ----------
+    path: str
+        The absolute path to the file to save. May contain any number of string
+        placeholders (i.e., pairs of curly brackets) that will be interpolated
+        when instances are called.
+    storage: str, optional
+        The type of file system to write to ("file", "s3", etc.).
+        Defaults to "file". Use the :class:`Storage` enum to avoid typos.
+    overwrite: bool, optional
+        Whether to silently overwrite the destination file. Defaults to
+        ``False``, which will raise an exception if it already exists.
+    skip: bool, optional
+        Whether to silently do nothing if the target file already exists.
+        Defaults to ``False``.
+    mode: str, optional
+        The mode to open the target file/object/blob in.
+        Defaults to "wb". Use the `Mode` enum to avoid typos.
+    chunk_size: float, optional
+        Chunk size to use when writing to the selected file system in MiB.
+        Defaults to 32 (MiB).
+    storage_kws: dict, optional
+        Passed on as keyword arguments to the constructor of the file system.
+    *args
+        Additional arguments are reflected in the representation of instances
+        but do not affect functionality in any way.
+    **kwargs
+        Additional keyword arguments are reflected in the representation of
+        instances but do not affect functionality in any way.
+
+    Raises
+    ------
+    TypeError
+        If `path` is not a string, `chunk_size` is not a float, or if
+        `storage_kws` is not a dictionary.
+    ValueError
+        If `storage` is not among the currently supported file-system
+        schemes, `mode` not among the supported file-mode options, the
+        `chunk_size` is smaller than 1 (MiB), or if `storage_kws` is not
+        a dictionary.
+
+    See Also
+    --------
+    Writer
+    Storage
+    Mode
+
+    Notes
+    -----
+    Natively asynchronous file systems bind to the event loop they are first
+    used in. Use instances within one and the same event loop.
+
+    """
+
+    @cached_property
+    def fs(self) -> AsyncFileSystem:
+        """Fresh asynchronous file system on first use, same thereafter."""
+        return async_filesystem(self.storage, self.storage_kws)
+
+    @asynccontextmanager
+    async def _managed(
+            self,
+            uri: str,
+            compression: LiteralCompression | Compression | str | None = None,
+            level: int | None = None,
+            threads: int | None = None
+    ) -> AsyncGenerator[IO]:
+        """Async context manager for atomic writes with automatic cleanup."""
+        compression = resolve_compression(uri, compression)
+        buffer = BytesIO()
+        with compressed(
+                buffer,
+                compression,
+                self.mode,
+                level,
+                threads
+        ) as file:
+            yield file
+        tmp = self._tmp(uri)
+        try:
+            try:
+                await self.fs._pipe_file(tmp, buffer.getvalue())
+            except FileNotFoundError:
+                # The parent directory might have been removed meanwhile.
+                parent = posixpath.dirname(uri)
+                self._directories.discard(parent)
+                await self.fs._makedirs(parent, exist_ok=True)
+                self._directories.add(parent)
+                await self.fs._pipe_file(tmp, buffer.getvalue())
+            await self.fs._mv_file(tmp, uri)
+        except Exception:
+            if await self.fs._exists(tmp):
+                await self.fs._rm_file(tmp)
+            raise
+        if listing := _LISTING.get():
+            listing.add(uri)
+
+    async def _uri_from(self, *parts: Any) -> str:
+        """Check skip/overwrite and create parent directories."""
+        uri = self._non_root_from(*parts)
+        parent = str(uri.parent)
+        listing = _LISTING.get()
+        if self.skip or not self.overwrite:
+            exists = None if listing is None else listing.exists(str(uri))
+            if exists is None:
+                exists = await self.fs._exists(str(uri))
+            if exists and self.skip:
+                return ''
+            if exists:
+                msg = f'File "{uri}" already exists!'
+                raise FileExistsError(msg)
+        if listing is not None and listing.created(parent):
+            return str(uri)
+        if parent not in self._directories:
+            await self.fs._makedirs(parent, exist_ok=True)
+            self._directories.add(parent)
+        if listing is not None:
+            listing.create(parent)
+        return str(uri)
+
+    async def _ls(self, directory: str) -> set[str] | None:
+        """Files directly in a directory or ``None`` if it does not exist."""
+        try:
+            listed = await self.fs._ls(directory, detail=True)
+        except FileNotFoundError:
+            return None
+        return {
+            '/' + entry['name'].lstrip('/')
+            for entry in listed
+            if entry['type'] == 'file'
+        }
+
+    async def bulk(
+            self,
+            items: Iterable[tuple[Any, ...]],
+            max_workers: int = 16
+    ) -> list[Any]:
+        """Write many objects concurrently after listing existing files once.
+
+        Instead of checking for every single file whether it exists, each
+        target directory is listed once (non-recursively), and only those
+        that do not exist yet are created. Objects are then written
+        concurrently in the event loop. The listing is used for this call
+        only.
+
+        Parameters
+        ----------
+        items: Iterable
+            Tuples holding the object to write as first element and the
+            fragments to interpolate into the `path` given at instantiation
+            as remaining elements, i.e., the arguments of a single call.
+        max_workers: int, optional
+            Maximum number of files to write concurrently. Defaults to 16.
+
+        Returns
+        -------
+        list
+            The return values of the individual calls, in the order of
+            `items`.
+
+        Raises
+        ------
+        IndexError
+            If the `path` given at instantiation has more string placeholders
+            than there are fragments in any of the `items`.
+        FileExistsError
+            If any of the destination files already exists, `skip` is
+            ``False`` and `overwrite` is also ``False``.
+        ValueError
+            If any final path is directly under root (e.g., "/file.txt")
+            because, on local file system, this is not where you want to save
+            to and, on object storage, the first directory refers to the name
+            of an (existing!) bucket.
+
+        """
+        items = [tuple(item) for item in items]
+        uris = [str(self._non_root_from(*item[1:])) for item in items]
+        parents = sorted({posixpath.dirname(uri) for uri in uris})
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def ls(directory: str) -> set[str] | None:
+            async with semaphore:
+                return await self._ls(directory)
+
+        async def write(item: tuple[Any, ...]) -> Any:
+            async with semaphore:
+                return await self(*item)
+
+        listed = await asyncio.gather(*(ls(parent) for parent in parents))
+        # Tasks copy the current context, so the listing is set only here.
+        token = _LISTING.set(_Listing(dict(zip(parents, listed))))
+        try:
+            results = await asyncio.gather(
+                *(write(item) for item in items),
+                return_exceptions=True
+            )
+        finally:
+            _LISTING.reset(token)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
@@ -0,0 +1,252 @@
+from typing import Any
+from collections.abc import Mapping
+from pandas import DataFrame as Pandas
+from polars import DataFrame as Polars
+import pyarrow as pa
+import polars as pl
+from pyarrow import feather
+from .types import Bears, LiteralBears, LiteralStorage, Storage, Mode
+from .writer import Writer
+from .reader import Reader
+from .cache import DiskCache
+
+
+class DataFrame2Arrow(Writer):
+    """Save a pandas or polars dataframe to an Arrow IPC (Feather V2) file.
+
+    Arrow IPC files hold the columnar in-memory format of Apache Arrow as is.
+    Writing them is, therefore, considerably cheaper than encoding parquet,
+    which makes them ideal for intermediate artifacts within a pipeline.
+
+    Parameters
+    ----------
+    path: str
+        The absolute path to the Arrow IPC file to save the dataframe into.
+        May include two or more forward slashes (subdirectories will be
+        created) and string placeholders (i.e., pairs of curly brackets)
+        that will be interpolated when instances are called.
+    storage: str, optional
+        The type of file system to write to ("file", "s3", etc.).
+        Defaults to "file". Use the :class:`Storage` enum to avoid typos.
+    overwrite: bool, optional
+        Whether to silently overwrite the destination file. Defaults to
+        ``False``, which will raise an exception if it already exists.
+    skip: bool, optional
+        Whether to silently do nothing if the target file already exists.
+        Defaults to ``False``.
+    chunk_size: int, optional
+        Chunk size to use when writing to the selected file system in MiB.
+        Defaults to 32 (MiB).
+    storage_kws: dict, optional
+        Passed on as keywords to the constructor of the file system.
+    arrow_kws: dict, optional
+        Passed on as keyword arguments to pyarrow's `write_feather
+        <https://arrow.apache.org/docs/python/generated/pyarrow.feather.
+        write_feather.html>`_ function. Defaults to ``{"compression":
+        "uncompressed"}``. Set "compression" to "lz4" or "zstd" to trade
+        write speed and zero-copy reads for smaller files.
+
+    Raises
+    ------
+    TypeError
+        If `path` is not a string, `chunk_size` is not an integer or either
+        `storage_kws` or `arrow_kws` are not dictionaries.
+    ValueError
+        If `storage` is not among the currently supported file-system
+        schemes, `mode` not among the supported file-mode options, the
+        `chunk_size` is smaller than 1 (MiB), or if either `storage_kws`
+        or `arrow_kws` are not dictionaries.
+
+    See Also
+    --------
+    Storage
+
+    """
+
+    def __init__(
+            self,
+            path: str,
+            storage: LiteralStorage | Storage = Storage.FILE,
+            overwrite: bool = False,
+            skip: bool = False,
+            chunk_size: int = 32,
+            storage_kws: Mapping[str, Any] | None = None,
+            arrow_kws: Mapping[str, Any] | None = None
+    ) -> None:
+        arrow_kws = {} if arrow_kws is None else dict(arrow_kws)
+        self.arrow_kws = {'compression': 'uncompressed'} | arrow_kws
+        super().__init__(
+            path,
+            storage,
+            overwrite,
+            skip,
+            Mode.WB,
+            chunk_size,
+            storage_kws,
+            self.arrow_kws
+        )
+
+    def __call__(self, df: Pandas | Polars, *parts: Any) -> tuple[()]:
+        """Write a pandas or polars dataframe to a supported file system.
+
+        Parameters
+        ----------
+        df: DataFrame
+            The pandas or polars dataframe to save.
+        *parts: str
+            Fragments that will be interpolated into the `path` given at
+            instantiation. Obviously, there must be at least as many as
+            there are placeholders in the `path`.
+
+        Returns
+        -------
+        tuple
+            An empty tuple.
+
+        Raises
+        ------
+        IndexError
+            If the `path` given at instantiation has more string placeholders
+            that there are `parts`.
+        FileExistsError
+            If the destination file already exists, `skip` is ``False`` and
+            `overwrite` is also ``False``.
+        ValueError
+            If the final path is directly under root (e.g., "/file.arrow")
+            because, on local file system, this is not where you want to save
+            to and, on object storage, the first directory refers to the name
+            of an (existing!) bucket.
+
+        """
+        if uri := self._uri_from(*parts):
+            if hasattr(df, 'to_arrow'):
+                table = df.to_arrow()
+            else:
+                table = pa.Table.from_pandas(df)
+            with self._managed(uri) as file:
+                feather.write_feather(table, file, **self.arrow_kws)
+        return ()
+
+
+class Arrow2DataFrame(Reader):
+    """Read an Arrow IPC (Feather V2) file into a pandas or polars dataframe.
+
+    Parameters
+    ----------
+    path: str, optional
+        Directory under which the Arrow IPC file is located or full path to
+        the Arrow IPC file. Since it (or part of it) can also be provided
+        later, when the callable instance is called, it is optional here.
+        Defaults to an empty string.
+    storage: str, optional
+        The type of file system to read from ("file", "s3", etc.).
+        Defaults to "file". Use the :class:`Storage` enum to avoid typos.
+    chunk_size: float, optional
+        Chunk size to use when reading from the selected file system in MiB.
+        Defaults to 32 (MiB).
+    storage_kws: dict, optional
+        Passed on as keyword arguments to the constructor of the file system.
+    arrow_kws: dict, optional
+        Passed on as keyword arguments to pyarrow's `read_table
+        <https://arrow.apache.org/docs/python/generated/pyarrow.feather.
+        read_table.html>`_ function, e.g., to select only certain columns.
+    bear: str, optional
+        Type of dataframe to return. Can be one of "pandas" or "polars". Use
+        the :class:`Bears` enum to avoid typos. Defaults to "pandas".
+    memory_map: bool, optional
+        Whether to memory-map Arrow IPC files on the local file system (or in
+        the local disk `cache`) instead of reading them through a buffered
+        file handle. If the file is not compressed, reading is then zero-copy
+        and pages are loaded on demand from the operating system's page
+        cache, which is shared between processes. Has no effect on remote
+        files that are not cached. Defaults to ``False``.
+    cache: DiskCache, optional
+        Local disk cache to read remote files through. Ignored for the
+        local file system. Defaults to ``None``.
+
+    Raises
+    ------
+    TypeError
+        If `path` is not a string, `chunk_size` is not an integer or either
+        `storage_kws` or `arrow_kws` are not dictionaries.
+    ValueError
+        If `storage` is not among the currently supported file-system
+        schemes, `mode` not among the supported file-mode options, the
+        `chunk_size` is smaller than 1 (MiB), or if `storage_kws` is not
+        a dictionary.
+
+    See Also
+    --------
+    Storage
+    Bears
+
+    """
+
+    def __init__(
+            self,
+            path: str = '',
+            storage: LiteralStorage | Storage = Storage.FILE,
+            chunk_size: int = 32,
+            storage_kws: Mapping[str, Any] | None = None,
+            arrow_kws: Mapping[str, Any] | None = None,
+            bear: LiteralBears | Bears = Bears.PANDAS,
+            memory_map: bool = False,
+            cache: DiskCache | None = None
+    ) -> None:
+        self.arrow_kws = {} if arrow_kws is None else dict(arrow_kws)
+        self.bear = str(Bears(bear))
+        self.memory_map = bool(memory_map)
+        super().__init__(
+            path,
+            storage,
+            Mode.RB,
+            chunk_size,
+            storage_kws,
+            self.arrow_kws,
+            self.bear,
+            self.memory_map,
+            cache=cache
+        )
+
+    def _converted(self, table: pa.Table) -> Pandas | Polars:
+        """Convert an arrow table into the requested type of dataframe."""
+        if self.bear == Bears.POLARS:
+            return pl.from_arrow(table)
+        return table.to_pandas()
+
+    def __call__(self, path: str = '') -> Pandas | Polars:
+        """Read a specific Arrow IPC file from the specified file system.
+
+        Parameters
+        ----------
+        path: str
+            Path (including file name) to the Arrow IPC file to read. If it
+            starts with a backslash, it will be interpreted as absolute,
+            if not, as relative to the `path` specified at instantiation.
+            Defaults to an empty string, which results in an unchanged `path`.
+
+        Returns
+        -------
+        DataFrame
+            Pandas or polars dataframe.
+
+        Raises
+        ------
+        ValueError
+            If the final path is directly under root (e.g., "/file.arrow")
+            because, on local file system, this is not where you want to save
+            to and, on object storage, the first directory refers to the name
+            of an (existing!) bucket.
+
+        """
+        uri = self._non_root(path)
+        if self.memory_map and (local := self._local(uri)):
+            table = feather.read_table(
+                local,
+                memory_map=True,
+                **self.arrow_kws
+            )
+            return self._converted(table)
+        with self._managed(uri) as file:
+            table = feather.read_table(file, **self.arrow_kws)
+        return self._converted(table)
@@ -0,0 +1,351 @@
+import os
+import time
+import uuid
+import asyncio
+import hashlib
+import tempfile
+import threading
+from typing import Any
+from pathlib import Path
+from collections import OrderedDict
+from fsspec.spec import AbstractFileSystem
+from fsspec.asyn import AsyncFileSystem
+from fsspec.utils import tokenize
+from ..misc import ArgRepr
+
+
+class DiskCache(ArgRepr):
+    """Bounded, local on-disk cache for files on remote file systems.
+
+    Cached copies are keyed by the full URI of the remote file together with
+    its current version (ETag, generation, or a fingerprint of its metadata).
+    Before every read, the (cheap) metadata of the remote file is requested
+    to check whether the cached copy is still fresh. If it is not, or if the
+    file has not been cached before, it is downloaded into the cache. The
+    total size of all cached files is kept below `max_size` by evicting the
+    least recently used ones first.
+
+    Parameters
+    ----------
+    directory: str, optional
+        Local directory to keep cached files in. Will be created if it does
+        not exist. Defaults to ``None``, which results in a "swak-cache"
+        folder in the system's temporary directory.
+    max_size: float, optional
+        Maximum size of all cached files combined in MiB. Defaults to 1024.
+    lease: float, optional
+        Number of seconds for which a cached file is protected from eviction
+        after its path has been returned, giving callers time to open it.
+        The cache may temporarily grow beyond `max_size` as a result.
+        Defaults to 10.
+
+    Raises
+    ------
+    TypeError
+        If `directory` is not a string or `max_size` or `lease` are not
+        floats.
+    ValueError
+        If `max_size` is not greater than zero or `lease` is negative.
+
+    Notes
+    -----
+    Instances are thread-safe. Several processes may share the same cache
+    directory, but each keeps its own account of hits, misses, and the total
+    size, which is only synchronized with the file system on instantiation.
+
+    """
+
+    def __init__(
+            self,
+            directory: str | None = None,
+            max_size: float = 1024.0,
+            lease: float = 10.0
+    ) -> None:
+        self.directory = self.__directory(directory)
+        self.max_size = self.__valid(max_size)
+        self.lease = self.__seconds(lease)
+        super().__init__(self.directory, self.max_size, self.lease)
+        self.__setup()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Keep only the arguments because locks cannot be pickled."""
+        return {
+            'directory': self.directory,
+            'max_size': self.max_size,
+            'lease': self.lease
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Re-index the cache directory when unpickling."""
+        self.__init__(**state)
+
+    def __setup(self) -> None:
+        """Initialize bookkeeping from the current content of the directory."""
+        Path(self.directory).mkdir(parents=True, exist_ok=True)
+        self.__lock = threading.RLock()
+        self.__latest: dict[str, str] = {}
+        self.__index: OrderedDict[str, int] = OrderedDict()
+        self.__leases: dict[str, float] = {}
+        cached = (
+            entry for entry in os.scandir(self.directory)
+            if entry.is_file() and '.tmp.' not in entry.name
+        )
+        for entry in sorted(cached, key=lambda e: e.stat().st_mtime):
+            self.__index[entry.name] = entry.stat().st_size
+        self.__bytes = sum(self.__index.values())
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def __directory(directory: Any) -> str:
+        """Try to normalize the cache directory."""
+        if directory is None:
+            return str(Path(tempfile.gettempdir()) / 'swak-cache')
+        try:
+            stripped = directory.strip()
+        except (AttributeError, TypeError) as error:
+            cls = type(directory).__name__
+            msg = '"directory" must be a string, not {}!'
+            raise TypeError(msg.format(cls)) from error
+        return str(Path(stripped).expanduser().resolve())
+
+    @staticmethod
+    def __valid(max_size: Any) -> float:
+        """Try to convert max_size to a meaningful float."""
+        try:
+            as_float = float(max_size)
+        except (TypeError, ValueError) as error:
+            cls = type(max_size).__name__
+            tmp = '"{}" must at least be convertible to a float, unlike {}!'
+            msg = tmp.format('max_size', cls)
+            raise TypeError(msg) from error
+        if as_float <= 0.0:
+            tmp = '"{}" must be greater than zero, unlike {}!'
+            msg = tmp.format('max_size', as_float)
+            raise ValueError(msg)
+        return as_float
+
+    @staticmethod
+    def __seconds(lease: Any) -> float:
+        """Try to convert lease to a meaningful float."""
+        try:
+            as_float = float(lease)
+        except (TypeError, ValueError) as error:
+            cls = type(lease).__name__
+            tmp = '"{}" must at least be convertible to a float, unlike {}!'
+            msg = tmp.format('lease', cls)
+            raise TypeError(msg) from error
+        if as_float < 0.0:
+            tmp = '"{}" must not be negative, unlike {}!'
+            msg = tmp.format('lease', as_float)
+            raise ValueError(msg)
+        return as_float
+
+    @property
+    def max_bytes(self) -> int:
+        """Maximum size of all cached files combined in bytes."""
+        return int(self.max_size * 1024 * 1024)
+
+    @property
+    def size(self) -> int:
+        """Current size of all cached files combined in bytes."""
+        return self.__bytes
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Number of hits, misses, evictions, and files and bytes cached."""
+        with self.__lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'files': len(self.__index),
+                'bytes': self.__bytes
+            }
+
+    @staticmethod
+    def _version(info: dict[str, Any]) -> str:
+        """Extract the version of a remote file from its metadata."""
+        for field in ('ETag', 'etag', 'generation', 'md5Hash'):
+            if info.get(field):
+                return str(info[field])
+        return tokenize(info)
+
+    @staticmethod
+    def _key(source: str, version: str) -> str:
+        """Content address of a specific version of a remote file."""
+        return hashlib.sha256(f'{source}#{version}'.encode()).hexdigest()
+
+    def _hit(self, source: str, key: str) -> str:
+        """Return the local path if cached, or an empty string if not."""
+        path = Path(self.directory) / key
+        with self.__lock:
+            if key in self.__index and path.exists():
+                self.__index.move_to_end(key)
+                self.__leases[key] = time.monotonic() + self.lease
+                self.hits += 1
+                os.utime(path)
+                return str(path)
+            self.__bytes -= self.__index.pop(key, 0)
+            self.misses += 1
+            stale = self.__latest.pop(source, None)
+            # Outdated copies still in use are left to regular LRU eviction.
+            if stale is not None and stale != key and not self.__leased(stale):
+                self.__evict(stale)
+        return ''
+
+    def _peek(self, key: str) -> str:
+        """Return the local path if cached without counting or evicting."""
+        path = Path(self.directory) / key
+        with self.__lock:
+            if key in self.__index and path.exists():
+                self.__leases[key] = time.monotonic() + self.lease
+                return str(path)
+        return ''
+
+    def _admit(self, source: str, key: str, tmp: str) -> str:
+        """Move a fresh download into the cache and evict if necessary."""
+        path = Path(self.directory) / key
+        Path(tmp).replace(path)
+        with self.__lock:
+            self.__bytes -= self.__index.pop(key, 0)
+            self.__index[key] = path.stat().st_size
+            self.__bytes += self.__index[key]
+            self.__latest[source] = key
+            self.__leases[key] = time.monotonic() + self.lease
+            while self.__bytes > self.max_bytes:
+                evictable = (
+                    cached for cached in self.__index
+                    if cached != key and not self.__leased(cached)
+                )
+                if (lru := next(evictable, None)) is None:
+                    break
+                self.__evict(lru)
+        return str(path)
+
+    def __leased(self, key: str) -> bool:
+        """Whether the path to a cached file was returned only just now."""
+        if self.__leases.get(key, 0.0) > time.monotonic():
+            return True
+        self.__leases.pop(key, None)
+        return False
+
+    def __evict(self, key: str) -> None:
+        """Remove a single file from the cache."""
+        if key in self.__index:
+            self.__bytes -= self.__index.pop(key)
+            self.evictions += 1
+        self.__leases.pop(key, None)
+        (Path(self.directory) / key).unlink(missing_ok=True)
+
+    def _tmp(self, key: str) -> str:
+        """Create a random name for a temporary download."""
+        return str(Path(self.directory) / f'{key}.tmp.{uuid.uuid4().hex}')
+
+    def fetch(self, fs: AbstractFileSystem, uri: str) -> str:
+        """Local path to a fresh copy of the given remote file.
+
+        Parameters
+        ----------
+        fs: AbstractFileSystem
+            The fsspec file system the file resides on.
+        uri: str
+            Full path to the file on that file system.
+
+        Returns
+        -------
+        str
+            The full path to the cached copy of the file on local disk.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the remote file does not exist.
+
+        """
+        source = fs.unstrip_protocol(uri)
+        key = self._key(source, self._version(fs.info(uri)))
+        if path := self._hit(source, key):
+            return path
+        tmp = self._tmp(key)
+        try:
+            fs.get_file(uri, tmp)
+        except Exception:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return self._admit(source, key, tmp)
+
+    def lookup(self, fs: AbstractFileSystem, uri: str) -> str:
+        """Local path to a fresh copy of the given remote file, if cached.
+
+        Unlike :meth:`fetch`, this never downloads the remote file. It only
+        checks its current version against what is cached. Other than leasing
+        a cached copy for `lease` seconds, it leaves the cache untouched. It
+        counts neither hits nor misses and does not evict outdated copies.
+
+        Parameters
+        ----------
+        fs: AbstractFileSystem
+            The fsspec file system the file resides on.
+        uri: str
+            Full path to the file on that file system.
+
+        Returns
+        -------
+        str
+            The full path to the cached copy of the file on local disk or an
+            empty string if there is no fresh copy in the cache.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the remote file does not exist.
+
+        """
+        source = fs.unstrip_protocol(uri)
+        key = self._key(source, self._version(fs.info(uri)))
+        return self._peek(key)
+
+    async def afetch(self, fs: AsyncFileSystem, uri: str) -> str:
+        """Local path to a fresh copy of the given remote file.
+
+        Parameters
+        ----------
+        fs: AsyncFileSystem
+            The asynchronous fsspec file system the file resides on.
+        uri: str
+            Full path to the file on that file system.
+
+        Returns
+        -------
+        str
+            The full path to the cached copy of the file on local disk.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the remote file does not exist.
+
+        """
+        source = fs.unstrip_protocol(uri)
+        key = self._key(source, self._version(await fs._info(uri)))
+        if path := await asyncio.to_thread(self._hit, source, key):
+            return path
+        tmp = self._tmp(key)
+        try:
+            await fs._get_file(uri, tmp)
+        except Exception:
+            await asyncio.to_thread(Path(tmp).unlink, missing_ok=True)
+            raise
+        return await asyncio.to_thread(self._admit, source, key, tmp)
+
+    def clear(self) -> None:
+        """Remove all cached files and reset statistics."""
+        with self.__lock:
+            for key in list(self.__index):
+                self.__evict(key)
+            self.__latest.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
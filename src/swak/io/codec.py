@@ -0,0 +1,192 @@
+import bz2
+import gzip
+import lzma
+from typing import Any, IO
+from io import TextIOWrapper
+from contextlib import contextmanager, ExitStack
+from collections.abc import Generator
+from importlib import import_module
+from pathlib import PurePosixPath
+from fsspec.compression import compr
+from .types import LiteralCompression, Compression
+
+INFER = 'infer'
+
+SUFFIXES = {
+    '.zip': Compression.ZIP,
+    '.bz2': Compression.BZ2,
+    '.gz': Compression.GZIP,
+    '.lzma': Compression.LZMA,
+    '.xz': Compression.XZ,
+    '.zst': Compression.ZSTD,
+    '.zstd': Compression.ZSTD,
+    '.lz4': Compression.LZ4
+}
+
+
+def infer_compression(uri: str) -> str | None:
+    """Infer the compression algorithm from the suffix of a file name.
+
+    Parameters
+    ----------
+    uri: str
+        Full path to or name of the file.
+
+    Returns
+    -------
+    str
+        The name of the compression algorithm or ``None`` if the suffix
+        of the file name does not hint at any.
+
+    """
+    codec = SUFFIXES.get(PurePosixPath(uri).suffix.lower())
+    return None if codec is None else str(codec)
+
+
+def resolve_compression(
+        uri: str,
+        compression: LiteralCompression | Compression | str | None = None
+) -> str | None:
+    """Validate the compression algorithm or infer it from the file name.
+
+    Parameters
+    ----------
+    uri: str
+        Full path to or name of the file.
+    compression: str, optional
+        The compression algorithm to use. Use the :class:`Compression` enum
+        to avoid typos. If "infer", it is guessed from the suffix of `uri`.
+        Defaults to ``None``, which means no compression.
+
+    Returns
+    -------
+    str
+        The name of the compression algorithm or ``None``.
+
+    Raises
+    ------
+    ValueError
+        If `compression` is not among the supported algorithms.
+
+    """
+    if compression is None:
+        return None
+    if compression == INFER:
+        return infer_compression(uri)
+    return str(Compression(compression))
+
+
+def _imported(module: str, compression: str) -> Any:
+    """Import the (optional) third-party library implementing a codec."""
+    try:
+        return import_module(module)
+    except ImportError as error:
+        msg = 'Compression "{}" requires "{}" to be installed!'
+        package = module.split('.')[0]
+        raise ImportError(msg.format(compression, package)) from error
+
+
+@contextmanager
+def compressed(
+        file: IO,
+        compression: LiteralCompression | Compression | None,
+        mode: str,
+        level: int | None = None,
+        threads: int | None = None
+) -> Generator[IO]:
+    """Wrap an open binary file handle into a (de-)compressing stream.
+
+    Leaving the context flushes all compressed data but leaves the
+    underlying `file` open. Closing that remains the job of the caller.
+
+    Parameters
+    ----------
+    file: IO
+        Binary file handle opened for reading or writing.
+    compression: str
+        The compression algorithm to use. Use the :class:`Compression` enum
+        to avoid typos. If ``None``, the `file` itself is yielded in
+        binary and wrapped into a text stream in text `mode`.
+    mode: str
+        One of "rb", "rt", "wb", or "wt". Use the `Mode` enum to avoid typos.
+    level: int, optional
+        Compression level when writing. Defaults to ``None``, which uses
+        the default of the respective algorithm.
+    threads: int, optional
+        Number of threads to compress with. Only "zstd" supports compressing
+        in multiple threads and -1 means one per logical CPU core. Defaults
+        to ``None``, which compresses in the calling thread.
+
+    Yields
+    ------
+    IO
+        A binary or text stream, depending on `mode`.
+
+    Raises
+    ------
+    ValueError
+        If `compression` is not among the supported algorithms.
+    ImportError
+        If the library required by `compression` is not installed.
+
+    """
+    writing = 'w' in mode
+    binary = 'wb' if writing else 'rb'
+    kws = {}
+    with ExitStack() as stack:
+        match None if compression is None else Compression(compression):
+            case None:
+                stream = file
+            case Compression.ZSTD:
+                zstd = _imported('zstandard', compression)
+                if writing:
+                    if level is not None:
+                        kws['level'] = level
+                    if threads is not None:
+                        kws['threads'] = threads
+                    compressor = zstd.ZstdCompressor(**kws)
+                    stream = stack.enter_context(
+                        compressor.stream_writer(file, closefd=False)
+                    )
+                else:
+                    decompressor = zstd.ZstdDecompressor()
+                    stream = stack.enter_context(
+                        decompressor.stream_reader(file, closefd=False)
+                    )
+            case Compression.LZ4:
+                frame = _imported('lz4.frame', compression)
+                if writing and level is not None:
+                    kws['compression_level'] = level
+                stream = stack.enter_context(
+                    frame.LZ4FrameFile(file, binary, **kws)
+                )
+            case Compression.GZIP:
+                if writing and level is not None:
+                    kws['compresslevel'] = level
+                stream = stack.enter_context(
+                    gzip.GzipFile(fileobj=file, mode=binary, **kws)
+                )
+            case Compression.BZ2:
+                if writing and level is not None:
+                    kws['compresslevel'] = level
+                stream = stack.enter_context(bz2.BZ2File(file, binary, **kws))
+            case Compression.LZMA | Compression.XZ:
+                if writing and level is not None:
+                    kws['preset'] = level
+                stream = stack.enter_context(
+                    lzma.LZMAFile(file, binary, **kws)
+                )
+            case _:
+                stream = stack.enter_context(
+                    compr[str(compression)](file, mode=binary)
+                )
+        if 't' not in mode:
+            yield stream
+            return
+        # Closing the text wrapper would also close the stream (or file).
+        wrapper = TextIOWrapper(stream)
+        try:
+            yield wrapper
+        finally:
+            wrapper.flush()
+            wrapper.detach()
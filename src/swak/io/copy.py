@@ -4,9 +4,11 @@ from typing import Any
 from collections.abc import Mapping
 from functools import cached_property
 from fsspec.spec import AbstractFileSystem
+from fsspec.asyn import AsyncFileSystem
 from pathlib import PurePosixPath
 from ..misc import ArgRepr
 from .types import Storage, LiteralStorage
+from .aio import async_filesystem
 
 
 class Copy(ArgRepr):
@@ -225,3 +227,119 @@ class Copy(ArgRepr):
                 raise
 
         return tgt_uri
+
+
+class AsyncCopy(Copy):
+    """Asynchronously copy a file from one location/filesystem to another.
+
+    Rather than being streamed in chunks, the source file is fetched in its
+    entirety with a single, awaitable call and then written to a temporary
+    target with another, before being moved to its final destination.
+
+    Parameters
+    ----------
+    src_base: str, optional
+        Base folder or bucket of the file to read or indeed the full, absolute
+        path to the file to read. Because it (or part of it) can also be given
+        later at call time, it defaults to an empty string here.
+    tgt_base: str, optional
+        Base folder or bucket of the file to write or indeed the full, absolute
+        path to the file to write. Defaults to ``None``, which will be resolved
+        to `src_base`.
+    src_storage: str, optional
+        The type of file system to read from ("file", "s3", etc.).
+        Defaults to "file". Use the :class:`Storage` enum to avoid typos.
+    tgt_storage: str, optional
+        The type of file system to read from ("file", "s3", etc.).
+        Defaults to `src_storage` if not set.
+        Use the :class:`Storage` enum to avoid typos.
+    overwrite: bool, optional
+        Whether to silently overwrite the destination file. Defaults to
+        ``False``, which will raise an exception if it already exists.
+    skip: bool, optional
+        Whether to silently do nothing if the target file already exists.
+        Defaults to ``False``.
+    chunk_size: int, optional
+        Retained for compatibility with :class:`Copy`. Has no effect.
+    src_kws: dict, optional
+        Passed on as keywords to the constructor of the source file system.
+    tgt_kws: dict, optional
+        Passed on as keywords to the constructor of the target file system.
+
+    Raises
+    ------
+    TypeError
+        If `path` is not a string, `chunk_size` is not an integer or either
+        `src_kws` or `tgt_kws` are not dictionaries.
+    ValueError
+        If `storage` is not among the currently supported file-system
+        schemes, the `chunk_size` is smaller than 1 (MiB), or if either
+        `src_kws` or `tgt_kws` are not dictionaries.
+
+    See Also
+    --------
+    Copy
+    Storage
+
+    """
+
+    @cached_property
+    def src_fs(self) -> AsyncFileSystem:
+        """Fresh asynchronous source file system on first use."""
+        return async_filesystem(self.src_storage, self.src_kws)
+
+    @cached_property
+    def tgt_fs(self) -> AsyncFileSystem:
+        """Fresh asynchronous target file system on first use."""
+        return async_filesystem(self.tgt_storage, self.tgt_kws)
+
+    async def __call__(self, path: str = '') -> str:
+        """Asynchronously copy a single file between file systems.
+
+        Parameters
+        ----------
+        path: str, optional
+            Full path or sub-folder relative to `src_base` and `tgt_base`
+            of the file to copy.
+
+        Returns
+        -------
+        str
+            Full path to the target file.
+
+        Raises
+        ------
+        FileExistsError
+            If the destination file already exists, `skip` is ``False`` and
+            `overwrite` is also ``False``.
+        ValueError
+            If the final path is directly under root (e.g., "/file.txt")
+            because, on local file system, this is not where you want to save
+            to and, on object storage, the first directory refers to the name
+            of an (existing!) bucket.
+
+        """
+        src_uri = self._src_uri_from(path)
+        tgt_uri = self._tgt_uri_from(src_uri)
+
+        if await self.tgt_fs._exists(tgt_uri):
+            if self.skip:
+                return tgt_uri
+            if not self.overwrite:
+                msg = f'File "{tgt_uri}" already exists!'
+                raise FileExistsError(msg)
+
+        parent = str(PurePosixPath(tgt_uri).parent)
+        await self.tgt_fs._makedirs(parent, exist_ok=True)
+
+        content = await self.src_fs._cat_file(src_uri)
+        tmp_uri = self._tmp(tgt_uri)
+        try:
+            await self.tgt_fs._pipe_file(tmp_uri, content)
+            await self.tgt_fs._mv_file(tmp_uri, tgt_uri)
+        except Exception:
+            if await self.tgt_fs._exists(tmp_uri):
+                await self.tgt_fs._rm_file(tmp_uri)
+            raise
+
+        return tgt_uri
@@ -6,6 +6,7 @@ import pandas as pd
 import polars as pl
 from .types import Bears, LiteralBears, LiteralStorage, Storage, Mode
 from .reader import Reader
+from .cache import DiskCache
 
 
 class Csv2DataFrame(Reader):
@@ -35,6 +36,9 @@ class Csv2DataFrame(Reader):
     bear: str, optional
         Type of dataframe to return. Can be one of "pandas" or "polars". Use
         the :class:`Bears` enum to avoid typos. Defaults to "pandas".
+    cache: DiskCache, optional
+        Local disk cache to read remote files through. Ignored for the
+        local file system. Defaults to ``None``.
 
     Raises
     ------
@@ -61,7 +65,8 @@ class Csv2DataFrame(Reader):
             chunk_size: int = 32,
             storage_kws: Mapping[str, Any] | None = None,
             csv_kws: Mapping[str, Any] | None = None,
-            bear: LiteralBears | Bears = Bears.PANDAS
+            bear: LiteralBears | Bears = Bears.PANDAS,
+            cache: DiskCache | None = None
     ) -> None:
         self.csv_kws = {} if csv_kws is None else dict(csv_kws)
         self.bear = str(Bears(bear))
@@ -72,7 +77,8 @@ class Csv2DataFrame(Reader):
             chunk_size,
             storage_kws,
             self.csv_kws,
-            self.bear
+            self.bear,
+            cache=cache
         )
 
     @property
@@ -1,12 +1,18 @@
 from typing import Any
-from collections.abc import Mapping
-from io import BytesIO
+from collections.abc import Mapping, Sequence, Iterator, Iterable
+from contextlib import contextmanager
+from tempfile import TemporaryDirectory
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import posixpath
+import shutil
 from pandas import DataFrame as Pandas
 from polars import DataFrame as Polars
 import pandas as pd
 import polars as pl
 from .types import Bears, LiteralBears, LiteralStorage, Storage, Mode
 from .reader import Reader
+from .cache import DiskCache
 
 
 class Excel2DataFrame(Reader):
@@ -37,23 +43,51 @@ class Excel2DataFrame(Reader):
     bear: str, optional
         Type of dataframe to return. Can be one of "pandas" or "polars". Use
         the :class:`Bears` enum to avoid typos. Defaults to "pandas".
+    cache: DiskCache, optional
+        Local disk cache to read remote files through. Ignored for the
+        local file system. Defaults to ``None``.
+    sheets: list, optional
+        Names or (zero-based) positions of the sheets to read. If given,
+        all of them are parsed from a single pass over the file and a
+        dictionary of dataframes, keyed by the given names or positions, is
+        returned. Defaults to ``None``, which returns a single dataframe from
+        the sheet selected through the `excel_kws` (or the first one).
+    n_rows: int, optional
+        Number of data rows to read from each sheet. Set to 0 to only read
+        the header, e.g., to discover the schema. Defaults to ``None``,
+        which reads all rows.
+    max_workers: int, optional
+        Maximum number of files to read concurrently in :meth:`bulk`.
+        Defaults to 4.
 
     Raises
     ------
     TypeError
         If `path` is not a string, `chunk_size` is not an integer or either
-        `storage_kws` or `excel_kws` are not dictionaries.
+        `storage_kws` or `excel_kws` are not dictionaries, or if `n_rows` or
+        `max_workers` are not integers.
     ValueError
         If `storage` is not among the currently supported file-system
         schemes, `mode` not among the supported file-mode options, the
-        `chunk_size` is smaller than 1 (MiB), or if `storage_kws` is not
-        a dictionary.
+        `chunk_size` is smaller than 1 (MiB), if `storage_kws` is not
+        a dictionary, if `n_rows` is negative, or if `max_workers` is
+        smaller than one.
 
     Important
     ---------
     If an `engine` other than ``calamine`` is set, it is the user's
     responsibility to make sure it is actually installed.
 
+    Notes
+    -----
+    Files on the local file system (or in the local disk `cache`) are parsed
+    directly from their path. Remote files are first streamed, chunk by chunk,
+    into a temporary file on local disk instead of into memory.
+
+    Polars can select sheets either by name or by position, but not both at
+    the same time. Mixing names and positions in `sheets` therefore parses
+    the file twice when reading into polars dataframes.
+
     See Also
     --------
     Storage
@@ -68,11 +102,22 @@ class Excel2DataFrame(Reader):
             chunk_size: int = 32,
             storage_kws: Mapping[str, Any] | None = None,
             excel_kws: Mapping[str, Any] | None = None,
-            bear: LiteralBears | Bears = Bears.PANDAS
+            bear: LiteralBears | Bears = Bears.PANDAS,
+            cache: DiskCache | None = None,
+            sheets: Sequence[str | int] | None = None,
+            n_rows: int | None = None,
+            max_workers: int = 4
     ) -> None:
         excel_kws = {} if excel_kws is None else dict(excel_kws)
         self.excel_kws = {'engine': 'calamine'} | excel_kws
         self.bear = str(Bears(bear))
+        self.sheets = None if sheets is None else list(sheets)
+        self.n_rows = None if n_rows is None else self.__valid(
+            n_rows,
+            'n_rows',
+            0
+        )
+        self.max_workers = self.__valid(max_workers, 'max_workers', 1)
         super().__init__(
             path,
             storage,
@@ -80,10 +125,86 @@ class Excel2DataFrame(Reader):
             chunk_size,
             storage_kws,
             self.excel_kws,
-            self.bear
+            self.bear,
+            self.sheets,
+            self.n_rows,
+            self.max_workers,
+            cache=cache
         )
 
-    def __call__(self, path: str = '') -> Pandas | Polars:
+    @staticmethod
+    def __valid(value: Any, name: str, minimum: int) -> int:
+        """Try to convert an argument to an integer no smaller than minimum."""
+        try:
+            as_int = int(value)
+        except (TypeError, ValueError) as error:
+            cls = type(value).__name__
+            tmp = '"{}" must at least be convertible to a int, unlike {}!'
+            msg = tmp.format(name, cls)
+            raise TypeError(msg) from error
+        if as_int < minimum:
+            tmp = '"{}" must be greater than (or equal to) {}, unlike {}!'
+            msg = tmp.format(name, minimum, as_int)
+            raise ValueError(msg)
+        return as_int
+
+    @contextmanager
+    def _source(self, uri: str) -> Iterator[str]:
+        """Path to a local copy of the file that can be opened repeatedly."""
+        if local := self._local(uri):
+            yield local
+        else:
+            # The copy is closed before it is yielded, because some operating
+            # systems (e.g., Windows) do not allow opening files twice.
+            with TemporaryDirectory() as tmp:
+                path = Path(tmp) / posixpath.basename(uri)
+                with self._managed(uri) as file, path.open('wb') as copy:
+                    shutil.copyfileobj(file, copy, self.chunk_bytes)
+                yield str(path)
+
+    def _read(
+            self,
+            source: str
+    ) -> Pandas | Polars | dict[str | int, Pandas | Polars]:
+        """Parse the requested sheet(s) of the excel file in one go."""
+        if self.sheets is not None and not self.sheets:
+            return {}
+        kws = dict(self.excel_kws)
+        if self.bear == 'pandas':
+            if self.sheets is not None:
+                kws['sheet_name'] = self.sheets
+            if self.n_rows is not None:
+                kws['nrows'] = self.n_rows
+            return pd.read_excel(source, **kws)
+        if self.bear == 'polars':
+            if self.n_rows is not None:
+                options = dict(kws.get('read_options') or {})
+                kws['read_options'] = options | {'n_rows': self.n_rows}
+            if self.sheets is None:
+                return pl.read_excel(source, **kws)
+            kws.pop('sheet_id', None)
+            kws.pop('sheet_name', None)
+            names = [name for name in self.sheets if isinstance(name, str)]
+            ids = [pos for pos in self.sheets if not isinstance(pos, str)]
+            parsed = {}
+            if names:
+                names = list(dict.fromkeys(names))
+                dfs = pl.read_excel(source, sheet_name=names, **kws)
+                parsed.update(dfs)
+            if ids:
+                ids = list(dict.fromkeys(ids))
+                sheet_ids = [sheet_id + 1 for sheet_id in ids]
+                dfs = pl.read_excel(source, sheet_id=sheet_ids, **kws)
+                parsed.update(zip(ids, dfs.values()))
+            return {sheet: parsed[sheet] for sheet in self.sheets}
+        tmp = '"bear" must be one of "pandas" or "polars", not "{}"!'
+        msg = tmp.format(self.bear)
+        raise ValueError(msg)
+
+    def __call__(
+            self,
+            path: str = ''
+    ) -> Pandas | Polars | dict[str | int, Pandas | Polars]:
         """Read a specific excel file from the specified file system.
 
         Parameters
@@ -96,8 +217,9 @@ class Excel2DataFrame(Reader):
 
         Returns
         -------
-        DataFrame
-            Pandas or polars dataframe.
+        DataFrame or dict
+            Pandas or polars dataframe or, if `sheets` were given, a
+            dictionary of dataframes keyed by the sheet names or positions.
 
         Raises
         ------
@@ -109,13 +231,34 @@ class Excel2DataFrame(Reader):
 
         """
         uri = self._non_root(path)
-        with self._managed(uri) as file:
-            if self.bear == 'pandas':
-                df = pd.read_excel(file, **self.excel_kws)
-            elif self.bear == 'polars':
-                df = pl.read_excel(BytesIO(file.read()), **self.excel_kws)
-            else:
-                tmp = '"bear" must be one of "pandas" or "polars", not "{}"!'
-                msg = tmp.format(self.bear)
-                raise ValueError(msg)
-        return df
+        with self._source(uri) as source:
+            return self._read(source)
+
+    def bulk(
+            self,
+            paths: Iterable[str]
+    ) -> list[Pandas | Polars | dict[str | int, Pandas | Polars]]:
+        """Read many excel files concurrently, each in a separate thread.
+
+        Parameters
+        ----------
+        paths: Iterable
+            Paths (including file names) to the excel files to read, each
+            interpreted as in a single call of the instance.
+
+        Returns
+        -------
+        list
+            The dataframes (or dictionaries of dataframes) of the individual
+            files in the order of `paths`.
+
+        Raises
+        ------
+        ValueError
+            If any final path is directly under root (e.g., "/file.ods").
+
+        """
+        paths = list(paths)
+        workers = min(self.max_workers, max(len(paths), 1))
+        with ThreadPoolExecutor(workers, 'excel') as pool:
+            return list(pool.map(self, paths))
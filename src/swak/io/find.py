@@ -1,11 +1,18 @@
 import fsspec
-from collections.abc import Mapping
+from datetime import datetime
+from collections.abc import Mapping, Iterator
 from typing import Any
 from functools import cached_property
+from fnmatch import fnmatchcase
+from concurrent.futures import ThreadPoolExecutor, Future, wait
+from concurrent.futures import FIRST_COMPLETED
 from fsspec.spec import AbstractFileSystem
+from fsspec.asyn import AsyncFileSystem
 from pathlib import PurePosixPath
 from ..misc import ArgRepr
-from .types import LiteralStorage, Storage
+from .types import LiteralStorage, Storage, NotFound
+from .aio import async_filesystem
+from .json import JsonReader, JsonWriter
 
 
 class Find(ArgRepr):
@@ -158,3 +165,548 @@ class Find(ArgRepr):
             for file in files
             if file.endswith(self.suffix)
         ]
+
+
+class AsyncFind(Find):
+    """Asynchronously list files by prefix and suffix on any filesystem.
+
+    Parameters
+    ----------
+    path: str, optional
+        Directory under which files should be discovered. Since it (or part of
+        it) can also be provided later, when the callable instance is called,
+        it is optional here. Defaults to an empty string.
+    storage: str, optional
+        The type of file system to read from ("file", "s3", etc.).
+        Defaults to "file". Use the :class:`Storage` enum to avoid typos.
+    suffix: str, optional
+        The suffix to filter file names by. Defaults to an empty string,
+        which will allow all and any suffixes.
+    max_depth: int, optional
+        The maximum depth to descend into subdirectories. Defaults to 1.
+        If set to ``None``, all subdirectories will be visited recursively.
+    storage_kws: dict, optional
+        Passed on as keyword arguments to the constructor of the file system.
+
+    Raises
+    ------
+    TypeError
+        If `path` is not a string, `max_depth` is not an int, or if
+        `storage_kws` is not a dictionary.
+    ValueError
+        If `storage` is not among the currently supported file-system schemes,
+        `max_depth` is smaller than 1, or if `storage_kws` is not a dictionary.
+
+    See Also
+    --------
+    Find
+    Storage
+
+    """
+
+    @cached_property
+    def fs(self) -> AsyncFileSystem:
+        """Fresh asynchronous file system on first use, same thereafter."""
+        return async_filesystem(self.storage, self.storage_kws)
+
+    async def __call__(self, path: str = '') -> list[str]:
+        """Asynchronously list files matching the given criteria.
+
+        Parameters
+        ----------
+        path: str
+            Directory under which files should be discovered. If it starts
+            with a backslash, it will be interpreted as absolute, if not, as
+            relative to the `path` specified at instantiation. Defaults to an
+            empty string, which results in an unchanged `path`.
+
+        Returns
+        -------
+        list
+            The full paths to all files under the specified directory,
+            filtered for their suffix (if any was given).
+
+        Raises
+        ------
+        ValueError
+            If the final path is directly under root (e.g., "/file.suffix")
+            because, on local file system, this is not where you want to save
+            to and, on object storage, the first directory refers to the name
+            of an (existing!) bucket.
+
+        """
+        uri = self._non_root(path)
+        files = await self.fs._find(
+            uri,
+            maxdepth=self.max_depth,
+            withdirs=False,
+            detail=False
+        )
+        return [
+            file.removeprefix(self.prefix)
+            for file in files
+            if file.endswith(self.suffix)
+        ]
+
+
+class IncrementalFind(Find):
+    """List only files that are new or have changed since the last call.
+
+    By default, the files under the given directory are listed in full, on
+    every call, together with their metadata. Only those files that were not
+    there before or whose fingerprint (ETag or, if not available,
+    last-modified time and size) changed are returned. Alternatively, only
+    a `watermark` is kept, i.e., the last file name or the latest
+    modification time seen, and only files beyond it are returned. The
+    snapshot or the watermark is kept in memory or, if a `state` file is
+    given, persisted as JSON on the same file system, such that polling
+    pipelines can pick up where they left off.
+
+    Parameters
+    ----------
+    path: str, optional
+        Directory under which files should be discovered. Since it (or part of
+        it) can also be provided later, when the callable instance is called,
+        it is optional here. Defaults to an empty string.
+    storage: str, optional
+        The type of file system to read from ("file", "s3", etc.).
+        Defaults to "file". Use the :class:`Storage` enum to avoid typos.
+    suffix: str, optional
+        The suffix to filter file names by. Defaults to an empty string,
+        which will allow all and any suffixes.
+    max_depth: int, optional
+        The maximum depth to descend into subdirectories. Defaults to 1.
+        If set to ``None``, all subdirectories will be visited recursively.
+    storage_kws: dict, optional
+        Passed on as keyword arguments to the constructor of the file system.
+    state: str, optional
+        Full path to the JSON file to persist the snapshot of known files in.
+        Must not lie under the directory to list. Defaults to an empty
+        string, in which case the snapshot is only kept in memory.
+    watermark: str, optional
+        One of "key" or "modified" to only keep track of the largest full
+        path or of the latest modification time seen so far, respectively.
+        Defaults to an empty string, which keeps a snapshot of all files.
+
+    Raises
+    ------
+    TypeError
+        If `path` or `state` are not strings, `max_depth` is not an int, or
+        if `storage_kws` is not a dictionary.
+    ValueError
+        If `storage` is not among the currently supported file-system schemes,
+        `max_depth` is smaller than 1, `storage_kws` is not a dictionary, or
+        if `watermark` is not one of the supported options.
+
+    See Also
+    --------
+    Find
+    Storage
+
+    Notes
+    -----
+    Without a `watermark`, this is a diff-only helper and not an incremental
+    lister. Every call lists, fingerprints, and persists all files, which is
+    more expensive than a plain :class:`Find`. On large prefixes, set a
+    `watermark` instead.
+
+    With a "key" `watermark`, files are expected to arrive with names that
+    sort after all existing ones (e.g., because they start with a timestamp
+    or are organized in date partitions). Directories are then walked level
+    by level and subdirectories that sort entirely before the watermark are
+    not listed at all. Files added with smaller names or changed in place
+    are missed.
+
+    With a "modified" `watermark`, files that are added or changed with a
+    modification time later than the latest one seen before are returned.
+    Because object storage cannot filter by time, all files still need to
+    be listed, but only the watermark (and the names of the files that share
+    its exact time) is persisted.
+
+    Use separate `state` files for different `watermark` settings.
+
+    """
+
+    def __init__(
+            self,
+            path: str = '',
+            storage: LiteralStorage | Storage = Storage.FILE,
+            suffix: str = '',
+            max_depth: int | None = 1,
+            storage_kws: Mapping[str, Any] | None = None,
+            state: str = '',
+            watermark: str = ''
+    ) -> None:
+        super().__init__(path, storage, suffix, max_depth, storage_kws)
+        self.state = self.__strip(state)
+        self.watermark = self.__mode(watermark)
+        self.__snapshots: dict[str, Any] = {}
+        ArgRepr.__init__(
+            self,
+            self.path,
+            self.storage,
+            self.suffix,
+            self.max_depth,
+            self.storage_kws,
+            self.state,
+            self.watermark
+        )
+
+    @staticmethod
+    def __mode(watermark: Any) -> str:
+        """Make sure the watermark is one of the supported options."""
+        if watermark in ('', 'key', 'modified'):
+            return watermark
+        tmp = '"watermark" must be one of "", "key", or "modified", not {}!'
+        raise ValueError(tmp.format(watermark))
+
+    @staticmethod
+    def __strip(state: Any) -> str:
+        """Try to normalize the path to the state file."""
+        try:
+            stripped = state.strip(' /')
+        except (AttributeError, TypeError) as error:
+            cls = type(state).__name__
+            msg = '"state" must be a string, not {}!'
+            raise TypeError(msg.format(cls)) from error
+        return '/' + stripped if stripped else stripped
+
+    @cached_property
+    def _load(self) -> JsonReader:
+        """Reader for the persisted snapshot of known files."""
+        return JsonReader(
+            self.state,
+            self.storage,
+            storage_kws=self.storage_kws,
+            not_found=NotFound.IGNORE
+        )
+
+    @cached_property
+    def _save(self) -> JsonWriter:
+        """Writer for the persisted snapshot of known files."""
+        return JsonWriter(
+            self.state,
+            self.storage,
+            overwrite=True,
+            storage_kws=self.storage_kws
+        )
+
+    @staticmethod
+    def _fingerprint(info: Mapping[str, Any]) -> str:
+        """Identify a version of a file from its metadata."""
+        for key in ('ETag', 'etag', 'md5Hash'):
+            if info.get(key):
+                return str(info[key]).strip('"')
+        for key in ('LastModified', 'mtime', 'updated', 'created'):
+            if info.get(key) is not None:
+                return f'{info[key]}-{info.get("size", "")}'
+        return str(info.get('size', ''))
+
+    @staticmethod
+    def _modified(info: Mapping[str, Any]) -> float:
+        """Last-modified time of a file from its metadata as timestamp."""
+        for key in ('LastModified', 'mtime', 'updated', 'created'):
+            value = info.get(key)
+            if isinstance(value, datetime):
+                return value.timestamp()
+            if isinstance(value, str):
+                return datetime.fromisoformat(value).timestamp()
+            if value is not None:
+                return float(value)
+        msg = 'File {} has no last-modified time!'
+        raise KeyError(msg.format(info.get('name')))
+
+    def _after(
+            self,
+            directory: str,
+            mark: str,
+            depth: int | None
+    ) -> list[str]:
+        """Files that sort after the mark, skipping directories before it."""
+        files = []
+        for info in self.fs.ls(directory, detail=True):
+            name = info['name'].removeprefix(self.prefix).rstrip('/')
+            if info['type'] != 'directory':
+                if name > mark and name.endswith(self.suffix):
+                    files.append(name)
+                continue
+            if depth is not None and depth <= 1:
+                continue
+            # All names in a subdirectory sort before a mark outside of it.
+            if name + '/' < mark and not mark.startswith(name + '/'):
+                continue
+            more = None if depth is None else depth - 1
+            files.extend(self._after(self.prefix + name, mark, more))
+        return files
+
+    def __by_key(self, uri: str, mark: str | None) -> tuple[list[str], str]:
+        """New files and the next watermark for the "key" mode."""
+        new = sorted(self._after(uri, mark or '', self.max_depth))
+        return new, new[-1] if new else mark
+
+    def __by_modified(
+            self,
+            uri: str,
+            mark: list | None
+    ) -> tuple[list[str], list]:
+        """New files and the next watermark for the "modified" mode."""
+        latest, seen = (float('-inf'), []) if mark is None else mark
+        infos = self.fs.find(
+            uri,
+            maxdepth=self.max_depth,
+            withdirs=False,
+            detail=True
+        )
+        times = {
+            file.removeprefix(self.prefix): self._modified(info)
+            for file, info in infos.items()
+            if file.endswith(self.suffix)
+        }
+        new = sorted(
+            file
+            for file, modified in times.items()
+            if modified > latest
+            or (modified == latest and file not in seen)
+        )
+        if not times:
+            return new, mark
+        newest = max(times.values())
+        if newest < latest:
+            return new, mark
+        at_newest = [file for file, at in times.items() if at == newest]
+        return new, [newest, sorted(at_newest)]
+
+    def __by_snapshot(
+            self,
+            uri: str,
+            known: dict[str, str] | None
+    ) -> tuple[list[str], dict[str, str]]:
+        """Changed files and the next snapshot without a watermark."""
+        infos = self.fs.find(
+            uri,
+            maxdepth=self.max_depth,
+            withdirs=False,
+            detail=True
+        )
+        current = {
+            file.removeprefix(self.prefix): self._fingerprint(info)
+            for file, info in infos.items()
+            if file.endswith(self.suffix)
+        }
+        known = {} if known is None else known
+        changed = sorted(
+            file
+            for file, fingerprint in current.items()
+            if known.get(file) != fingerprint
+        )
+        return changed, current
+
+    def __call__(self, path: str = '') -> list[str]:
+        """List files that are new or changed since the previous call.
+
+        Parameters
+        ----------
+        path: str
+            Directory under which files should be discovered. If it starts
+            with a backslash, it will be interpreted as absolute, if not, as
+            relative to the `path` specified at instantiation. Defaults to an
+            empty string, which results in an unchanged `path`.
+
+        Returns
+        -------
+        list
+            The sorted full paths to all new or changed files under the
+            specified directory, filtered for their suffix (if any was given).
+            On the very first call, that is all of them.
+
+        Raises
+        ------
+        ValueError
+            If the final path is directly under root (e.g., "/file.suffix")
+            because, on local file system, this is not where you want to save
+            to and, on object storage, the first directory refers to the name
+            of an (existing!) bucket.
+
+        """
+        uri = self._non_root(path)
+        snapshots = dict(self._load()) if self.state else self.__snapshots
+        match self.watermark:
+            case 'key':
+                changed, mark = self.__by_key(uri, snapshots.get(uri))
+            case 'modified':
+                changed, mark = self.__by_modified(uri, snapshots.get(uri))
+            case _:
+                changed, mark = self.__by_snapshot(uri, snapshots.get(uri))
+        snapshots[uri] = mark
+        if self.state:
+            self._save(snapshots)
+        return changed
+
+
+class ParallelFind(Find):
+    """Concurrently walk directories and stream matching files as found.
+
+    Instead of listing one directory after the other, all subdirectories
+    discovered so far are listed in parallel in a pool of threads. Files are
+    filtered by their suffix and (optionally) by a glob pattern on their name
+    during the walk and yielded as soon as the listing of their parent
+    directory arrives. Therefore, the order of results is not deterministic.
+    This pays off on cloud object storage with many (nested) prefixes, where
+    every listing is a slow network round trip.
+
+    Parameters
+    ----------
+    path: str, optional
+        Directory under which files should be discovered. Since it (or part of
+        it) can also be provided later, when the callable instance is called,
+        it is optional here. Defaults to an empty string.
+    storage: str, optional
+        The type of file system to read from ("file", "s3", etc.).
+        Defaults to "file". Use the :class:`Storage` enum to avoid typos.
+    suffix: str, optional
+        The suffix to filter file names by. Defaults to an empty string,
+        which will allow all and any suffixes.
+    max_depth: int, optional
+        The maximum depth to descend into subdirectories. Defaults to 1.
+        If set to ``None``, all subdirectories will be visited recursively.
+    storage_kws: dict, optional
+        Passed on as keyword arguments to the constructor of the file system.
+    glob: str, optional
+        Shell-style wildcard pattern (e.g., "part-*") that file names (not
+        their full paths) must match. Defaults to an empty string, which
+        will allow all and any file names.
+    max_workers: int, optional
+        Maximum number of directories to list concurrently. Defaults to 16.
+
+    Raises
+    ------
+    TypeError
+        If `path` or `glob` are not strings, `max_depth` or `max_workers`
+        are not integers, or if `storage_kws` is not a dictionary.
+    ValueError
+        If `storage` is not among the currently supported file-system schemes,
+        `max_depth` or `max_workers` are smaller than 1, or if `storage_kws`
+        is not a dictionary.
+
+    See Also
+    --------
+    Find
+    Storage
+
+    """
+
+    def __init__(
+            self,
+            path: str = '',
+            storage: LiteralStorage | Storage = Storage.FILE,
+            suffix: str = '',
+            max_depth: int | None = 1,
+            storage_kws: Mapping[str, Any] | None = None,
+            glob: str = '',
+            max_workers: int = 16
+    ) -> None:
+        super().__init__(path, storage, suffix, max_depth, storage_kws)
+        self.glob = self.__stripped(glob)
+        self.max_workers = self.__valid(max_workers)
+        ArgRepr.__init__(
+            self,
+            self.path,
+            self.storage,
+            self.suffix,
+            self.max_depth,
+            self.storage_kws,
+            self.glob,
+            self.max_workers
+        )
+
+    @staticmethod
+    def __stripped(glob: Any) -> str:
+        """Try to normalize the glob pattern."""
+        try:
+            stripped = glob.strip(' /')
+        except (AttributeError, TypeError) as error:
+            cls = type(glob).__name__
+            msg = '"glob" must be a string, not {}!'
+            raise TypeError(msg.format(cls)) from error
+        return stripped
+
+    @staticmethod
+    def __valid(max_workers: Any) -> int:
+        """Try to convert max_workers to a meaningful int."""
+        try:
+            as_int = int(max_workers)
+        except (TypeError, ValueError) as error:
+            cls = type(max_workers).__name__
+            tmp = '"{}" must at least be convertible to a int, unlike {}!'
+            msg = tmp.format('max_workers', cls)
+            raise TypeError(msg) from error
+        if as_int < 1:
+            tmp = '"{}" must be greater than (or equal to) one, unlike {}!'
+            msg = tmp.format('max_workers', as_int)
+            raise ValueError(msg)
+        return as_int
+
+    def _matches(self, file: str) -> bool:
+        """Filter file names by suffix and glob pattern."""
+        if not file.endswith(self.suffix):
+            return False
+        name = file.rstrip('/').rsplit('/', 1)[-1]
+        return not self.glob or fnmatchcase(name, self.glob)
+
+    def _ls(self, directory: str) -> list[dict[str, Any]]:
+        """List the immediate children of a single directory."""
+        try:
+            return self.fs.ls(directory, detail=True)
+        except FileNotFoundError:
+            return []
+
+    def _walk(self, uri: str) -> Iterator[str]:
+        """Concurrently list directories breadth-first, yielding files."""
+        pool = ThreadPoolExecutor(self.max_workers, 'find')
+        pending: dict[Future, int] = {pool.submit(self._ls, uri): 1}
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for listing in done:
+                    depth = pending.pop(listing)
+                    deeper = self.max_depth is None or depth < self.max_depth
+                    for info in listing.result():
+                        name = info['name']
+                        if info['type'] == 'directory':
+                            if deeper:
+                                child = self.prefix + '/' + name.lstrip('/')
+                                future = pool.submit(self._ls, child)
+                                pending[future] = depth + 1
+                        elif self._matches(name):
+                            yield name.removeprefix(self.prefix)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def __call__(self, path: str = '') -> Iterator[str]:
+        """Stream files matching the given criteria as they are found.
+
+        Parameters
+        ----------
+        path: str
+            Directory under which files should be discovered. If it starts
+            with a backslash, it will be interpreted as absolute, if not, as
+            relative to the `path` specified at instantiation. Defaults to an
+            empty string, which results in an unchanged `path`.
+
+        Returns
+        -------
+        Iterator
+            The full paths to all files under the specified directory,
+            filtered for their suffix and name pattern (if any were given),
+            in the order in which they are found.
+
+        Raises
+        ------
+        ValueError
+            If the final path is directly under root (e.g., "/file.suffix")
+            because, on local file system, this is not where you want to save
+            to and, on object storage, the first directory refers to the name
+            of an (existing!) bucket.
+
+        """
+        return self._walk(self._non_root(path))
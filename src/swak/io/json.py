@@ -1,10 +1,14 @@
 import json
 import warnings
 from typing import Any
-from collections.abc import Mapping
-from pathlib import PurePosixPath
+from collections.abc import Mapping, Callable, Iterable, Iterator
+from importlib import import_module
+from importlib.util import find_spec
 from .writer import Writer
 from .reader import Reader
+from .cache import DiskCache
+from .aio import AsyncReader
+from .codec import INFER
 from .types import (
     LiteralStorage,
     Yaml,
@@ -12,10 +16,82 @@ from .types import (
     Mode,
     Compression,
     NotFound,
-    LiteralNotFound
+    LiteralNotFound,
+    JsonBackend,
+    LiteralJsonBackend
 )
 
 
+def json_backend(
+        backend: LiteralJsonBackend | JsonBackend | None = None
+) -> str:
+    """Resolve the library to parse and serialize JSON with.
+
+    Parameters
+    ----------
+    backend: str, optional
+        The JSON library to use. One of "orjson", "msgspec", or "json". Use
+        the :class:`JsonBackend` enum to avoid typos. Defaults to ``None``,
+        which selects python's own :mod:`json` module. The faster third-party
+        libraries must be opted into explicitly because they are stricter,
+        e.g., with respect to non-string dictionary keys or NaN values.
+
+    Returns
+    -------
+    str
+        The name of the selected JSON library.
+
+    Raises
+    ------
+    ValueError
+        If `backend` is not among the supported JSON libraries.
+    ImportError
+        If the requested `backend` is not installed.
+
+    """
+    if backend is None:
+        return str(JsonBackend.JSON)
+    backend = str(JsonBackend(backend))
+    if find_spec(backend) is None:
+        msg = 'JSON backend "{}" is not installed!'
+        raise ImportError(msg.format(backend))
+    return backend
+
+
+def _json_dumps(obj: Any, **kwargs: Any) -> bytes:
+    """Serialize to UTF-8 encoded bytes with python's own json module."""
+    return json.dumps(obj, **kwargs).encode()
+
+
+def _compression(gzip: bool | None) -> str | None:
+    """Compression to use given the (optional) explicit choice of gzip."""
+    if gzip is None:
+        return INFER
+    return str(Compression.GZIP) if gzip else None
+
+
+def _loads_with(backend: str) -> Callable[..., Any]:
+    """Function that parses bytes with the given JSON library."""
+    match backend:
+        case JsonBackend.ORJSON:
+            return import_module('orjson').loads
+        case JsonBackend.MSGSPEC:
+            return import_module('msgspec.json').decode
+        case _:
+            return json.loads
+
+
+def _dumps_with(backend: str) -> Callable[..., bytes]:
+    """Function that serializes to bytes with the given JSON library."""
+    match backend:
+        case JsonBackend.ORJSON:
+            return import_module('orjson').dumps
+        case JsonBackend.MSGSPEC:
+            return import_module('msgspec.json').encode
+        case _:
+            return _json_dumps
+
+
 class JsonWriter(Writer):
     """Save a dictionary to a JSON file on any of the supported file systems.
 
@@ -41,14 +117,28 @@ class JsonWriter(Writer):
     storage_kws: dict, optional
         Passed on as keywords to the constructor of the file system.
     json_kws: dict, optional
-        Passed on as keyword arguments to the :func:`dump` function of
-        python's own :mod:`json` module. See the `json documentation
-        <https://docs.python.org/3/library/json.html>`_ for options.
+        Passed on as keyword arguments to the serialization function of the
+        JSON `backend`, e.g., to :func:`dumps` of python's own :mod:`json`
+        module (see the `json documentation <https://docs.python.org/3/
+        library/json.html>`_ for options) or to :func:`orjson.dumps`.
     gzip: bool, optional
         Write the JSON to a gzip-compressed JSON file if ``True`` and a plain
         text file if ``False``. If left at ``None``, which is the default,
-        file names ending in ".gz" will trigger compression whereas all other
-        extensions (if any) will not.
+        the compression algorithm is inferred from the file-name suffix
+        (e.g., ".gz", ".zst", or ".lz4") and all other extensions (if any)
+        will result in plain text files.
+    backend: str, optional
+        The JSON library to serialize with. One of "orjson", "msgspec", or
+        "json". Use the :class:`JsonBackend` enum to avoid typos. Defaults
+        to ``None``, which results in python's own :mod:`json` module. The
+        others are faster but stricter, e.g., with respect to NaN values.
+    level: int, optional
+        Compression level to use if the file is compressed. Defaults to
+        ``None``, which uses the default of the respective algorithm.
+    threads: int, optional
+        Number of threads to compress with. Only honored by "zstd", where -1
+        means one thread per logical CPU core. Defaults to ``None``, which
+        compresses in the calling thread.
 
     Raises
     ------
@@ -58,8 +148,11 @@ class JsonWriter(Writer):
     ValueError
         If `storage` is not among the currently supported file-system
         schemes, `mode` not among the supported file-mode options, the
-        `chunk_size` is smaller than 1 (MiB), or if either `storage_kws`
-        or `json_kws` are not dictionaries.
+        `chunk_size` is smaller than 1 (MiB), if either `storage_kws`
+        or `json_kws` are not dictionaries, or if `backend` is not among
+        the supported JSON libraries.
+    ImportError
+        If the requested JSON `backend` is not installed.
 
     See Also
     --------
@@ -76,22 +169,36 @@ class JsonWriter(Writer):
             chunk_size: int = 32,
             storage_kws: Mapping[str, Any] | None = None,
             json_kws: Mapping[str, Any] | None = None,
-            gzip: bool | None = None
+            gzip: bool | None = None,
+            backend: LiteralJsonBackend | JsonBackend | None = None,
+            level: int | None = None,
+            threads: int | None = None
     ) -> None:
         self.json_kws = {} if json_kws is None else dict(json_kws)
         self.gzip = None if gzip is None else bool(gzip)
+        self.backend = json_backend(backend)
+        self.level = None if level is None else int(level)
+        self.threads = None if threads is None else int(threads)
         super().__init__(
             path,
             storage,
             overwrite,
             skip,
-            Mode.WT,
+            Mode.WB,
             chunk_size,
             storage_kws,
             self.json_kws,
-            self.gzip
+            self.gzip,
+            self.backend,
+            self.level,
+            self.threads
         )
 
+    @property
+    def dumps(self) -> Callable[..., bytes]:
+        """Function serializing objects to bytes with the JSON backend."""
+        return _dumps_with(self.backend)
+
     def __call__(self, obj: Yaml, *parts: Any) -> tuple[()]:
         """Write a dictionary-like object to JSON file the given file system.
 
@@ -125,11 +232,13 @@ class JsonWriter(Writer):
 
         """
         if uri := self._uri_from(*parts):
-            suffix = PurePosixPath(uri).suffix
-            zipped = suffix == '.gz' if self.gzip is None else self.gzip
-            compression = Compression.GZIP if zipped else None
-            with self._managed(uri, compression) as file:
-                json.dump(obj, file, **self.json_kws)
+            with self._managed(
+                    uri,
+                    _compression(self.gzip),
+                    self.level,
+                    self.threads
+            ) as file:
+                file.write(self.dumps(obj, **self.json_kws))
         return ()
 
 
@@ -152,9 +261,10 @@ class JsonReader(Reader):
     storage_kws: dict, optional
         Passed on as keyword arguments to the constructor of the file system.
     json_kws: dict, optional
-        Passed on as keyword arguments to the :func:`load` function of
-        python's own :mod:`json` module. See the `json documentation
-        <https://docs.python.org/3/library/json.html>`_ for options.
+        Passed on as keyword arguments to the parsing function of the JSON
+        `backend`, e.g., to :func:`loads` of python's own :mod:`json` module.
+        See the `json documentation <https://docs.python.org/3/library/
+        json.html>`_ for options.
     not_found: str, optional
         What to do if the specified JSON file is not found. One of "ignore",
         "warn", or "raise". Defaults to "raise". Use the :class:`NotFound`
@@ -162,8 +272,17 @@ class JsonReader(Reader):
     gzip: bool, optional
         Read the JSON from a gzip-compressed file if ``True`` and a plain
         text file if ``False``. If left at ``None``, which is the default,
-        file names ending in ".gz" will be assumed to be compressed whereas
-        all other extensions will not.
+        the compression algorithm is inferred from the file-name suffix
+        (e.g., ".gz", ".zst", or ".lz4") and all other extensions (if any)
+        are assumed to be plain text files.
+    backend: str, optional
+        The JSON library to parse raw bytes with. One of "orjson", "msgspec",
+        or "json". Use the :class:`JsonBackend` enum to avoid typos. Defaults
+        to ``None``, which results in python's own :mod:`json` module. The
+        others are faster but stricter, e.g., with respect to NaN values.
+    cache: DiskCache, optional
+        Local disk cache to read remote files through. Ignored for the
+        local file system. Defaults to ``None``.
 
     Raises
     ------
@@ -173,8 +292,11 @@ class JsonReader(Reader):
     ValueError
         If `storage` is not among the currently supported file-system
         schemes, `mode` not among the supported file-mode options, the
-        `chunk_size` is smaller than 1 (MiB), or if `storage_kws` is not
-        a dictionary.
+        `chunk_size` is smaller than 1 (MiB), if `storage_kws` is not
+        a dictionary, or if `backend` is not among the supported JSON
+        libraries.
+    ImportError
+        If the requested JSON `backend` is not installed.
 
     See Also
     --------
@@ -191,22 +313,32 @@ class JsonReader(Reader):
             storage_kws: Mapping[str, Any] | None = None,
             json_kws: Mapping[str, Any] | None = None,
             not_found: LiteralNotFound | NotFound = 'raise',
-            gzip: bool | None = None
+            gzip: bool | None = None,
+            backend: LiteralJsonBackend | JsonBackend | None = None,
+            cache: DiskCache | None = None
     ) -> None:
         self.json_kws = {} if json_kws is None else dict(json_kws)
         self.not_found = str(NotFound(not_found))
         self.gzip = None if gzip is None else bool(gzip)
+        self.backend = json_backend(backend)
         super().__init__(
             path,
             storage,
-            Mode.RT,
+            Mode.RB,
             chunk_size,
             storage_kws,
             self.json_kws,
             self.not_found,
-            self.gzip
+            self.gzip,
+            self.backend,
+            cache=cache
         )
 
+    @property
+    def loads(self) -> Callable[..., Any]:
+        """Function parsing raw bytes with the JSON backend."""
+        return _loads_with(self.backend)
+
     def __call__(self, path: str = '') -> Yaml:
         """Read a specific JSON file from the specified file system.
 
@@ -237,11 +369,117 @@ class JsonReader(Reader):
         """
         uri = self._non_root(path)
         try:
-            suffix = PurePosixPath(uri).suffix
-            zipped = suffix == '.gz' if self.gzip is None else self.gzip
-            compression = Compression.GZIP if zipped else None
-            with self._managed(uri, compression) as file:
-                obj = json.load(file, **self.json_kws)
+            with self._managed(uri, _compression(self.gzip)) as file:
+                obj = self.loads(file.read(), **self.json_kws)
+        except FileNotFoundError as error:
+            match self.not_found:
+                case NotFound.WARN:
+                    msg = 'File "{}" not found!\nReturning empty JSON.'
+                    warnings.warn(msg.format(uri))
+                    obj = {}
+                case NotFound.IGNORE:
+                    obj = {}
+                case _:
+                    raise error
+        return obj
+
+
+class AsyncJsonReader(JsonReader, AsyncReader):
+    """Asynchronously read a potentially compressed JSON file from anywhere.
+
+    Parameters
+    ----------
+    path: str, optional
+        Directory under which the JSON file is located or full path to the
+        JSON file. Since it (or part of it) can also be provided later, when
+        the callable instance is called, it is optional here.
+        Defaults to an empty string.
+    storage: str, optional
+        The type of file system to read from ("file", "s3", etc.).
+        Defaults to "file". Use the :class:`Storage` enum to avoid typos.
+    chunk_size: float, optional
+        Chunk size to use when reading from the selected file system in MiB.
+        Defaults to 32 (MiB).
+    storage_kws: dict, optional
+        Passed on as keyword arguments to the constructor of the file system.
+    json_kws: dict, optional
+        Passed on as keyword arguments to the parsing function of the JSON
+        `backend`, e.g., to :func:`loads` of python's own :mod:`json` module.
+        See the `json documentation <https://docs.python.org/3/library/
+        json.html>`_ for options.
+    not_found: str, optional
+        What to do if the specified JSON file is not found. One of "ignore",
+        "warn", or "raise". Defaults to "raise". Use the :class:`NotFound`
+        enum to avoid typos!
+    gzip: bool, optional
+        Read the JSON from a gzip-compressed file if ``True`` and a plain
+        text file if ``False``. If left at ``None``, which is the default,
+        the compression algorithm is inferred from the file-name suffix
+        (e.g., ".gz", ".zst", or ".lz4") and all other extensions (if any)
+        are assumed to be plain text files.
+    backend: str, optional
+        The JSON library to parse raw bytes with. One of "orjson", "msgspec",
+        or "json". Use the :class:`JsonBackend` enum to avoid typos. Defaults
+        to ``None``, which results in python's own :mod:`json` module. The
+        others are faster but stricter, e.g., with respect to NaN values.
+    cache: DiskCache, optional
+        Local disk cache to read remote files through. Ignored for the
+        local file system. Defaults to ``None``.
+
+    Raises
+    ------
+    TypeError
+        If `path` is not a string, `chunk_size` is not a float, or if
+        `storage_kws` is not a dictionary.
+    ValueError
+        If `storage` is not among the currently supported file-system
+        schemes, `mode` not among the supported file-mode options, the
+        `chunk_size` is smaller than 1 (MiB), if `storage_kws` is not
+        a dictionary, or if `backend` is not among the supported JSON
+        libraries.
+    ImportError
+        If the requested JSON `backend` is not installed.
+
+    See Also
+    --------
+    JsonReader
+    Storage
+    ~swak.io.NotFound
+
+    """
+
+    async def __call__(self, path: str = '') -> Yaml:
+        """Asynchronously read a specific JSON file from the file system.
+
+        If `not_found` is set to "warn" or "ignore" and the file cannot be
+        found, an empty dictionary is returned.
+
+        Parameters
+        ----------
+        path: str
+            Path (including file name) to the JSON file to read. If it starts
+            with a backslash, it will be interpreted as absolute, if not, as
+            relative to the `path` specified at instantiation. Defaults to an
+            empty string, which results in an unchanged `path`.
+
+        Returns
+        -------
+        dict
+            The parsed contents of the JSON file.
+
+        Raises
+        ------
+        ValueError
+            If the final path is directly under root (e.g., "/file.json")
+            because, on local file system, this is not where you want to save
+            to and, on object storage, the first directory refers to the name
+            of an (existing!) bucket.
+
+        """
+        uri = self._non_root(path)
+        try:
+            async with self._managed(uri, _compression(self.gzip)) as file:
+                obj = self.loads(file.read(), **self.json_kws)
         except FileNotFoundError as error:
             match self.not_found:
                 case NotFound.WARN:
@@ -253,3 +491,305 @@ class JsonReader(Reader):
                 case _:
                     raise error
         return obj
+
+
+class JsonLinesWriter(Writer):
+    """Stream records to a (compressed) JSON Lines file on any file system.
+
+    Records are serialized one at a time and written to a buffered file
+    handle, such that arbitrarily many of them can be written from an
+    iterator (or generator) in bounded memory.
+
+    Parameters
+    ----------
+    path: str
+        The absolute path to the JSON Lines file to save the records into.
+        May include two or more forward slashes (subdirectories will be
+        created) and string placeholders (i.e., pairs of curly brackets)
+        that will be interpolated when instances are called.
+    storage: str, optional
+        The type of file system to write to ("file", "s3", etc.).
+        Defaults to "file". Use the :class:`Storage` enum to avoid typos.
+    overwrite: bool, optional
+        Whether to silently overwrite the destination file. Defaults to
+        ``False``, which will raise an exception if it already exists.
+    skip: bool, optional
+        Whether to silently do nothing if the target file already exists.
+        Defaults to ``False``.
+    chunk_size: int, optional
+        Chunk size to use when writing to the selected file system in MiB.
+        Defaults to 32 (MiB).
+    storage_kws: dict, optional
+        Passed on as keywords to the constructor of the file system.
+    json_kws: dict, optional
+        Passed on as keyword arguments to the serialization function of the
+        JSON `backend`, e.g., to :func:`dumps` of python's own :mod:`json`
+        module (see the `json documentation <https://docs.python.org/3/
+        library/json.html>`_ for options) or to :func:`orjson.dumps`. Must
+        not result in line breaks within records!
+    gzip: bool, optional
+        Write the JSON Lines to a gzip-compressed file if ``True`` and a plain
+        text file if ``False``. If left at ``None``, which is the default,
+        the compression algorithm is inferred from the file-name suffix
+        (e.g., ".gz", ".zst", or ".lz4") and all other extensions (if any)
+        will result in plain text files.
+    backend: str, optional
+        The JSON library to serialize with. One of "orjson", "msgspec", or
+        "json". Use the :class:`JsonBackend` enum to avoid typos. Defaults
+        to ``None``, which results in python's own :mod:`json` module. The
+        others are faster but stricter, e.g., with respect to NaN values.
+    level: int, optional
+        Compression level to use if the file is compressed. Defaults to
+        ``None``, which uses the default of the respective algorithm.
+    threads: int, optional
+        Number of threads to compress with. Only honored by "zstd", where -1
+        means one thread per logical CPU core. Defaults to ``None``, which
+        compresses in the calling thread.
+
+    Raises
+    ------
+    TypeError
+        If `path` is not a string, `chunk_size` is not an integer or either
+        `storage_kws` or `json_kws` are not dictionaries.
+    ValueError
+        If `storage` is not among the currently supported file-system
+        schemes, `mode` not among the supported file-mode options, the
+        `chunk_size` is smaller than 1 (MiB), if either `storage_kws`
+        or `json_kws` are not dictionaries, or if `backend` is not among
+        the supported JSON libraries.
+    ImportError
+        If the requested JSON `backend` is not installed.
+
+    See Also
+    --------
+    Storage
+    JsonBackend
+
+    """
+
+    def __init__(
+            self,
+            path: str,
+            storage: LiteralStorage | Storage = Storage.FILE,
+            overwrite: bool = False,
+            skip: bool = False,
+            chunk_size: int = 32,
+            storage_kws: Mapping[str, Any] | None = None,
+            json_kws: Mapping[str, Any] | None = None,
+            gzip: bool | None = None,
+            backend: LiteralJsonBackend | JsonBackend | None = None,
+            level: int | None = None,
+            threads: int | None = None
+    ) -> None:
+        self.json_kws = {} if json_kws is None else dict(json_kws)
+        self.gzip = None if gzip is None else bool(gzip)
+        self.backend = json_backend(backend)
+        self.level = None if level is None else int(level)
+        self.threads = None if threads is None else int(threads)
+        super().__init__(
+            path,
+            storage,
+            overwrite,
+            skip,
+            Mode.WB,
+            chunk_size,
+            storage_kws,
+            self.json_kws,
+            self.gzip,
+            self.backend,
+            self.level,
+            self.threads
+        )
+
+    @property
+    def dumps(self) -> Callable[..., bytes]:
+        """Function serializing objects to bytes with the JSON backend."""
+        return _dumps_with(self.backend)
+
+    def __call__(self, records: Iterable[Yaml], *parts: Any) -> tuple[()]:
+        """Write records to a JSON Lines file on the given file system.
+
+        Parameters
+        ----------
+        records: Iterable
+            The records (typically dictionaries) to save, one per line.
+        *parts: str
+            Fragments that will be interpolated into the `path` given at
+            instantiation. Obviously, there must be at least as many as
+            there are placeholders in the `path`.
+
+        Returns
+        -------
+        tuple
+            An empty tuple.
+
+        Raises
+        ------
+        IndexError
+            If the `path` given at instantiation has more string placeholders
+            that there are `parts`.
+        FileExistsError
+            If the destination file already exists, `skip` is ``False`` and
+            `overwrite` is also ``False``.
+        ValueError
+            If the final path is directly under root (e.g., "/file.jsonl")
+            because, on local file system, this is not where you want to save
+            to and, on object storage, the first directory refers to the name
+            of an (existing!) bucket.
+
+        """
+        if uri := self._uri_from(*parts):
+            dumps = self.dumps
+            with self._managed(
+                    uri,
+                    _compression(self.gzip),
+                    self.level,
+                    self.threads
+            ) as file:
+                for record in records:
+                    file.write(dumps(record, **self.json_kws) + b'\n')
+        return ()
+
+
+class JsonLinesReader(Reader):
+    """Stream records from a (compressed) JSON Lines file on any file system.
+
+    The file is read in chunks of `chunk_size`, which are split into lines
+    that are parsed one at a time. Arbitrarily large files can, therefore, be
+    iterated over in bounded memory.
+
+    Parameters
+    ----------
+    path: str, optional
+        Directory under which the JSON Lines file is located or full path to
+        the JSON Lines file. Since it (or part of it) can also be provided
+        later, when the callable instance is called, it is optional here.
+        Defaults to an empty string.
+    storage: str, optional
+        The type of file system to read from ("file", "s3", etc.).
+        Defaults to "file". Use the :class:`Storage` enum to avoid typos.
+    chunk_size: float, optional
+        Chunk size to use when reading from the selected file system in MiB.
+        Defaults to 32 (MiB).
+    storage_kws: dict, optional
+        Passed on as keyword arguments to the constructor of the file system.
+    json_kws: dict, optional
+        Passed on as keyword arguments to the parsing function of the JSON
+        `backend`, e.g., to :func:`loads` of python's own :mod:`json` module.
+        See the `json documentation <https://docs.python.org/3/library/
+        json.html>`_ for options.
+    gzip: bool, optional
+        Read the JSON Lines from a gzip-compressed file if ``True`` and a
+        plain text file if ``False``. If left at ``None``, which is the
+        default, the compression algorithm is inferred from the file-name
+        suffix (e.g., ".gz", ".zst", or ".lz4") and all other extensions
+        (if any) are assumed to be plain text files.
+    backend: str, optional
+        The JSON library to parse raw bytes with. One of "orjson", "msgspec",
+        or "json". Use the :class:`JsonBackend` enum to avoid typos. Defaults
+        to ``None``, which results in python's own :mod:`json` module. The
+        others are faster but stricter, e.g., with respect to NaN values.
+    cache: DiskCache, optional
+        Local disk cache to read remote files through. Ignored for the
+        local file system. Defaults to ``None``.
+
+    Raises
+    ------
+    TypeError
+        If `path` is not a string, `chunk_size` is not a float, or if
+        `storage_kws` is not a dictionary.
+    ValueError
+        If `storage` is not among the currently supported file-system
+        schemes, `mode` not among the supported file-mode options, the
+        `chunk_size` is smaller than 1 (MiB), if `storage_kws` is not
+        a dictionary, or if `backend` is not among the supported JSON
+        libraries.
+    ImportError
+        If the requested JSON `backend` is not installed.
+
+    See Also
+    --------
+    Storage
+    JsonBackend
+
+    """
+
+    def __init__(
+            self,
+            path: str = '',
+            storage: LiteralStorage | Storage = Storage.FILE,
+            chunk_size: int = 32,
+            storage_kws: Mapping[str, Any] | None = None,
+            json_kws: Mapping[str, Any] | None = None,
+            gzip: bool | None = None,
+            backend: LiteralJsonBackend | JsonBackend | None = None,
+            cache: DiskCache | None = None
+    ) -> None:
+        self.json_kws = {} if json_kws is None else dict(json_kws)
+        self.gzip = None if gzip is None else bool(gzip)
+        self.backend = json_backend(backend)
+        super().__init__(
+            path,
+            storage,
+            Mode.RB,
+            chunk_size,
+            storage_kws,
+            self.json_kws,
+            self.gzip,
+            self.backend,
+            cache=cache
+        )
+
+    @property
+    def loads(self) -> Callable[..., Any]:
+        """Function parsing raw bytes with the JSON backend."""
+        return _loads_with(self.backend)
+
+    def _records(
+            self,
+            uri: str,
+            compression: str | None
+    ) -> Iterator[Yaml]:
+        """Parse the lines of an open file chunk by chunk."""
+        loads = self.loads
+        tail = b''
+        with self._managed(uri, compression) as file:
+            while chunk := file.read(self.chunk_bytes):
+                lines = (tail + chunk).split(b'\n')
+                tail = lines.pop()
+                for line in lines:
+                    if line.strip():
+                        yield loads(line, **self.json_kws)
+        if tail.strip():
+            yield loads(tail, **self.json_kws)
+
+    def __call__(self, path: str = '') -> Iterator[Yaml]:
+        """Iterate over the records of a JSON Lines file on the file system.
+
+        The file is opened only once iteration starts and is closed again
+        when it is exhausted (or when the iterator is garbage-collected).
+
+        Parameters
+        ----------
+        path: str
+            Path (including file name) to the JSON Lines file to read. If it
+            starts with a backslash, it will be interpreted as absolute, if
+            not, as relative to the `path` specified at instantiation.
+            Defaults to an empty string, which results in an unchanged `path`.
+
+        Returns
+        -------
+        Iterator
+            The parsed records, one per (non-empty) line.
+
+        Raises
+        ------
+        ValueError
+            If the final path is directly under root (e.g., "/file.jsonl")
+            because, on local file system, this is not where you want to save
+            to and, on object storage, the first directory refers to the name
+            of an (existing!) bucket.
+
+        """
+        uri = self._non_root(path)
+        return self._records(uri, _compression(self.gzip))
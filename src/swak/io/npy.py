@@ -0,0 +1,237 @@
+from typing import Any
+from collections.abc import Mapping
+import numpy as np
+from .types import LiteralStorage, Storage, Mode
+from .writer import Writer
+from .reader import Reader
+from .cache import DiskCache
+
+
+class Array2Npy(Writer):
+    """Save a numpy array (or a dictionary of arrays) to any file system.
+
+    Single arrays are saved in numpy's own ".npy" format. Dictionaries of
+    arrays are saved as (optionally compressed) ".npz" archives with one
+    member per key. Pickling of object arrays is never allowed.
+
+    Parameters
+    ----------
+    path: str
+        The absolute path to the file to save the array(s) into.
+        May include two or more forward slashes (subdirectories will be
+        created) and string placeholders (i.e., pairs of curly brackets)
+        that will be interpolated when instances are called.
+    storage: str, optional
+        The type of file system to write to ("file", "s3", etc.).
+        Defaults to "file". Use the :class:`Storage` enum to avoid typos.
+    overwrite: bool, optional
+        Whether to silently overwrite the destination file. Defaults to
+        ``False``, which will raise an exception if it already exists.
+    skip: bool, optional
+        Whether to silently do nothing if the target file already exists.
+        Defaults to ``False``.
+    chunk_size: int, optional
+        Chunk size to use when writing to the selected file system in MiB.
+        Defaults to 32 (MiB).
+    storage_kws: dict, optional
+        Passed on as keywords to the constructor of the file system.
+    compress: bool, optional
+        Whether to compress ".npz" archives when saving dictionaries of
+        arrays. Has no effect on single arrays. Defaults to ``False``.
+
+    Raises
+    ------
+    TypeError
+        If `path` is not a string, `chunk_size` is not an integer or
+        `storage_kws` is not a dictionary.
+    ValueError
+        If `storage` is not among the currently supported file-system
+        schemes, `mode` not among the supported file-mode options, the
+        `chunk_size` is smaller than 1 (MiB), or if `storage_kws` is not
+        a dictionary.
+
+    See Also
+    --------
+    Storage
+
+    """
+
+    def __init__(
+            self,
+            path: str,
+            storage: LiteralStorage | Storage = Storage.FILE,
+            overwrite: bool = False,
+            skip: bool = False,
+            chunk_size: int = 32,
+            storage_kws: Mapping[str, Any] | None = None,
+            compress: bool = False
+    ) -> None:
+        self.compress = bool(compress)
+        super().__init__(
+            path,
+            storage,
+            overwrite,
+            skip,
+            Mode.WB,
+            chunk_size,
+            storage_kws,
+            self.compress
+        )
+
+    def __call__(
+            self,
+            array: np.ndarray | Mapping[str, np.ndarray],
+            *parts: Any
+    ) -> tuple[()]:
+        """Write a numpy array or a dictionary thereof to file.
+
+        Parameters
+        ----------
+        array: ndarray or dict
+            The numpy array or the dictionary of numpy arrays to save.
+        *parts: str
+            Fragments that will be interpolated into the `path` given at
+            instantiation. Obviously, there must be at least as many as
+            there are placeholders in the `path`.
+
+        Returns
+        -------
+        tuple
+            An empty tuple.
+
+        Raises
+        ------
+        IndexError
+            If the `path` given at instantiation has more string placeholders
+            that there are `parts`.
+        FileExistsError
+            If the destination file already exists, `skip` is ``False`` and
+            `overwrite` is also ``False``.
+        ValueError
+            If the final path is directly under root (e.g., "/file.npy")
+            because, on local file system, this is not where you want to save
+            to and, on object storage, the first directory refers to the name
+            of an (existing!) bucket.
+
+        """
+        if uri := self._uri_from(*parts):
+            with self._managed(uri) as file:
+                if isinstance(array, Mapping):
+                    save = np.savez_compressed if self.compress else np.savez
+                    save(file, allow_pickle=False, **array)
+                else:
+                    np.save(file, array, allow_pickle=False)
+        return ()
+
+
+class Npy2Array(Reader):
+    """Read a numpy array (or a dictionary of arrays) from any file system.
+
+    Files in numpy's ".npy" format are returned as a single array, ".npz"
+    archives as a dictionary of arrays with one entry per member. Pickled
+    object arrays are never loaded.
+
+    Parameters
+    ----------
+    path: str, optional
+        Directory under which the file is located or full path to the file.
+        Since it (or part of it) can also be provided later, when the callable
+        instance is called, it is optional here. Defaults to an empty string.
+    storage: str, optional
+        The type of file system to read from ("file", "s3", etc.).
+        Defaults to "file". Use the :class:`Storage` enum to avoid typos.
+    chunk_size: float, optional
+        Chunk size to use when reading from the selected file system in MiB.
+        Defaults to 32 (MiB).
+    storage_kws: dict, optional
+        Passed on as keyword arguments to the constructor of the file system.
+    memory_map: bool, optional
+        Whether to memory-map ".npy" files on the local file system (or in
+        the local disk `cache`) instead of reading them into memory. The
+        returned array is then read-only and its pages are loaded on demand
+        from the operating system's page cache, which is shared between
+        processes. Has no effect on ".npz" archives or on remote files that
+        are not cached. Defaults to ``False``.
+    cache: DiskCache, optional
+        Local disk cache to read remote files through. Ignored for the
+        local file system. Defaults to ``None``.
+
+    Raises
+    ------
+    TypeError
+        If `path` is not a string, `chunk_size` is not an integer or
+        `storage_kws` is not a dictionary.
+    ValueError
+        If `storage` is not among the currently supported file-system
+        schemes, `mode` not among the supported file-mode options, the
+        `chunk_size` is smaller than 1 (MiB), or if `storage_kws` is not
+        a dictionary.
+
+    See Also
+    --------
+    Storage
+
+    """
+
+    def __init__(
+            self,
+            path: str = '',
+            storage: LiteralStorage | Storage = Storage.FILE,
+            chunk_size: int = 32,
+            storage_kws: Mapping[str, Any] | None = None,
+            memory_map: bool = False,
+            cache: DiskCache | None = None
+    ) -> None:
+        self.memory_map = bool(memory_map)
+        super().__init__(
+            path,
+            storage,
+            Mode.RB,
+            chunk_size,
+            storage_kws,
+            self.memory_map,
+            cache=cache
+        )
+
+    @staticmethod
+    def _materialized(
+            loaded: np.ndarray | np.lib.npyio.NpzFile
+    ) -> np.ndarray | dict[str, np.ndarray]:
+        """Read all members of an ".npz" archive into a dictionary."""
+        if isinstance(loaded, np.lib.npyio.NpzFile):
+            with loaded:
+                return {key: loaded[key] for key in loaded.files}
+        return loaded
+
+    def __call__(self, path: str = '') -> np.ndarray | dict[str, np.ndarray]:
+        """Read a specific ".npy" or ".npz" file from the file system.
+
+        Parameters
+        ----------
+        path: str
+            Path (including file name) to the file to read. If it starts
+            with a backslash, it will be interpreted as absolute, if not,
+            as relative to the `path` specified at instantiation. Defaults
+            to an empty string, which results in an unchanged `path`.
+
+        Returns
+        -------
+        ndarray or dict
+            A single numpy array or a dictionary of numpy arrays.
+
+        Raises
+        ------
+        ValueError
+            If the final path is directly under root (e.g., "/file.npy")
+            because, on local file system, this is not where you want to save
+            to and, on object storage, the first directory refers to the name
+            of an (existing!) bucket.
+
+        """
+        uri = self._non_root(path)
+        if self.memory_map and (local := self._local(uri)):
+            loaded = np.load(local, mmap_mode='r', allow_pickle=False)
+            return self._materialized(loaded)
+        with self._managed(uri) as file:
+            loaded = np.load(file, allow_pickle=False)
+            return self._materialized(loaded)
@@ -1,5 +1,9 @@
+import asyncio
 from typing import Any
-from collections.abc import Mapping, Callable
+from collections.abc import Mapping, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+from pathlib import PurePosixPath
 from io import BytesIO
 from pandas import DataFrame as Pandas
 from polars import DataFrame as Polars
@@ -8,6 +12,8 @@ import polars as pl
 from .types import Bears, LiteralBears, LiteralStorage, Storage, Mode
 from .writer import Writer
 from .reader import Reader
+from .cache import DiskCache
+from .aio import AsyncWriter, AsyncReader
 
 
 class DataFrame2Parquet(Writer):
@@ -153,6 +159,15 @@ class Parquet2DataFrame(Reader):
     bear: str, optional
         Type of dataframe to return. Can be one of "pandas" or "polars". Use
         the :class:`Bears` enum to avoid typos. Defaults to "pandas".
+    memory_map: bool, optional
+        Whether to memory-map parquet files on the local file system (or in
+        the local disk `cache`) instead of reading them through a buffered
+        file handle. Pages are then loaded on demand from the operating
+        system's page cache, which is shared between processes. Has no
+        effect on remote files that are not cached. Defaults to ``False``.
+    cache: DiskCache, optional
+        Local disk cache to read remote files through. Ignored for the
+        local file system. Defaults to ``None``.
 
     Raises
     ------
@@ -179,10 +194,13 @@ class Parquet2DataFrame(Reader):
             chunk_size: int = 32,
             storage_kws: Mapping[str, Any] | None = None,
             parquet_kws: Mapping[str, Any] | None = None,
-            bear: LiteralBears | Bears = Bears.PANDAS
+            bear: LiteralBears | Bears = Bears.PANDAS,
+            memory_map: bool = False,
+            cache: DiskCache | None = None
     ) -> None:
         self.parquet_kws = {} if parquet_kws is None else dict(parquet_kws)
         self.bear = str(Bears(bear))
+        self.memory_map = bool(memory_map)
         super().__init__(
             path,
             storage,
@@ -190,7 +208,9 @@ class Parquet2DataFrame(Reader):
             chunk_size,
             storage_kws,
             self.parquet_kws,
-            self.bear
+            self.bear,
+            self.memory_map,
+            cache=cache
         )
 
     @property
@@ -227,6 +247,449 @@ class Parquet2DataFrame(Reader):
 
         """
         uri = self._non_root(path)
+        if self.memory_map and (local := self._local(uri)):
+            return self.read(local, memory_map=True, **self.parquet_kws)
         with self._managed(uri) as file:
             df = self.read(file, **self.parquet_kws)
         return df
+
+
+class DataFrame2PartitionedParquet(Writer):
+    """Save a pandas or polars dataframe as a hive-partitioned parquet dataset.
+
+    The dataframe is split by the distinct values of the `partition_by`
+    columns (and, optionally, into chunks of at most `max_rows` rows) in a
+    single pass. Each part is written to its own file under nested
+    "column=value" directories, concurrently and with the same atomic
+    temporary-file-then-move semantics as all other writers. Existing files
+    are looked up by listing each partition directory once, and only missing
+    partition directories are created.
+
+    Parameters
+    ----------
+    path: str
+        The absolute path to the root directory of the dataset. May include
+        two or more forward slashes (subdirectories will be created) and string
+        placeholders (i.e., pairs of curly brackets) that will be interpolated
+        when instances are called.
+    partition_by: str or iterable of str
+        Name(s) of the column(s) to partition the dataframe by. The values of
+        these columns are encoded in the directory names and are, therefore,
+        not stored in the parquet files themselves.
+    storage: str, optional
+        The type of file system to write to ("file", "s3", etc.).
+        Defaults to "file". Use the :class:`Storage` enum to avoid typos.
+    overwrite: bool, optional
+        Whether to silently overwrite existing files. Once all new files are
+        written, files left over from earlier writes in the partitions that
+        were written to are also removed. Defaults to ``False``, which will
+        raise an exception if any of them already exists.
+    skip: bool, optional
+        Whether to silently not write files that already exist.
+        Defaults to ``False``.
+    max_rows: int, optional
+        Maximum number of rows per file. Partitions with more rows are split
+        into several files. Defaults to ``None``, which results in exactly
+        one file per partition.
+    max_workers: int, optional
+        Maximum number of files to write concurrently. Defaults to 16.
+    chunk_size: int, optional
+        Chunk size to use when writing to the selected file system in MiB.
+        Defaults to 32 (MiB).
+    storage_kws: dict, optional
+        Passed on as keywords to the constructor of the file system.
+    parquet_kws: dict, optional
+        Passed on as keyword arguments to the `write_parquet <https://docs.
+        pola.rs/api/python/stable/reference/api/polars.DataFrame.
+        write_parquet.html>`_ method of polars dataframes.
+
+    Raises
+    ------
+    TypeError
+        If `path` is not a string, `partition_by` is not a (sequence of)
+        string(s), `max_rows` or `max_workers` are not integers, `chunk_size`
+        is not an integer, or either `storage_kws` or `parquet_kws` are not
+        dictionaries.
+    ValueError
+        If `storage` is not among the currently supported file-system
+        schemes, `mode` not among the supported file-mode options, the
+        `chunk_size` is smaller than 1 (MiB), `max_rows` or `max_workers`
+        are smaller than 1, or if either `storage_kws` or `parquet_kws` are
+        not dictionaries.
+
+    See Also
+    --------
+    DataFrame2Parquet
+    Storage
+
+    Note
+    ----
+    Pandas dataframes are converted to polars before writing and their index
+    is dropped. Partitions that do not appear in the dataframe are always
+    left untouched.
+
+    """
+
+    def __init__(
+            self,
+            path: str,
+            partition_by: str | Iterable[str],
+            storage: LiteralStorage | Storage = Storage.FILE,
+            overwrite: bool = False,
+            skip: bool = False,
+            max_rows: int | None = None,
+            max_workers: int = 16,
+            chunk_size: int = 32,
+            storage_kws: Mapping[str, Any] | None = None,
+            parquet_kws: Mapping[str, Any] | None = None
+    ) -> None:
+        self.partition_by = self.__columns(partition_by)
+        self.max_rows = self.__positive(max_rows, 'max_rows', True)
+        self.max_workers = self.__positive(max_workers, 'max_workers')
+        self.parquet_kws = {} if parquet_kws is None else dict(parquet_kws)
+        super().__init__(
+            path,
+            storage,
+            overwrite,
+            skip,
+            Mode.WB,
+            chunk_size,
+            storage_kws,
+            self.partition_by,
+            self.max_rows,
+            self.max_workers,
+            self.parquet_kws
+        )
+
+    @staticmethod
+    def __columns(partition_by: Any) -> tuple[str, ...]:
+        """Try to convert partition_by into a tuple of column names."""
+        if isinstance(partition_by, str):
+            return (partition_by,)
+        try:
+            columns = tuple(partition_by)
+        except TypeError as error:
+            cls = type(partition_by).__name__
+            msg = '"partition_by" must be a string or an iterable, not {}!'
+            raise TypeError(msg.format(cls)) from error
+        for column in columns:
+            if not isinstance(column, str):
+                cls = type(column).__name__
+                msg = 'Columns to partition by must be strings, not {}!'
+                raise TypeError(msg.format(cls))
+        return columns
+
+    @staticmethod
+    def __positive(value: Any, name: str, optional: bool = False) -> int:
+        """Try to convert value into a strictly positive integer."""
+        if optional and value is None:
+            return value
+        try:
+            as_int = int(value)
+        except (TypeError, ValueError) as error:
+            cls = type(value).__name__
+            tmp = '"{}" must at least be convertible to an int, unlike {}!'
+            msg = tmp.format(name, cls)
+            raise TypeError(msg) from error
+        if as_int < 1:
+            tmp = '"{}" must be greater than (or equal to) one, unlike {}!'
+            msg = tmp.format(name, as_int)
+            raise ValueError(msg)
+        return as_int
+
+    @staticmethod
+    def _directory(column: str, value: Any) -> str:
+        """Hive-style directory name for one partition value."""
+        if value is None:
+            return f'{column}=__HIVE_DEFAULT_PARTITION__'
+        return f'{column}={quote(str(value), safe="")}'
+
+    def _split(
+            self,
+            df: Polars,
+            root: PurePosixPath
+    ) -> dict[str, Polars]:
+        """Map the full path of each file to write onto its content."""
+        if self.partition_by:
+            partitions = df.partition_by(
+                self.partition_by,
+                maintain_order=True,
+                include_key=False,
+                as_dict=True
+            )
+        else:
+            partitions = {(): df}
+        files = {}
+        for values, partition in partitions.items():
+            directory = root.joinpath(*(
+                self._directory(column, value)
+                for column, value in zip(self.partition_by, values)
+            ))
+            if self.max_rows is None:
+                chunks = [partition]
+            else:
+                chunks = partition.iter_slices(self.max_rows)
+            for index, chunk in enumerate(chunks):
+                files[str(directory / f'part-{index:05d}.parquet')] = chunk
+        return files
+
+    def _write(self, uri: str, df: Polars) -> str:
+        """Atomically write a single file of the dataset."""
+        with self._managed(uri) as file:
+            df.write_parquet(file, **self.parquet_kws)
+        return uri
+
+    def __call__(self, df: Pandas | Polars, *parts: Any) -> list[str]:
+        """Write a pandas or polars dataframe as a partitioned dataset.
+
+        Parameters
+        ----------
+        df: DataFrame
+            The pandas or polars dataframe to save.
+        *parts: str
+            Fragments that will be interpolated into the `path` given at
+            instantiation. Obviously, there must be at least as many as
+            there are placeholders in the `path`.
+
+        Returns
+        -------
+        list
+            The manifest, i.e., the full paths of all files actually written,
+            in the order in which the partitions first appear in `df`.
+
+        Raises
+        ------
+        IndexError
+            If the `path` given at instantiation has more string placeholders
+            that there are `parts`.
+        FileExistsError
+            If any of the destination files already exists, `skip` is
+            ``False`` and `overwrite` is also ``False``. Nothing is written
+            in this case.
+        ValueError
+            If the final path is directly under root (e.g., "/dataset")
+            because, on local file system, this is not where you want to save
+            to and, on object storage, the first directory refers to the name
+            of an (existing!) bucket.
+
+        """
+        root = self._non_root_from(*parts)
+        df = df if isinstance(df, Polars) else pl.from_pandas(df)
+        files = self._split(df, root)
+        directories = sorted({str(PurePosixPath(uri).parent) for uri in files})
+        with ThreadPoolExecutor(self.max_workers) as executor:
+            listings = executor.map(self._ls, directories)
+            listed = dict(zip(directories, listings))
+        existing = set().union(*(
+            listing for listing in listed.values()
+            if listing is not None
+        ))
+        clashes = [uri for uri in files if uri in existing]
+        if clashes and self.skip:
+            for uri in clashes:
+                del files[uri]
+        elif clashes and not self.overwrite:
+            msg = f'File "{clashes[0]}" already exists!'
+            raise FileExistsError(msg)
+        for directory, listing in listed.items():
+            if listing is None:
+                self.fs.makedirs(directory, exist_ok=True)
+        parents = {str(PurePosixPath(uri).parent) for uri in files}
+        with ThreadPoolExecutor(self.max_workers) as executor:
+            futures = [
+                executor.submit(self._write, uri, chunk)
+                for uri, chunk in files.items()
+            ]
+            written = [future.result() for future in futures]
+        # Partitions written to must not keep parts of earlier writes.
+        if self.overwrite and not self.skip:
+            stale = [
+                uri for uri in existing
+                if uri not in files
+                and str(PurePosixPath(uri).parent) in parents
+            ]
+            if stale:
+                self.fs.rm(stale)
+        return written
+
+
+class AsyncDataFrame2Parquet(DataFrame2Parquet, AsyncWriter):
+    """Asynchronously save a pandas or polars dataframe to any file system.
+
+    Parameters
+    ----------
+    path: str
+        The absolute path to the parquet file to save the dataframe into.
+        May include two or more forward slashes (subdirectories will be
+        created) and string placeholders (i.e., pairs of curly brackets)
+        that will be interpolated when instances are called.
+    storage: str, optional
+        The type of file system to write to ("file", "s3", etc.).
+        Defaults to "file". Use the :class:`Storage` enum to avoid typos.
+    overwrite: bool, optional
+        Whether to silently overwrite the destination file. Defaults to
+        ``False``, which will raise an exception if it already exists.
+    skip: bool, optional
+        Whether to silently do nothing if the target file already exists.
+        Defaults to ``False``.
+    chunk_size: int, optional
+        Chunk size to use when writing to the selected file system in MiB.
+        Defaults to 32 (MiB).
+    storage_kws: dict, optional
+        Passed on as keywords to the constructor of the file system.
+    parquet_kws: dict, optional
+        Passed on as keyword arguments to the dataframe's write method. See
+        the documentation for `to_parquet <https://pandas.pydata.org/
+        pandas-docs/stable/reference/api/pandas.DataFrame.to_parquet.html>`_
+        and `write_parquet <https://docs.pola.rs/api/python/stable/reference/
+        api/polars.DataFrame.write_parquet.html>`_ methods.
+
+    Raises
+    ------
+    TypeError
+        If `path` is not a string, `chunk_size` is not an integer or either
+        `storage_kws` or `parquet_kws` are not dictionaries.
+    ValueError
+        If `storage` is not among the currently supported file-system
+        schemes, `mode` not among the supported file-mode options, the
+        `chunk_size` is smaller than 1 (MiB), or if either `storage_kws`
+        or `parquet_kws` are not dictionaries.
+
+    See Also
+    --------
+    DataFrame2Parquet
+    Storage
+
+    """
+
+    async def __call__(self, df: Pandas | Polars, *parts: Any) -> tuple[()]:
+        """Asynchronously write a pandas or polars dataframe to file.
+
+        Parameters
+        ----------
+        df: DataFrame
+            The pandas or polars dataframe to save.
+        *parts: str
+            Fragments that will be interpolated into the `path` given at
+            instantiation. Obviously, there must be at least as many as
+            there are placeholders in the `path`.
+
+        Returns
+        -------
+        tuple
+            An empty tuple.
+
+        Raises
+        ------
+        IndexError
+            If the `path` given at instantiation has more string placeholders
+            that there are `parts`.
+        FileExistsError
+            If the destination file already exists, `skip` is ``False`` and
+            `overwrite` is also ``False``.
+        ValueError
+            If the final path is directly under root (e.g., "/file.parquet")
+            because, on local file system, this is not where you want to save
+            to and, on object storage, the first directory refers to the name
+            of an (existing!) bucket.
+
+        """
+        writer = 'to_parquet' if hasattr(df, 'to_parquet') else 'write_parquet'
+        if uri := await self._uri_from(*parts):
+            async with self._managed(uri) as file:
+                getattr(df, writer)(file, **self.parquet_kws)
+        return ()
+
+
+class AsyncParquet2DataFrame(Parquet2DataFrame, AsyncReader):
+    """Asynchronously read a parquet file into a pandas or polars dataframe.
+
+    Parameters
+    ----------
+    path: str, optional
+        Directory under which the parquet file is located or full path to the
+        parquet file. Since it (or part of it) can also be provided later,
+        when the callable instance is called, it is optional here.
+        Defaults to an empty string.
+    storage: str, optional
+        The type of file system to read from ("file", "s3", etc.).
+        Defaults to "file". Use the :class:`Storage` enum to avoid typos.
+    chunk_size: float, optional
+        Chunk size to use when reading from the selected file system in MiB.
+        Defaults to 32 (MiB).
+    storage_kws: dict, optional
+        Passed on as keyword arguments to the constructor of the file system.
+    parquet_kws: dict, optional
+        Passed on as keyword arguments to the dataframe's read method. See
+        the documentation for `pandas.read_parquet <https://pandas.pydata.org/
+        pandas-docs/stable/reference/api/pandas.read_parquet.html>`_
+        and `polars.read_parquet <https://docs.pola.rs/api/python/stable/
+        reference/api/polars.read_parquet.html>`_ top-level functions.
+    bear: str, optional
+        Type of dataframe to return. Can be one of "pandas" or "polars". Use
+        the :class:`Bears` enum to avoid typos. Defaults to "pandas".
+    memory_map: bool, optional
+        Whether to memory-map parquet files on the local file system (or in
+        the local disk `cache`) instead of reading them through a buffered
+        file handle. Pages are then loaded on demand from the operating
+        system's page cache, which is shared between processes. Has no
+        effect on remote files that are not cached. Defaults to ``False``.
+    cache: DiskCache, optional
+        Local disk cache to read remote files through. Ignored for the
+        local file system. Defaults to ``None``.
+
+    Raises
+    ------
+    TypeError
+        If `path` is not a string, `chunk_size` is not an integer or either
+        `storage_kws` or `parquet_kws` are not dictionaries.
+    ValueError
+        If `storage` is not among the currently supported file-system
+        schemes, `mode` not among the supported file-mode options, the
+        `chunk_size` is smaller than 1 (MiB), or if `storage_kws` is not
+        a dictionary.
+
+    See Also
+    --------
+    Parquet2DataFrame
+    Storage
+    Bears
+
+    """
+
+    async def __call__(self, path: str = '') -> Pandas | Polars:
+        """Asynchronously read a specific parquet file from the file system.
+
+        Parameters
+        ----------
+        path: str
+            Path (including file name) to the parquet file to read. If it
+            starts with a backslash, it will be interpreted as absolute,
+            if not, as relative to the `path` specified at instantiation.
+            Defaults to an empty string, which results in an unchanged `path`.
+
+        Returns
+        -------
+        DataFrame
+            Pandas or polars dataframe.
+
+        Raises
+        ------
+        ValueError
+            If the final path is directly under root (e.g., "/file.parquet")
+            because, on local file system, this is not where you want to save
+            to and, on object storage, the first directory refers to the name
+            of an (existing!) bucket.
+
+        """
+        uri = self._non_root(path)
+        if self.memory_map and (local := await self._local(uri)):
+            return await asyncio.to_thread(
+                self.read,
+                local,
+                memory_map=True,
+                **self.parquet_kws
+            )
+        async with self._managed(uri) as file:
+            df = self.read(file, **self.parquet_kws)
+        return df
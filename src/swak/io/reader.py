@@ -1,11 +1,14 @@
+import os
 import fsspec
-from collections.abc import Generator, Mapping
+from bisect import bisect_right
+from collections.abc import Generator, Mapping, Iterable
 from typing import Any, IO
 from functools import cached_property
 from contextlib import contextmanager
 from fsspec.spec import AbstractFileSystem
 from pathlib import PurePosixPath
 from ..misc import ArgRepr
+from .cache import DiskCache
 from .types import (
     LiteralStorage,
     Storage,
@@ -14,6 +17,7 @@ from .types import (
     LiteralCompression,
     Compression
 )
+from .codec import resolve_compression, compressed
 
 
 class Reader(ArgRepr):
@@ -39,6 +43,10 @@ class Reader(ArgRepr):
     *args
         Additional arguments are reflected in the representation of instances
         but do not affect functionality in any way.
+    cache: DiskCache, optional
+        Local disk cache to read remote files through. Ignored for the
+        local file system. Defaults to ``None``, which reads files directly
+        from the selected file system.
     **kwargs
         Additional keyword arguments are reflected in the representation of
         instances but do not affect functionality in any way.
@@ -46,8 +54,9 @@ class Reader(ArgRepr):
     Raises
     ------
     TypeError
-        If `path` is not a string, `chunk_size` is not a float, or if
-        `storage_kws` is not a dictionary.
+        If `path` is not a string, `chunk_size` is not a float, if
+        `storage_kws` is not a dictionary, or if `cache` is not a
+        :class:`DiskCache`.
     ValueError
         If `storage` is not among the currently supported file-system
         schemes, `mode` not among the supported file-mode options, the
@@ -58,6 +67,7 @@ class Reader(ArgRepr):
     --------
     Storage
     Mode
+    DiskCache
 
     """
 
@@ -69,6 +79,7 @@ class Reader(ArgRepr):
             chunk_size: int = 32,
             storage_kws: Mapping[str, Any] | None = None,
             *args: Any,
+            cache: DiskCache | None = None,
             **kwargs: Any
     ) -> None:
         self.path = self.__strip(path)
@@ -76,6 +87,7 @@ class Reader(ArgRepr):
         self.mode = str(Mode(mode))
         self.chunk_size = self.__valid(chunk_size)
         self.storage_kws = {} if storage_kws is None else dict(storage_kws)
+        self.cache = self.__cache(cache)
         super().__init__(
             self.path,
             self.storage,
@@ -108,6 +120,20 @@ class Reader(ArgRepr):
             raise TypeError(msg.format(cls)) from error
         return stripped
 
+    @staticmethod
+    def __cache(cache: Any) -> DiskCache | None:
+        """Make sure that cache is either None or a DiskCache."""
+        if cache is None or isinstance(cache, DiskCache):
+            return cache
+        cls = type(cache).__name__
+        msg = '"cache" must be None or a DiskCache, not {}!'
+        raise TypeError(msg.format(cls))
+
+    @property
+    def cached(self) -> bool:
+        """Whether files are read through the local disk cache."""
+        return self.cache is not None and self.storage != Storage.FILE
+
     @staticmethod
     def __valid(chunk_size: Any) -> float:
         """Try to convert chunk_size to a meaningful float."""
@@ -128,18 +154,45 @@ class Reader(ArgRepr):
     def _managed(
             self,
             uri: str,
-            compression: LiteralCompression | Compression | None = None
+            compression: LiteralCompression | Compression | str | None = None
     ) -> Generator[IO]:
         """Context manager for atomic reads from the given file system."""
-        if compression is not None:
-            compression = str(Compression(compression))
-        with self.fs.open(
-                uri,
-                self.mode,
-                self.chunk_bytes,
-                compression=compression
-        ) as file:
-            yield file
+        compression = resolve_compression(uri, compression)
+        if self.cached:
+            fs = fsspec.filesystem(Storage.FILE)
+            uri = self.cache.fetch(self.fs, uri)
+        else:
+            fs = self.fs
+        if compression is None:
+            with fs.open(
+                    uri,
+                    self.mode,
+                    self.chunk_bytes,
+                    compression=compression
+            ) as file:
+                yield file
+        else:
+            with (
+                fs.open(uri, Mode.RB, self.chunk_bytes) as raw,
+                compressed(raw, compression, self.mode) as file
+            ):
+                yield file
+
+    def _local(self, uri: str) -> str:
+        """Path to a local copy of the file to memory-map, if there is one."""
+        if self.storage == Storage.FILE:
+            return uri
+        if self.cached:
+            return self.cache.fetch(self.fs, uri)
+        return ''
+
+    def _cached(self, uri: str) -> str:
+        """Path to a local copy of the file only if it need not be fetched."""
+        if self.storage == Storage.FILE:
+            return uri
+        if self.cached:
+            return self.cache.lookup(self.fs, uri)
+        return ''
 
     def _non_root(self, path: str = '') -> str:
         """Append/replace the path given at instantiation on instance call."""
@@ -148,3 +201,164 @@ class Reader(ArgRepr):
             msg = 'Path "{}" must not point to the root directory ("/")!'
             raise ValueError(msg.format(uri))
         return uri
+
+    @staticmethod
+    def _absolute(
+            start: int | None,
+            end: int | None,
+            size: int
+    ) -> tuple[int, int]:
+        """Resolve a (negative or open) byte range against the file size."""
+        start = 0 if start is None else int(start)
+        start = max(size + start, 0) if start < 0 else min(start, size)
+        end = size if end is None else int(end)
+        end = max(size + end, 0) if end < 0 else min(end, size)
+        return start, max(start, end)
+
+    @staticmethod
+    def _coalesced(
+            ranges: Iterable[tuple[int, int]],
+            max_gap: int
+    ) -> list[tuple[int, int]]:
+        """Merge sorted byte ranges that overlap or lie close together."""
+        merged = []
+        for start, end in sorted(ranges):
+            if merged and start - merged[-1][1] <= max_gap:
+                merged[-1] = merged[-1][0], max(merged[-1][1], end)
+            else:
+                merged.append((start, end))
+        return merged
+
+    def read_range(
+            self,
+            path: str = '',
+            start: int | None = None,
+            end: int | None = None
+    ) -> bytes:
+        """Read a single range of raw bytes from a file.
+
+        Maps to a ranged HTTP request on object storage and to ``pread`` on
+        the local file system (or on a fresh copy already in the local disk
+        `cache`), such that only the requested bytes are transferred. Files
+        not yet cached are never downloaded in full just to read a range.
+
+        Parameters
+        ----------
+        path: str, optional
+            Path (including file name) to the file to read from. If it starts
+            with a backslash, it will be interpreted as absolute, if not, as
+            relative to the `path` specified at instantiation. Defaults to
+            an empty string, which results in an unchanged `path`.
+        start: int, optional
+            Offset of the first byte to read. Negative values count from the
+            end of the file. Defaults to ``None``, which starts at the
+            beginning of the file.
+        end: int, optional
+            Offset of the byte to stop reading at (exclusive). Negative values
+            count from the end of the file. Defaults to ``None``, which reads
+            to the end of the file.
+
+        Returns
+        -------
+        bytes
+            The requested bytes, i.e., ``content[start:end]``.
+
+        Raises
+        ------
+        ValueError
+            If the final path is directly under root (e.g., "/file.bin").
+
+        """
+        uri = self._non_root(path)
+        if local := self._cached(uri):
+            return self.__pread(local, [(start, end)])[0]
+        return self.fs.cat_file(uri, start, end)
+
+    def read_ranges(
+            self,
+            path: str = '',
+            ranges: Iterable[tuple[int | None, int | None]] = (),
+            max_gap: int = 64 * 1024
+    ) -> list[bytes]:
+        """Read multiple ranges of raw bytes from a file in one go.
+
+        Requested ranges that overlap or are separated by no more than
+        `max_gap` bytes are merged before fetching. On object storage, the
+        merged ranges are then requested concurrently.
+
+        Parameters
+        ----------
+        path: str, optional
+            Path (including file name) to the file to read from. If it starts
+            with a backslash, it will be interpreted as absolute, if not, as
+            relative to the `path` specified at instantiation. Defaults to
+            an empty string, which results in an unchanged `path`.
+        ranges: Iterable, optional
+            Pairs of `start` and `end` byte offsets as in :meth:`read_range`.
+            Defaults to an empty tuple.
+        max_gap: int, optional
+            Largest number of unrequested bytes between two ranges that are
+            still fetched together. Defaults to 64 KiB.
+
+        Returns
+        -------
+        list
+            The requested bytes for each range, in the order requested.
+
+        Raises
+        ------
+        ValueError
+            If the final path is directly under root (e.g., "/file.bin").
+
+        """
+        uri = self._non_root(path)
+        ranges = list(ranges)
+        if not ranges:
+            return []
+        if local := self._cached(uri):
+            return self.__pread(local, ranges, max_gap)
+        size = self.fs.size(uri)
+        absolute = [self._absolute(*pair, size) for pair in ranges]
+        merged = self._coalesced(absolute, max(int(max_gap), 0))
+        blocks = self.fs.cat_ranges(
+            [uri] * len(merged),
+            [start for start, _ in merged],
+            [end for _, end in merged],
+            on_error='raise'
+        )
+        return self.__sliced(absolute, merged, blocks)
+
+    def __pread(
+            self,
+            local: str,
+            ranges: list[tuple[int | None, int | None]],
+            max_gap: int = 0
+    ) -> list[bytes]:
+        """Read byte ranges from a local file without seeking."""
+        fd = os.open(local, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        try:
+            size = os.fstat(fd).st_size
+            absolute = [self._absolute(*pair, size) for pair in ranges]
+            merged = self._coalesced(absolute, max(int(max_gap), 0))
+            blocks = [
+                os.pread(fd, end - start, start)
+                for start, end in merged
+            ]
+        finally:
+            os.close(fd)
+        return self.__sliced(absolute, merged, blocks)
+
+    @staticmethod
+    def __sliced(
+            ranges: list[tuple[int, int]],
+            merged: list[tuple[int, int]],
+            blocks: list[bytes]
+    ) -> list[bytes]:
+        """Cut the requested ranges out of the merged blocks."""
+        offsets = [start for start, _ in merged]
+        sliced = []
+        for start, end in ranges:
+            index = bisect_right(offsets, start) - 1
+            offset = offsets[index]
+            sliced.append(blocks[index][start - offset:end - offset])
+        return sliced
@@ -5,6 +5,8 @@ import tomli_w
 import warnings
 from .writer import Writer
 from .reader import Reader
+from .cache import DiskCache
+from .aio import AsyncReader
 from .types import (
     Toml,
     LiteralStorage,
@@ -194,6 +196,9 @@ class TomlReader(Reader):
         What to do if the specified TOML file is not found. One of "ignore",
         "warn", or "raise". Defaults to "raise". Use the :class:`NotFound`
         enum to avoid typos!
+    cache: DiskCache, optional
+        Local disk cache to read remote files through. Ignored for the
+        local file system. Defaults to ``None``.
 
     Raises
     ------
@@ -220,7 +225,8 @@ class TomlReader(Reader):
             chunk_size: int = 32,
             storage_kws: Mapping[str, Any] | None = None,
             toml_kws: Mapping[str, Any] | None = None,
-            not_found: LiteralNotFound | NotFound = 'raise'
+            not_found: LiteralNotFound | NotFound = 'raise',
+            cache: DiskCache | None = None
     ) -> None:
         self.toml_kws = {} if toml_kws is None else dict(toml_kws)
         self.not_found = str(NotFound(not_found))
@@ -231,7 +237,8 @@ class TomlReader(Reader):
             chunk_size,
             storage_kws,
             self.toml_kws,
-            self.not_found
+            self.not_found,
+            cache=cache
         )
 
     def __call__(self, path: str = '') -> Toml:
@@ -277,3 +284,97 @@ class TomlReader(Reader):
                 case _:
                     raise error
         return toml
+
+
+class AsyncTomlReader(TomlReader, AsyncReader):
+    """Asynchronously read a TOML file from any supported file system.
+
+    Parameters
+    ----------
+    path: str, optional
+        Directory under which the TOML file is located or full path to the
+        TOML file. Since it (or part of it) can also be provided later,
+        when the callable instance is called, it is optional here.
+        Defaults to an empty string.
+    storage: str, optional
+        The type of file system to read from ("file", "s3", etc.).
+        Defaults to "file". Use the :class:`Storage` enum to avoid typos.
+    chunk_size: float, optional
+        Chunk size to use when reading from the selected file system in MiB.
+        Defaults to 32 (MiB).
+    storage_kws: dict, optional
+        Passed on as keyword arguments to the constructor of the file system.
+    toml_kws: dict, optional
+        Passed on as keyword arguments to the :func:`load` function of python's
+        own `tomllib <https://docs.python.org/3/library/tomllib.html>`_
+        package.
+    not_found: str, optional
+        What to do if the specified TOML file is not found. One of "ignore",
+        "warn", or "raise". Defaults to "raise". Use the :class:`NotFound`
+        enum to avoid typos!
+    cache: DiskCache, optional
+        Local disk cache to read remote files through. Ignored for the
+        local file system. Defaults to ``None``.
+
+    Raises
+    ------
+    TypeError
+        If `path` is not a string, `chunk_size` is not a float, or if
+        `storage_kws` is not a dictionary.
+    ValueError
+        If `storage` is not among the currently supported file-system
+        schemes, `mode` not among the supported file-mode options, the
+        `chunk_size` is smaller than 1 (MiB), or if `storage_kws` is not
+        a dictionary.
+
+    See Also
+    --------
+    TomlReader
+    Storage
+    ~swak.io.NotFound
+
+    """
+
+    async def __call__(self, path: str = '') -> Toml:
+        """Asynchronously read a specific TOML file from the file system.
+
+        If `not_found` is set to "warn" or "ignore" and the file cannot be
+        found, an empty dictionary is returned.
+
+        Parameters
+        ----------
+        path: str
+            Path (including file name) to the TOML file to read. If it starts
+            with a backslash, it will be interpreted as absolute, if not, as
+            relative to the `path` specified at instantiation. Defaults to an
+            empty string, which results in an unchanged `path`.
+
+        Returns
+        -------
+        dict
+            The parsed contents of the TOML file.
+
+        Raises
+        ------
+        ValueError
+            If the final path is directly under root (e.g., "/file.toml")
+            because, on local file system, this is not where you want to save
+            to and, on object storage, the first directory refers to the name
+            of an (existing!) bucket.
+
+        """
+        uri = self._non_root(path)
+        try:
+            async with self._managed(uri) as file:
+                toml = tomllib.load(file, **self.toml_kws)
+        except FileNotFoundError as error:
+            match self.not_found:
+                case NotFound.WARN:
+                    msg = 'File "{}" not found!\nReturning empty TOML.'
+                    warnings.warn(msg.format(uri))
+                    toml = {}
+                case NotFound.IGNORE:
+                    toml = {}
+                case _:
+                    raise error
+        return toml
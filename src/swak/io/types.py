@@ -4,9 +4,18 @@ from collections.abc import Mapping
 
 type LiteralMode = Literal['wb', 'wt']
 type LiteralStorage = Literal['file', 's3', 'gcs', 'memory']
-type LiteralCompression = Literal['zip', 'bz2', 'gzip', 'lzma', 'xz']
+type LiteralCompression = Literal[
+    'zip',
+    'bz2',
+    'gzip',
+    'lzma',
+    'xz',
+    'zstd',
+    'lz4'
+]
 type LiteralNotFound = Literal['ignore', 'warn', 'raise']
 type LiteralBears = Literal['pandas', 'polars']
+type LiteralJsonBackend = Literal['orjson', 'msgspec', 'json']
 type Toml = Mapping[str, Any]
 type Yaml = Mapping[str, Any] | list[Any]
 
@@ -34,6 +43,8 @@ class Compression(StrEnum):
     GZIP = 'gzip'
     LZMA = 'lzma'
     XZ = 'xz'
+    ZSTD = 'zstd'
+    LZ4 = 'lz4'
 
 
 class NotFound(StrEnum):
@@ -47,3 +58,10 @@ class Bears(StrEnum):
     """Enum to choose pandas versus polars."""
     PANDAS = 'pandas'
     POLARS = 'polars'
+
+
+class JsonBackend(StrEnum):
+    """Libraries to parse and serialize JSON with."""
+    ORJSON = 'orjson'
+    MSGSPEC = 'msgspec'
+    JSON = 'json'
@@ -1,6 +1,11 @@
 import uuid
+import posixpath
+import threading
 import fsspec
-from collections.abc import Generator, Mapping
+from collections import OrderedDict
+from contextvars import ContextVar, copy_context
+from collections.abc import Generator, Mapping, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, IO
 from functools import cached_property
 from contextlib import contextmanager
@@ -15,6 +20,109 @@ from .types import (
     LiteralCompression,
     Compression
 )
+from .codec import resolve_compression, compressed
+
+
+class _Listing:
+    """Thread-safe snapshot of the target directories of a single bulk write.
+
+    Listing the directories that files are about to be written to once
+    saves the round trips to (remote) file systems that checking every
+    single file for existence and creating its parent directory would take.
+
+    """
+
+    def __init__(self, listed: Mapping[str, set[str] | None]) -> None:
+        self.__lock = threading.Lock()
+        self.__dirs = {
+            directory for directory, files in listed.items()
+            if files is not None
+        }
+        self.__files = set().union(*(
+            files for files in listed.values()
+            if files is not None
+        ))
+        self.__listed = set(listed)
+
+    def exists(self, uri: str) -> bool | None:
+        """Whether a file exists or ``None`` if it is not known."""
+        with self.__lock:
+            if posixpath.dirname(uri) in self.__listed:
+                return uri in self.__files
+        return None
+
+    def created(self, directory: str) -> bool:
+        """Whether the given directory is known to exist."""
+        with self.__lock:
+            return directory in self.__dirs
+
+    def create(self, directory: str) -> None:
+        """Remember a directory as existing."""
+        with self.__lock:
+            self.__dirs.add(directory)
+
+    def add(self, uri: str) -> None:
+        """Remember a newly written file."""
+        with self.__lock:
+            self.__files.add(uri)
+
+
+class _Directories:
+    """Bounded, thread-safe memory of directories known to exist.
+
+    Remembering the directories that files were recently written to saves
+    repeated calls the round trip to (remote) file systems that (re-)creating
+    them would take. Should a remembered directory have been removed since,
+    writing into it fails, it is forgotten, and created again.
+
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.__lock = threading.Lock()
+        self.__dirs: OrderedDict[str, None] = OrderedDict()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Only the size is pickled, the remembered directories are not."""
+        return {'size': self.size}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore an empty memory of the pickled size."""
+        self.__init__(**state)
+
+    def __len__(self) -> int:
+        """Number of currently remembered directories."""
+        return len(self.__dirs)
+
+    def __contains__(self, directory: str) -> bool:
+        """Whether a directory is remembered, refreshing it if so."""
+        with self.__lock:
+            if directory in self.__dirs:
+                self.__dirs.move_to_end(directory)
+                return True
+        return False
+
+    def add(self, directory: str) -> None:
+        """Remember a directory as existing."""
+        with self.__lock:
+            self.__dirs[directory] = None
+            self.__dirs.move_to_end(directory)
+            while len(self.__dirs) > self.size:
+                self.__dirs.popitem(last=False)
+
+    def discard(self, directory: str) -> None:
+        """Forget a single directory."""
+        with self.__lock:
+            self.__dirs.pop(directory, None)
+
+    def clear(self) -> None:
+        """Forget all directories."""
+        with self.__lock:
+            self.__dirs.clear()
+
+
+# Only set for the duration of a bulk write and, thus, never stale.
+_LISTING: ContextVar[_Listing | None] = ContextVar('listing', default=None)
 
 
 class Writer(ArgRepr):
@@ -87,6 +195,7 @@ class Writer(ArgRepr):
         self.mode = str(Mode(mode))
         self.chunk_size = self.__valid(chunk_size)
         self.storage_kws = {} if storage_kws is None else dict(storage_kws)
+        self._directories = _Directories(1024)
         super().__init__(
             self.path,
             self.storage,
@@ -110,6 +219,17 @@ class Writer(ArgRepr):
         """Fresh fsspec file system on first use, same thereafter."""
         return fsspec.filesystem(self.storage, **self.storage_kws)
 
+    def forget(self) -> None:
+        """Forget which directories are known to exist.
+
+        Parent directories of target files are only created on first use
+        and remembered (up to 1024 of them) thereafter. Should they be removed
+        in the meantime, they are re-created on the next write into them.
+        Call this method to force re-creating all of them anyway.
+
+        """
+        self._directories.clear()
+
     @staticmethod
     def __strip(path: Any) -> str:
         """Try to normalize the path."""
@@ -141,31 +261,58 @@ class Writer(ArgRepr):
     def _managed(
             self,
             uri: str,
-            compression: LiteralCompression | Compression | None = None
+            compression: LiteralCompression | Compression | str | None = None,
+            level: int | None = None,
+            threads: int | None = None
     ) -> Generator[IO]:
         """Context manager for atomic writes with automatic cleanup."""
-        if compression is not None:
-            compression = str(Compression(compression))
+        compression = resolve_compression(uri, compression)
         tmp = self._tmp(uri)
         try:
-            with self.fs.open(
-                    tmp,
-                    self.mode,
-                    self.chunk_bytes,
-                    compression=compression
-            ) as file:
-                yield file
+            if compression is None:
+                with self.__open(
+                        tmp,
+                        self.mode,
+                        compression=compression
+                ) as file:
+                    yield file
+            else:
+                with (
+                    self.__open(tmp, Mode.WB) as raw,
+                    compressed(
+                        raw,
+                        compression,
+                        self.mode,
+                        level,
+                        threads
+                    ) as file
+                ):
+                    yield file
             self.fs.move(tmp, uri)
         except Exception:
             self.fs.rm(tmp)
             raise
+        if listing := _LISTING.get():
+            listing.add(uri)
+
+    def __open(self, tmp: str, mode: str, **kwargs: Any) -> IO:
+        """Open a temporary file, creating its directory if it is missing."""
+        try:
+            return self.fs.open(tmp, mode, self.chunk_bytes, **kwargs)
+        except FileNotFoundError:
+            # The directory might have been removed since it was created.
+            parent = posixpath.dirname(tmp)
+            self._directories.discard(parent)
+            self.fs.makedirs(parent, exist_ok=True)
+            self._directories.add(parent)
+            return self.fs.open(tmp, mode, self.chunk_bytes, **kwargs)
 
     @staticmethod
     def _tmp(uri: str) -> str:
         """Create a random name for a temporary target file."""
         return f'{uri}.tmp.{uuid.uuid4().hex}'
 
-    def __non_root_from(self, *parts: Any) -> PurePosixPath:
+    def _non_root_from(self, *parts: Any) -> PurePosixPath:
         """Interpolate parts into the path and validate the result."""
         path = self.__strip(self.path.format(*parts))
         if path.count('/') < 2:
@@ -175,13 +322,93 @@ class Writer(ArgRepr):
 
     def _uri_from(self, *parts: Any) -> str:
         """Check skip/overwrite and create parent directories."""
-        uri = self.__non_root_from(*parts)
+        uri = self._non_root_from(*parts)
         parent = str(uri.parent)
-        if self.fs.exists(uri):
-            if self.skip:
+        listing = _LISTING.get()
+        if self.skip or not self.overwrite:
+            exists = None if listing is None else listing.exists(str(uri))
+            if exists is None:
+                exists = self.fs.exists(uri)
+            if exists and self.skip:
                 return ''
-            if not self.overwrite:
+            if exists:
                 msg = f'File "{uri}" already exists!'
                 raise FileExistsError(msg)
-        self.fs.makedirs(parent, exist_ok=True)
+        if listing is not None and listing.created(parent):
+            return str(uri)
+        if parent not in self._directories:
+            self.fs.makedirs(parent, exist_ok=True)
+            self._directories.add(parent)
+        if listing is not None:
+            listing.create(parent)
         return str(uri)
+
+    def _ls(self, directory: str) -> set[str] | None:
+        """Files directly in a directory or ``None`` if it does not exist."""
+        try:
+            listed = self.fs.ls(directory, detail=True)
+        except FileNotFoundError:
+            return None
+        return {
+            '/' + entry['name'].lstrip('/')
+            for entry in listed
+            if entry['type'] == 'file'
+        }
+
+    def bulk(
+            self,
+            items: Iterable[tuple[Any, ...]],
+            max_workers: int = 16
+    ) -> list[Any]:
+        """Write many objects concurrently after listing existing files once.
+
+        Instead of checking for every single file whether it exists, each
+        target directory is listed once (non-recursively), and only those
+        that do not exist yet are created. Objects are then written in
+        parallel threads. The listing is used for this call only.
+
+        Parameters
+        ----------
+        items: Iterable
+            Tuples holding the object to write as first element and the
+            fragments to interpolate into the `path` given at instantiation
+            as remaining elements, i.e., the arguments of a single call.
+        max_workers: int, optional
+            Maximum number of files to write concurrently. Defaults to 16.
+
+        Returns
+        -------
+        list
+            The return values of the individual calls, in the order of
+            `items`.
+
+        Raises
+        ------
+        IndexError
+            If the `path` given at instantiation has more string placeholders
+            than there are fragments in any of the `items`.
+        FileExistsError
+            If any of the destination files already exists, `skip` is
+            ``False`` and `overwrite` is also ``False``.
+        ValueError
+            If any final path is directly under root (e.g., "/file.txt")
+            because, on local file system, this is not where you want to save
+            to and, on object storage, the first directory refers to the name
+            of an (existing!) bucket.
+
+        """
+        items = [tuple(item) for item in items]
+        uris = [str(self._non_root_from(*item[1:])) for item in items]
+        parents = sorted({posixpath.dirname(uri) for uri in uris})
+        with ThreadPoolExecutor(max_workers) as executor:
+            listed = dict(zip(parents, executor.map(self._ls, parents)))
+            token = _LISTING.set(_Listing(listed))
+            try:
+                # Worker threads only see the listing in a copied context.
+                futures = [
+                    executor.submit(copy_context().run, self, *item)
+                    for item in items
+                ]
+                return [future.result() for future in futures]
+            finally:
+                _LISTING.reset(token)
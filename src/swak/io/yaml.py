@@ -1,11 +1,16 @@
 from typing import Any
-from collections.abc import Mapping
+from collections.abc import Mapping, Callable
+from collections import OrderedDict
+import pickle
+import hashlib
 import warnings
+import threading
 import yaml
-from yaml import Loader
 from ..misc import ArgRepr
 from .writer import Writer
 from .reader import Reader
+from .cache import DiskCache
+from .aio import AsyncReader
 from .types import (
     LiteralStorage,
     Yaml,
@@ -15,6 +20,79 @@ from .types import (
     LiteralNotFound
 )
 
+try:
+    from yaml import CLoader as Loader, CDumper as Dumper
+except ImportError:  # pragma: no cover
+    from yaml import Loader, Dumper
+
+
+class _Memo:
+    """Bounded, thread-safe memory of parsed documents keyed by content.
+
+    Parsed documents are kept in pickled form, such that every hit returns
+    a fresh copy that callers can freely mutate. Unpickling is more than an
+    order of magnitude faster than parsing the YAML again.
+
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.__lock = threading.Lock()
+        self.__parsed: OrderedDict[str, bytes] = OrderedDict()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Only the size is pickled, the memorized documents are not."""
+        return {'size': self.size}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore an empty memo of the pickled size."""
+        self.__init__(**state)
+
+    def __len__(self) -> int:
+        """Number of currently memorized documents."""
+        return len(self.__parsed)
+
+    def __call__(
+            self,
+            content: str | bytes,
+            parse: Callable[[str | bytes], Any]
+    ) -> Any:
+        """Parse content or return a copy of its memorized parsed version."""
+        raw = content.encode() if isinstance(content, str) else content
+        key = hashlib.sha256(raw).hexdigest()
+        with self.__lock:
+            pickled = self.__parsed.get(key)
+            if pickled is not None:
+                self.__parsed.move_to_end(key)
+        if pickled is not None:
+            return pickle.loads(pickled)
+        parsed = parse(content)
+        try:
+            pickled = pickle.dumps(parsed, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return parsed
+        with self.__lock:
+            self.__parsed[key] = pickled
+            while len(self.__parsed) > self.size:
+                self.__parsed.popitem(last=False)
+        return parsed
+
+
+def _non_negative(memo_size: Any) -> int:
+    """Try to convert memo_size into a non-negative integer."""
+    try:
+        as_int = int(memo_size)
+    except (TypeError, ValueError) as error:
+        cls = type(memo_size).__name__
+        tmp = '"{}" must at least be convertible to an int, unlike {}!'
+        msg = tmp.format('memo_size', cls)
+        raise TypeError(msg) from error
+    if as_int < 0:
+        tmp = '"{}" must not be negative, unlike {}!'
+        msg = tmp.format('memo_size', as_int)
+        raise ValueError(msg)
+    return as_int
+
 
 class YamlWriter(Writer):
     """Save a dictionary to a YAML file on any of the supported file systems.
@@ -44,6 +122,10 @@ class YamlWriter(Writer):
         Passed on as keyword arguments to PyYaml`s :func:`dump` function.
         See the `PyYaml documentation <https://pyyaml.org/wiki/
         PyYAMLDocumentation>`_ for options.
+    dumper: type, optional
+        The dumper class to use. Defaults to the libyaml-backed
+        :class:`CDumper` if PyYaml was built with it and to the pure-Python
+        :class:`Dumper` if not.
 
     Raises
     ------
@@ -70,9 +152,11 @@ class YamlWriter(Writer):
             skip: bool = False,
             chunk_size: int = 32,
             storage_kws: Mapping[str, Any] | None = None,
-            yaml_kws: Mapping[str, Any] | None = None
+            yaml_kws: Mapping[str, Any] | None = None,
+            dumper: type = Dumper
     ) -> None:
         self.yaml_kws = {} if yaml_kws is None else dict(yaml_kws)
+        self.dumper = dumper
         super().__init__(
             path,
             storage,
@@ -81,7 +165,8 @@ class YamlWriter(Writer):
             Mode.WT,
             chunk_size,
             storage_kws,
-            self.yaml_kws
+            self.yaml_kws,
+            dumper
         )
 
     def __call__(self, yml: Yaml, *parts: Any) -> tuple[()]:
@@ -118,7 +203,7 @@ class YamlWriter(Writer):
         """
         if uri := self._uri_from(*parts):
             with self._managed(uri) as file:
-                yaml.dump(yml, file, **self.yaml_kws)
+                yaml.dump(yml, file, self.dumper, **self.yaml_kws)
         return ()
 
 
@@ -141,24 +226,33 @@ class YamlReader(Reader):
     storage_kws: dict, optional
         Passed on as keyword arguments to the constructor of the file system.
     loader: type, optional
-        The loader class to use. Defaults to :class:`Loader`. See the
-        `PyYaml documentation <https://pyyaml.org/wiki/PyYAMLDocumentation>`_
-        for options.
+        The loader class to use. Defaults to the libyaml-backed
+        :class:`CLoader` if PyYaml was built with it and to the pure-Python
+        :class:`Loader` if not. See the `PyYaml documentation <https://
+        pyyaml.org/wiki/PyYAMLDocumentation>`_ for options.
     not_found: str, optional
         What to do if the specified YAML file is not found. One of "ignore",
         "warn", or "raise". Defaults to "raise". Use the :class:`NotFound`
         enum to avoid typos!
+    memo_size: int, optional
+        Maximum number of parsed documents to keep in memory, keyed by a hash
+        of the file content. Files are still read on every call, but parsing
+        is skipped if their content has been seen before. Defaults to 0,
+        which turns off memorization.
+    cache: DiskCache, optional
+        Local disk cache to read remote files through. Ignored for the
+        local file system. Defaults to ``None``.
 
     Raises
     ------
     TypeError
-        If `path` is not a string, `chunk_size` is not a float, or if
-        `storage_kws` is not a dictionary.
+        If `path` is not a string, `chunk_size` is not a float, `storage_kws`
+        is not a dictionary, or `memo_size` is not an integer.
     ValueError
         If `storage` is not among the currently supported file-system
         schemes, `mode` not among the supported file-mode options, the
-        `chunk_size` is smaller than 1 (MiB), or if `storage_kws` is not
-        a dictionary.
+        `chunk_size` is smaller than 1 (MiB), `storage_kws` is not a
+        dictionary, or `memo_size` is negative.
 
     See Also
     --------
@@ -174,10 +268,14 @@ class YamlReader(Reader):
             chunk_size: int = 32,
             storage_kws: Mapping[str, Any] | None = None,
             loader: type = Loader,
-            not_found: LiteralNotFound | NotFound = 'raise'
+            not_found: LiteralNotFound | NotFound = 'raise',
+            memo_size: int = 0,
+            cache: DiskCache | None = None
     ) -> None:
         self.loader = loader
         self.not_found = str(NotFound(not_found))
+        self.memo_size = _non_negative(memo_size)
+        self._memo = _Memo(self.memo_size)
         super().__init__(
             path,
             storage,
@@ -185,9 +283,21 @@ class YamlReader(Reader):
             chunk_size,
             storage_kws,
             loader,
-            self.not_found
+            self.not_found,
+            self.memo_size,
+            cache=cache
         )
 
+    def _load(self, file: Any) -> Yaml:
+        """Parse an open file, skipping documents that were seen before."""
+        if self.memo_size:
+            return self._memo(file.read(), self._parse)
+        return yaml.load(file, self.loader)
+
+    def _parse(self, content: str | bytes) -> Yaml:
+        """Parse the full content of a YAML file."""
+        return yaml.load(content, self.loader)
+
     def __call__(self, path: str = '') -> Yaml:
         """Read a specific YAML file from the specified file system.
 
@@ -219,7 +329,7 @@ class YamlReader(Reader):
         uri = self._non_root(path)
         try:
             with self._managed(uri) as file:
-                yml = yaml.load(file, self.loader)
+                yml = self._load(file)
         except FileNotFoundError as error:
             match self.not_found:
                 case NotFound.WARN:
@@ -239,13 +349,32 @@ class YamlParser(ArgRepr):
     Parameters
     ----------
     loader: type, optional
-        The loader class to use. Defaults to :class:`Loader`.
+        The loader class to use. Defaults to the libyaml-backed
+        :class:`CLoader` if PyYaml was built with it and to the pure-Python
+        :class:`Loader` if not.
+    memo_size: int, optional
+        Maximum number of parsed documents to keep in memory, keyed by a hash
+        of the YAML string. Parsing is skipped for strings that have been seen
+        before. Defaults to 0, which turns off memorization.
+
+    Raises
+    ------
+    TypeError
+        If `memo_size` is not an integer.
+    ValueError
+        If `memo_size` is negative.
 
     """
 
-    def __init__(self, loader: type = Loader) -> None:
+    def __init__(self, loader: type = Loader, memo_size: int = 0) -> None:
         self.loader = loader
-        super().__init__(loader)
+        self.memo_size = _non_negative(memo_size)
+        self._memo = _Memo(self.memo_size)
+        super().__init__(loader, self.memo_size)
+
+    def _parse(self, yml: str) -> Yaml:
+        """Parse a YAML string."""
+        return yaml.load(yml, self.loader)
 
     def __call__(self, yml: str) -> Yaml:
         """Parse a specific YAML string.
@@ -261,4 +390,106 @@ class YamlParser(ArgRepr):
             The result of parsing the YAML string.
 
         """
+        if self.memo_size:
+            return self._memo(yml, self._parse) or {}
         return yaml.load(yml, self.loader) or {}
+
+
+class AsyncYamlReader(YamlReader, AsyncReader):
+    """Asynchronously read a YAML file from any supported file system.
+
+    Parameters
+    ----------
+    path: str, optional
+        Directory under which the YAML file is located or full path to the
+        YAML file. Since it (or part of it) can also be provided later,
+        when the callable instance is called, it is optional here.
+        Defaults to an empty string.
+    storage: str, optional
+        The type of file system to read from ("file", "s3", etc.).
+        Defaults to "file". Use the :class:`Storage` enum to avoid typos.
+    chunk_size: float, optional
+        Chunk size to use when reading from the selected file system in MiB.
+        Defaults to 32 (MiB).
+    storage_kws: dict, optional
+        Passed on as keyword arguments to the constructor of the file system.
+    loader: type, optional
+        The loader class to use. Defaults to the libyaml-backed
+        :class:`CLoader` if PyYaml was built with it and to the pure-Python
+        :class:`Loader` if not. See the `PyYaml documentation <https://
+        pyyaml.org/wiki/PyYAMLDocumentation>`_ for options.
+    not_found: str, optional
+        What to do if the specified YAML file is not found. One of "ignore",
+        "warn", or "raise". Defaults to "raise". Use the :class:`NotFound`
+        enum to avoid typos!
+    memo_size: int, optional
+        Maximum number of parsed documents to keep in memory, keyed by a hash
+        of the file content. Files are still read on every call, but parsing
+        is skipped if their content has been seen before. Defaults to 0,
+        which turns off memorization.
+    cache: DiskCache, optional
+        Local disk cache to read remote files through. Ignored for the
+        local file system. Defaults to ``None``.
+
+    Raises
+    ------
+    TypeError
+        If `path` is not a string, `chunk_size` is not a float, `storage_kws`
+        is not a dictionary, or `memo_size` is not an integer.
+    ValueError
+        If `storage` is not among the currently supported file-system
+        schemes, `mode` not among the supported file-mode options, the
+        `chunk_size` is smaller than 1 (MiB), `storage_kws` is not a
+        dictionary, or `memo_size` is negative.
+
+    See Also
+    --------
+    YamlReader
+    Storage
+    ~swak.io.NotFound
+
+    """
+
+    async def __call__(self, path: str = '') -> Yaml:
+        """Asynchronously read a specific YAML file from the file system.
+
+        If `not_found` is set to "warn" or "ignore" and the file cannot be
+        found, an empty dictionary is returned.
+
+        Parameters
+        ----------
+        path: str
+            Path (including file name) to the YAML file to read. If it starts
+            with a backslash, it will be interpreted as absolute, if not, as
+            relative to the `path` specified at instantiation. Defaults to an
+            empty string, which results in an unchanged `path`.
+
+        Returns
+        -------
+        dict
+            The parsed contents of the YAML file.
+
+        Raises
+        ------
+        ValueError
+            If the final path is directly under root (e.g., "/file.yml")
+            because, on local file system, this is not where you want to save
+            to and, on object storage, the first directory refers to the name
+            of an (existing!) bucket.
+
+        """
+        uri = self._non_root(path)
+        try:
+            async with self._managed(uri) as file:
+                yml = self._load(file)
+        except FileNotFoundError as error:
+            match self.not_found:
+                case NotFound.WARN:
+                    msg = 'File "{}" not found!\nReturning empty YAML.'
+                    warnings.warn(msg.format(uri))
+                    yml = {}
+                case NotFound.IGNORE:
+                    yml = {}
+                case _:
+                    raise error
+        return yml
@@ -4,6 +4,9 @@ from .types import LiteralLazyStorage, LazyStorage
 from .lazy_reader import LazyReader
 from .lazy_writer import LazyWriter
 from .parquet import LazyFrame2Parquet, Parquet2LazyFrame
+from .csv import LazyFrame2Csv, Csv2LazyFrame
+from .ndjson import LazyFrame2NdJson, NdJson2LazyFrame
+from .ipc import LazyFrame2Ipc, Ipc2LazyFrame
 
 __all__ = [
     'LiteralLazyStorage',
@@ -11,5 +14,11 @@ __all__ = [
     'LazyReader',
     'LazyWriter',
     'LazyFrame2Parquet',
-    'Parquet2LazyFrame'
+    'Parquet2LazyFrame',
+    'LazyFrame2Csv',
+    'Csv2LazyFrame',
+    'LazyFrame2NdJson',
+    'NdJson2LazyFrame',
+    'LazyFrame2Ipc',
+    'Ipc2LazyFrame'
 ]
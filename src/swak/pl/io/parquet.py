@@ -1,4 +1,5 @@
-from collections.abc import Mapping
+from collections.abc import Mapping, Iterable
+from inspect import signature
 from typing import Any
 import polars as pl
 from polars import LazyFrame
@@ -6,21 +7,55 @@ from .types import LiteralLazyStorage, LazyStorage
 from .lazy_writer import LazyWriter
 from .lazy_reader import LazyReader
 
+# Older polars versions cannot partition sinks or report the files written.
+_PARTITIONS = hasattr(pl, 'PartitionBy')
+_CALLBACK = 'sinked_paths_callback' in signature(
+    LazyFrame.sink_parquet
+).parameters
+
 
 class LazyFrame2Parquet(LazyWriter):
-    """Sink a polars lazy frame to a parquet file on any supported file system.
+    """Sink a polars lazy frame to parquet file(s) on any file system.
+
+    By default, the lazy frame is sunk into a single parquet file, such that
+    results larger than memory can be written without ever collecting them.
+    Optionally, the output is split into a (hive-)partitioned dataset by the
+    values of one or more columns and/or into files with a maximum number of
+    rows each, and a manifest of all files written is returned.
 
     Parameters
     ----------
     path: str
-        The absolute path to the parquet file to write. May include any number
-        of string placeholders (i.e., pairs of curly brackets) that will be
-        interpolated when the instance is called.
+        The absolute path to the parquet file to write or, if `partition_by`
+        or `max_rows` are given, to the root directory of the dataset. May
+        include any number of string placeholders (i.e., pairs of curly
+        brackets) that will be interpolated when the instance is called.
     storage: str, optional
         The type of file system to write to ("file", "s3", "gcs", etc.).
         Defaults to "file". Use the :class:`LazyStorage` enum to avoid typos.
     storage_kws: dict, optional
         Passed as `storage_options` to :meth:`polars.LazyFrame.sink_parquet`.
+    partition_by: str or iterable, optional
+        Name(s) of the column(s) to partition the dataset by. Files are
+        written into hive-style subdirectories (e.g., "year=2024/") and do
+        not contain the partition columns themselves. Defaults to an empty
+        tuple, which results in no partitioning.
+    max_rows: int, optional
+        Maximum number of rows per file. If given, (every partition of) the
+        data is split into as many files as needed. Defaults to ``None``.
+    row_group_size: int, optional
+        Number of rows per row group in each file. Defaults to ``None``,
+        which lets polars decide.
+    statistics: bool or str, optional
+        Whether to write column statistics into the file metadata. Can also
+        be "full" to compute all (including expensive) statistics. Defaults
+        to ``True``.
+    engine: str, optional
+        The polars engine to run the lazy query on. Defaults to ``None``,
+        which leaves the choice to polars.
+    manifest: bool, optional
+        Whether to return the full paths of all files written when called
+        instead of an empty tuple. Defaults to ``False``.
     **kwargs
         Passed on as additional keyword arguments to
         :meth:`polars.LazyFrame.sink_parquet`. See the `sink documentation
@@ -30,9 +65,15 @@ class LazyFrame2Parquet(LazyWriter):
     Raises
     ------
     TypeError
-        If `path` is not a string or `storage_kws` is not a dictionary.
+        If `path` is not a string, `storage_kws` is not a dictionary,
+        `partition_by` is neither a string nor an iterable of strings, or
+        if `max_rows` or `row_group_size` cannot be converted to integers.
     ValueError
-        If `storage` is not among the currently supported file-system schemes.
+        If `storage` is not among the currently supported file-system schemes,
+        if `max_rows` or `row_group_size` are smaller than one, or if either
+        `partition_by` or `max_rows` is given but the installed polars version
+        cannot sink partitioned datasets or, with `manifest` requested, cannot
+        report the files written.
 
     See Also
     --------
@@ -42,6 +83,10 @@ class LazyFrame2Parquet(LazyWriter):
     ----
     ``sink_parquet`` requires a streaming-compatible query plan. Ensure your
     lazy query is compatible before calling. Polars will raise if it is not.
+    Partitioned sinks require a polars version that provides ``PartitionBy``
+    and, to also return their manifest, the public ``sinked_paths_callback``
+    argument to ``sink_parquet``. On older versions, only single files can be
+    written, and their manifest is simply the path of that file.
 
     """
 
@@ -50,13 +95,98 @@ class LazyFrame2Parquet(LazyWriter):
             path: str,
             storage: LiteralLazyStorage | LazyStorage = LazyStorage.FILE,
             storage_kws: Mapping[str, Any] | None = None,
+            partition_by: str | Iterable[str] = (),
+            max_rows: int | None = None,
+            row_group_size: int | None = None,
+            statistics: bool | str = True,
+            engine: str | None = None,
+            manifest: bool = False,
             **kwargs: Any
     ) -> None:
+        self.partition_by = self.__columns(partition_by)
+        self.max_rows = self.__positive(max_rows, 'max_rows')
+        self.row_group_size = self.__positive(row_group_size, 'row_group_size')
+        self.statistics = statistics
+        self.engine = None if engine is None else str(engine)
+        self.manifest = bool(manifest)
         self.kwargs = kwargs
-        super().__init__(path, storage, storage_kws, **kwargs)
+        if self.partitioned and not _PARTITIONS:
+            msg = 'Installed polars version cannot sink partitioned datasets!'
+            raise ValueError(msg)
+        if self.partitioned and self.manifest and not _CALLBACK:
+            msg = 'Installed polars version cannot report the files written!'
+            raise ValueError(msg)
+        super().__init__(
+            path,
+            storage,
+            storage_kws,
+            self.partition_by,
+            self.max_rows,
+            self.row_group_size,
+            self.statistics,
+            self.engine,
+            self.manifest,
+            **kwargs
+        )
+
+    @property
+    def partitioned(self) -> bool:
+        """Whether to write a dataset of multiple files or a single file."""
+        return bool(self.partition_by) or self.max_rows is not None
+
+    @staticmethod
+    def __columns(partition_by: Any) -> tuple[str, ...]:
+        """Try to convert partition_by into a tuple of column names."""
+        if isinstance(partition_by, str):
+            return (partition_by,)
+        try:
+            columns = tuple(partition_by)
+        except TypeError as error:
+            cls = type(partition_by).__name__
+            msg = '"partition_by" must be a string or an iterable, not {}!'
+            raise TypeError(msg.format(cls)) from error
+        for column in columns:
+            if not isinstance(column, str):
+                cls = type(column).__name__
+                msg = 'Columns to partition by must be strings, not {}!'
+                raise TypeError(msg.format(cls))
+        return columns
 
-    def __call__(self, ldf: LazyFrame, *parts: Any) -> tuple[()]:
-        """Sink a polars lazy frame to a parquet file.
+    @staticmethod
+    def __positive(value: Any, name: str) -> int | None:
+        """Try to convert an optional value into a positive integer."""
+        if value is None:
+            return value
+        try:
+            as_int = int(value)
+        except (TypeError, ValueError) as error:
+            cls = type(value).__name__
+            tmp = '"{}" must at least be convertible to an int, unlike {}!'
+            msg = tmp.format(name, cls)
+            raise TypeError(msg) from error
+        if as_int < 1:
+            tmp = '"{}" must be greater than (or equal to) one, unlike {}!'
+            msg = tmp.format(name, as_int)
+            raise ValueError(msg)
+        return as_int
+
+    def _target(self, uri: str) -> str | pl.PartitionBy:
+        """Single file or partitioning scheme to sink the lazy frame into."""
+        if not self.partitioned:
+            return uri
+        return pl.PartitionBy(
+            uri,
+            key=list(self.partition_by) or None,
+            include_key=False if self.partition_by else None,
+            max_rows_per_file=self.max_rows
+        )
+
+    def __call__(
+            self,
+            ldf: LazyFrame,
+            *parts: Any
+    ) -> tuple[()] | list[str]:
+        """Sink a polars lazy frame to parquet file(s).
 
         Parameters
         ----------
@@ -69,8 +199,9 @@ class LazyFrame2Parquet(LazyWriter):
 
         Returns
         -------
-        tuple
-            An empty tuple.
+        tuple or list
+            An empty tuple or, if `manifest` was requested at instantiation,
+            the sorted full paths of all files written.
 
         Raises
         ------
@@ -85,8 +216,23 @@ class LazyFrame2Parquet(LazyWriter):
 
         """
         uri = self._uri_from(*parts)
-        ldf.sink_parquet(uri, storage_options=self.storage_kws, **self.kwargs)
-        return ()
+        sinked = []
+        options = {} if self.engine is None else {'engine': self.engine}
+        if self.manifest and _CALLBACK:
+            options['sinked_paths_callback'] = lambda args: sinked.extend(
+                sink.path for sink in args.paths
+            )
+        ldf.sink_parquet(
+            self._target(uri),
+            statistics=self.statistics,
+            row_group_size=self.row_group_size,
+            storage_options=self.storage_kws,
+            **options,
+            **self.kwargs
+        )
+        if not self.manifest:
+            return ()
+        return sorted(sinked) if _CALLBACK else [uri]
 
 
 class Parquet2LazyFrame(LazyReader):
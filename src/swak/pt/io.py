@@ -1,9 +1,15 @@
 """Save and load (the state of) PyTorch models to and from any filesystem."""
 
+import json
+import hashlib
 import warnings
+import posixpath
 import torch as pt
 from typing import Any
-from collections.abc import Mapping
+from types import ModuleType
+from importlib import import_module
+from collections.abc import Mapping, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from ..io import (
     Mode,
     Writer,
@@ -11,18 +17,47 @@ from ..io import (
     NotFound,
     LiteralNotFound,
     Storage,
-    LiteralStorage
+    LiteralStorage,
+    DiskCache
 )
-from .types import Module
+from .types import Module, Tensor
 
 __all__ = [
     'StateSaver',
     'StateLoader',
+    'ShardedStateSaver',
+    'ShardedStateLoader',
     'ModelSaver',
     'ModelLoader'
 ]
 
 
+def _safetensors() -> ModuleType:
+    """Import the PyTorch interface of the optional safetensors library."""
+    try:
+        return import_module('safetensors.torch')
+    except ImportError as error:
+        msg = 'Sharded states require "safetensors" to be installed!'
+        raise ImportError(msg) from error
+
+
+def _positive(value: Any, name: str, cast: type[int | float]) -> int | float:
+    """Try to convert an argument into a positive int or float."""
+    try:
+        converted = cast(value)
+    except (TypeError, ValueError) as error:
+        cls = type(value).__name__
+        kind = 'an int' if cast is int else 'a float'
+        tmp = '"{}" must at least be convertible to {}, unlike {}!'
+        msg = tmp.format(name, kind, cls)
+        raise TypeError(msg) from error
+    if converted <= 0:
+        tmp = '"{}" must be greater than zero, unlike {}!'
+        msg = tmp.format(name, converted)
+        raise ValueError(msg)
+    return converted
+
+
 class StateSaver(Writer):
     """Save the state of a model to any supported file system.
 
@@ -161,6 +196,9 @@ class StateLoader(Reader):
         Defaults to "raise". If set to "ignore" or "warn" and the specified
         file is not found, `merge` is overridden to ``True``, thus returning
         the unaltered model.
+    cache: DiskCache, optional
+        Local disk cache to read remote files through. Ignored for the
+        local file system. Defaults to ``None``.
 
     Raises
     ------
@@ -188,7 +226,8 @@ class StateLoader(Reader):
             storage_kws: Mapping[str, Any] | None = None,
             map_location: pt.device | str | None = None,
             merge: bool = True,
-            not_found: NotFound | LiteralNotFound = NotFound.RAISE
+            not_found: NotFound | LiteralNotFound = NotFound.RAISE,
+            cache: DiskCache | None = None
     ) -> None:
         self.map_location = map_location
         self.merge = bool(merge)
@@ -201,7 +240,8 @@ class StateLoader(Reader):
             storage_kws,
             map_location,
             self.merge,
-            self.not_found
+            self.not_found,
+            cache=cache
         )
 
     def __call__(self, model: Module, *parts: str) -> Module:
@@ -257,6 +297,401 @@ class StateLoader(Reader):
         return model.to(self.map_location) if hasattr(model, 'to') else model
 
 
+class ShardedStateSaver(Writer):
+    """Save the state of a model as sharded safetensors to any file system.
+
+    Tensors are grouped, in the order of the model's ``state_dict()``, into
+    shards of at most `shard_size` MiB that are serialized in the safetensors
+    format and written concurrently. The shards are named after the index
+    file and a hash of their content and are listed in the JSON index file
+    that maps every tensor name to its shard. On re-saving, shards that did
+    not change are not written again and shards that the previous version
+    of the same index file referenced but the new one does not are removed.
+    Index files saved into the same directory, thus, never share shards.
+
+    Parameters
+    ----------
+    path: str
+        The absolute path to the JSON index file to save. Shards are saved
+        into the same directory. May include two or more forward slashes
+        (subdirectories will be created) and string placeholders (i.e., pairs
+        of curly brackets) that will be interpolated when instances are
+        called.
+    storage: str, optional
+        The type of file system to write to ("file", "s3", etc.).
+        Defaults to "file". Use the :class:`Storage` enum to avoid typos.
+    overwrite: bool, optional
+        Whether to silently overwrite the index file. Must be ``True`` to
+        incrementally update a saved state. Defaults to ``False``, which will
+        raise an exception if the index file already exists.
+    skip: bool, optional
+        Whether to silently do nothing if the index file already exists.
+        Defaults to ``False``.
+    chunk_size: float, optional
+        Chunk size to use when writing to the selected file system in MiB.
+        Defaults to 32 (MiB).
+    storage_kws: dict, optional
+        Passed on as keyword arguments to the constructor of the file system.
+    shard_size: float, optional
+        Maximum size of a single shard in MiB. Single tensors that are larger
+        end up in shards of their own. Defaults to 1024 (MiB).
+    max_workers: int, optional
+        Maximum number of shards to serialize and write concurrently.
+        Defaults to 4.
+
+    Raises
+    ------
+    TypeError
+        If `path` is not a string, `chunk_size` or `shard_size` are not
+        floats, `max_workers` is not an integer, or if `storage_kws` is not
+        a dictionary.
+    ValueError
+        If `storage` is not among the currently supported file-system
+        schemes, the `chunk_size` is smaller than 1 (MiB), `shard_size` or
+        `max_workers` are not positive, or if `storage_kws` is not a
+        dictionary.
+
+    Note
+    ----
+    Requires the optional `safetensors <https://huggingface.co/docs/
+    safetensors>`_ package to be installed.
+
+    See Also
+    --------
+    ~swak.io.Storage
+    ShardedStateLoader
+
+    """
+
+    def __init__(
+            self,
+            path: str,
+            storage: LiteralStorage | Storage = Storage.FILE,
+            overwrite: bool = False,
+            skip: bool = False,
+            chunk_size: int = 32,
+            storage_kws: Mapping[str, Any] | None = None,
+            shard_size: float = 1024,
+            max_workers: int = 4
+    ) -> None:
+        self.shard_size = _positive(shard_size, 'shard_size', float)
+        self.max_workers = _positive(max_workers, 'max_workers', int)
+        super().__init__(
+            path,
+            storage,
+            overwrite,
+            skip,
+            Mode.WB,
+            chunk_size,
+            storage_kws,
+            self.shard_size,
+            self.max_workers
+        )
+
+    @property
+    def shard_bytes(self) -> int:
+        """Maximum size of a single shard in bytes."""
+        return int(self.shard_size * 1024 * 1024)
+
+    def _shards(self, state: Mapping[str, Any]) -> list[dict[str, Tensor]]:
+        """Group contiguous CPU copies of tensors into shards."""
+        shards = [{}]
+        size = 0
+        storages = set()
+        for name, value in state.items():
+            if not isinstance(value, Tensor):
+                cls = type(value).__name__
+                tmp = 'State entry "{}" must be a tensor, not {}!'
+                raise TypeError(tmp.format(name, cls))
+            tensor = value.detach().cpu().contiguous()
+            # Safetensors refuses tensors that share memory (e.g., tied
+            # weights), so all but the first get their own copy.
+            pointer = tensor.untyped_storage().data_ptr()
+            if pointer in storages and tensor.numel():
+                tensor = tensor.clone()
+            storages.add(pointer)
+            n_bytes = tensor.numel() * tensor.element_size()
+            if shards[-1] and size + n_bytes > self.shard_bytes:
+                shards.append({})
+                size = 0
+            shards[-1][name] = tensor
+            size += n_bytes
+        return shards
+
+    def _index(self, uri: str) -> dict[str, Any]:
+        """Read a previously saved index file, if there is one."""
+        try:
+            return json.loads(self.fs.cat_file(uri))
+        except FileNotFoundError:
+            return {}
+
+    def _write(self, index: str, shard: dict[str, Tensor]) -> str:
+        """Serialize a shard and write it unless it exists already."""
+        content = _safetensors().save(shard)
+        digest = hashlib.sha256(content).hexdigest()[:16]
+        directory, stem = posixpath.split(posixpath.splitext(index)[0])
+        name = f'{stem}-{digest}.safetensors'
+        uri = posixpath.join(directory, name)
+        if not self.fs.exists(uri):
+            with self._managed(uri) as file:
+                file.write(content)
+        return name
+
+    def __call__(self, model: Module, *parts: str) -> tuple[()]:
+        """Save the state of a model as sharded safetensors.
+
+        Parameters
+        ----------
+        model: Module
+            Model to save the state of.
+        *parts: str, optional
+            Fragments that will be interpolated into the `path` string given at
+            instantiation. Obviously, there must be at least as many as there
+            are placeholders in the `path`.
+
+        Returns
+        -------
+        tuple
+            An empty tuple.
+
+        Raises
+        ------
+        TypeError
+            If the `model` does no have a callable `state_dict` method or if
+            its state contains entries that are not tensors.
+        IndexError
+            If the `path` given at instantiation has more string placeholders
+            that there are `parts`.
+        FileExistsError
+            If the index file already exists, `skip` is ``False`` and
+            `overwrite` is also ``False``.
+        ValueError
+            If the final path is directly under root (e.g., "/index.json")
+            because, on local file system, this is not where you want to save
+            to and, on object storage, the first directory refers to the name
+            of an (existing!) bucket.
+        ImportError
+            If the optional `safetensors` package is not installed.
+
+        """
+        has_state = hasattr(model, 'state_dict') and callable(model.state_dict)
+        if not has_state:
+            cls = type(model).__name__
+            tmp = '"{}" object does not have a callable "state_dict" method!'
+            msg = tmp.format(cls)
+            raise TypeError(msg)
+        if uri := self._uri_from(*parts):
+            directory = posixpath.dirname(uri)
+            shards = self._shards(model.state_dict())
+            old = set(self._index(uri).get('weight_map', {}).values())
+            with ThreadPoolExecutor(self.max_workers, 'shard') as pool:
+                names = list(pool.map(
+                    lambda shard: self._write(uri, shard),
+                    shards
+                ))
+            index = {
+                'metadata': {
+                    'total_size': sum(
+                        tensor.numel() * tensor.element_size()
+                        for shard in shards
+                        for tensor in shard.values()
+                    )
+                },
+                'weight_map': {
+                    key: name
+                    for name, shard in zip(names, shards)
+                    for key in shard
+                }
+            }
+            with self._managed(uri) as file:
+                file.write(json.dumps(index, indent=2).encode())
+            for name in old - set(names):
+                self.fs.rm(posixpath.join(directory, name))
+        return ()
+
+
+class ShardedStateLoader(Reader):
+    """Load the state of a model from sharded safetensors on any file system.
+
+    Only the shards holding the requested tensors are read, concurrently.
+    Shards on the local file system (or in the local disk `cache`) are
+    memory-mapped, such that only the requested tensors are actually loaded.
+    Remote shards are downloaded as a whole.
+
+    Parameters
+    ----------
+    path: str
+        Full path to the JSON index file written by
+        :class:`ShardedStateSaver`. May include string placeholders (i.e.,
+        pairs of curly brackets) that will be interpolated when instances
+        are called.
+    storage: str, optional
+        The type of file system to read from ("file", "s3", etc.).
+        Defaults to "file". Use the :class:`Storage` enum to avoid typos.
+    chunk_size: float, optional
+        Chunk size to use when reading from the selected file system in MiB.
+        Defaults to 32 (MiB).
+    storage_kws: dict, optional
+        Passed on as keyword arguments to the constructor of the file system.
+    map_location: str or Device, optional
+        The device to move the model to after loading its state. Defaults to
+        ``None``, which leaves the model where it is.
+    merge: bool, optional
+        Whether the loaded state should be merged into the state of the model
+        (``True``) or replace its state (``False``). This allows loading only
+        a partial state. Defaults to ``True``.
+    not_found: str, optional
+        What to do if the index file is not found. One of "ignore", "warn",
+        or "raise" (use the :class:`NotFound` enum to avoid typos). Defaults
+        to "raise". If set to "ignore" or "warn" and the index file is not
+        found, the unaltered model is returned, even if `keys` are given.
+    keys: Iterable, optional
+        Names of the tensors to load. Defaults to ``None``, which loads all
+        tensors. If given, `merge` is overridden to ``True``.
+    max_workers: int, optional
+        Maximum number of shards to read concurrently. Defaults to 4.
+    cache: DiskCache, optional
+        Local disk cache to read remote shards through, making them
+        memory-mappable. Ignored for the local file system.
+        Defaults to ``None``.
+
+    Raises
+    ------
+    TypeError
+        If `path` is not a string, `chunk_size` or `max_workers` are not
+        integers or `storage_kws` is not a dictionary.
+    ValueError
+        If `storage` is not among the currently supported file-system
+        schemes, `not_found` not a permitted string, if the `chunk_size`
+        is smaller than 1 (MiB), `max_workers` is not positive, or if
+        `storage_kws` is not a dictionary.
+
+    Note
+    ----
+    Requires the optional `safetensors <https://huggingface.co/docs/
+    safetensors>`_ package to be installed.
+
+    See Also
+    --------
+    ~swak.io.Storage
+    ~swak.io.NotFound
+    ShardedStateSaver
+
+    """
+
+    def __init__(
+            self,
+            path: str,
+            storage: LiteralStorage | Storage = Storage.FILE,
+            chunk_size: int = 32,
+            storage_kws: Mapping[str, Any] | None = None,
+            map_location: pt.device | str | None = None,
+            merge: bool = True,
+            not_found: NotFound | LiteralNotFound = NotFound.RAISE,
+            keys: Iterable[str] | None = None,
+            max_workers: int = 4,
+            cache: DiskCache | None = None
+    ) -> None:
+        self.map_location = map_location
+        self.merge = bool(merge)
+        self.not_found = str(NotFound(not_found))
+        self.keys = None if keys is None else list(keys)
+        self.max_workers = _positive(max_workers, 'max_workers', int)
+        super().__init__(
+            path,
+            storage,
+            Mode.RB,
+            chunk_size,
+            storage_kws,
+            map_location,
+            self.merge,
+            self.not_found,
+            self.keys,
+            self.max_workers,
+            cache=cache
+        )
+
+    def _read(self, uri: str, keys: list[str]) -> dict[str, Tensor]:
+        """Read the requested tensors from a single shard."""
+        if local := self._local(uri):
+            safe_open = import_module('safetensors').safe_open
+            with safe_open(local, framework='pt') as shard:
+                return {key: shard.get_tensor(key) for key in keys}
+        with self._managed(uri) as file:
+            loaded = _safetensors().load(file.read())
+        return {key: loaded[key] for key in keys}
+
+    def __call__(self, model: Module, *parts: str) -> Module:
+        """Load the state of a model from sharded safetensors.
+
+        Parameters
+        ----------
+        model: Module
+            Model to load the state of.
+        *parts: str, optional
+            Fragments that will be interpolated into the `path` string given at
+            instantiation. Obviously, there must be at least as many as there
+            are placeholders in the `path`.
+
+        Returns
+        -------
+        Module
+            The `model` with its state restored.
+
+        Raises
+        ------
+        ValueError
+            If the final path is directly under root (e.g., "/index.json")
+            because, on local file system, this is not where you want to save
+            to and, on object storage, the first directory refers to the name
+            of an (existing!) bucket.
+        KeyError
+            If any of the requested `keys` is not in the saved state.
+        RuntimeError
+            If `merge` set to ``False`` and the loaded state has fewer keys
+            than the state of the `model` or if the loaded state has more keys
+            than the model.
+        ImportError
+            If the optional `safetensors` package is not installed.
+
+        """
+        uri = self._non_root(self.path.format(*parts))
+        try:
+            with self._managed(uri) as file:
+                weight_map = json.load(file)['weight_map']
+        except FileNotFoundError as error:
+            match self.not_found:
+                case NotFound.WARN:
+                    msg = 'File {} not found!\nReturning unaltered model.'
+                    warnings.warn(msg.format(uri))
+                case NotFound.IGNORE:
+                    pass
+                case _:
+                    raise error
+            weight_map, keys = {}, []
+        else:
+            keys = list(weight_map) if self.keys is None else self.keys
+        by_shard = {}
+        for key in keys:
+            by_shard.setdefault(weight_map[key], []).append(key)
+        directory = posixpath.dirname(uri)
+        loaded = {}
+        with ThreadPoolExecutor(self.max_workers, 'shard') as pool:
+            for tensors in pool.map(
+                    lambda item: self._read(
+                        posixpath.join(directory, item[0]),
+                        item[1]
+                    ),
+                    by_shard.items()
+            ):
+                loaded.update(tensors)
+        # Partial states, requested or for lack of an index, must be merged.
+        merge = self.merge or self.keys is not None or not weight_map
+        state = model.state_dict() | loaded if merge else loaded
+        _ = model.load_state_dict(state, strict=True)
+        return model.to(self.map_location) if hasattr(model, 'to') else model
+
+
 class ModelSaver(Writer):
     """Save an entire model to any supported file system.
 
@@ -376,6 +811,9 @@ class ModelLoader(Reader):
     map_location: str or Device, optional
         The device to load the modelo onto. Defaults to ``None`` which loads
         to the PyTorch default device.
+    cache: DiskCache, optional
+        Local disk cache to read remote files through. Ignored for the
+        local file system. Defaults to ``None``.
 
     Raises
     ------
@@ -401,6 +839,7 @@ class ModelLoader(Reader):
             chunk_size: int = 32,
             storage_kws: Mapping[str, Any] | None = None,
             map_location: pt.device | str | None = None,
+            cache: DiskCache | None = None
     ) -> None:
         self.map_location = map_location
         super().__init__(
@@ -409,7 +848,8 @@ class ModelLoader(Reader):
             Mode.RB,
             chunk_size,
             storage_kws,
-            self.map_location
+            self.map_location,
+            cache=cache
         )
 
     def __call__(self, path: str = '') -> Module:
@@ -8,8 +8,15 @@ the training loop are also provided.
 
 """
 
-from .data import TestDataBase, TrainDataBase
+from .data import (
+    TestDataBase,
+    TrainDataBase,
+    TestData,
+    TrainData,
+    Prefetch
+)
 from .trainer import Trainer
+from .buckets import Buckets
 from .checkpoint import Checkpoint, State
 from .schedulers import LinearInverse, LinearExponential, LinearCosine
 from .callbacks import (
@@ -24,11 +31,15 @@ from .callbacks import (
 
 __all__ = [
     'Trainer',
+    'Buckets',
     'StepPrinter',
     'EpochPrinter',
     'TrainPrinter',
     'TrainDataBase',
     'TestDataBase',
+    'TrainData',
+    'TestData',
+    'Prefetch',
     'Checkpoint',
     'StepCallback',
     'EpochCallback',
@@ -0,0 +1,240 @@
+from collections.abc import Iterable, Iterator
+import torch as pt
+from ...misc import ArgRepr
+from ..types import Tensor, Tensors
+
+__all__ = ['Buckets']
+
+
+class Buckets(ArgRepr):
+    """Pad batches to one of few fixed shapes to avoid model recompilations.
+
+    Compiled models are specialized to the shapes of their inputs. Batches
+    of varying size (like the last, partial batch of an epoch or of an
+    evaluation) and sequences of varying length therefore trigger costly
+    recompilations. Padding all feature tensors to the next-largest of a few
+    fixed batch sizes and sequence lengths, and cropping the model outputs
+    back to the actual data points, bounds the number of distinct shapes.
+
+    Parameters
+    ----------
+    sizes: iterable of int, optional
+        Batch sizes to pad the first dimension of feature tensors to.
+        Batches larger than the largest size are left as they are. Defaults
+        to ``None``, which pads to the next power of two.
+    lengths: iterable of int, optional
+        Sequence lengths to pad to. The sequence length is taken to be the
+        size of the second dimension of the first feature tensor. Second
+        dimensions of the other tensors are only padded if they are of the
+        same size. Sequences longer than the longest length are left as they
+        are. Defaults to an empty tuple, which does not pad sequences at all.
+    pad_value: float, optional
+        The value to pad feature tensors with. Defaults to 0.0.
+
+    Important
+    ---------
+    Model outputs for the actual data points must not depend on the padded
+    ones, which they do, for example, with ``BatchNorm`` in training mode.
+    Likewise, outputs at any position in a sequence must not depend on the
+    padded positions, as is the case for causal models or for models that
+    mask out the `pad_value`.
+
+    See Also
+    --------
+    Trainer
+
+    """
+
+    def __init__(
+            self,
+            sizes: Iterable[int] | None = None,
+            lengths: Iterable[int] = (),
+            pad_value: float = 0.0
+    ) -> None:
+        self.sizes = None if sizes is None else sorted(set(sizes))
+        self.lengths = sorted(set(lengths))
+        self.pad_value = pad_value
+        super().__init__(self.sizes, self.lengths, pad_value)
+
+    def size(self, n: int) -> int:
+        """Batch size to pad a batch of `n` data points to.
+
+        Parameters
+        ----------
+        n: int
+            Number of data points in the batch.
+
+        Returns
+        -------
+        int
+            The smallest of the `sizes` that is not smaller than `n` or
+            `n` itself if there is no such size.
+
+        """
+        if self.sizes is None:
+            return 1 << max(n - 1, 0).bit_length()
+        return next((size for size in self.sizes if size >= n), n)
+
+    def length(self, length: int) -> int:
+        """Sequence length to pad a sequence of the given `length` to.
+
+        Parameters
+        ----------
+        length: int
+            Actual length of the sequence.
+
+        Returns
+        -------
+        int
+            The smallest of the `lengths` that is not smaller than `length`
+            or `length` itself if there is no such length.
+
+        """
+        return next((pad for pad in self.lengths if pad >= length), length)
+
+    def up_to(self, n: int) -> list[int]:
+        """All batch sizes that batches of at most `n` data points pad to.
+
+        Parameters
+        ----------
+        n: int
+            Maximum number of data points in a batch.
+
+        Returns
+        -------
+        list
+            The batch sizes in ascending order.
+
+        """
+        if self.sizes is None:
+            powers = range(max(n - 1, 0).bit_length() + 1)
+            return [1 << power for power in powers]
+        return [size for size in self.sizes if size < n] + [self.size(n)]
+
+    @staticmethod
+    def _sequence(features: Tensors) -> int | None:
+        """The sequence length of the first feature tensor, if there is one."""
+        return features[0].size(1) if features[0].dim() > 1 else None
+
+    def _fit(self, tensor: Tensor, dim: int, size: int) -> Tensor:
+        """Truncate or pad a tensor to the given size along one dimension."""
+        current = tensor.size(dim)
+        if current == size:
+            return tensor
+        if current > size:
+            return tensor.narrow(dim, 0, size)
+        shape = list(tensor.shape)
+        shape[dim] = size - current
+        padding = tensor.new_full(shape, self.pad_value)
+        return pt.cat([tensor, padding], dim)
+
+    def _resized(
+            self,
+            tensor: Tensor,
+            size: int,
+            sequence: int | None,
+            length: int | None
+    ) -> Tensor:
+        """Fit the batch and, if there is one, the sequence dimension."""
+        tensor = self._fit(tensor, 0, size)
+        if length is None or tensor.dim() < 2 or tensor.size(1) != sequence:
+            return tensor
+        return self._fit(tensor, 1, length)
+
+    @staticmethod
+    def _copied(tensor: Tensor, resized: Tensor) -> Tensor:
+        """Copy a resized tensor into new memory, just like actual batches."""
+        if resized is tensor:
+            return resized
+        # Compiled models distinguish views and inference tensors from others.
+        with pt.inference_mode(tensor.is_inference()):
+            return resized.clone()
+
+    def __call__(self, features: Tensors) -> Tensors:
+        """Pad feature tensors to the next-largest batch size and length.
+
+        Parameters
+        ----------
+        features: tuple
+            The feature tensors of one batch to call the model with.
+
+        Returns
+        -------
+        tuple
+            The padded feature tensors.
+
+        """
+        size = self.size(features[0].size(0))
+        sequence = self._sequence(features)
+        length = None
+        if self.lengths and sequence is not None:
+            length = self.length(sequence)
+        return tuple(
+            self._resized(tensor, size, sequence, length)
+            for tensor in features
+        )
+
+    def crop(self, outputs: Tensors, features: Tensors) -> Tensors:
+        """Crop model outputs for padded features back to the actual sizes.
+
+        Parameters
+        ----------
+        outputs: tuple
+            The tensors returned by the model when called with the
+            padded `features`.
+        features: tuple
+            The original, unpadded feature tensors of the batch.
+
+        Returns
+        -------
+        tuple
+            The model outputs for the actual data points (and sequences).
+
+        """
+        n = features[0].size(0)
+        sequence = self._sequence(features)
+        padded = None
+        if self.lengths and sequence is not None:
+            padded = self.length(sequence)
+        return tuple(
+            self._resized(tensor, n, padded, sequence)
+            for tensor in outputs
+        )
+
+    def variants(
+            self,
+            features: Tensors,
+            target: Tensor,
+            n: int
+    ) -> Iterator[tuple[Tensors, Tensor]]:
+        """Resize one batch to all shapes that batches can be padded to.
+
+        Used to compile models for all of these shapes in advance.
+
+        Parameters
+        ----------
+        features: tuple
+            The feature tensors of one batch.
+        target: Tensor
+            The target of the same batch.
+        n: int
+            Maximum number of data points in a batch.
+
+        Yields
+        ------
+        tuple
+            Features and target, padded or truncated to one of the shapes.
+
+        """
+        sequence = self._sequence(features)
+        lengths = self.lengths if sequence is not None else []
+        for size in self.up_to(n):
+            for length in lengths or [None]:
+                resized = tuple(
+                    self._copied(
+                        tensor,
+                        self._resized(tensor, size, sequence, length)
+                    )
+                    for tensor in (*features, target)
+                )
+                yield resized[:-1], resized[-1]
@@ -1,7 +1,9 @@
+import copy
 import uuid
 import fsspec
 import torch as pt
 from typing import Any, ClassVar
+from concurrent.futures import ThreadPoolExecutor, Future
 from collections import OrderedDict
 from collections.abc import Mapping
 from functools import cached_property
@@ -9,7 +11,7 @@ from fsspec.spec import AbstractFileSystem
 from typing import TypedDict
 from ...io import Storage, LiteralStorage
 from ...misc import ArgRepr
-from ..types import Module, Optimizer, LRScheduler
+from ..types import Module, Optimizer, LRScheduler, GradScaler, Tensor
 
 __all__ = [
     'State',
@@ -24,6 +26,7 @@ class State(TypedDict):
     model: OrderedDict[str, Any]
     optimizer: dict[str, Any]
     scheduler: dict[str, Any]
+    scaler: dict[str, Any]
 
 
 class Checkpoint(ArgRepr):
@@ -44,6 +47,21 @@ class Checkpoint(ArgRepr):
         Chunk size for file-system IO in MiB. Defaults to 32.
     storage_kws: dict, optional
         Passed as keyword arguments to the fsspec file-system constructor.
+    in_process: bool, optional
+        Whether to keep the checkpoint as detached copies of all tensors in
+        the CPU memory of the current process instead of serializing it
+        to the file system, which is much faster for large models. Neither
+        `path` nor `storage` are used in this case. Defaults to ``False``.
+    background: bool, optional
+        Whether to write checkpoints to the file system on a background
+        thread. Tensors are copied to CPU memory before returning, such that
+        training can continue right away. Pending writes are waited for
+        before any subsequent save or load. Defaults to ``False``.
+    pin_memory: bool, optional
+        Whether to copy tensors into page-locked CPU memory for faster
+        transfers from and to the GPU, if CUDA is available. Only has an
+        effect if `in_process` or `background` are ``True``.
+        Defaults to ``False``.
 
     Raises
     ------
@@ -65,7 +83,8 @@ class Checkpoint(ArgRepr):
         'loss': float('inf'),
         'model': OrderedDict(),
         'optimizer': {},
-        'scheduler': {}
+        'scheduler': {},
+        'scaler': {}
     }
 
     def __init__(
@@ -74,19 +93,38 @@ class Checkpoint(ArgRepr):
             storage: LiteralStorage | Storage = Storage.MEMORY,
             chunk_size: int = 32,
             storage_kws: Mapping[str, Any] | None = None,
+            in_process: bool = False,
+            background: bool = False,
+            pin_memory: bool = False
     ) -> None:
         self.path = self.__strip(path)
         self.storage = str(Storage(storage))
         self.chunk_size = self.__valid(chunk_size)
         self.storage_kws = {} if storage_kws is None else dict(storage_kws)
+        self.in_process = in_process
+        self.background = background
+        self.pin_memory = pin_memory
         self.__counter = 0
+        self.__state: State | None = None
+        self.__pending: Future | None = None
         super().__init__(
             self.path,
             self.storage,
             self.chunk_size,
-            self.storage_kws
+            self.storage_kws,
+            self.in_process,
+            self.background,
+            self.pin_memory
         )
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Drop the thread pool and pending writes when pickling."""
+        self.flush()
+        state = self.__dict__.copy()
+        state.pop('_executor', None)
+        state['_Checkpoint__pending'] = None
+        return state
+
     @staticmethod
     def __strip(path: Any) -> str:
         """Try to normalize the path."""
@@ -134,13 +172,51 @@ class Checkpoint(ArgRepr):
         """Fresh fsspec file system on first use, same thereafter."""
         return fsspec.filesystem(self.storage, **self.storage_kws)
 
+    @cached_property
+    def _executor(self) -> ThreadPoolExecutor:
+        """Single background thread to write checkpoints in order."""
+        return ThreadPoolExecutor(1, 'checkpoint')
+
+    def _copied(self, obj: Any) -> Any:
+        """Recursively copy (nested) state with tensors detached on CPU."""
+        if isinstance(obj, Tensor):
+            copied = obj.detach().to('cpu', copy=True)
+            if self.pin_memory and pt.cuda.is_available():
+                return copied.pin_memory()
+            return copied
+        if isinstance(obj, dict):
+            copied = type(obj)(
+                (key, self._copied(value))
+                for key, value in obj.items()
+            )
+            if hasattr(obj, '_metadata'):
+                copied._metadata = copy.deepcopy(obj._metadata)
+            return copied
+        if type(obj) in (list, tuple):
+            return type(obj)(self._copied(item) for item in obj)
+        return copy.deepcopy(obj)
+
+    def flush(self) -> None:
+        """Wait for a checkpoint that is written in the background.
+
+        Raises
+        ------
+        Exception
+            Any exception that occurred while writing in the background.
+
+        """
+        pending, self.__pending = self.__pending, None
+        if pending is not None:
+            pending.result()
+
     def save(
             self,
             epoch: int,
             loss: float,
             model: Module,
             optimizer: Optimizer | None = None,
-            scheduler: LRScheduler | None = None
+            scheduler: LRScheduler | None = None,
+            scaler: GradScaler | None = None
     ) -> None:
         """Save a checkpoint of the current training state.
 
@@ -156,21 +232,37 @@ class Checkpoint(ArgRepr):
             The optimizer to checkpoint. Defaults to ``None``.
         scheduler: LRScheduler, optional
             The scheduler to checkpoint. Defaults to ``None``.
+        scaler: GradScaler, optional
+            The gradient scaler of mixed-precision training to checkpoint.
+            Defaults to ``None``.
 
         """
-        self._save_state({
+        state = {
             'epoch': epoch,
             'loss': loss,
             'model': model.state_dict(),
             'optimizer': {} if optimizer is None else optimizer.state_dict(),
-            'scheduler': {} if scheduler is None else scheduler.state_dict()
-        })
+            'scheduler': {} if scheduler is None else scheduler.state_dict(),
+            'scaler': {} if scaler is None else scaler.state_dict()
+        }
+        self.flush()
+        if self.in_process:
+            self.__state = self._copied(state)
+        elif self.background:
+            snapshot = self._copied(state)
+            self.__pending = self._executor.submit(self._save_state, snapshot)
+        else:
+            self._save_state(state)
         self.__counter += 1
 
     def reset_parameters(self) -> None:
         """Reset the checkpoint to a pristine initial state."""
+        self.flush()
         self.__counter = 0
-        self._save_state(dict(self._EMPTY))
+        if self.in_process:
+            self.__state = self._copied(self._EMPTY)
+        else:
+            self._save_state(dict(self._EMPTY))
 
     def _save_state(self, state: State) -> None:
         """Atomically persist state via a temp file."""
@@ -187,7 +279,8 @@ class Checkpoint(ArgRepr):
             self,
             model: Module,
             optimizer: Optimizer | None = None,
-            scheduler: LRScheduler | None = None
+            scheduler: LRScheduler | None = None,
+            scaler: GradScaler | None = None
     ) -> tuple[int, float]:
         """Load a checkpoint into the provided training objects in-place.
 
@@ -202,6 +295,8 @@ class Checkpoint(ArgRepr):
             The optimizer to restore state into. Defaults to ``None``.
         scheduler: LRScheduler, optional
             The scheduler to restore state into. Defaults to ``None``.
+        scaler: GradScaler, optional
+            The gradient scaler to restore state into. Defaults to ``None``.
 
         Returns
         -------
@@ -211,12 +306,23 @@ class Checkpoint(ArgRepr):
             The loss stored in the checkpoint (``inf`` if empty).
 
         """
-        try:
-            with self.fs.open(self.path, 'rb', self.chunk_bytes) as file:
-                state = pt.load(file, weights_only=True)
-        except FileNotFoundError:
-            self.reset_parameters()
-            state = dict(self._EMPTY)
+        self.flush()
+        if self.in_process:
+            if self.__state is None:
+                self.reset_parameters()
+            # Models copy parameters on load, but the optimizer state must
+            # be copied so that it never aliases the snapshot.
+            state = self.__state | {
+                key: self._copied(self.__state[key])
+                for key in ('optimizer', 'scheduler', 'scaler')
+            }
+        else:
+            try:
+                with self.fs.open(self.path, 'rb', self.chunk_bytes) as file:
+                    state = pt.load(file, weights_only=True)
+            except FileNotFoundError:
+                self.reset_parameters()
+                state = dict(self._EMPTY)
         model.load_state_dict(model.state_dict() | state['model'])
         if optimizer is not None:
             optimizer.load_state_dict(
@@ -226,4 +332,8 @@ class Checkpoint(ArgRepr):
             scheduler.load_state_dict(
                 scheduler.state_dict() | state['scheduler']
             )
+        if scaler is not None and scaler.is_enabled():
+            scaler.load_state_dict(
+                scaler.state_dict() | state.get('scaler', {})
+            )
         return state['epoch'], state['loss']
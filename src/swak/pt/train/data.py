@@ -1,12 +1,26 @@
 import math
 from abc import ABC, abstractmethod
-from ..types import Batches
+from collections.abc import Sequence, Callable
+from typing import Any
+from queue import Queue, Full
+from threading import Thread, Event
+from concurrent.futures import ThreadPoolExecutor
+import torch as pt
+from pandas import DataFrame as Pandas
+from polars import DataFrame as Polars
+from ..types import Batches, Tensor, Tensors
+from ..create import from_dataframe
 
 __all__ = [
     'TestDataBase',
-    'TrainDataBase'
+    'TrainDataBase',
+    'TestData',
+    'TrainData',
+    'Prefetch'
 ]
 
+type Data = Tensor | Pandas | Polars
+
 
 class TestDataBase(ABC):
 
@@ -183,3 +197,416 @@ class TrainDataBase(TestDataBase):
 
         """
         ...
+
+
+class TestData(TestDataBase):
+    """Reproducible batches from in-memory feature and target tensors.
+
+    Batches are cut from the given tensors as slices (i.e., views) or, if
+    only a subset of the data is requested, gathered with a single call to
+    ``index_select`` per tensor and batch. There is no per-row work in Python
+    and tensors are never copied as a whole. To batch on the GPU, simply move
+    features and target there before instantiation.
+
+    Parameters
+    ----------
+    features: Tensor or DataFrame or Sequence
+        One feature tensor (or pandas or polars dataframe) or a sequence of
+        them, each having the number of data points as its first dimension.
+        Dataframes are converted with :func:`~swak.pt.create.from_dataframe`.
+    target: Tensor or DataFrame
+        The target values with the number of data points as first dimension.
+    seed: int, optional
+        Seed for drawing the fixed random subset of data points to return
+        when `sample` is called with a `max_n` smaller than `n`.
+        Defaults to 42.
+
+    Raises
+    ------
+    ValueError
+        If there are no features or if not all tensors contain the same
+        number of data points.
+
+    """
+
+    def __init__(
+            self,
+            features: Data | Sequence[Data],
+            target: Data,
+            seed: int = 42
+    ) -> None:
+        if isinstance(features, Tensor | Pandas | Polars):
+            features = [features]
+        self.features: Tensors = tuple(self._tensor(f) for f in features)
+        self.target = self._tensor(target)
+        self.seed = seed
+        if not self.features:
+            raise ValueError('There must be at least one feature tensor!')
+        sizes = {tensor.shape[0] for tensor in (*self.features, self.target)}
+        if len(sizes) > 1:
+            tmp = 'All tensors must have the same first dimension, not {}!'
+            raise ValueError(tmp.format(sorted(sizes)))
+
+    @staticmethod
+    def _tensor(data: Data) -> Tensor:
+        """Convert dataframes to tensors and leave tensors as they are."""
+        if isinstance(data, Pandas | Polars):
+            return from_dataframe(data)
+        return data
+
+    @property
+    def n(self) -> int:
+        """The total number of data points."""
+        return self.target.shape[0]
+
+    @staticmethod
+    def _generator(seed: int) -> pt.Generator:
+        """Fresh CPU random-number generator with the given seed."""
+        generator = pt.Generator()
+        generator.manual_seed(seed)
+        return generator
+
+    def _sliced(self, batch_size: int, n: int) -> Batches:
+        """Batches of the first `n` data points as views of the tensors."""
+        for start in range(0, n, batch_size):
+            stop = min(start + batch_size, n)
+            features = tuple(tensor[start:stop] for tensor in self.features)
+            yield features, self.target[start:stop]
+
+    def _indexed(self, batch_size: int, indices: Tensor) -> Batches:
+        """Batches gathered from the tensors at the given indices."""
+        for start in range(0, indices.shape[0], batch_size):
+            batch = indices[start:start + batch_size]
+            features = tuple(
+                tensor.index_select(0, batch.to(tensor.device))
+                for tensor in self.features
+            )
+            target = self.target.index_select(0, batch.to(self.target.device))
+            yield features, target
+
+    def sample(self, batch_size: int, max_n: int | None = None) -> Batches:
+        """Iterator over batches from a reproducible sample of your data.
+
+        Parameters
+        ----------
+        batch_size: int
+            Number of data points in (or `batch_size` of) the batches.
+        max_n: int, optional
+            Total number of data points to return mini-batches for. Defaults
+            to ``None``, resulting in all available data points being used
+            in their original order. If smaller than `n`, the same random
+            subset of data points is returned every time.
+
+        Returns
+        -------
+        iterator
+            One element yielded by the iterator is a 2-tuple. The first
+            element is a tuple with the feature tensors, the second is the
+            target tensor.
+
+        """
+        if max_n is None or max_n >= self.n:
+            return self._sliced(batch_size, self.n)
+        generator = self._generator(self.seed)
+        indices = pt.randperm(self.n, generator=generator)[:max(max_n, 0)]
+        return self._indexed(batch_size, indices.sort().values)
+
+
+class TrainData(TestData, TrainDataBase):
+    """Shuffled batches from in-memory feature and target tensors.
+
+    In every epoch, the data points are shuffled with a single random
+    permutation and batches are gathered with one call to ``index_select``
+    per tensor and batch. There is no per-row work in Python and tensors
+    are never copied as a whole. If `shuffle` is ``False``, batches are
+    simply slices (i.e., views) of the original tensors. To batch on the
+    GPU, simply move features and target there before instantiation.
+
+    Parameters
+    ----------
+    features: Tensor or DataFrame or Sequence
+        One feature tensor (or pandas or polars dataframe) or a sequence of
+        them, each having the number of data points as its first dimension.
+        Dataframes are converted with :func:`~swak.pt.create.from_dataframe`.
+    target: Tensor or DataFrame
+        The target values with the number of data points as first dimension.
+    seed: int, optional
+        Seed for the random permutations. The permutation for any given
+        epoch depends only on `seed` and the epoch, making training runs
+        reproducible. Defaults to 42.
+    shuffle: bool, optional
+        Whether to shuffle data points every epoch. Defaults to ``True``.
+
+    Raises
+    ------
+    ValueError
+        If there are no features or if not all tensors contain the same
+        number of data points.
+
+    """
+
+    def __init__(
+            self,
+            features: Data | Sequence[Data],
+            target: Data,
+            seed: int = 42,
+            shuffle: bool = True
+    ) -> None:
+        super().__init__(features, target, seed)
+        self.shuffle = shuffle
+
+    def __call__(
+            self,
+            batch_size: int,
+            step_freq: int = 1,
+            epoch: int = 0
+    ) -> tuple[int, Batches]:
+        """Return an iterator over the mini-batches to train on.
+
+        Parameters
+        ----------
+        batch_size: int
+            The (maximum) number of data points in one batch.
+        step_freq: int, optional
+            In case this number is > 1, the optimizer will accumulate
+            gradients for that many batches before taking a step. The number
+            of data points is then reduced such that all batches have the
+            same size and there are no "left-over" batches. Defaults to 1.
+        epoch: int, optional
+            The current epoch, which seeds the permutation of data points
+            together with `seed`. Defaults to 0.
+
+        Returns
+        -------
+        n_batches: int
+            Total number of batches the returned iterator will provide.
+        batches: Iterator
+            One element yielded by the iterator is a 2-tuple. The first
+            element is a tuple with the feature tensors, the second is the
+            target tensor.
+
+        """
+        n = self.adjust_n_for(batch_size, step_freq)
+        n_batches = self.adjust_batches_for(batch_size, step_freq)
+        if not self.shuffle:
+            return n_batches, self._sliced(batch_size, n)
+        generator = self._generator(self.seed + epoch)
+        indices = pt.randperm(self.n, generator=generator)[:n]
+        return n_batches, self._indexed(batch_size, indices)
+
+
+class Prefetch(TrainDataBase):
+    """Produce the batches of wrapped train or test data in the background.
+
+    Batches are pulled from the wrapped data on a background thread and put
+    into a queue of limited `depth`, such that their preparation (reading,
+    decoding, augmentation, tensor creation, etc.) overlaps with the forward
+    and backward passes of the model in the training loop. Optionally, each
+    batch is further prepared by a `transform` running on a pool of worker
+    threads. Batches are yielded in exactly the order the wrapped data
+    produces them and any exception raised while producing or transforming
+    them is re-raised on consumption.
+
+    Parameters
+    ----------
+    data: TrainDataBase or TestDataBase
+        The train or test data to prefetch batches from.
+    depth: int, optional
+        Maximum number of batches to prepare ahead of time. Defaults to 2.
+    pin_memory: bool, optional
+        Whether to copy the tensors in each batch into page-locked memory in
+        the background, which speeds up (non-blocking) transfers to the GPU.
+        Has no effect if CUDA is not available. Defaults to ``False``.
+    transform: callable, optional
+        Called with a batch of the wrapped data and a freshly seeded
+        ``torch.Generator`` to return the prepared batch. Defaults to
+        ``None``, which leaves batches as they are.
+    workers: int, optional
+        Number of threads to concurrently `transform` batches on. To keep all
+        of them busy, `depth` should be at least as large. Defaults to 1.
+    seed: int, optional
+        Together with the epoch (which is 0 for `sample`), seeds the random
+        number generators that are passed to `transform` with every batch.
+        Defaults to 42.
+
+    Raises
+    ------
+    TypeError
+        If `depth` or `workers` is not an integer.
+    ValueError
+        If `depth` or `workers` is smaller than one.
+
+    Notes
+    -----
+    The generator passed to `transform` with each batch depends only on
+    `seed`, the epoch, and the position of the batch in that epoch, but not
+    on which of the `workers` happens to transform it. Results are therefore
+    reproducible regardless of the number of `workers`.
+
+    Workers are threads rather than processes, because batches are consumed
+    from an iterator that cannot be shared between processes. They run
+    concurrently only as long as `transform` releases the GIL, as PyTorch
+    operations on tensors do.
+
+    The random-number generators of PyTorch, numpy, and Python are shared
+    between threads. To reproducibly randomize batches, use the generator
+    passed to `transform` or derive seeds from the `epoch` that is passed on
+    to the wrapped data (as :class:`TrainData` does), rather than relying on
+    global random state.
+
+    """
+
+    __END = object()
+
+    def __init__(
+            self,
+            data: TrainDataBase | TestDataBase,
+            depth: int = 2,
+            pin_memory: bool = False,
+            transform: Callable[[Any, pt.Generator], Any] | None = None,
+            workers: int = 1,
+            seed: int = 42
+    ) -> None:
+        self.data = data
+        self.depth = self.__valid(depth, 'depth')
+        self.pin_memory = pin_memory
+        self.transform = transform
+        self.workers = self.__valid(workers, 'workers')
+        self.seed = seed
+
+    @staticmethod
+    def __valid(value: Any, name: str) -> int:
+        """Try to convert value to a meaningful int."""
+        try:
+            as_int = int(value)
+        except (TypeError, ValueError) as error:
+            cls = type(value).__name__
+            tmp = '"{}" must at least be convertible to a int, unlike {}!'
+            msg = tmp.format(name, cls)
+            raise TypeError(msg) from error
+        if as_int < 1:
+            tmp = '"{}" must be greater than (or equal to) one, unlike {}!'
+            msg = tmp.format(name, as_int)
+            raise ValueError(msg)
+        return as_int
+
+    @property
+    def n(self) -> int:
+        """The total number of data points in the wrapped data."""
+        return self.data.n
+
+    def _pinned(self, batch: Any) -> Any:
+        """Recursively copy all CPU tensors into page-locked memory."""
+        if isinstance(batch, Tensor):
+            return batch if batch.is_cuda else batch.pin_memory()
+        if isinstance(batch, tuple | list):
+            return type(batch)(self._pinned(item) for item in batch)
+        return batch
+
+    def _prepared(self, batch: Any, seed: int, pin: bool) -> Any:
+        """Transform and pin a single batch on one of the worker threads."""
+        if self.transform is not None:
+            batch = self.transform(batch, pt.Generator().manual_seed(seed))
+        return self._pinned(batch) if pin else batch
+
+    def _prefetched(self, batches: Batches, epoch: int = 0) -> Batches:
+        """Consume batches produced on background threads in order."""
+        queue = Queue(self.depth)
+        stop = Event()
+        pin = self.pin_memory and pt.cuda.is_available()
+        seeds = pt.Generator().manual_seed(self.seed + epoch)
+        pool = ThreadPoolExecutor(self.workers, 'prefetch')
+
+        def put(item: tuple[Any, BaseException | None]) -> bool:
+            while not stop.is_set():
+                try:
+                    queue.put(item, timeout=0.1)
+                    return True
+                except Full:
+                    continue
+            return False
+
+        def produce() -> None:
+            try:
+                for batch in batches:
+                    seed = int(pt.randint(2**62, (1,), generator=seeds))
+                    future = pool.submit(self._prepared, batch, seed, pin)
+                    if not put((future, None)):
+                        return
+            except Exception as error:
+                put((None, error))
+            else:
+                put((self.__END, None))
+
+        thread = Thread(target=produce, name='prefetch', daemon=True)
+        thread.start()
+        try:
+            while True:
+                future, error = queue.get()
+                if error is not None:
+                    raise error
+                if future is self.__END:
+                    return
+                yield future.result()
+        finally:
+            stop.set()
+            thread.join()
+            pool.shutdown(cancel_futures=True)
+
+    def sample(self, batch_size: int, max_n: int | None = None) -> Batches:
+        """Prefetched batches from a reproducible sample of the wrapped data.
+
+        Parameters
+        ----------
+        batch_size: int
+            Number of data points in (or `batch_size` of) the batches.
+        max_n: int, optional
+            Total number of data points to return mini-batches for.
+            Defaults to ``None``, resulting in all data points being used.
+
+        Returns
+        -------
+        iterator
+            The batches of the wrapped data's `sample` method.
+
+        """
+        return self._prefetched(self.data.sample(batch_size, max_n))
+
+    def __call__(
+            self,
+            batch_size: int,
+            step_freq: int = 1,
+            epoch: int = 0
+    ) -> tuple[int | None, Batches]:
+        """Prefetched mini-batches from the wrapped train data.
+
+        Parameters
+        ----------
+        batch_size: int
+            The (maximum) number of data points in one batch.
+        step_freq: int, optional
+            Number of batches to accumulate gradients over before the
+            optimizer takes a step. Defaults to 1.
+        epoch: int, optional
+            The current epoch, which is passed on to the wrapped data and,
+            together with `seed`, seeds the `transform`. Defaults to 0.
+
+        Returns
+        -------
+        n_batches: int
+            Total number of batches as returned by the wrapped data.
+        batches: Iterator
+            The batches of the wrapped data, produced in the background.
+
+        Raises
+        ------
+        TypeError
+            If the wrapped data is test data that cannot be called.
+
+        """
+        if not isinstance(self.data, TrainDataBase):
+            cls = type(self.data).__name__
+            msg = 'Only train data can be called, not {}!'
+            raise TypeError(msg.format(cls))
+        n_batches, batches = self.data(batch_size, step_freq, epoch)
+        return n_batches, self._prefetched(batches, epoch)
@@ -11,7 +11,12 @@ __all__ = [
 ]
 
 
-NoSchedule = Curry[LambdaLR](LambdaLR, lambda _: 1.0)
+def _constant(_: int) -> float:
+    """Learning-rate scaling factor that is always 1.0 (and picklable)."""
+    return 1.0
+
+
+NoSchedule = Curry[LambdaLR](LambdaLR, _constant)
 
 
 class LinearInverse(ArgRepr):
@@ -1,13 +1,32 @@
 import math
-from collections.abc import Iterable
+import socket
+import warnings
+from copy import deepcopy
+from itertools import islice
+from tempfile import TemporaryDirectory
+from contextlib import AbstractContextManager, nullcontext
+from collections.abc import Iterable, Callable
+from typing import Any
 import torch as pt
+import torch.distributed as dist
 from torch.optim import AdamW
+from torch.nn.parallel import DistributedDataParallel
 from torch.nn.utils import clip_grad_norm_
+from torch.amp import GradScaler
 from tqdm import tqdm
 from ...misc import ArgRepr
 from ...funcflow import Curry
-from ..types import Module, Optimizer, LRScheduler, Resettable
+from ..types import (
+    Tensor,
+    Tensors,
+    Module,
+    Optimizer,
+    LRScheduler,
+    Resettable,
+    Batches
+)
 from ..exceptions import TrainError
+from ..misc import Compile
 from .callbacks import (
     StepCallback,
     EpochCallback,
@@ -18,10 +37,68 @@ from .callbacks import (
 from .checkpoint import Checkpoint
 from .schedulers import NoSchedule
 from .data import TestDataBase, TrainDataBase
+from .buckets import Buckets
 
 __all__ = ['Trainer']
 
 
+class _Counted:
+    """Compiler backend that counts the graphs it compiles.
+
+    Wraps the very backend that ``torch.compile`` would build from the
+    same arguments, such that `mode` and `options` are handled by PyTorch
+    itself. Nothing is imported from dynamo or inductor before compiling.
+
+    Parameters
+    ----------
+    backend: str or callable, optional
+        The backend to compile with. Defaults to "inductor".
+    mode: str, optional
+        Passed on to the `backend` by ``torch.compile``. Defaults to ``None``.
+    options: dict, optional
+        Passed on to the `backend` by ``torch.compile``. Defaults to ``None``.
+    dynamic: bool, optional
+        Whether to compile with dynamic shapes. Defaults to ``None``.
+
+    """
+
+    def __init__(
+            self,
+            backend: str | Callable[..., Any] = 'inductor',
+            mode: str | None = None,
+            options: dict[str, Any] | None = None,
+            dynamic: bool | None = None
+    ) -> None:
+        if backend == 'inductor':
+            self.backend = pt._TorchCompileInductorWrapper(
+                mode,
+                options,
+                dynamic
+            )
+        else:
+            self.backend = pt._TorchCompileWrapper(
+                backend,
+                mode,
+                options,
+                dynamic
+            )
+        self.graphs = 0
+
+    def __call__(
+            self,
+            graph: Module,
+            inputs: list[Tensor],
+            **kwargs: Any
+    ) -> Callable:
+        """Count and compile a graph captured by dynamo."""
+        self.graphs += 1
+        return self.backend(graph, inputs, **kwargs)
+
+    def reset(self) -> None:
+        """Reset the wrapped backend when compiler caches are reset."""
+        self.backend.reset()
+
+
 # ToDo: Add EMA model averaging?
 class Trainer(ArgRepr):
     """Train and, optionally, evaluate a model with early stopping.
@@ -53,10 +130,10 @@ class Trainer(ArgRepr):
     patience: int, optional
         If patience is not ``None`` and smaller than `max_epochs`, early
         stopping is active. A snapshot of the model's state is taken after
-        each epoch that improved the loss below its last minimum. If no
-        improvement occurs for `patience` epochs, model training is stopped
-        (even if `max_epochs` has not been reached yet) and the model is reset
-        to its best state.
+        each evaluation that improved the loss below its last minimum. If no
+        improvement occurs for `patience` evaluations, model training is
+        stopped (even if `max_epochs` has not been reached yet) and the model
+        is reset to its best state.
     max_n: int, optional
         Maximum number of data points to take from the training data to
         evaluate the train loss after each epoch. Defaults to number of data
@@ -65,8 +142,9 @@ class Trainer(ArgRepr):
         For how many batches to accumulate gradients before taking an
         optimization step. Defaults to 1, which corresponds to no accumulation.
     clip_grad: float, optional
-        Clip gradients such that their overall norm is capped by the given
-        value. Defaults to 1.0
+        Clip the accumulated gradients right before each optimization step
+        such that their overall norm is capped by the given value.
+        Defaults to 1.0
     checkpoint: Checkpoint, optional
         Whenever the train (or test) loss after an epoch is smaller than the
         loss after the last, a new snapshot of the model state is saved.
@@ -83,8 +161,11 @@ class Trainer(ArgRepr):
         Number of batches to skip before calling `step_cb` again.
         Defaults to 1.
     epoch_cbs: iterable of EpochCallback, optional
-        All epoch callbacks will be called after each epoch with epoch, train
-        loss, test loss, and current learning rate. Defaults to a single
+        All epoch callbacks will be called after each evaluation with epoch,
+        train loss, test loss, current learning rate, the model, and an
+        iterator over the same (reproducible) sample of test (or, if there is
+        none, train) data that the loss was evaluated on. The sample is only
+        drawn if a callback consumes the iterator. Defaults to a single
         :class:`EpochPrinter`.
     train_cbs: iterable of TrainCallback, optional
         All train callbacks will be called after training finished with last
@@ -92,6 +173,43 @@ class Trainer(ArgRepr):
         `max_epochs` was exhausted, and with the training history in the form
         of a dictionary of lists with train loss, test loss and learning rate.
         Defaults to a single :class:`TrainPrinter`.
+    sync_freq: int, optional
+        Losses and gradient norms are accumulated on the device the model
+        lives on and are only transferred to the host for display in the
+        progress bar every `sync_freq` batches (and whenever `step_cbs` are
+        called). Reported numbers are not affected. Defaults to 16.
+    precision: str or dtype, optional
+        Lower-precision floating-point type ("bfloat16" or "float16") to run
+        forward passes and losses in, both during training and evaluation,
+        with ``torch.autocast`` on the device the model lives on. For
+        "float16", gradients are scaled with a ``GradScaler``, whose state is
+        checkpointed alongside the model. Defaults to ``None``, which runs
+        everything in the dtype of the model.
+    eval_freq: int, optional
+        Evaluate train and test loss, append them to the `history`, call the
+        `epoch_cbs`, and check for improvement only every `eval_freq` epochs
+        (and after the last epoch). Defaults to 1.
+    estimate_train: bool, optional
+        Whether to estimate the train loss from the losses of all batches seen
+        during the epoch instead of evaluating the model on (up to `max_n`)
+        training data points in an extra pass. Defaults to ``False``.
+    n_procs: int, optional
+        Number of processes to train the model in, data-parallel on CPU,
+        with the "gloo" backend of ``torch.distributed``. Each process gets
+        an equal share of the intra-op threads and of the train and test
+        batches, gradients are averaged across processes, and losses are
+        aggregated. Defaults to 1, which trains in the current process.
+    compiler: Compile, optional
+        If given, forward passes of the model and the loss are compiled with
+        its keyword arguments once per call to :meth:`train` or
+        :meth:`resume`. Before training starts, model and loss are compiled
+        in training and in evaluation mode for all shapes of batches
+        expected. Defaults to ``None``.
+    buckets: Buckets, optional
+        If given, features are padded to one of a few fixed batch sizes (and
+        sequence lengths) before being fed into the model. Model outputs are
+        cropped back to the actual data points before computing the loss.
+        Defaults to ``None``, which feeds batches into the model as they are.
 
     Important
     ---------
@@ -106,7 +224,37 @@ class Trainer(ArgRepr):
         divided by this number before performing the backward pass. Strictly
         speaking, each batch should thus have the exact same number of data
         points in this case. Furthermore, complications might arise when
-        the model to train contains elements like ``BatchNorm``.
+        the model to train contains elements like ``BatchNorm``. Gradients
+        are clipped only once per optimization step and, in between, the
+        gradient norm of the last step is reported. If the model has a
+        ``no_sync()`` method (like ``DistributedDataParallel``), backward
+        passes of all but the last batch of each step run within it.
+
+    estimate_train
+        The estimated train loss comes for free but is biased because the
+        model changes during the epoch and is in training mode, i.e., with
+        dropout active, for example. If no `test` data is given, early
+        stopping (if active) then tracks the estimated train loss.
+    n_procs
+        Worker processes are spawned, so the trainer, the model, and the data
+        must be picklable. The `batch_size` applies to each process, such that
+        every optimizer step sees `n_procs` times as many data points. Train
+        data must honor the `step_freq` it is called with, such that every
+        process gets the same number of batches.
+        Progress bars, callbacks, and checkpoints are handled by the first
+        process only. After training, the trained parameters and the
+        training history are transferred back to the calling process.
+        The checkpoint, however, is not. To resume training, it must therefore
+        be saved to a file system that all processes have access to.
+    compiler
+        Compiled wrappers are created around model and loss, such that
+        neither is changed by compilation, regardless of whether the
+        `compiler` is set to compile in place. Without `buckets`, the last,
+        partial batch of every epoch and evaluation triggers a
+        recompilation. The number of graphs compiled
+        after the warm-up is stored in the `recompiles` attribute and a
+        warning is issued if it is not zero. The loss is always compiled
+        with dynamic shapes because it only ever sees the actual data points.
 
     See Also
     --------
@@ -135,7 +283,14 @@ class Trainer(ArgRepr):
             step_cbs: Iterable[StepCallback] = (),
             cb_freq: int = 1,
             epoch_cbs: Iterable[EpochCallback] = EpochPrinter(),
-            train_cbs: Iterable[TrainCallback] = TrainPrinter()
+            train_cbs: Iterable[TrainCallback] = TrainPrinter(),
+            sync_freq: int = 16,
+            precision: pt.dtype | str | None = None,
+            eval_freq: int = 1,
+            estimate_train: bool = False,
+            n_procs: int = 1,
+            compiler: Compile | None = None,
+            buckets: Buckets | None = None
     ) -> None:
         self.loss = self.__sane(loss)
         self.optimizer = optimizer
@@ -153,6 +308,13 @@ class Trainer(ArgRepr):
         self.cb_freq = cb_freq
         self.epoch_cbs = epoch_cbs
         self.train_cbs = train_cbs
+        self.sync_freq = sync_freq
+        self.precision = self.__precision(precision)
+        self.eval_freq = eval_freq
+        self.estimate_train = bool(estimate_train)
+        self.n_procs = n_procs
+        self.compiler = compiler
+        self.buckets = buckets
         super().__init__(
             loss,
             optimizer,
@@ -169,9 +331,17 @@ class Trainer(ArgRepr):
             step_cbs,
             cb_freq,
             epoch_cbs,
-            train_cbs
+            train_cbs,
+            sync_freq,
+            precision,
+            eval_freq,
+            self.estimate_train,
+            n_procs,
+            compiler,
+            buckets
         )
         self.history = {'train_loss': [], 'test_loss': [], 'lr': []}
+        self.recompiles = 0
 
     @staticmethod
     def __sane(loss: Module) -> Module:
@@ -185,6 +355,243 @@ class Trainer(ArgRepr):
             raise ValueError(msg)
         return loss
 
+    @staticmethod
+    def __precision(precision: pt.dtype | str | None) -> pt.dtype | None:
+        """Check that the precision is a supported lower-precision float."""
+        if precision is None:
+            return None
+        dtype = {
+            'bfloat16': pt.bfloat16,
+            'bf16': pt.bfloat16,
+            'float16': pt.float16,
+            'fp16': pt.float16,
+            'half': pt.float16
+        }.get(precision, precision)
+        if dtype not in (pt.bfloat16, pt.float16):
+            tmp = 'Precision must be "bfloat16" or "float16", not {}!'
+            raise ValueError(tmp.format(precision))
+        return dtype
+
+    def _autocast(self, device: str) -> pt.autocast:
+        """Context for running forward passes in the configured precision."""
+        return pt.autocast(
+            device,
+            self.precision,
+            enabled=self.precision is not None
+        )
+
+    def _no_sync(
+            self,
+            model: Module,
+            batch_index: int
+    ) -> AbstractContextManager:
+        """Context for intermediate batches that do not end in a step.
+
+        Gradients accumulated in between optimization steps do not need to be
+        synchronized across processes. If the `model` has a ``no_sync()``
+        method, its context is returned for all batches that are not followed
+        by an optimization step. Override to hook in other contexts.
+
+        Parameters
+        ----------
+        model: Module
+            The model currently being trained.
+        batch_index: int
+            The (1-based) index of the current batch within the epoch.
+
+        Returns
+        -------
+        AbstractContextManager
+            The context to run forward and backward pass of the batch in.
+
+        """
+        steps = batch_index % self.step_freq == 0
+        if steps or not callable(getattr(model, 'no_sync', None)):
+            return nullcontext()
+        return model.no_sync()
+
+    def __syncs(
+            self,
+            progress: tqdm,
+            batch_index: int,
+            n_batches: int | None
+    ) -> bool:
+        """Whether to sync with the host to update the progress bar."""
+        if progress.disable:
+            return False
+        return batch_index % self.sync_freq == 0 or batch_index == n_batches
+
+    def __accumulate(
+            self,
+            total: Tensor | None,
+            n: int,
+            loss: Tensor,
+            target: Tensor
+    ) -> tuple[Tensor, int]:
+        """Add the loss of one batch to the running total (or mean)."""
+        if total is None:
+            total = pt.zeros_like(loss)
+        if self.loss.reduction == 'mean':
+            n_new = target.size(0)
+            total += n_new * (loss - total) / (n + n_new)
+            n += n_new
+        else:
+            total += loss
+        return total, n
+
+    def __forward(
+            self,
+            model: Module,
+            loss: Module,
+            features: Tensors,
+            target: Tensor
+    ) -> Tensor:
+        """Loss of a batch, padded to a fixed shape and cropped back."""
+        if self.buckets is None:
+            return loss(*model(*features), target)
+        outputs = model(*self.buckets(features))
+        return loss(*self.buckets.crop(outputs, features), target)
+
+    def __compiled(
+            self,
+            module: Module,
+            backends: list[_Counted],
+            **kwargs: Any
+    ) -> Module:
+        """Compile a wrapper around the module that counts its graphs."""
+        kwargs = self.compiler.kwargs | kwargs
+        backend = _Counted(
+            kwargs.pop('backend', 'inductor'),
+            kwargs.pop('mode', None),
+            kwargs.pop('options', None),
+            kwargs.get('dynamic')
+        )
+        backends.append(backend)
+        return pt.compile(module, backend=backend, **kwargs)
+
+    def __warmup(
+            self,
+            model: Module,
+            trained: Module,
+            forward: Module,
+            loss: Module,
+            train: TrainDataBase,
+            test: TestDataBase | None,
+            device: str
+    ) -> None:
+        """Compile model and loss for all expected batch shapes in advance."""
+        train_variants = self.__variants(train.sample(self.batch_size))
+        # Evaluation batches are drawn in inference mode, so warm-up ones are.
+        with pt.inference_mode():
+            eval_variants = [] if self.estimate_train else self.__variants(
+                train.sample(self.batch_size, self.batch_size)
+            )
+            if test is not None:
+                eval_variants += self.__variants(test.sample(self.batch_size))
+        # Warm-up passes must not leave any traces in the model.
+        buffers = {name: buf.clone() for name, buf in model.named_buffers()}
+        model.train()
+        loss.train()
+        for features, target in train_variants:
+            with self._autocast(device):
+                value = self.__forward(trained, loss, features, target)
+            value.backward()
+        model.eval()
+        loss.eval()
+        for features, target in eval_variants:
+            with pt.inference_mode(), self._autocast(device):
+                _ = self.__forward(forward, loss, features, target)
+        model.zero_grad(set_to_none=True)
+        with pt.no_grad():
+            for name, buffer in model.named_buffers():
+                buffer.copy_(buffers[name])
+
+    def __variants(self, batches: Batches) -> list[tuple[Tensors, Tensor]]:
+        """The first batch in all shapes that batches can be padded to."""
+        features, target = next(iter(batches))
+        if self.buckets is None:
+            return [(features, target)]
+        return list(self.buckets.variants(features, target, self.batch_size))
+
+    def __evaluate(
+            self,
+            model: Module,
+            loss: Module,
+            batches: Batches,
+            desc: str,
+            n_batches: int,
+            device: str,
+            rank: int = 0
+    ) -> float:
+        """Accumulate the loss over all batches on the device of the model."""
+        n = 0
+        ema = None
+        total = None
+        # Every process evaluates its own share of the batches.
+        if self.n_procs > 1:
+            batches = islice(batches, rank, None, self.n_procs)
+            n_batches = len(range(rank, n_batches, self.n_procs))
+        progress = tqdm(
+            batches,
+            desc=desc,
+            total=n_batches,
+            leave=False,
+            disable=not self.show_progress or rank > 0
+        )
+        for batch_index, (features, target) in enumerate(progress, 1):
+            with self._autocast(device):
+                value = self.__forward(model, loss, features, target)
+            value = value.double()
+            ema = value if ema is None else 0.5 * (value + ema)
+            if self.__syncs(progress, batch_index, n_batches):
+                progress.set_postfix(loss=f'{ema:4.2f}')
+            total, n = self.__accumulate(total, n, value, target)
+        return self.__reduce(total, n)
+
+    @staticmethod
+    def __deferred(data: TestDataBase, *args: int) -> Batches:
+        """Draw the evaluation sample only once it is actually consumed."""
+        yield from data.sample(*args)
+
+    def __reduce(self, total: Tensor | None, n: int) -> float:
+        """Combine the losses accumulated by all data-parallel processes."""
+        if self.n_procs == 1:
+            return 0.0 if total is None else total.item()
+        total = pt.zeros((), dtype=pt.float64) if total is None else total
+        if self.loss.reduction == 'mean':
+            stats = pt.stack([n * total, total.new_tensor(n)])
+            dist.all_reduce(stats)
+            return (stats[0] / stats[1].clamp(min=1)).item()
+        dist.all_reduce(total)
+        return total.item()
+
+    def __broadcast(
+            self,
+            rank: int,
+            epoch: int,
+            best_loss: float,
+            optimizer: Optimizer,
+            scheduler: LRScheduler,
+            scaler: GradScaler
+    ) -> tuple[int, float]:
+        """Hand the state of the first process on to all others."""
+        if self.n_procs == 1:
+            return epoch, best_loss
+        states = [
+            epoch,
+            best_loss,
+            optimizer.state_dict(),
+            scheduler.state_dict(),
+            scaler.state_dict()
+        ] if rank == 0 else [None] * 5
+        dist.broadcast_object_list(states)
+        if rank > 0:
+            optimizer.load_state_dict(states[2])
+            scheduler.load_state_dict(states[3])
+            if scaler.is_enabled():
+                scaler.load_state_dict(states[4])
+        return states[0], states[1]
+
     @property
     def scale(self) -> float:
         """Scaling factor for the accumulated loss before the backward pass."""
@@ -281,10 +688,120 @@ class Trainer(ArgRepr):
         of tensors.
 
         """
+        if self.n_procs > 1:
+            return self.__spawn(model, train, test)
+        return self.__resume(model, train, test)
+
+    def __spawn(
+            self,
+            model: Module,
+            train: TrainDataBase,
+            test: TestDataBase | None
+    ) -> Module:
+        """Train the model in `n_procs` data-parallel worker processes."""
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+        with TemporaryDirectory() as tmp:
+            path = tmp + '/trained.pt'
+            pt.multiprocessing.spawn(
+                self._work,
+                (model, train, test, port, path),
+                self.n_procs
+            )
+            trained = pt.load(path, weights_only=True)
+        model.load_state_dict(trained['state'])
+        self.history = trained['history']
+        self.recompiles = trained['recompiles']
+        return model
+
+    def _work(
+            self,
+            rank: int,
+            model: Module,
+            train: TrainDataBase,
+            test: TestDataBase | None,
+            port: int,
+            path: str
+    ) -> None:
+        """Train the model as one of `n_procs` data-parallel processes."""
+        pt.set_num_threads(max(pt.get_num_threads() // self.n_procs, 1))
+        dist.init_process_group(
+            'gloo',
+            init_method=f'tcp://127.0.0.1:{port}',
+            rank=rank,
+            world_size=self.n_procs
+        )
+        try:
+            # Tensors passed to spawned processes share memory with each other
+            # but each process must train its own copy of the parameters.
+            model = self.__resume(deepcopy(model), train, test, rank)
+            if rank == 0:
+                pt.save({
+                    'state': model.state_dict(),
+                    'history': self.history,
+                    'recompiles': self.recompiles
+                }, path)
+        finally:
+            dist.destroy_process_group()
+
+    def __resume(
+            self,
+            model: Module,
+            train: TrainDataBase,
+            test: TestDataBase | None,
+            rank: int = 0
+    ) -> Module:
+        """Train the model in the current (data-parallel) process."""
         # Initialize training cycle.
         optimizer = self.optimizer(model.parameters())
         scheduler = self.scheduler(optimizer)
-        epoch, best_loss = self.checkpoint.load(model, optimizer, scheduler)
+        device = next(model.parameters()).device.type
+        scaler = GradScaler(device, enabled=self.precision == pt.float16)
+        epoch, best_loss = self.checkpoint.load(
+            model,
+            optimizer,
+            scheduler,
+            scaler
+        ) if rank == 0 else (0, float('inf'))
+        epoch, best_loss = self.__broadcast(
+            rank,
+            epoch,
+            best_loss,
+            optimizer,
+            scheduler,
+            scaler
+        )
+        # Forward passes may run through compiled versions of model and loss.
+        backends = []
+        if self.compiler is None:
+            forward, criterion = model, self.loss
+        else:
+            forward = self.__compiled(model, backends)
+            criterion = self.__compiled(self.loss, backends, dynamic=True)
+        # Parameters and buffers of the first process are broadcast on wrap.
+        if self.n_procs > 1:
+            trained = DistributedDataParallel(forward)
+        else:
+            trained = forward
+        # Averaging gradients over processes must be undone for summed losses.
+        if self.loss.reduction == 'mean':
+            scale = self.scale
+        else:
+            scale = self.scale * self.n_procs
+
+        # Compile for all expected batch shapes before training starts.
+        if self.compiler is not None:
+            self.__warmup(
+                model,
+                trained,
+                forward,
+                criterion,
+                train,
+                test,
+                device
+            )
+        n_graphs = sum(backend.graphs for backend in backends)
 
         # Initialize counting and accumulation variables.
         n_wait = 1
@@ -293,42 +810,83 @@ class Trainer(ArgRepr):
 
         # Loop over epochs.
         for epoch in range(epoch + 1, self.max_epochs + 1):
+            n_seen = 0
             ema = None
+            total = None
+            norm = pt.full((), float('nan'))
             model.train()
             self.loss.train()
             # Get an iterator over batches for one epoch of training data.
-            n_batches, batches = train(self.batch_size, self.step_freq, epoch)
+            n_batches, batches = train(
+                self.batch_size,
+                self.step_freq * self.n_procs,
+                epoch
+            )
+            # Every process trains on its own share of the batches.
+            if self.n_procs > 1:
+                batches = islice(batches, rank, None, self.n_procs)
+                if n_batches is not None:
+                    n_batches //= self.n_procs
             # Initialize a progress bar to monitor training in real time.
             progress = tqdm(
                 batches,
                 desc='Train',
                 total=n_batches,
                 leave=False,
-                disable=not self.show_progress
+                disable=not self.show_progress or rank > 0
             )
             # Loop over batches for one epoch of training data
             for batch_index, (features, target) in enumerate(progress, 1):
-                loss = self.loss(*model(*features), target)
-                # Scale gradients for multi-batch accumulation if required.
-                (self.scale * loss).backward()
-                # Clip gradients if greater than specified maximum norm.
-                norm = clip_grad_norm_(model.parameters(), self.clip_grad)
-                # Report loss and norm to the tqdm progress bar for feedback.
-                grad = 'CLIP' if norm > self.clip_grad else f'{norm:4.2f}'
-                # Exponentially smoothen the reported per-batch loss
-                ema = loss.item() if ema is None else 0.5 * (loss.item() + ema)
-                progress.set_postfix(loss=f'{ema:4.2f}', grad=grad)
+                # Skip gradient synchronization on intermediate batches.
+                with self._no_sync(trained, batch_index):
+                    with self._autocast(device):
+                        loss = self.__forward(
+                            trained,
+                            criterion,
+                            features,
+                            target
+                        )
+                    # Scale gradients for multi-batch accumulation.
+                    scaler.scale(scale * loss).backward()
                 # Step after accumulating gradients for step_freq batches.
                 if batch_index % self.step_freq == 0:
-                    optimizer.step()
+                    # Scaled gradients must be unscaled before clipping.
+                    scaler.unscale_(optimizer)
+                    # Clip gradients if greater than specified maximum norm.
+                    norm = clip_grad_norm_(model.parameters(), self.clip_grad)
+                    scaler.step(optimizer)
+                    scaler.update()
                     optimizer.zero_grad(set_to_none=True)
                     # Step the scheduler if we do so per batch
                     if self.batch_step:
                         scheduler.step()
+                # Exponentially smoothen the per-batch loss on the device.
+                loss = loss.detach().double()
+                ema = loss if ema is None else 0.5 * (loss + ema)
+                # Accumulate the train loss over the epoch if so chosen.
+                if self.estimate_train:
+                    total, n_seen = self.__accumulate(
+                        total,
+                        n_seen,
+                        loss,
+                        target
+                    )
+                # Sync with the host only to report to the progress bar.
+                if self.__syncs(progress, batch_index, n_batches):
+                    grad = 'CLIP' if norm > self.clip_grad else f'{norm:4.2f}'
+                    progress.set_postfix(loss=f'{ema:4.2f}', grad=grad)
                 # Call the step callback with current loss and learning rate
-                if batch_index % self.cb_freq == 0:
+                calls = rank == 0 and batch_index % self.cb_freq == 0
+                if self.step_cbs and calls:
+                    lr = scheduler.get_last_lr()[0]
                     for step_cb in self.step_cbs:
-                        step_cb(ema, scheduler.get_last_lr()[0], norm.item())
+                        step_cb(ema.item(), lr, norm.item())
+
+            # Evaluate only every eval_freq epochs and after the last one.
+            if epoch % self.eval_freq and epoch < self.max_epochs:
+                if not self.batch_step:
+                    scheduler.step()
+                continue
 
             # How many data points to take for computing train (and test) loss.
             n = train.n if test is None else test.n
@@ -339,56 +897,37 @@ class Trainer(ArgRepr):
             model.eval()
             self.loss.eval()
 
-            # Evaluate model on training data ...
-            n = 0
-            ema = None
-            train_loss = 0.0
-            with pt.inference_mode():
-                batches = train.sample(self.batch_size, max_n)
-                progress = tqdm(
-                    batches,
-                    desc='Eval (train)',
-                    total=n_batches,
-                    leave=False,
-                    disable=not self.show_progress
-                )
-                for features, target in progress:
-                    loss = self.loss(*model(*features), target).item()
-                    ema = loss if ema is None else 0.5 * (loss + ema)
-                    progress.set_postfix(loss=f'{ema:4.2f}')
-                    if self.loss.reduction == 'mean':
-                        n_new = target.size(0)
-                        train_loss += n_new * (loss - train_loss) / (n + n_new)
-                        n += n_new
-                    else:
-                        train_loss += loss
+            # Estimate the train loss or evaluate model on training data ...
+            if self.estimate_train:
+                train_loss = self.__reduce(total, n_seen)
+            else:
+                with pt.inference_mode():
+                    batches = train.sample(self.batch_size, max_n)
+                    train_loss = self.__evaluate(
+                        forward,
+                        criterion,
+                        batches,
+                        'Eval (train)',
+                        n_batches,
+                        device,
+                        rank
+                    )
 
             # ... and, if present, on test data.
             if test is None:
                 test_loss = float('nan')
             else:
-                n = 0
-                ema = None
-                test_loss = 0.0
                 with pt.inference_mode():
                     batches = test.sample(self.batch_size)
-                    progress = tqdm(
+                    test_loss = self.__evaluate(
+                        forward,
+                        criterion,
                         batches,
-                        desc='Eval (test)',
-                        total=n_batches,
-                        leave=False,
-                        disable=not self.show_progress
+                        'Eval (test)',
+                        n_batches,
+                        device,
+                        rank
                     )
-                    for features, target in progress:
-                        loss = self.loss(*model(*features), target).item()
-                        ema = loss if ema is None else 0.5 * (loss + ema)
-                        progress.set_postfix(loss=f'{ema:4.2f}')
-                        if self.loss.reduction == 'mean':
-                            n_new = target.size(0)
-                            test_loss += n_new * (loss - test_loss)/(n + n_new)
-                            n += n_new
-                        else:
-                            test_loss += loss
 
             # Append epoch metrics to training history.
             current_lr = scheduler.get_last_lr()[0]
@@ -396,12 +935,12 @@ class Trainer(ArgRepr):
             self.history['test_loss'].append(test_loss)
             self.history['lr'].append(current_lr)
 
-            # Call callback with epoch metrics and information.
+            # Call callback with epoch metrics and the evaluated sample.
             if test is None:
-                sample = train.sample(self.batch_size, max_n)
+                sample = self.__deferred(train, self.batch_size, max_n)
             else:
-                sample = test.sample(self.batch_size)
-            for epoch_cb in self.epoch_cbs:
+                sample = self.__deferred(test, self.batch_size)
+            for epoch_cb in self.epoch_cbs if rank == 0 else ():
                 epoch_cb(
                     epoch,
                     train_loss,
@@ -421,24 +960,47 @@ class Trainer(ArgRepr):
                 best_loss = track_loss
                 best_epoch = epoch
                 n_wait = 1
-                self.checkpoint.save(
-                    best_epoch,
-                    best_loss,
-                    model,
-                    optimizer,
-                    scheduler
-                )
+                if rank == 0:
+                    self.checkpoint.save(
+                        best_epoch,
+                        best_loss,
+                        model,
+                        optimizer,
+                        scheduler,
+                        scaler
+                    )
             elif self.patience is not None:
                 if n_wait < self.patience:
                     n_wait += 1
                 else:
-                    self.checkpoint.load(model, optimizer, scheduler)
+                    if rank == 0:
+                        self.checkpoint.load(
+                            model,
+                            optimizer,
+                            scheduler,
+                            scaler
+                        )
                     break
 
         # Did we exhaust the maximum number of epochs?
         else:
             max_epochs_reached = True
 
+        # Count the graphs that had to be compiled after the warm-up.
+        self.recompiles = sum(b.graphs for b in backends) - n_graphs
+
+        # Only the first of several data-parallel processes reports.
+        if rank > 0:
+            return model
+
+        # Make sure the last checkpoint is written.
+        self.checkpoint.flush()
+
+        # Recompilations after the warm-up cost time during training.
+        if self.recompiles:
+            msg = '{} graphs were compiled after the warm-up!'
+            warnings.warn(msg.format(self.recompiles))
+
         # Call callbacks on finished training.
         for step_cb in self.step_cbs:
             step_cb.close()
@@ -7,6 +7,7 @@ from torch import Tensor
 from torch.nn import Module
 from torch.optim import Optimizer
 from torch.optim.lr_scheduler import LRScheduler
+from torch.amp import GradScaler
 
 type Functional = Callable[[Tensor], Tensor]
 type Tensors1T = tuple[Tensor]
@@ -29,6 +30,7 @@ __all__ = [
     'Tensors',
     'Optimizer',
     'LRScheduler',
+    'GradScaler',
     'Batch',
     'Batches',
     'Resettable',
@@ -0,0 +1,260 @@
+import pickle
+import unittest
+import pandas as pd
+import polars as pl
+from polars.testing import assert_frame_equal as pl_assert_frame_equal
+from unittest.mock import patch
+from tempfile import TemporaryDirectory
+from pathlib import Path
+from pyarrow import ArrowInvalid, feather
+from swak.io import Arrow2DataFrame, Reader, Storage, Mode, Bears, DiskCache
+
+
+class TestInstantiation(unittest.TestCase):
+
+    def test_is_reader(self):
+        self.assertTrue(issubclass(Arrow2DataFrame, Reader))
+
+    @patch.object(Reader, '__init__')
+    def test_reader_init_called_defaults(self, init):
+        _ = Arrow2DataFrame()
+        init.assert_called_once_with(
+            '', Storage.FILE, Mode.RB, 32, None, {}, 'pandas', False,
+            cache=None
+        )
+
+    @patch.object(Reader, '__init__')
+    def test_reader_init_called_custom(self, init):
+        _ = Arrow2DataFrame(
+                '/path/to/file.arrow',
+                Storage.MEMORY,
+                16,
+                {'storage': 'kws'},
+                {'arrow': 'kws'},
+                Bears.POLARS,
+                True
+        )
+        init.assert_called_once_with(
+            '/path/to/file.arrow',
+            Storage.MEMORY,
+            Mode.RB,
+            16,
+            {'storage': 'kws'},
+            {'arrow': 'kws'},
+            'polars',
+            True,
+            cache=None
+        )
+
+
+class TestAttributes(unittest.TestCase):
+
+    def test_has_arrow_kws(self):
+        read = Arrow2DataFrame()
+        self.assertTrue(hasattr(read, 'arrow_kws'))
+
+    def test_default_arrow_kws(self):
+        read = Arrow2DataFrame()
+        self.assertDictEqual({}, read.arrow_kws)
+
+    def test_custom_arrow_kws(self):
+        read = Arrow2DataFrame(arrow_kws={'arrow': 'kws'})
+        self.assertDictEqual({'arrow': 'kws'}, read.arrow_kws)
+
+    def test_has_bear(self):
+        read = Arrow2DataFrame()
+        self.assertTrue(hasattr(read, 'bear'))
+
+    def test_default_bear(self):
+        read = Arrow2DataFrame()
+        self.assertEqual('pandas', read.bear)
+
+    def test_custom_bear(self):
+        read = Arrow2DataFrame(bear='polars')
+        self.assertEqual('polars', read.bear)
+
+    def test_wrong_bear_raises(self):
+        with self.assertRaises(ValueError):
+            _ = Arrow2DataFrame(bear='grizzly')
+
+    def test_has_memory_map(self):
+        read = Arrow2DataFrame()
+        self.assertTrue(hasattr(read, 'memory_map'))
+
+    def test_default_memory_map(self):
+        read = Arrow2DataFrame()
+        self.assertFalse(read.memory_map)
+
+    def test_custom_memory_map(self):
+        read = Arrow2DataFrame(memory_map=True)
+        self.assertIsInstance(read.memory_map, bool)
+        self.assertTrue(read.memory_map)
+
+
+class TestUsage(unittest.TestCase):
+
+    def setUp(self):
+        self.storage = Storage.FILE
+        self.dir = TemporaryDirectory()
+        self.file = self.dir.name + '/file.arrow'
+        self.path = Path(self.file)
+        self.pd_df = pd.DataFrame({'foo': [1, 2, 3], 'bar': [4.0, 5.0, 6.0]})
+        self.pl_df = pl.from_pandas(self.pd_df)
+        self.pd_df.to_feather(self.file, compression='uncompressed')
+        self.table = feather.read_table(self.file)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_callable(self):
+        read = Arrow2DataFrame()
+        self.assertTrue(callable(read))
+
+    @patch.object(Reader, '_non_root')
+    def test_non_root_called(self, non_root):
+        non_root.return_value = self.file
+        read = Arrow2DataFrame(self.file, self.storage)
+        _ = read('/some/other/file.arrow')
+        non_root.assert_called_once_with('/some/other/file.arrow')
+
+    @patch.object(Reader, '_managed')
+    def test_managed_called(self, managed):
+        read = Arrow2DataFrame(self.file, self.storage)
+        with self.path.open('rb') as file:
+            managed.return_value = file
+            _ = read()
+        managed.assert_called_once_with(self.file)
+
+    @patch.object(Reader, '_managed')
+    @patch('swak.io.arrow.feather.read_table')
+    def test_read_table_called(self, load, managed):
+        read = Arrow2DataFrame(
+            self.file,
+            self.storage,
+            arrow_kws={'columns': ['foo']}
+        )
+        with self.path.open('rb') as file:
+            managed.return_value = file
+            load.return_value = self.table
+            _ = read()
+            load.assert_called_once_with(file, columns=['foo'])
+
+    @patch.object(Reader, '_managed')
+    @patch('swak.io.arrow.feather.read_table')
+    def test_memory_map_reads_path(self, load, managed):
+        read = Arrow2DataFrame(
+            self.file,
+            self.storage,
+            arrow_kws={'columns': ['foo']},
+            memory_map=True
+        )
+        load.return_value = self.table
+        _ = read()
+        managed.assert_not_called()
+        load.assert_called_once_with(
+            self.file,
+            memory_map=True,
+            columns=['foo']
+        )
+
+    @patch.object(Reader, '_managed')
+    def test_memory_map_ignored_for_remote(self, managed):
+        read = Arrow2DataFrame(self.file, Storage.MEMORY, memory_map=True)
+        with self.path.open('rb') as file:
+            managed.return_value = file
+            _ = read()
+        managed.assert_called_once_with(self.file)
+
+    def test_memory_map_return_value_pandas(self):
+        read = Arrow2DataFrame(self.file, self.storage, memory_map=True)
+        actual = read()
+        pd.testing.assert_frame_equal(actual, self.pd_df)
+
+    def test_memory_map_return_value_polars(self):
+        read = Arrow2DataFrame(
+            self.file,
+            self.storage,
+            bear='polars',
+            memory_map=True
+        )
+        actual = read()
+        pl_assert_frame_equal(actual, self.pl_df)
+
+    def test_memory_map_through_cache(self):
+        read = Arrow2DataFrame(self.file, Storage.FILE, memory_map=True)
+        expected = read()
+        with TemporaryDirectory() as tmp:
+            cache = DiskCache(tmp)
+            read = Arrow2DataFrame(
+                '/data/file.arrow',
+                Storage.MEMORY,
+                memory_map=True,
+                cache=cache
+            )
+            read.fs.pipe_file('/data/file.arrow', self.path.read_bytes())
+            actual = read()
+            read.fs.rm('/data', recursive=True)
+        pd.testing.assert_frame_equal(actual, expected)
+        self.assertEqual(1, cache.stats['misses'])
+
+    def test_columns(self):
+        read = Arrow2DataFrame(
+            self.file,
+            self.storage,
+            arrow_kws={'columns': ['foo']}
+        )
+        actual = read()
+        pd.testing.assert_frame_equal(actual, self.pd_df[['foo']])
+
+    def test_raises_on_file_not_found(self):
+        read = Arrow2DataFrame('/some/other/file.arrow', self.storage)
+        with self.assertRaises(FileNotFoundError):
+            _ = read()
+
+    def test_invalid_arrow_raises(self):
+        read = Arrow2DataFrame(self.file, self.storage)
+        self.path.write_bytes(b'not an arrow file')
+        with self.assertRaises(ArrowInvalid):
+            _ = read()
+
+    def test_return_value_pandas(self):
+        read = Arrow2DataFrame(self.file, self.storage)
+        actual = read()
+        pd.testing.assert_frame_equal(actual, self.pd_df)
+
+    def test_return_value_polars(self):
+        read = Arrow2DataFrame(self.file, self.storage, bear='polars')
+        actual = read()
+        pl_assert_frame_equal(actual, self.pl_df)
+
+
+class TestMisc(unittest.TestCase):
+
+    def test_default_repr(self):
+        read = Arrow2DataFrame()
+        expected = ("Arrow2DataFrame('/', 'file',"
+                    " 32.0, {}, {}, 'pandas', False)")
+        self.assertEqual(expected, repr(read))
+
+    def test_custom_repr(self):
+        read = Arrow2DataFrame(
+                '/path/file.arrow',
+                Storage.MEMORY,
+                16,
+                {'storage': 'kws'},
+                {'arrow': 'kws'},
+                'polars',
+                True
+        )
+        expected = ("Arrow2DataFrame('/path/file.arrow', 'memory', 16.0,"
+                    " {'storage': 'kws'}, {'arrow': 'kws'}, 'polars',"
+                    " True)")
+        self.assertEqual(expected, repr(read))
+
+    def test_pickle_works(self):
+        read = Arrow2DataFrame()
+        _ = pickle.loads(pickle.dumps(read))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,214 @@
+import pickle
+import unittest
+import pandas as pd
+import polars as pl
+from unittest.mock import patch
+from tempfile import TemporaryDirectory
+from pathlib import Path
+from pyarrow import feather
+from polars.testing import assert_frame_equal as pl_assert_frame_equal
+from swak.io import DataFrame2Arrow, Writer, Storage, Mode
+
+
+class TestInstantiation(unittest.TestCase):
+
+    def setUp(self):
+        self.path = '/path/to/file.arrow'
+
+    def test_is_writer(self):
+        self.assertTrue(issubclass(DataFrame2Arrow, Writer))
+
+    @patch.object(Writer, '__init__')
+    def test_writer_init_called_defaults(self, init):
+        _ = DataFrame2Arrow(self.path)
+        init.assert_called_once_with(
+            self.path,
+            Storage.FILE,
+            False,
+            False,
+            Mode.WB,
+            32,
+            None,
+            {'compression': 'uncompressed'}
+        )
+
+    @patch.object(Writer, '__init__')
+    def test_writer_init_called_custom(self, init):
+        _ = DataFrame2Arrow(
+            '/some/other/file.arrow',
+            Storage.MEMORY,
+            True,
+            True,
+            16,
+            {'foo': 'bar'},
+            {'compression': 'zstd'},
+        )
+        init.assert_called_once_with(
+            '/some/other/file.arrow',
+            Storage.MEMORY,
+            True,
+            True,
+            Mode.WB,
+            16,
+            {'foo': 'bar'},
+            {'compression': 'zstd'}
+        )
+
+
+class TestAttributes(unittest.TestCase):
+
+    def setUp(self):
+        self.path = '/path/to/file.arrow'
+
+    def test_has_arrow_kws(self):
+        write = DataFrame2Arrow(self.path)
+        self.assertTrue(hasattr(write, 'arrow_kws'))
+
+    def test_default_arrow_kws(self):
+        write = DataFrame2Arrow(self.path)
+        expected = {'compression': 'uncompressed'}
+        self.assertDictEqual(expected, write.arrow_kws)
+
+    def test_custom_arrow_kws(self):
+        write = DataFrame2Arrow(self.path, arrow_kws={'answer': 42})
+        expected = {'compression': 'uncompressed', 'answer': 42}
+        self.assertDictEqual(expected, write.arrow_kws)
+
+    def test_custom_compression(self):
+        write = DataFrame2Arrow(self.path, arrow_kws={'compression': 'lz4'})
+        self.assertDictEqual({'compression': 'lz4'}, write.arrow_kws)
+
+
+class TestUsage(unittest.TestCase):
+
+    def setUp(self):
+        self.storage = Storage.FILE
+        self.dir = TemporaryDirectory()
+        self.file = self.dir.name + '/file.arrow'
+        self.path = Path(self.file)
+        self.df = pd.DataFrame({'foo': [1, 2, 3], 'bar': [4.0, 5.0, 6.0]})
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_callable(self):
+        write = DataFrame2Arrow(self.file)
+        self.assertTrue(callable(write))
+
+    @patch.object(Writer, '_uri_from')
+    def test_uri_from_called(self, uri_from):
+        uri_from.return_value = self.file
+        write = DataFrame2Arrow(self.file, self.storage)
+        _ = write(self.df, 'foo', 42)
+        uri_from.assert_called_once_with('foo', 42)
+
+    @patch.object(Writer, '_managed')
+    @patch.object(Writer, '_uri_from')
+    def test_managed_not_called(self, uri_from, managed):
+        uri_from.return_value = ''
+        write = DataFrame2Arrow(self.file, self.storage)
+        _ = write(self.df, 'foo', 42)
+        managed.assert_not_called()
+
+    @patch('swak.io.arrow.feather.write_feather')
+    def test_write_feather_called(self, save):
+        write = DataFrame2Arrow(
+            self.file,
+            self.storage,
+            arrow_kws={'compression': 'zstd'}
+        )
+        _ = write(self.df)
+        save.assert_called_once()
+        self.assertDictEqual({'compression': 'zstd'}, save.call_args.kwargs)
+
+    def test_return_value(self):
+        write = DataFrame2Arrow(self.file, self.storage)
+        actual = write(self.df)
+        self.assertTupleEqual((), actual)
+
+    def test_actually_saves_pandas(self):
+        write = DataFrame2Arrow(self.file, self.storage)
+        _ = write(self.df)
+        actual = feather.read_table(self.file).to_pandas()
+        pd.testing.assert_frame_equal(actual, self.df)
+
+    def test_actually_saves_polars(self):
+        df = pl.from_pandas(self.df)
+        write = DataFrame2Arrow(self.file, self.storage)
+        _ = write(df)
+        actual = pl.read_ipc(self.file)
+        pl_assert_frame_equal(actual, df)
+
+    def test_actually_saves_compressed(self):
+        write = DataFrame2Arrow(
+            self.file,
+            self.storage,
+            arrow_kws={'compression': 'zstd'}
+        )
+        _ = write(self.df)
+        actual = feather.read_table(self.file).to_pandas()
+        pd.testing.assert_frame_equal(actual, self.df)
+
+    def test_parts_interpolated(self):
+        write = DataFrame2Arrow(self.dir.name + '/{}/{}.arrow', self.storage)
+        _ = write(self.df, 'sub', 'file')
+        self.assertTrue((Path(self.dir.name) / 'sub' / 'file.arrow').exists())
+
+    def test_raises_on_existing(self):
+        write = DataFrame2Arrow(self.file, self.storage)
+        _ = write(self.df)
+        with self.assertRaises(FileExistsError):
+            _ = write(self.df)
+
+    def test_skip(self):
+        write = DataFrame2Arrow(self.file, self.storage, skip=True)
+        _ = write(self.df)
+        _ = write(self.df.iloc[:1])
+        actual = feather.read_table(self.file).to_pandas()
+        pd.testing.assert_frame_equal(actual, self.df)
+
+    def test_overwrite(self):
+        write = DataFrame2Arrow(self.file, self.storage, overwrite=True)
+        _ = write(self.df.iloc[:1])
+        _ = write(self.df)
+        actual = feather.read_table(self.file).to_pandas()
+        pd.testing.assert_frame_equal(actual, self.df)
+
+    def test_no_temporary_files_left(self):
+        write = DataFrame2Arrow(self.file, self.storage)
+        _ = write(self.df)
+        self.assertListEqual([self.path], list(self.path.parent.iterdir()))
+
+    def test_subdirectory_created_memory(self):
+        path = self.dir.name + '/sub/folder/file.arrow'
+        write = DataFrame2Arrow(path, 'memory')
+        _ = write(self.df)
+        with write.fs.open(path, 'rb') as file:
+            actual = feather.read_table(file).to_pandas()
+        pd.testing.assert_frame_equal(actual, self.df)
+
+
+class TestMisc(unittest.TestCase):
+
+    def setUp(self):
+        self.path = '/path/file.arrow'
+
+    def test_default_repr(self):
+        write = DataFrame2Arrow(self.path)
+        expected = ("DataFrame2Arrow('/path/file.arrow', 'file', False, "
+                    "False, 32.0, {}, {'compression': 'uncompressed'})")
+        self.assertEqual(expected, repr(write))
+
+    def test_custom_repr(self):
+        write = DataFrame2Arrow(self.path, arrow_kws={'compression': 'lz4'})
+        expected = ("DataFrame2Arrow('/path/file.arrow', 'file', False, "
+                    "False, 32.0, {}, {'compression': 'lz4'})")
+        self.assertEqual(expected, repr(write))
+
+    def test_pickle_works(self):
+        write = DataFrame2Arrow(self.path)
+        _ = pickle.loads(pickle.dumps(write))
+
+
+if __name__ == '__main__':
+    unittest.main()
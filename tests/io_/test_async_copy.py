@@ -0,0 +1,65 @@
+import asyncio
+import unittest
+from tempfile import TemporaryDirectory
+from pathlib import Path
+from fsspec.asyn import AsyncFileSystem
+from swak.io import AsyncCopy, Copy
+
+
+class TestAsyncCopy(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.src = TemporaryDirectory()
+        self.tgt = TemporaryDirectory()
+        (Path(self.src.name) / 'sub').mkdir()
+        (Path(self.src.name) / 'sub' / 'file.txt').write_text('Hello world!')
+
+    def tearDown(self):
+        self.src.cleanup()
+        self.tgt.cleanup()
+
+    def test_is_copy(self):
+        self.assertTrue(issubclass(AsyncCopy, Copy))
+
+    def test_fs(self):
+        copy = AsyncCopy(self.src.name, self.tgt.name)
+        self.assertIsInstance(copy.src_fs, AsyncFileSystem)
+        self.assertIsInstance(copy.tgt_fs, AsyncFileSystem)
+
+    async def test_copies(self):
+        copy = AsyncCopy(self.src.name, self.tgt.name)
+        actual = await copy('sub/file.txt')
+        expected = self.tgt.name + '/sub/file.txt'
+        self.assertEqual(expected, actual)
+        content = await asyncio.to_thread(Path(expected).read_text)
+        self.assertEqual('Hello world!', content)
+
+    async def test_raises_on_existing(self):
+        copy = AsyncCopy(self.src.name, self.tgt.name)
+        _ = await copy('sub/file.txt')
+        with self.assertRaises(FileExistsError):
+            _ = await copy('sub/file.txt')
+
+    async def test_skip(self):
+        copy = AsyncCopy(self.src.name, self.tgt.name, skip=True)
+        _ = await copy('sub/file.txt')
+        actual = await copy('sub/file.txt')
+        self.assertEqual(self.tgt.name + '/sub/file.txt', actual)
+
+    async def test_overwrite(self):
+        copy = AsyncCopy(self.src.name, self.tgt.name, overwrite=True)
+        _ = await copy('sub/file.txt')
+        (Path(self.src.name) / 'sub' / 'file.txt').write_text('Changed!')
+        actual = await copy('sub/file.txt')
+        content = await asyncio.to_thread(Path(actual).read_text)
+        self.assertEqual('Changed!', content)
+
+    async def test_no_temporary_files_left(self):
+        copy = AsyncCopy(self.src.name, self.tgt.name)
+        _ = await copy('sub/file.txt')
+        files = list((Path(self.tgt.name) / 'sub').iterdir())
+        self.assertEqual(1, len(files))
+
+
+if __name__ == '__main__':
+    unittest.main()
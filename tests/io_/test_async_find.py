@@ -0,0 +1,60 @@
+import unittest
+from tempfile import TemporaryDirectory
+from pathlib import Path
+from fsspec.asyn import AsyncFileSystem
+from swak.io import AsyncFind, Find
+
+
+class TestAsyncFind(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.dir = TemporaryDirectory()
+        self.base = Path(self.dir.name)
+        (self.base / 'sub').mkdir()
+        (self.base / 'file.txt').write_text('foo')
+        (self.base / 'file.json').write_text('{}')
+        (self.base / 'sub' / 'other.txt').write_text('bar')
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_is_find(self):
+        self.assertTrue(issubclass(AsyncFind, Find))
+
+    def test_fs(self):
+        find = AsyncFind(self.dir.name)
+        self.assertIsInstance(find.fs, AsyncFileSystem)
+
+    async def test_default_depth(self):
+        find = AsyncFind(self.dir.name)
+        actual = await find()
+        expected = [
+            str(self.base / 'file.json'),
+            str(self.base / 'file.txt')
+        ]
+        self.assertListEqual(expected, sorted(actual))
+
+    async def test_suffix_and_depth(self):
+        find = AsyncFind(self.dir.name, suffix='txt', max_depth=None)
+        actual = await find()
+        expected = [
+            str(self.base / 'file.txt'),
+            str(self.base / 'sub' / 'other.txt')
+        ]
+        self.assertListEqual(expected, sorted(actual))
+
+    async def test_same_as_sync(self):
+        find = Find(self.dir.name, max_depth=None)
+        expected = sorted(find())
+        find = AsyncFind(self.dir.name, max_depth=None)
+        actual = sorted(await find())
+        self.assertListEqual(expected, actual)
+
+    async def test_raises_on_root(self):
+        find = AsyncFind()
+        with self.assertRaises(ValueError):
+            _ = await find()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,214 @@
+import gzip
+import pickle
+import asyncio
+import unittest
+from tempfile import TemporaryDirectory
+from pathlib import Path
+import pandas as pd
+import polars as pl
+from fsspec.asyn import AsyncFileSystem
+from fsspec.implementations.memory import MemoryFileSystem
+from swak.io import (
+    AsyncReader,
+    AsyncJsonReader,
+    AsyncYamlReader,
+    AsyncTomlReader,
+    AsyncParquet2DataFrame,
+    JsonReader,
+    Reader,
+    Storage,
+    Mode,
+    Compression
+)
+from swak.io.aio import async_filesystem
+
+
+class TestAsyncFilesystem(unittest.TestCase):
+
+    def test_local_is_async(self):
+        fs = async_filesystem(Storage.FILE)
+        self.assertIsInstance(fs, AsyncFileSystem)
+        self.assertTrue(fs.asynchronous)
+
+    def test_memory_is_async(self):
+        fs = async_filesystem('memory')
+        self.assertIsInstance(fs, AsyncFileSystem)
+        self.assertIsInstance(fs.sync_fs, MemoryFileSystem)
+
+    def test_storage_raises(self):
+        with self.assertRaises(ValueError):
+            _ = async_filesystem('foo')
+
+
+class TestAsyncReader(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.dir = TemporaryDirectory()
+        self.file = self.dir.name + '/file.txt'
+        Path(self.file).write_bytes(b'Hello world!')
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_is_reader(self):
+        self.assertTrue(issubclass(AsyncReader, Reader))
+
+    def test_fs(self):
+        read = AsyncReader(self.file)
+        self.assertIsInstance(read.fs, AsyncFileSystem)
+
+    async def test_managed_binary(self):
+        read = AsyncReader(self.file)
+        async with read._managed(self.file) as file:
+            actual = file.read()
+        self.assertEqual(b'Hello world!', actual)
+
+    async def test_managed_text(self):
+        read = AsyncReader(self.file, mode=Mode.RT)
+        async with read._managed(self.file) as file:
+            actual = file.read()
+        self.assertEqual('Hello world!', actual)
+
+    async def test_managed_compression(self):
+        zipped = self.file + '.gz'
+        content = gzip.compress(b'Hello world!')
+        await asyncio.to_thread(Path(zipped).write_bytes, content)
+        read = AsyncReader(zipped)
+        async with read._managed(zipped, Compression.GZIP) as file:
+            actual = file.read()
+        self.assertEqual(b'Hello world!', actual)
+
+    async def test_managed_raises_file_not_found(self):
+        read = AsyncReader(self.file)
+        with self.assertRaises(FileNotFoundError):
+            async with read._managed(self.dir.name + '/missing.txt'):
+                pass
+
+    def test_pickle_works(self):
+        read = AsyncReader(self.file)
+        _ = pickle.loads(pickle.dumps(read))
+
+
+class TestAsyncJsonReader(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.dir = TemporaryDirectory()
+        self.json = {'hello': 'world', 'answer': 42}
+        path = Path(self.dir.name + '/file.json')
+        path.write_text('{"hello": "world", "answer": 42}')
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_is_json_reader(self):
+        self.assertTrue(issubclass(AsyncJsonReader, JsonReader))
+        self.assertTrue(issubclass(AsyncJsonReader, AsyncReader))
+
+    async def test_reads(self):
+        read = AsyncJsonReader(self.dir.name)
+        actual = await read('file.json')
+        self.assertDictEqual(self.json, actual)
+
+    async def test_reads_gzip(self):
+        zipped = Path(self.dir.name + '/file.json.gz')
+        content = gzip.compress(b'{"hello": "world", "answer": 42}')
+        await asyncio.to_thread(zipped.write_bytes, content)
+        read = AsyncJsonReader(self.dir.name)
+        actual = await read('file.json.gz')
+        self.assertDictEqual(self.json, actual)
+
+    async def test_not_found_raises(self):
+        read = AsyncJsonReader(self.dir.name)
+        with self.assertRaises(FileNotFoundError):
+            _ = await read('missing.json')
+
+    async def test_not_found_warns(self):
+        read = AsyncJsonReader(self.dir.name, not_found='warn')
+        with self.assertWarns(UserWarning):
+            actual = await read('missing.json')
+        self.assertDictEqual({}, actual)
+
+    async def test_not_found_ignore(self):
+        read = AsyncJsonReader(self.dir.name, not_found='ignore')
+        actual = await read('missing.json')
+        self.assertDictEqual({}, actual)
+
+    def test_repr(self):
+        read = AsyncJsonReader('/path/to/file.json', backend='json')
+        expected = ("AsyncJsonReader('/path/to/file.json', 'file', "
+                    "32.0, {}, {}, 'raise', None, 'json')")
+        self.assertEqual(expected, repr(read))
+
+
+class TestAsyncYamlReader(unittest.IsolatedAsyncioTestCase):
+
+    async def test_reads(self):
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp + '/file.yml')
+            content = 'hello: world\nanswer: 42\n'
+            await asyncio.to_thread(path.write_text, content)
+            read = AsyncYamlReader(tmp)
+            actual = await read('file.yml')
+        self.assertDictEqual({'hello': 'world', 'answer': 42}, actual)
+
+    async def test_not_found_ignore(self):
+        with TemporaryDirectory() as tmp:
+            read = AsyncYamlReader(tmp, not_found='ignore')
+            actual = await read('file.yml')
+        self.assertDictEqual({}, actual)
+
+
+class TestAsyncTomlReader(unittest.IsolatedAsyncioTestCase):
+
+    async def test_reads(self):
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp + '/file.toml')
+            content = 'hello = "world"\nanswer = 42\n'
+            await asyncio.to_thread(path.write_text, content)
+            read = AsyncTomlReader(tmp)
+            actual = await read('file.toml')
+        self.assertDictEqual({'hello': 'world', 'answer': 42}, actual)
+
+    async def test_not_found_ignore(self):
+        with TemporaryDirectory() as tmp:
+            read = AsyncTomlReader(tmp, not_found='ignore')
+            actual = await read('file.toml')
+        self.assertDictEqual({}, actual)
+
+
+class TestAsyncParquet2DataFrame(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.dir = TemporaryDirectory()
+        self.df = pd.DataFrame({'A': [1, 2, 3], 'B': [4, 5, 6]})
+        self.df.to_parquet(self.dir.name + '/file.parquet')
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    async def test_reads_pandas(self):
+        read = AsyncParquet2DataFrame(self.dir.name)
+        actual = await read('file.parquet')
+        pd.testing.assert_frame_equal(self.df, actual)
+
+    async def test_reads_polars(self):
+        read = AsyncParquet2DataFrame(self.dir.name, bear='polars')
+        actual = await read('file.parquet')
+        self.assertIsInstance(actual, pl.DataFrame)
+        pd.testing.assert_frame_equal(self.df, actual.to_pandas())
+
+    async def test_reads_memory_map(self):
+        read = AsyncParquet2DataFrame(self.dir.name, memory_map=True)
+        actual = await read('file.parquet')
+        pd.testing.assert_frame_equal(self.df, actual)
+
+    async def test_reads_memory(self):
+        fs = MemoryFileSystem()
+        fs.pipe_file('/bucket/file.parquet', self.df.to_parquet())
+        read = AsyncParquet2DataFrame('/bucket', Storage.MEMORY)
+        actual = await read('file.parquet')
+        pd.testing.assert_frame_equal(self.df, actual)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,216 @@
+import gzip
+import pickle
+import asyncio
+import shutil
+import unittest
+from unittest.mock import patch
+from tempfile import TemporaryDirectory
+from pathlib import Path
+import pandas as pd
+import polars as pl
+from fsspec.asyn import AsyncFileSystem
+from swak.io import (
+    AsyncWriter,
+    AsyncDataFrame2Parquet,
+    DataFrame2Parquet,
+    Writer,
+    Mode,
+    Compression
+)
+
+
+class TestAsyncWriter(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.dir = TemporaryDirectory()
+        self.file = self.dir.name + '/sub/file.txt'
+        self.path = Path(self.file)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_is_writer(self):
+        self.assertTrue(issubclass(AsyncWriter, Writer))
+
+    def test_fs(self):
+        write = AsyncWriter(self.file)
+        self.assertIsInstance(write.fs, AsyncFileSystem)
+
+    async def test_uri_from_creates_parent(self):
+        write = AsyncWriter(self.dir.name + '/{}/file.txt')
+        actual = await write._uri_from('sub')
+        self.assertEqual(self.file, actual)
+        self.assertTrue(self.path.parent.is_dir())
+
+    async def test_uri_from_raises_on_existing(self):
+        self.path.parent.mkdir()
+        self.path.write_bytes(b'foo')
+        write = AsyncWriter(self.file)
+        with self.assertRaises(FileExistsError):
+            _ = await write._uri_from()
+
+    async def test_uri_from_skips_existing(self):
+        self.path.parent.mkdir()
+        self.path.write_bytes(b'foo')
+        write = AsyncWriter(self.file, skip=True)
+        actual = await write._uri_from()
+        self.assertEqual('', actual)
+
+    async def test_uri_from_overwrites_existing(self):
+        self.path.parent.mkdir()
+        self.path.write_bytes(b'foo')
+        write = AsyncWriter(self.file, overwrite=True)
+        actual = await write._uri_from()
+        self.assertEqual(self.file, actual)
+
+    async def test_uri_from_raises_on_root(self):
+        write = AsyncWriter('/file.txt')
+        with self.assertRaises(ValueError):
+            _ = await write._uri_from()
+
+    async def test_managed_binary(self):
+        write = AsyncWriter(self.file)
+        uri = await write._uri_from()
+        async with write._managed(uri) as file:
+            file.write(b'Hello world!')
+        self.assertEqual(b'Hello world!', self.path.read_bytes())
+
+    async def test_managed_text(self):
+        write = AsyncWriter(self.file, mode=Mode.WT)
+        uri = await write._uri_from()
+        async with write._managed(uri) as file:
+            file.write('Hello world!')
+        self.assertEqual('Hello world!', self.path.read_text())
+
+    async def test_managed_compression(self):
+        write = AsyncWriter(self.file, mode=Mode.WT)
+        uri = await write._uri_from()
+        async with write._managed(uri, Compression.GZIP) as file:
+            file.write('Hello world!')
+        actual = gzip.decompress(self.path.read_bytes())
+        self.assertEqual(b'Hello world!', actual)
+
+    async def test_managed_leaves_no_trace_on_error(self):
+        write = AsyncWriter(self.file)
+        uri = await write._uri_from()
+        with self.assertRaises(OSError):
+            async with write._managed(uri) as file:
+                file.write(b'Hello world!')
+                raise OSError
+        self.assertListEqual([], list(self.path.parent.iterdir()))
+
+    def test_pickle_works(self):
+        write = AsyncWriter(self.file)
+        _ = pickle.loads(pickle.dumps(write))
+
+    async def test_managed_creates_missing_parent(self):
+        write = AsyncWriter(self.file)
+        async with write._managed(self.file) as file:
+            file.write(b'Hello world!')
+        content = await asyncio.to_thread(self.path.read_bytes)
+        self.assertEqual(b'Hello world!', content)
+
+    async def test_makedirs_called_once_per_directory(self):
+        write = AsyncWriter(self.dir.name + '/{}/file-{}.txt', overwrite=True)
+        with patch.object(
+                write.fs,
+                '_makedirs',
+                wraps=write.fs._makedirs
+        ) as makedirs:
+            for i in range(3):
+                _ = await write._uri_from('sub', i)
+        makedirs.assert_called_once()
+
+    async def test_reused_after_directory_removed(self):
+        write = AsyncWriter(self.file, overwrite=True)
+        uri = await write._uri_from()
+        await asyncio.to_thread(shutil.rmtree, self.path.parent)
+        uri = await write._uri_from()
+        async with write._managed(uri) as file:
+            file.write(b'Hello world!')
+        content = await asyncio.to_thread(self.path.read_bytes)
+        self.assertEqual(b'Hello world!', content)
+
+    async def test_ls(self):
+        await asyncio.to_thread(self.path.parent.mkdir)
+        await asyncio.to_thread(self.path.write_bytes, b'foo')
+        write = AsyncWriter(self.file)
+        actual = await write._ls(str(self.path.parent))
+        self.assertSetEqual({self.file}, actual)
+
+    async def test_ls_missing_directory(self):
+        write = AsyncWriter(self.file)
+        self.assertIsNone(await write._ls(str(self.path.parent)))
+
+
+class TestAsyncDataFrame2Parquet(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.dir = TemporaryDirectory()
+        self.path = self.dir.name + '/{}/file.parquet'
+        self.df = pd.DataFrame({'A': [1, 2, 3], 'B': [4, 5, 6]})
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_is_parquet_writer(self):
+        self.assertTrue(issubclass(AsyncDataFrame2Parquet, DataFrame2Parquet))
+        self.assertTrue(issubclass(AsyncDataFrame2Parquet, AsyncWriter))
+
+    async def test_return_value(self):
+        write = AsyncDataFrame2Parquet(self.path)
+        actual = await write(self.df, 'foo')
+        self.assertTupleEqual((), actual)
+
+    async def test_writes_pandas(self):
+        write = AsyncDataFrame2Parquet(self.path)
+        _ = await write(self.df, 'foo')
+        actual = pd.read_parquet(self.path.format('foo'))
+        pd.testing.assert_frame_equal(self.df, actual)
+
+    async def test_writes_polars(self):
+        write = AsyncDataFrame2Parquet(self.path)
+        _ = await write(pl.from_pandas(self.df), 'foo')
+        actual = pd.read_parquet(self.path.format('foo'))
+        pd.testing.assert_frame_equal(self.df, actual)
+
+    async def test_writes_concurrently(self):
+        write = AsyncDataFrame2Parquet(self.path)
+        parts = [str(part) for part in range(8)]
+        _ = await asyncio.gather(*(write(self.df, part) for part in parts))
+        for part in parts:
+            path = Path(self.path.format(part))
+            self.assertTrue(await asyncio.to_thread(path.exists))
+
+    async def test_bulk(self):
+        write = AsyncDataFrame2Parquet(self.path)
+        parts = [str(part) for part in range(8)]
+        items = [(self.df, part) for part in parts]
+        actual = await write.bulk(items, max_workers=3)
+        self.assertListEqual([()] * 8, actual)
+        for part in parts:
+            path = Path(self.path.format(part))
+            self.assertTrue(await asyncio.to_thread(path.exists))
+
+    async def test_bulk_raises_on_existing(self):
+        write = AsyncDataFrame2Parquet(self.path)
+        _ = await write(self.df, 'foo')
+        with self.assertRaises(FileExistsError):
+            _ = await write.bulk([(self.df, 'bar'), (self.df, 'foo')])
+
+    async def test_skip(self):
+        write = AsyncDataFrame2Parquet(self.path, skip=True)
+        _ = await write(self.df, 'foo')
+        _ = await write(self.df.iloc[:1], 'foo')
+        actual = pd.read_parquet(self.path.format('foo'))
+        pd.testing.assert_frame_equal(self.df, actual)
+
+    async def test_raises_on_existing(self):
+        write = AsyncDataFrame2Parquet(self.path)
+        _ = await write(self.df, 'foo')
+        with self.assertRaises(FileExistsError):
+            _ = await write(self.df, 'foo')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,178 @@
+import io
+import bz2
+import gzip
+import lzma
+import unittest
+from unittest.mock import patch
+from importlib.util import find_spec
+from swak.io import Compression
+from swak.io.codec import infer_compression, resolve_compression, compressed
+
+HAS_ZSTD = find_spec('zstandard') is not None
+HAS_LZ4 = find_spec('lz4') is not None
+
+
+class TestInferCompression(unittest.TestCase):
+
+    def test_no_suffix(self):
+        self.assertIsNone(infer_compression('/path/to/file'))
+
+    def test_unknown_suffix(self):
+        self.assertIsNone(infer_compression('/path/to/file.json'))
+
+    def test_suffixes(self):
+        expected = {
+            '.zip': 'zip',
+            '.bz2': 'bz2',
+            '.gz': 'gzip',
+            '.lzma': 'lzma',
+            '.xz': 'xz',
+            '.zst': 'zstd',
+            '.zstd': 'zstd',
+            '.lz4': 'lz4'
+        }
+        for suffix, compression in expected.items():
+            with self.subTest(suffix=suffix):
+                actual = infer_compression('/path/file.json' + suffix)
+                self.assertIsInstance(actual, str)
+                self.assertEqual(compression, actual)
+
+    def test_case_insensitive(self):
+        actual = infer_compression('/path/to/file.json.ZST')
+        self.assertEqual('zstd', actual)
+
+    def test_only_last_suffix(self):
+        self.assertIsNone(infer_compression('/path/to/file.gz.json'))
+
+
+class TestResolveCompression(unittest.TestCase):
+
+    def test_none(self):
+        self.assertIsNone(resolve_compression('/path/file.gz'))
+
+    def test_explicit(self):
+        actual = resolve_compression('/path/file.json', Compression.LZ4)
+        self.assertIsInstance(actual, str)
+        self.assertEqual('lz4', actual)
+
+    def test_infer(self):
+        actual = resolve_compression('/path/file.json.zst', 'infer')
+        self.assertEqual('zstd', actual)
+
+    def test_infer_none(self):
+        self.assertIsNone(resolve_compression('/path/file.json', 'infer'))
+
+    def test_invalid_raises(self):
+        with self.assertRaises(ValueError):
+            _ = resolve_compression('/path/file.json', 'brotli')
+
+
+class TestCompressed(unittest.TestCase):
+
+    def setUp(self):
+        self.content = b'Hello World!\n' * 1000
+
+    def round_trip(self, compression, **kwargs):
+        raw = io.BytesIO()
+        with compressed(raw, compression, 'wb', **kwargs) as file:
+            file.write(self.content)
+        self.assertFalse(raw.closed)
+        raw.seek(0)
+        with compressed(raw, compression, 'rb') as file:
+            actual = file.read()
+        self.assertFalse(raw.closed)
+        return raw.getvalue(), actual
+
+    def test_none_binary(self):
+        raw = io.BytesIO()
+        with compressed(raw, None, 'wb') as file:
+            self.assertIs(raw, file)
+
+    def test_none_text(self):
+        raw = io.BytesIO()
+        with compressed(raw, None, 'wt') as file:
+            self.assertIsInstance(file, io.TextIOWrapper)
+        self.assertFalse(raw.closed)
+
+    def test_text(self):
+        raw = io.BytesIO()
+        with compressed(raw, Compression.GZIP, 'wt') as file:
+            file.write('Hello World!')
+        raw.seek(0)
+        with compressed(raw, Compression.GZIP, 'rt') as file:
+            actual = file.read()
+        self.assertEqual('Hello World!', actual)
+
+    def test_zip(self):
+        _, actual = self.round_trip(Compression.ZIP)
+        self.assertEqual(self.content, actual)
+
+    def test_bz2(self):
+        written, actual = self.round_trip(Compression.BZ2, level=1)
+        self.assertEqual(self.content, actual)
+        self.assertEqual(self.content, bz2.decompress(written))
+
+    def test_gzip(self):
+        written, actual = self.round_trip(Compression.GZIP, level=1)
+        self.assertEqual(self.content, actual)
+        self.assertEqual(self.content, gzip.decompress(written))
+
+    def test_gzip_level(self):
+        fast, _ = self.round_trip(Compression.GZIP, level=0)
+        best, _ = self.round_trip(Compression.GZIP, level=9)
+        self.assertGreater(len(fast), len(best))
+
+    def test_lzma(self):
+        written, actual = self.round_trip(Compression.LZMA, level=1)
+        self.assertEqual(self.content, actual)
+        self.assertEqual(self.content, lzma.decompress(written))
+
+    def test_xz(self):
+        written, actual = self.round_trip(Compression.XZ)
+        self.assertEqual(self.content, actual)
+        self.assertEqual(self.content, lzma.decompress(written))
+
+    @unittest.skipUnless(HAS_ZSTD, 'zstandard is not installed')
+    def test_zstd(self):
+        import zstandard
+        written, actual = self.round_trip(Compression.ZSTD)
+        self.assertEqual(self.content, actual)
+        decompressor = zstandard.ZstdDecompressor()
+        with decompressor.stream_reader(io.BytesIO(written)) as file:
+            self.assertEqual(self.content, file.read())
+
+    @unittest.skipUnless(HAS_ZSTD, 'zstandard is not installed')
+    def test_zstd_level_and_threads(self):
+        written, actual = self.round_trip(
+            Compression.ZSTD,
+            level=19,
+            threads=2
+        )
+        self.assertEqual(self.content, actual)
+
+    @unittest.skipUnless(HAS_LZ4, 'lz4 is not installed')
+    def test_lz4(self):
+        import lz4.frame
+        written, actual = self.round_trip(Compression.LZ4, level=9)
+        self.assertEqual(self.content, actual)
+        self.assertEqual(self.content, lz4.frame.decompress(written))
+
+    @patch('swak.io.codec.import_module')
+    def test_missing_library_raises(self, import_module):
+        import_module.side_effect = ImportError()
+        with (
+            self.assertRaises(ImportError),
+            compressed(io.BytesIO(), Compression.ZSTD, 'wb')
+        ):
+            pass
+
+    def test_invalid_raises(self):
+        with (
+            self.assertRaises(ValueError),
+            compressed(io.BytesIO(), 'brotli', 'wb')
+        ):
+            pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -19,7 +19,7 @@ class TestInstantiation(unittest.TestCase):
     def test_reader_init_called_defaults(self, init):
         _ = Csv2DataFrame()
         init.assert_called_once_with(
-            '', Storage.FILE, Mode.RT, 32, None, {}, 'pandas'
+            '', Storage.FILE, Mode.RT, 32, None, {}, 'pandas', cache=None
         )
 
     @patch.object(Reader, '__init__')
@@ -39,7 +39,8 @@ class TestInstantiation(unittest.TestCase):
             16,
             {'storage': 'kws'},
             {'csv': 'kws'},
-            'polars'
+            'polars',
+            cache=None
         )
 
     @patch.object(Reader, '__init__')
@@ -60,6 +61,7 @@ class TestInstantiation(unittest.TestCase):
             {'storage': 'kws'},
             {'csv': 'kws'},
             'polars',
+            cache=None
         )
 
 
@@ -0,0 +1,325 @@
+import pickle
+import unittest
+import threading
+from unittest.mock import patch
+from tempfile import TemporaryDirectory
+from pathlib import Path
+from fsspec.implementations.memory import MemoryFileSystem
+from swak.io import DiskCache, JsonReader, AsyncJsonReader, Reader, Storage
+
+
+class TestAttributes(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = TemporaryDirectory()
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_default_directory(self):
+        cache = DiskCache()
+        self.assertTrue(cache.directory.endswith('swak-cache'))
+
+    def test_custom_directory(self):
+        cache = DiskCache(self.dir.name)
+        self.assertEqual(str(Path(self.dir.name).resolve()), cache.directory)
+
+    def test_directory_created(self):
+        directory = self.dir.name + '/sub/cache'
+        _ = DiskCache(directory)
+        self.assertTrue(Path(directory).is_dir())
+
+    def test_directory_raises(self):
+        with self.assertRaises(TypeError):
+            _ = DiskCache(1)
+
+    def test_default_max_size(self):
+        cache = DiskCache(self.dir.name)
+        self.assertIsInstance(cache.max_size, float)
+        self.assertEqual(1024.0, cache.max_size)
+        self.assertEqual(1024 * 1024 * 1024, cache.max_bytes)
+
+    def test_max_size_raises_type(self):
+        with self.assertRaises(TypeError):
+            _ = DiskCache(self.dir.name, 'foo')
+
+    def test_max_size_raises_value(self):
+        with self.assertRaises(ValueError):
+            _ = DiskCache(self.dir.name, 0)
+
+    def test_default_lease(self):
+        cache = DiskCache(self.dir.name)
+        self.assertIsInstance(cache.lease, float)
+        self.assertEqual(10.0, cache.lease)
+
+    def test_lease_raises_type(self):
+        with self.assertRaises(TypeError):
+            _ = DiskCache(self.dir.name, lease='foo')
+
+    def test_lease_raises_value(self):
+        with self.assertRaises(ValueError):
+            _ = DiskCache(self.dir.name, lease=-1)
+
+    def test_stats_empty(self):
+        cache = DiskCache(self.dir.name)
+        expected = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'files': 0,
+            'bytes': 0
+        }
+        self.assertDictEqual(expected, cache.stats)
+
+    def test_existing_files_indexed(self):
+        (Path(self.dir.name) / 'abc').write_bytes(b'12345')
+        cache = DiskCache(self.dir.name)
+        self.assertEqual(1, cache.stats['files'])
+        self.assertEqual(5, cache.size)
+
+
+class TestUsage(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = TemporaryDirectory()
+        self.fs = MemoryFileSystem()
+        self.fs.pipe_file('/bucket/file.json', b'{"answer": 42}')
+        self.cache = DiskCache(self.dir.name)
+
+    def tearDown(self):
+        self.fs.rm('/bucket', recursive=True)
+        self.dir.cleanup()
+
+    def test_miss_then_hit(self):
+        first = self.cache.fetch(self.fs, '/bucket/file.json')
+        second = self.cache.fetch(self.fs, '/bucket/file.json')
+        self.assertEqual(first, second)
+        self.assertEqual(b'{"answer": 42}', Path(first).read_bytes())
+        self.assertEqual(1, self.cache.misses)
+        self.assertEqual(1, self.cache.hits)
+
+    def test_hit_does_not_download(self):
+        _ = self.cache.fetch(self.fs, '/bucket/file.json')
+        with patch.object(self.fs, 'get_file') as get_file:
+            _ = self.cache.fetch(self.fs, '/bucket/file.json')
+        get_file.assert_not_called()
+
+    def test_changed_file_is_refetched(self):
+        cache = DiskCache(self.dir.name, lease=0)
+        first = cache.fetch(self.fs, '/bucket/file.json')
+        self.fs.pipe_file('/bucket/file.json', b'{"answer": 43}')
+        with patch.object(cache, '_version', return_value='new'):
+            second = cache.fetch(self.fs, '/bucket/file.json')
+        self.assertNotEqual(first, second)
+        self.assertEqual(b'{"answer": 43}', Path(second).read_bytes())
+        self.assertFalse(Path(first).exists())
+        self.assertEqual(1, cache.stats['files'])
+
+    def test_lru_eviction(self):
+        cache = DiskCache(self.dir.name, 20 / 1024 / 1024, 0)
+        for i in range(3):
+            self.fs.pipe_file(f'/bucket/{i}.bin', b'0123456789')
+        _ = cache.fetch(self.fs, '/bucket/0.bin')
+        _ = cache.fetch(self.fs, '/bucket/1.bin')
+        _ = cache.fetch(self.fs, '/bucket/0.bin')
+        _ = cache.fetch(self.fs, '/bucket/2.bin')
+        self.assertEqual(1, cache.evictions)
+        self.assertEqual(20, cache.size)
+        self.assertEqual(3, cache.misses)
+        _ = cache.fetch(self.fs, '/bucket/0.bin')
+        self.assertEqual(2, cache.hits)
+
+    def test_leased_files_not_evicted(self):
+        cache = DiskCache(self.dir.name, 10 / 1024 / 1024)
+        self.fs.pipe_file('/bucket/0.bin', b'0123456789')
+        self.fs.pipe_file('/bucket/1.bin', b'0123456789')
+        first = cache.fetch(self.fs, '/bucket/0.bin')
+        _ = cache.fetch(self.fs, '/bucket/1.bin')
+        self.assertTrue(Path(first).exists())
+        self.assertEqual(0, cache.evictions)
+        self.assertEqual(20, cache.size)
+
+    def test_expired_leases_evicted(self):
+        cache = DiskCache(self.dir.name, 10 / 1024 / 1024, 0)
+        self.fs.pipe_file('/bucket/0.bin', b'0123456789')
+        self.fs.pipe_file('/bucket/1.bin', b'0123456789')
+        first = cache.fetch(self.fs, '/bucket/0.bin')
+        second = cache.fetch(self.fs, '/bucket/1.bin')
+        self.assertFalse(Path(first).exists())
+        self.assertTrue(Path(second).exists())
+        self.assertEqual(1, cache.evictions)
+
+    def test_lookup_miss_does_not_download(self):
+        with patch.object(self.fs, 'get_file') as get_file:
+            actual = self.cache.lookup(self.fs, '/bucket/file.json')
+        get_file.assert_not_called()
+        self.assertEqual('', actual)
+        self.assertEqual(0, self.cache.stats['files'])
+
+    def test_lookup_hit(self):
+        expected = self.cache.fetch(self.fs, '/bucket/file.json')
+        actual = self.cache.lookup(self.fs, '/bucket/file.json')
+        self.assertEqual(expected, actual)
+        self.assertEqual(0, self.cache.hits)
+
+    def test_lookup_changed_file_misses(self):
+        _ = self.cache.fetch(self.fs, '/bucket/file.json')
+        with patch.object(self.cache, '_version', return_value='new'):
+            actual = self.cache.lookup(self.fs, '/bucket/file.json')
+        self.assertEqual('', actual)
+
+    def test_lookup_does_not_count(self):
+        _ = self.cache.lookup(self.fs, '/bucket/file.json')
+        _ = self.cache.fetch(self.fs, '/bucket/file.json')
+        _ = self.cache.lookup(self.fs, '/bucket/file.json')
+        self.assertEqual(0, self.cache.hits)
+        self.assertEqual(1, self.cache.misses)
+
+    def test_lookup_does_not_evict(self):
+        cached = self.cache.fetch(self.fs, '/bucket/file.json')
+        with patch.object(self.cache, '_version', return_value='new'):
+            _ = self.cache.lookup(self.fs, '/bucket/file.json')
+        self.assertTrue(Path(cached).exists())
+        self.assertEqual(1, self.cache.stats['files'])
+        self.assertEqual(0, self.cache.evictions)
+
+    def test_lookup_missing_file_raises(self):
+        with self.assertRaises(FileNotFoundError):
+            _ = self.cache.lookup(self.fs, '/bucket/missing.json')
+
+    def test_missing_file_raises(self):
+        with self.assertRaises(FileNotFoundError):
+            _ = self.cache.fetch(self.fs, '/bucket/missing.json')
+        self.assertEqual(0, self.cache.stats['files'])
+
+    def test_no_temporary_files_left(self):
+        _ = self.cache.fetch(self.fs, '/bucket/file.json')
+        files = list(Path(self.cache.directory).iterdir())
+        self.assertEqual(1, len(files))
+
+    def test_clear(self):
+        path = self.cache.fetch(self.fs, '/bucket/file.json')
+        self.cache.clear()
+        self.assertFalse(Path(path).exists())
+        self.assertEqual(0, self.cache.size)
+        self.assertEqual(0, self.cache.misses)
+
+    def test_version_from_etag(self):
+        actual = self.cache._version({'ETag': '"abc"', 'size': 1})
+        self.assertEqual('"abc"', actual)
+
+    def test_version_from_generation(self):
+        actual = self.cache._version({'generation': 123, 'size': 1})
+        self.assertEqual('123', actual)
+
+    def test_pickle_works(self):
+        _ = self.cache.fetch(self.fs, '/bucket/file.json')
+        cache = pickle.loads(pickle.dumps(self.cache))
+        self.assertEqual(self.cache.directory, cache.directory)
+        self.assertEqual(self.cache.lease, cache.lease)
+        self.assertEqual(1, cache.stats['files'])
+
+
+class TestReader(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = TemporaryDirectory()
+        self.fs = MemoryFileSystem()
+        self.fs.pipe_file('/bucket/file.json', b'{"answer": 42}')
+        self.cache = DiskCache(self.dir.name)
+
+    def tearDown(self):
+        self.fs.rm('/bucket', recursive=True)
+        self.dir.cleanup()
+
+    def test_default_cache(self):
+        read = Reader()
+        self.assertIsNone(read.cache)
+        self.assertFalse(read.cached)
+
+    def test_cache_raises(self):
+        with self.assertRaises(TypeError):
+            _ = Reader(cache='foo')
+
+    def test_cache_ignored_for_local_files(self):
+        read = Reader(cache=self.cache)
+        self.assertFalse(read.cached)
+
+    def test_reads_through_cache(self):
+        read = JsonReader('/bucket', Storage.MEMORY, cache=self.cache)
+        self.assertTrue(read.cached)
+        self.assertDictEqual({'answer': 42}, read('file.json'))
+        self.assertDictEqual({'answer': 42}, read('file.json'))
+        self.assertEqual(1, self.cache.misses)
+        self.assertEqual(1, self.cache.hits)
+
+    def test_not_found_through_cache(self):
+        read = JsonReader(
+            '/bucket',
+            Storage.MEMORY,
+            not_found='ignore',
+            cache=self.cache
+        )
+        self.assertDictEqual({}, read('missing.json'))
+
+    def test_local_without_cache(self):
+        read = Reader('/bucket', Storage.MEMORY)
+        self.assertEqual('', read._local('/bucket/file.json'))
+
+    def test_cached_without_cache(self):
+        read = Reader('/bucket', Storage.MEMORY)
+        self.assertEqual('', read._cached('/bucket/file.json'))
+
+    def test_cached_does_not_fetch(self):
+        read = Reader('/bucket', Storage.MEMORY, cache=self.cache)
+        self.assertEqual('', read._cached('/bucket/file.json'))
+        local = read._local('/bucket/file.json')
+        self.assertEqual(local, read._cached('/bucket/file.json'))
+
+    def test_local_from_cache(self):
+        read = Reader('/bucket', Storage.MEMORY, cache=self.cache)
+        local = read._local('/bucket/file.json')
+        self.assertTrue(local.startswith(self.cache.directory))
+        self.assertEqual(b'{"answer": 42}', Path(local).read_bytes())
+
+    def test_pickle_works(self):
+        read = JsonReader('/bucket', Storage.MEMORY, cache=self.cache)
+        _ = pickle.loads(pickle.dumps(read))
+
+
+class TestAsyncReader(unittest.IsolatedAsyncioTestCase):
+
+    async def test_reads_through_cache(self):
+        fs = MemoryFileSystem()
+        fs.pipe_file('/bucket/file.json', b'{"answer": 42}')
+        with TemporaryDirectory() as tmp:
+            cache = DiskCache(tmp)
+            read = AsyncJsonReader('/bucket', Storage.MEMORY, cache=cache)
+            self.assertDictEqual({'answer': 42}, await read('file.json'))
+            self.assertDictEqual({'answer': 42}, await read('file.json'))
+        fs.rm('/bucket', recursive=True)
+        self.assertEqual(1, cache.misses)
+        self.assertEqual(1, cache.hits)
+
+    async def test_admits_outside_event_loop(self):
+        fs = MemoryFileSystem()
+        fs.pipe_file('/bucket/file.json', b'{"answer": 42}')
+        threads = []
+        with TemporaryDirectory() as tmp:
+            cache = DiskCache(tmp)
+            admit = cache._admit
+
+            def recorded(*args):
+                threads.append(threading.current_thread())
+                return admit(*args)
+
+            read = AsyncJsonReader('/bucket', Storage.MEMORY, cache=cache)
+            with patch.object(cache, '_admit', recorded):
+                _ = await read('file.json')
+        fs.rm('/bucket', recursive=True)
+        self.assertEqual(1, len(threads))
+        self.assertIsNot(threading.main_thread(), threads[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
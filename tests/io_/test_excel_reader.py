@@ -25,7 +25,11 @@ class TestInstantiation(unittest.TestCase):
             32,
             None,
             {'engine': 'calamine'},
-            'pandas'
+            'pandas',
+            None,
+            None,
+            4,
+            cache=None
         )
 
     @patch.object(Reader, '__init__')
@@ -45,7 +49,11 @@ class TestInstantiation(unittest.TestCase):
             16,
             {'storage': 'kws'},
             {'excel': 'kws', 'engine': 'calamine'},
-            'polars'
+            'polars',
+            None,
+            None,
+            4,
+            cache=None
         )
 
     @patch.object(Reader, '__init__')
@@ -66,6 +74,10 @@ class TestInstantiation(unittest.TestCase):
             {'storage': 'kws'},
             {'excel': 'kws', 'engine': 'calamine'},
             'polars',
+            None,
+            None,
+            4,
+            cache=None
         )
 
 
@@ -102,6 +114,48 @@ class TestAttributes(unittest.TestCase):
         with self.assertRaises(ValueError):
             _ = Excel2DataFrame(bear='grizzly')
 
+    def test_default_sheets(self):
+        read = Excel2DataFrame()
+        self.assertIsNone(read.sheets)
+
+    def test_custom_sheets(self):
+        read = Excel2DataFrame(sheets=('one', 2))
+        self.assertListEqual(['one', 2], read.sheets)
+
+    def test_default_n_rows(self):
+        read = Excel2DataFrame()
+        self.assertIsNone(read.n_rows)
+
+    def test_custom_n_rows(self):
+        read = Excel2DataFrame(n_rows=0)
+        self.assertIsInstance(read.n_rows, int)
+        self.assertEqual(0, read.n_rows)
+
+    def test_n_rows_wrong_type_raises(self):
+        with self.assertRaises(TypeError):
+            _ = Excel2DataFrame(n_rows='foo')
+
+    def test_n_rows_wrong_value_raises(self):
+        with self.assertRaises(ValueError):
+            _ = Excel2DataFrame(n_rows=-1)
+
+    def test_default_max_workers(self):
+        read = Excel2DataFrame()
+        self.assertEqual(4, read.max_workers)
+
+    def test_custom_max_workers(self):
+        read = Excel2DataFrame(max_workers=2.0)
+        self.assertIsInstance(read.max_workers, int)
+        self.assertEqual(2, read.max_workers)
+
+    def test_max_workers_wrong_type_raises(self):
+        with self.assertRaises(TypeError):
+            _ = Excel2DataFrame(max_workers='foo')
+
+    def test_max_workers_wrong_value_raises(self):
+        with self.assertRaises(ValueError):
+            _ = Excel2DataFrame(max_workers=0)
+
 
 class TestUsage(unittest.TestCase):
 
@@ -133,67 +187,185 @@ class TestUsage(unittest.TestCase):
         non_root.assert_called_once_with('/some/other/file.xlsx')
 
     @patch.object(Reader, '_managed')
-    def test_managed_called(self, managed):
+    def test_managed_not_called_local(self, managed):
         read = Excel2DataFrame(self.file, self.storage)
-        with self.path.open('rb') as file:
-            managed.return_value = file
-            _ = read()
-        managed.assert_called_once_with(self.file)
+        _ = read()
+        managed.assert_not_called()
+
+    def test_managed_called_remote(self):
+        read = Excel2DataFrame('/excel/valid.ods', Storage.MEMORY)
+        read.fs.pipe('/excel/valid.ods', self.path.read_bytes())
+        with patch.object(
+                Reader,
+                '_managed',
+                wraps=read._managed
+        ) as managed:
+            actual = read()
+        managed.assert_called_once_with('/excel/valid.ods')
+        pd.testing.assert_frame_equal(actual, self.pd_df)
+        read.fs.rm('/excel', recursive=True)
+
+    def test_remote_copy_removed(self):
+        read = Excel2DataFrame('/excel/valid.ods', Storage.MEMORY)
+        read.fs.pipe('/excel/valid.ods', self.path.read_bytes())
+        with read._source('/excel/valid.ods') as source:
+            copy = Path(source)
+            self.assertEqual('valid.ods', copy.name)
+            self.assertEqual(self.path.read_bytes(), copy.read_bytes())
+        self.assertFalse(copy.parent.exists())
+        read.fs.rm('/excel', recursive=True)
 
-    @patch.object(Reader, '_managed')
     @patch('swak.io.excel.pd.read_excel')
-    def test_pandas_read_excel_called_defaults(self, load, managed):
+    def test_pandas_read_excel_called_defaults(self, load):
         read = Excel2DataFrame(self.file, self.storage)
-        with self.path.open('rb') as file:
-            managed.return_value = file
-            load.return_value = self.pd_df
-            _ = read()
-            load.assert_called_once_with(file, engine='calamine')
+        load.return_value = self.pd_df
+        _ = read()
+        load.assert_called_once_with(self.file, engine='calamine')
 
-    @patch.object(Reader, '_managed')
     @patch('swak.io.excel.pd.read_excel')
-    def test_pandas_read_excel_called_custom(self, load, managed):
+    def test_pandas_read_excel_called_custom(self, load):
         read = Excel2DataFrame(
             self.file,
             self.storage,
             excel_kws={'excel': 'kws'},
         )
-        with self.path.open('rb') as file:
-            managed.return_value = file
-            load.return_value = self.pd_df
-            _ = read()
-            load.assert_called_once_with(file, engine='calamine', excel='kws')
-
+        load.return_value = self.pd_df
+        _ = read()
+        load.assert_called_once_with(self.file, engine='calamine', excel='kws')
 
+    @patch('swak.io.excel.pd.read_excel')
+    def test_pandas_read_excel_called_n_rows(self, load):
+        read = Excel2DataFrame(self.file, self.storage, n_rows=0)
+        load.return_value = self.pd_df
+        _ = read()
+        load.assert_called_once_with(self.file, engine='calamine', nrows=0)
 
-    @patch('swak.io.excel.BytesIO')
-    @patch.object(Reader, '_managed')
     @patch('swak.io.excel.pl.read_excel')
-    def test_polars_read_excel_called_defaults(self, load, managed, bytes_io):
+    def test_polars_read_excel_called_defaults(self, load):
         read = Excel2DataFrame(self.file, self.storage, bear=Bears.POLARS)
-        with self.path.open('rb') as file:
-            managed.return_value = file
-            load.return_value = self.pl_df
-            bytes_io.return_value = 42
-            _ = read()
-            load.assert_called_once_with(42, engine='calamine')
+        load.return_value = self.pl_df
+        _ = read()
+        load.assert_called_once_with(self.file, engine='calamine')
 
-    @patch('swak.io.excel.BytesIO')
-    @patch.object(Reader, '_managed')
     @patch('swak.io.excel.pl.read_excel')
-    def test_polars_read_excel_called_custom(self, load, managed, bytes_io):
+    def test_polars_read_excel_called_custom(self, load):
         read = Excel2DataFrame(
             self.file,
             self.storage,
             excel_kws={'excel': 'kws'},
             bear='polars'
         )
-        with self.path.open('rb') as file:
-            managed.return_value = file
-            load.return_value = self.pl_df
-            bytes_io.return_value = 42
-            _ = read()
-            load.assert_called_once_with(42, engine='calamine', excel='kws')
+        load.return_value = self.pl_df
+        _ = read()
+        load.assert_called_once_with(self.file, engine='calamine', excel='kws')
+
+    @patch('swak.io.excel.pl.read_excel')
+    def test_polars_read_excel_called_n_rows(self, load):
+        read = Excel2DataFrame(
+            self.file,
+            self.storage,
+            excel_kws={'read_options': {'header_row': 0}},
+            bear='polars',
+            n_rows=2
+        )
+        load.return_value = self.pl_df
+        _ = read()
+        load.assert_called_once_with(
+            self.file,
+            engine='calamine',
+            read_options={'header_row': 0, 'n_rows': 2}
+        )
+
+    @patch('swak.io.excel.pd.read_excel')
+    def test_pandas_read_excel_called_sheets(self, load):
+        read = Excel2DataFrame(self.file, self.storage, sheets=['Sheet1', 0])
+        load.return_value = {'Sheet1': self.pd_df, 0: self.pd_df}
+        _ = read()
+        load.assert_called_once_with(
+            self.file,
+            engine='calamine',
+            sheet_name=['Sheet1', 0]
+        )
+
+    @patch('swak.io.excel.pl.read_excel')
+    def test_polars_read_excel_called_sheets(self, load):
+        read = Excel2DataFrame(
+            self.file,
+            self.storage,
+            bear='polars',
+            sheets=['Sheet1', 0, 'Sheet1']
+        )
+        load.return_value = {'Sheet1': self.pl_df}
+        _ = read()
+        self.assertEqual(2, load.call_count)
+        load.assert_any_call(
+            self.file,
+            sheet_name=['Sheet1'],
+            engine='calamine'
+        )
+        load.assert_any_call(self.file, sheet_id=[1], engine='calamine')
+
+    @patch('swak.io.excel.pl.read_excel')
+    def test_polars_read_excel_called_once_for_names(self, load):
+        read = Excel2DataFrame(
+            self.file,
+            self.storage,
+            bear='polars',
+            sheets=['Sheet1', 'Sheet2']
+        )
+        load.return_value = {'Sheet1': self.pl_df, 'Sheet2': self.pl_df}
+        _ = read()
+        load.assert_called_once_with(
+            self.file,
+            sheet_name=['Sheet1', 'Sheet2'],
+            engine='calamine'
+        )
+
+    @patch('swak.io.excel.pl.read_excel')
+    def test_polars_read_excel_called_once_for_positions(self, load):
+        read = Excel2DataFrame(
+            self.file,
+            self.storage,
+            bear='polars',
+            sheets=[1, 0]
+        )
+        load.return_value = {'Sheet2': self.pl_df, 'Sheet1': self.pl_df}
+        _ = read()
+        load.assert_called_once_with(
+            self.file,
+            sheet_id=[2, 1],
+            engine='calamine'
+        )
+
+    @patch('swak.io.excel.pd.read_excel')
+    def test_no_sheets_not_parsed(self, load):
+        read = Excel2DataFrame(self.file, self.storage, sheets=[])
+        actual = read()
+        self.assertDictEqual({}, actual)
+        load.assert_not_called()
+
+    def test_bulk_calls_instance(self):
+        read = Excel2DataFrame(self.file, self.storage)
+        with patch.object(
+                Excel2DataFrame,
+                '__call__',
+                side_effect=['first', 'second']
+        ) as call:
+            actual = read.bulk(['foo', 'bar'])
+        self.assertEqual(2, call.call_count)
+        self.assertSetEqual({'first', 'second'}, set(actual))
+
+    def test_bulk_empty(self):
+        read = Excel2DataFrame(self.file, self.storage)
+        actual = read.bulk([])
+        self.assertListEqual([], actual)
+
+    def test_return_value_bulk(self):
+        read = Excel2DataFrame(self.file, self.storage, bear='polars')
+        actual = read.bulk([self.file, self.file, self.file])
+        self.assertEqual(3, len(actual))
+        for df in actual:
+            pl_assert_frame_equal(df, self.pl_df)
 
     def test_raises_on_file_not_found(self):
         read = Excel2DataFrame('/some/other/file.excel', self.storage)
@@ -215,13 +387,50 @@ class TestUsage(unittest.TestCase):
         actual = read()
         pl_assert_frame_equal(actual, self.pl_df)
 
+    def test_return_value_sheets_pandas(self):
+        read = Excel2DataFrame(self.file, self.storage, sheets=['Sheet1', 0])
+        actual = read()
+        self.assertIsInstance(actual, dict)
+        self.assertListEqual(['Sheet1', 0], list(actual))
+        for df in actual.values():
+            pd.testing.assert_frame_equal(df, self.pd_df)
+
+    def test_return_value_sheets_polars(self):
+        read = Excel2DataFrame(
+            self.file,
+            self.storage,
+            bear='polars',
+            sheets=['Sheet1', 0]
+        )
+        actual = read()
+        self.assertIsInstance(actual, dict)
+        self.assertListEqual(['Sheet1', 0], list(actual))
+        for df in actual.values():
+            pl_assert_frame_equal(df, self.pl_df)
+
+    def test_return_value_header_pandas(self):
+        read = Excel2DataFrame(self.file, self.storage, n_rows=0)
+        actual = read()
+        self.assertListEqual([1], list(actual.columns))
+        self.assertEqual(0, len(actual))
+
+    def test_return_value_first_rows_polars(self):
+        read = Excel2DataFrame(
+            self.file,
+            self.storage,
+            bear='polars',
+            n_rows=2
+        )
+        actual = read()
+        pl_assert_frame_equal(actual, self.pl_df.head(2))
+
 
 class TestMisc(unittest.TestCase):
 
     def test_default_repr(self):
         read = Excel2DataFrame()
-        expected = ("Excel2DataFrame('/', 'file',"
-                    " 32.0, {}, {'engine': 'calamine'}, 'pandas')")
+        expected = ("Excel2DataFrame('/', 'file', 32.0, {}, "
+                    "{'engine': 'calamine'}, 'pandas', None, None, 4)")
         self.assertEqual(expected, repr(read))
 
     def test_custom_repr(self):
@@ -235,7 +444,7 @@ class TestMisc(unittest.TestCase):
         )
         expected = ("Excel2DataFrame('/path/file.excel', 'memory', 16.0,"
                     " {'storage': 'kws'}, {'engine': 'calamine', "
-                    "'excel': 'kws'}, 'polars')")
+                    "'excel': 'kws'}, 'polars', None, None, 4)")
         self.assertEqual(expected, repr(read))
 
     def test_pickle_works(self):
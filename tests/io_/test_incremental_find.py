@@ -0,0 +1,311 @@
+import json
+import pickle
+import unittest
+from datetime import datetime, UTC
+from unittest.mock import patch
+from tempfile import TemporaryDirectory
+from pathlib import Path
+from swak.io import IncrementalFind, Find, Storage
+
+
+class TestAttributes(unittest.TestCase):
+
+    def test_is_find(self):
+        self.assertTrue(issubclass(IncrementalFind, Find))
+
+    def test_default_state(self):
+        find = IncrementalFind()
+        self.assertEqual('', find.state)
+
+    def test_custom_state(self):
+        find = IncrementalFind(state=' /path/to/state.json/ ')
+        self.assertEqual('/path/to/state.json', find.state)
+
+    def test_state_wrong_type_raises(self):
+        with self.assertRaises(TypeError):
+            _ = IncrementalFind(state=42)
+
+    def test_default_watermark(self):
+        find = IncrementalFind()
+        self.assertEqual('', find.watermark)
+
+    def test_custom_watermark(self):
+        for watermark in ('key', 'modified'):
+            with self.subTest(watermark=watermark):
+                find = IncrementalFind(watermark=watermark)
+                self.assertEqual(watermark, find.watermark)
+
+    def test_watermark_wrong_value_raises(self):
+        with self.assertRaises(ValueError):
+            _ = IncrementalFind(watermark='foo')
+
+
+class TestFingerprint(unittest.TestCase):
+
+    def test_etag(self):
+        info = {'ETag': '"abc"', 'LastModified': 'then', 'size': 1}
+        self.assertEqual('abc', IncrementalFind._fingerprint(info))
+
+    def test_gcs_etag(self):
+        info = {'etag': 'abc', 'updated': 'then', 'size': 1}
+        self.assertEqual('abc', IncrementalFind._fingerprint(info))
+
+    def test_mtime_and_size(self):
+        info = {'mtime': 1.5, 'size': 3}
+        self.assertEqual('1.5-3', IncrementalFind._fingerprint(info))
+
+    def test_size_only(self):
+        info = {'size': 3}
+        self.assertEqual('3', IncrementalFind._fingerprint(info))
+
+
+class TestModified(unittest.TestCase):
+
+    def test_datetime(self):
+        then = datetime(2024, 1, 2, tzinfo=UTC)
+        info = {'LastModified': then}
+        self.assertEqual(then.timestamp(), IncrementalFind._modified(info))
+
+    def test_iso_string(self):
+        info = {'updated': '2024-01-02T00:00:00+00:00'}
+        expected = datetime(2024, 1, 2, tzinfo=UTC).timestamp()
+        self.assertEqual(expected, IncrementalFind._modified(info))
+
+    def test_float(self):
+        self.assertEqual(1.5, IncrementalFind._modified({'mtime': 1.5}))
+
+    def test_missing_raises(self):
+        with self.assertRaises(KeyError):
+            _ = IncrementalFind._modified({'size': 1})
+
+
+class TestUsage(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = TemporaryDirectory()
+        self.root = Path(self.dir.name, 'landing')
+        self.root.mkdir()
+        for name in ('a.csv', 'b.csv', 'c.txt'):
+            (self.root / name).write_text(name)
+        self.state = self.dir.name + '/state/state.json'
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_first_call_returns_all(self):
+        find = IncrementalFind(str(self.root))
+        actual = find()
+        names = 'a.csv', 'b.csv', 'c.txt'
+        expected = [str(self.root / name) for name in names]
+        self.assertListEqual(expected, actual)
+
+    def test_second_call_returns_nothing(self):
+        find = IncrementalFind(str(self.root))
+        _ = find()
+        self.assertListEqual([], find())
+
+    def test_returns_new(self):
+        find = IncrementalFind(str(self.root))
+        _ = find()
+        (self.root / 'd.csv').write_text('d')
+        self.assertListEqual([str(self.root / 'd.csv')], find())
+
+    def test_returns_changed(self):
+        find = IncrementalFind(str(self.root))
+        _ = find()
+        (self.root / 'a.csv').write_text('changed')
+        self.assertListEqual([str(self.root / 'a.csv')], find())
+
+    def test_suffix(self):
+        find = IncrementalFind(str(self.root), suffix='csv')
+        actual = find()
+        expected = [str(self.root / 'a.csv'), str(self.root / 'b.csv')]
+        self.assertListEqual(expected, actual)
+
+    def test_paths_tracked_separately(self):
+        other = Path(self.dir.name, 'other')
+        other.mkdir()
+        (other / 'x.csv').write_text('x')
+        find = IncrementalFind(self.dir.name)
+        _ = find('landing')
+        self.assertListEqual([str(other / 'x.csv')], find('other'))
+        self.assertListEqual([], find('landing'))
+
+    def test_state_persisted(self):
+        find = IncrementalFind(str(self.root), state=self.state)
+        _ = find()
+        persisted = json.loads(Path(self.state).read_text())
+        self.assertEqual(1, len(persisted))
+        snapshot = next(iter(persisted.values()))
+        self.assertEqual(3, len(snapshot))
+
+    def test_state_survives_instances(self):
+        _ = IncrementalFind(str(self.root), state=self.state)()
+        (self.root / 'd.csv').write_text('d')
+        find = IncrementalFind(str(self.root), state=self.state)
+        self.assertListEqual([str(self.root / 'd.csv')], find())
+
+    def test_memory_storage(self):
+        find = IncrementalFind('/incremental', Storage.MEMORY)
+        find.fs.pipe('/incremental/a.txt', b'a')
+        self.assertListEqual(['/incremental/a.txt'], find())
+        self.assertListEqual([], find())
+        find.fs.rm('/incremental', recursive=True)
+
+
+class TestKeyWatermark(unittest.TestCase):
+
+    def setUp(self):
+        self.find = IncrementalFind(
+            '/landing',
+            Storage.MEMORY,
+            max_depth=None,
+            watermark='key'
+        )
+        self.fs = self.find.fs
+        for day in ('01', '02'):
+            self.fs.pipe(f'/landing/day={day}/a.csv', b'a')
+            self.fs.pipe(f'/landing/day={day}/b.csv', b'b')
+
+    def tearDown(self):
+        self.fs.rm('/landing', recursive=True)
+
+    def test_first_call_returns_all(self):
+        expected = [
+            '/landing/day=01/a.csv',
+            '/landing/day=01/b.csv',
+            '/landing/day=02/a.csv',
+            '/landing/day=02/b.csv'
+        ]
+        self.assertListEqual(expected, self.find())
+
+    def test_second_call_returns_nothing(self):
+        _ = self.find()
+        self.assertListEqual([], self.find())
+
+    def test_returns_only_after_watermark(self):
+        _ = self.find()
+        self.fs.pipe('/landing/day=02/c.csv', b'c')
+        self.fs.pipe('/landing/day=03/a.csv', b'a')
+        self.fs.pipe('/landing/day=01/c.csv', b'c')
+        expected = ['/landing/day=02/c.csv', '/landing/day=03/a.csv']
+        self.assertListEqual(expected, self.find())
+
+    def test_directories_before_watermark_not_listed(self):
+        _ = self.find()
+        with patch.object(self.fs, 'ls', wraps=self.fs.ls) as ls:
+            _ = self.find()
+        listed = [call.args[0] for call in ls.call_args_list]
+        self.assertNotIn('memory://landing/day=01', listed)
+        self.assertFalse(any('day=01' in path for path in listed))
+        self.assertEqual(2, len(listed))
+
+    def test_max_depth(self):
+        self.fs.pipe('/landing/top.csv', b't')
+        find = IncrementalFind('/landing', Storage.MEMORY, watermark='key')
+        self.assertListEqual(['/landing/top.csv'], find())
+
+    def test_suffix(self):
+        self.fs.pipe('/landing/day=02/c.txt', b'c')
+        find = IncrementalFind(
+            '/landing',
+            Storage.MEMORY,
+            'txt',
+            None,
+            watermark='key'
+        )
+        self.assertListEqual(['/landing/day=02/c.txt'], find())
+
+    def test_only_watermark_persisted(self):
+        with TemporaryDirectory() as tmp:
+            state = tmp + '/state.json'
+            find = IncrementalFind(
+                '/landing',
+                Storage.MEMORY,
+                max_depth=None,
+                state=state,
+                watermark='key'
+            )
+            find.fs.pipe(state, b'{}')
+            _ = find()
+            persisted = json.loads(find.fs.cat(state))
+        self.assertDictEqual(
+            {'memory://landing': '/landing/day=02/b.csv'},
+            persisted
+        )
+
+
+class TestModifiedWatermark(unittest.TestCase):
+
+    def setUp(self):
+        self.find = IncrementalFind(
+            '/landing',
+            Storage.MEMORY,
+            watermark='modified'
+        )
+        self.fs = self.find.fs
+        self.times = {'/landing/a.csv': 1.0, '/landing/b.csv': 2.0}
+        for file in self.times:
+            self.fs.pipe(file, b'x')
+
+    def tearDown(self):
+        self.fs.rm('/landing', recursive=True)
+
+    def modified(self, info):
+        return self.times[info['name']]
+
+    def test_first_call_returns_all(self):
+        with patch.object(IncrementalFind, '_modified', self.modified):
+            actual = self.find()
+        self.assertListEqual(list(self.times), actual)
+
+    def test_returns_newer_only(self):
+        with patch.object(IncrementalFind, '_modified', self.modified):
+            _ = self.find()
+            self.fs.pipe('/landing/c.csv', b'c')
+            self.fs.pipe('/landing/0.csv', b'0')
+            self.times['/landing/c.csv'] = 3.0
+            self.times['/landing/0.csv'] = 1.5
+            self.times['/landing/a.csv'] = 4.0
+            actual = self.find()
+        self.assertListEqual(['/landing/a.csv', '/landing/c.csv'], actual)
+
+    def test_same_time_as_watermark(self):
+        with patch.object(IncrementalFind, '_modified', self.modified):
+            _ = self.find()
+            self.fs.pipe('/landing/c.csv', b'c')
+            self.times['/landing/c.csv'] = 2.0
+            self.assertListEqual(['/landing/c.csv'], self.find())
+            self.assertListEqual([], self.find())
+
+    def test_watermark_kept(self):
+        with patch.object(IncrementalFind, '_modified', self.modified):
+            _ = self.find()
+            mark = self.find._IncrementalFind__snapshots['memory://landing']
+        self.assertListEqual([2.0, ['/landing/b.csv']], mark)
+
+    def test_memory_times(self):
+        self.assertListEqual(list(self.times), self.find())
+        self.assertListEqual([], self.find())
+
+
+class TestMisc(unittest.TestCase):
+
+    def test_default_repr(self):
+        find = IncrementalFind()
+        expected = "IncrementalFind('/', 'file', '', 1, {}, '', '')"
+        self.assertEqual(expected, repr(find))
+
+    def test_custom_repr(self):
+        find = IncrementalFind('/path', 'memory', 'csv', 2, {'a': 1}, 's.json')
+        expected = ("IncrementalFind('/path', 'memory', '.csv', 2, "
+                    "{'a': 1}, '/s.json', '')")
+        self.assertEqual(expected, repr(find))
+
+    def test_pickle_works(self):
+        find = IncrementalFind()
+        _ = pickle.loads(pickle.dumps(find))
+
+
+if __name__ == '__main__':
+    unittest.main()
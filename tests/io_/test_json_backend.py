@@ -0,0 +1,58 @@
+import json
+import unittest
+from unittest.mock import patch
+from importlib.util import find_spec
+from swak.io import JsonBackend
+from swak.io.json import json_backend, _loads_with, _dumps_with
+
+
+class TestJsonBackend(unittest.TestCase):
+
+    @patch('swak.io.json.find_spec')
+    def test_defaults_to_json(self, spec):
+        spec.return_value = object()
+        self.assertEqual('json', json_backend())
+
+    @patch('swak.io.json.find_spec')
+    def test_explicit_backend(self, spec):
+        spec.return_value = object()
+        self.assertEqual('orjson', json_backend(JsonBackend.ORJSON))
+
+    def test_explicit_json(self):
+        self.assertEqual('json', json_backend('json'))
+
+    def test_wrong_backend_raises(self):
+        with self.assertRaises(ValueError):
+            _ = json_backend('simplejson')
+
+    @patch('swak.io.json.find_spec')
+    def test_missing_backend_raises(self, spec):
+        spec.return_value = None
+        with self.assertRaises(ImportError):
+            _ = json_backend('orjson')
+
+    def test_json_loads_bytes(self):
+        loads = _loads_with('json')
+        self.assertDictEqual({'a': 1}, loads(b'{"a": 1}'))
+
+    def test_json_dumps_bytes(self):
+        dumps = _dumps_with('json')
+        actual = dumps({'a': 'ä'}, ensure_ascii=False)
+        expected = json.dumps({'a': 'ä'}, ensure_ascii=False).encode()
+        self.assertEqual(expected, actual)
+
+    @unittest.skipIf(find_spec('orjson') is None, 'orjson is not installed')
+    def test_orjson_round_trip(self):
+        obj = {'a': [1, 2.5, None, 'b']}
+        actual = _loads_with('orjson')(_dumps_with('orjson')(obj))
+        self.assertDictEqual(obj, actual)
+
+    @unittest.skipIf(find_spec('msgspec') is None, 'msgspec is not installed')
+    def test_msgspec_round_trip(self):
+        obj = {'a': [1, 2.5, None, 'b']}
+        actual = _loads_with('msgspec')(_dumps_with('msgspec')(obj))
+        self.assertDictEqual(obj, actual)
+
+
+if __name__ == '__main__':
+    unittest.main()
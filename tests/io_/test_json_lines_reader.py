@@ -0,0 +1,215 @@
+import gzip
+import json
+import pickle
+import unittest
+from unittest.mock import patch
+from importlib.util import find_spec
+from collections.abc import Iterator
+from tempfile import TemporaryDirectory
+from pathlib import Path
+from swak.io import JsonLinesReader, Reader, Storage, Mode, DiskCache
+
+BACKEND = 'json'
+
+
+class TestInstantiation(unittest.TestCase):
+
+    def test_is_reader(self):
+        self.assertTrue(issubclass(JsonLinesReader, Reader))
+
+    @patch.object(Reader, '__init__')
+    def test_reader_init_called_defaults(self, init):
+        _ = JsonLinesReader()
+        init.assert_called_once_with(
+            '', Storage.FILE, Mode.RB, 32, None, {}, None, BACKEND,
+            cache=None
+        )
+
+    @patch.object(Reader, '__init__')
+    def test_reader_init_called_custom(self, init):
+        _ = JsonLinesReader(
+            '/root',
+            Storage.MEMORY,
+            16,
+            {'storage': 'kws'},
+            {'json': 'kws'},
+            True,
+            'json'
+        )
+        init.assert_called_once_with(
+            '/root',
+            Storage.MEMORY,
+            Mode.RB,
+            16,
+            {'storage': 'kws'},
+            {'json': 'kws'},
+            True,
+            'json',
+            cache=None
+        )
+
+
+class TestAttributes(unittest.TestCase):
+
+    def test_default_gzip(self):
+        read = JsonLinesReader()
+        self.assertIsNone(read.gzip)
+
+    def test_custom_gzip(self):
+        read = JsonLinesReader(gzip=1)
+        self.assertIsInstance(read.gzip, bool)
+        self.assertTrue(read.gzip)
+
+    def test_default_backend(self):
+        read = JsonLinesReader()
+        self.assertEqual(BACKEND, read.backend)
+
+    def test_json_kws_select_json_backend(self):
+        read = JsonLinesReader(json_kws={'parse_int': float})
+        self.assertEqual('json', read.backend)
+
+
+class TestUsage(unittest.TestCase):
+
+    def setUp(self):
+        self.storage = Storage.FILE
+        self.dir = TemporaryDirectory()
+        self.file = self.dir.name + '/file.jsonl'
+        self.path = Path(self.file)
+        self.records = [{'id': i, 'name': f'event-{i}'} for i in range(5)]
+        self.content = '\n'.join(json.dumps(r) for r in self.records) + '\n'
+        self.path.write_text(self.content)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_callable(self):
+        read = JsonLinesReader()
+        self.assertTrue(callable(read))
+
+    def test_returns_iterator(self):
+        read = JsonLinesReader(self.file, self.storage)
+        actual = read()
+        self.assertIsInstance(actual, Iterator)
+        _ = list(actual)
+
+    @patch.object(Reader, '_managed')
+    def test_lazy(self, managed):
+        read = JsonLinesReader(self.file, self.storage)
+        _ = read()
+        managed.assert_not_called()
+
+    def test_return_value(self):
+        read = JsonLinesReader(self.file, self.storage)
+        actual = list(read())
+        self.assertListEqual(self.records, actual)
+
+    def test_relative_path(self):
+        read = JsonLinesReader(self.dir.name, self.storage)
+        actual = list(read('file.jsonl'))
+        self.assertListEqual(self.records, actual)
+
+    def test_no_trailing_newline(self):
+        self.path.write_text(self.content.rstrip())
+        read = JsonLinesReader(self.file, self.storage)
+        actual = list(read())
+        self.assertListEqual(self.records, actual)
+
+    def test_skips_empty_lines(self):
+        self.path.write_text('\n' + self.content.replace('\n', '\n\r\n'))
+        read = JsonLinesReader(self.file, self.storage)
+        actual = list(read())
+        self.assertListEqual(self.records, actual)
+
+    def test_lines_spanning_chunks(self):
+        read = JsonLinesReader(self.file, self.storage)
+        with patch.object(
+                JsonLinesReader,
+                'chunk_bytes',
+                new_callable=lambda: 7
+        ):
+            actual = list(read())
+        self.assertListEqual(self.records, actual)
+
+    def test_gzip_suffix(self):
+        zipped = self.file + '.gz'
+        Path(zipped).write_bytes(gzip.compress(self.content.encode()))
+        read = JsonLinesReader(zipped, self.storage)
+        actual = list(read())
+        self.assertListEqual(self.records, actual)
+
+    @unittest.skipIf(find_spec('zstandard') is None, 'zstandard is missing')
+    def test_zstd_suffix(self):
+        import zstandard
+        zipped = self.file + '.zst'
+        compressor = zstandard.ZstdCompressor()
+        Path(zipped).write_bytes(compressor.compress(self.content.encode()))
+        read = JsonLinesReader(zipped, self.storage)
+        actual = list(read())
+        self.assertListEqual(self.records, actual)
+
+    @unittest.skipIf(find_spec('lz4') is None, 'lz4 is not installed')
+    def test_lz4_suffix(self):
+        import lz4.frame
+        zipped = self.file + '.lz4'
+        Path(zipped).write_bytes(lz4.frame.compress(self.content.encode()))
+        read = JsonLinesReader(zipped, self.storage)
+        actual = list(read())
+        self.assertListEqual(self.records, actual)
+
+    def test_gzip_false(self):
+        zipped = self.file + '.gz'
+        Path(zipped).write_text(self.content)
+        read = JsonLinesReader(zipped, self.storage, gzip=False)
+        actual = list(read())
+        self.assertListEqual(self.records, actual)
+
+    def test_json_kws_used(self):
+        read = JsonLinesReader(
+            self.file,
+            self.storage,
+            json_kws={'parse_int': float}
+        )
+        actual = next(read())
+        self.assertIsInstance(actual['id'], float)
+
+    def test_cache(self):
+        with TemporaryDirectory() as tmp:
+            cache = DiskCache(tmp)
+            read = JsonLinesReader(
+                '/data/file.jsonl',
+                Storage.MEMORY,
+                cache=cache
+            )
+            read.fs.pipe_file('/data/file.jsonl', self.content.encode())
+            actual = list(read())
+            read.fs.rm('/data', recursive=True)
+        self.assertListEqual(self.records, actual)
+        self.assertEqual(1, cache.stats['misses'])
+
+    def test_raises_on_file_not_found(self):
+        read = JsonLinesReader('/some/other/file.jsonl', self.storage)
+        with self.assertRaises(FileNotFoundError):
+            _ = list(read())
+
+    def test_invalid_json_raises(self):
+        self.path.write_text('{"id": 1}\n{"id": \n')
+        read = JsonLinesReader(self.file, self.storage, backend='json')
+        with self.assertRaises(json.JSONDecodeError):
+            _ = list(read())
+
+
+class TestMisc(unittest.TestCase):
+
+    def test_default_repr(self):
+        read = JsonLinesReader(backend='json')
+        expected = "JsonLinesReader('/', 'file', 32.0, {}, {}, None, 'json')"
+        self.assertEqual(expected, repr(read))
+
+    def test_pickle_works(self):
+        read = JsonLinesReader()
+        _ = pickle.loads(pickle.dumps(read))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,246 @@
+import gzip
+import json
+import pickle
+import unittest
+from unittest.mock import patch
+from importlib.util import find_spec
+from tempfile import TemporaryDirectory
+from pathlib import Path
+from swak.io import JsonLinesWriter, Writer, Storage, Mode
+
+BACKEND = 'json'
+
+
+class TestInstantiation(unittest.TestCase):
+
+    def setUp(self):
+        self.path = '/path/to/file.jsonl'
+
+    def test_is_writer(self):
+        self.assertTrue(issubclass(JsonLinesWriter, Writer))
+
+    @patch.object(Writer, '__init__')
+    def test_writer_init_called_defaults(self, init):
+        _ = JsonLinesWriter(self.path)
+        init.assert_called_once_with(
+            self.path,
+            Storage.FILE,
+            False,
+            False,
+            Mode.WB,
+            32,
+            None,
+            {},
+            None,
+            BACKEND,
+            None,
+            None
+        )
+
+    @patch.object(Writer, '__init__')
+    def test_writer_init_called_custom(self, init):
+        _ = JsonLinesWriter(
+            '/some/other/file.jsonl',
+            Storage.MEMORY,
+            True,
+            True,
+            16,
+            {'foo': 'bar'},
+            {'answer': 42},
+            False,
+            'json',
+            5,
+            2
+        )
+        init.assert_called_once_with(
+            '/some/other/file.jsonl',
+            Storage.MEMORY,
+            True,
+            True,
+            Mode.WB,
+            16,
+            {'foo': 'bar'},
+            {'answer': 42},
+            False,
+            'json',
+            5,
+            2
+        )
+
+
+class TestAttributes(unittest.TestCase):
+
+    def setUp(self):
+        self.path = '/path/to/file.jsonl'
+
+    def test_default_gzip(self):
+        write = JsonLinesWriter(self.path)
+        self.assertIsNone(write.gzip)
+
+    def test_default_level(self):
+        write = JsonLinesWriter(self.path)
+        self.assertIsNone(write.level)
+
+    def test_default_threads(self):
+        write = JsonLinesWriter(self.path)
+        self.assertIsNone(write.threads)
+
+    def test_default_json_kws(self):
+        write = JsonLinesWriter(self.path)
+        self.assertDictEqual({}, write.json_kws)
+
+    def test_default_backend(self):
+        write = JsonLinesWriter(self.path)
+        self.assertEqual(BACKEND, write.backend)
+
+    def test_wrong_backend_raises(self):
+        with self.assertRaises(ValueError):
+            _ = JsonLinesWriter(self.path, backend='simplejson')
+
+
+class TestUsage(unittest.TestCase):
+
+    def setUp(self):
+        self.storage = Storage.FILE
+        self.dir = TemporaryDirectory()
+        self.file = self.dir.name + '/file.jsonl'
+        self.path = Path(self.file)
+        self.records = [{'id': i, 'name': f'event-{i}'} for i in range(5)]
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_callable(self):
+        write = JsonLinesWriter(self.file)
+        self.assertTrue(callable(write))
+
+    @patch.object(Writer, '_uri_from')
+    def test_uri_from_called(self, uri_from):
+        uri_from.return_value = self.file
+        write = JsonLinesWriter(self.file, self.storage)
+        _ = write(self.records, 'foo', 42)
+        uri_from.assert_called_once_with('foo', 42)
+
+    @patch.object(Writer, '_managed')
+    def test_managed_called_default(self, managed):
+        write = JsonLinesWriter(self.file, self.storage)
+        _ = write(self.records)
+        managed.assert_called_once_with(self.file, 'infer', None, None)
+
+    @patch.object(Writer, '_managed')
+    def test_managed_called_gzip_suffix(self, managed):
+        zipped = self.file + '.gz'
+        write = JsonLinesWriter(zipped, self.storage)
+        _ = write(self.records)
+        managed.assert_called_once_with(zipped, 'infer', None, None)
+
+    @patch.object(Writer, '_managed')
+    def test_managed_called_gzip_false(self, managed):
+        zipped = self.file + '.gz'
+        write = JsonLinesWriter(zipped, self.storage, gzip=False)
+        _ = write(self.records)
+        managed.assert_called_once_with(zipped, None, None, None)
+
+    @patch.object(Writer, '_managed')
+    @patch.object(Writer, '_uri_from')
+    def test_managed_not_called(self, uri_from, managed):
+        uri_from.return_value = ''
+        write = JsonLinesWriter(self.file, self.storage)
+        _ = write(self.records)
+        managed.assert_not_called()
+
+    def test_return_value(self):
+        write = JsonLinesWriter(self.file, self.storage)
+        actual = write(self.records)
+        self.assertTupleEqual((), actual)
+
+    def test_actually_saves(self):
+        write = JsonLinesWriter(self.file, self.storage)
+        _ = write(self.records)
+        lines = self.path.read_text().splitlines()
+        actual = [json.loads(line) for line in lines]
+        self.assertListEqual(self.records, actual)
+
+    def test_actually_saves_gzip(self):
+        zipped = self.file + '.gz'
+        write = JsonLinesWriter(zipped, self.storage)
+        _ = write(self.records)
+        lines = gzip.decompress(Path(zipped).read_bytes()).splitlines()
+        actual = [json.loads(line) for line in lines]
+        self.assertListEqual(self.records, actual)
+
+
+    @unittest.skipIf(find_spec('zstandard') is None, 'zstandard is missing')
+    def test_actually_saves_zstd(self):
+        import zstandard
+        zipped = self.file + '.zst'
+        write = JsonLinesWriter(zipped, self.storage, level=9, threads=2)
+        _ = write(self.records)
+        with zstandard.open(zipped, 'rb') as file:
+            lines = file.read().splitlines()
+        actual = [json.loads(line) for line in lines]
+        self.assertListEqual(self.records, actual)
+
+    @unittest.skipIf(find_spec('lz4') is None, 'lz4 is not installed')
+    def test_actually_saves_lz4(self):
+        import lz4.frame
+        zipped = self.file + '.lz4'
+        write = JsonLinesWriter(zipped, self.storage)
+        _ = write(self.records)
+        lines = lz4.frame.decompress(Path(zipped).read_bytes()).splitlines()
+        actual = [json.loads(line) for line in lines]
+        self.assertListEqual(self.records, actual)
+    def test_consumes_generator(self):
+        write = JsonLinesWriter(self.file, self.storage)
+        _ = write(record for record in self.records)
+        self.assertEqual(5, len(self.path.read_text().splitlines()))
+
+    def test_json_kws_used(self):
+        write = JsonLinesWriter(
+            self.file,
+            self.storage,
+            json_kws={'separators': (',', ':')}
+        )
+        _ = write(self.records[:1])
+        self.assertEqual('{"id":0,"name":"event-0"}\n', self.path.read_text())
+
+    def test_empty_records(self):
+        write = JsonLinesWriter(self.file, self.storage)
+        _ = write([])
+        self.assertEqual(b'', self.path.read_bytes())
+
+    def test_no_file_left_on_error(self):
+        write = JsonLinesWriter(self.file, self.storage)
+        with self.assertRaises(TypeError):
+            _ = write([{'id': 1}, {'id': object()}])
+        self.assertListEqual([], list(self.path.parent.iterdir()))
+
+    def test_raises_on_existing(self):
+        write = JsonLinesWriter(self.file, self.storage)
+        _ = write(self.records)
+        with self.assertRaises(FileExistsError):
+            _ = write(self.records)
+
+    def test_subdirectory_created_memory(self):
+        path = self.dir.name + '/sub/folder/file.jsonl'
+        write = JsonLinesWriter(path, 'memory')
+        _ = write(self.records)
+        self.assertEqual(5, len(write.fs.cat_file(path).splitlines()))
+        write.fs.rm(self.dir.name, recursive=True)
+
+
+class TestMisc(unittest.TestCase):
+
+    def test_default_repr(self):
+        write = JsonLinesWriter('/path/file.jsonl', backend='json')
+        expected = ("JsonLinesWriter('/path/file.jsonl', 'file', "
+                    "False, False, 32.0, {}, {}, None, 'json', None, None)")
+        self.assertEqual(expected, repr(write))
+
+    def test_pickle_works(self):
+        write = JsonLinesWriter('/path/file.jsonl')
+        _ = pickle.loads(pickle.dumps(write))
+
+
+if __name__ == '__main__':
+    unittest.main()
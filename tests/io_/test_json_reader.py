@@ -7,6 +7,8 @@ from pathlib import Path
 from json import JSONDecodeError
 from swak.io import JsonReader, Reader, Storage, Mode, Compression, NotFound
 
+BACKEND = 'json'
+
 
 class TestInstantiation(unittest.TestCase):
 
@@ -17,7 +19,8 @@ class TestInstantiation(unittest.TestCase):
     def test_reader_init_called_defaults(self, init):
         _ = JsonReader()
         init.assert_called_once_with(
-            '', Storage.FILE, Mode.RT, 32, None, {}, 'raise', None
+            '', Storage.FILE, Mode.RB, 32, None, {}, 'raise', None, BACKEND,
+            cache=None
         )
 
     @patch.object(Reader, '__init__')
@@ -34,12 +37,14 @@ class TestInstantiation(unittest.TestCase):
         init.assert_called_once_with(
             '/root',
             Storage.MEMORY,
-            Mode.RT,
+            Mode.RB,
             16,
             {'storage': 'kws'},
             {'json': 'kws'},
             'warn',
-            True
+            True,
+            'json',
+            cache=None
         )
 
     @patch.object(Reader, '__init__')
@@ -56,12 +61,14 @@ class TestInstantiation(unittest.TestCase):
         init.assert_called_once_with(
             '/path/to/file.json',
             Storage.MEMORY,
-            Mode.RT,
+            Mode.RB,
             16,
             {'storage': 'kws'},
             {'json': 'kws'},
             'ignore',
-            False
+            False,
+            'json',
+            cache=None
         )
 
 
@@ -161,38 +168,47 @@ class TestUsage(unittest.TestCase):
     @patch.object(Reader, '_managed')
     def test_managed_called_default(self, managed):
         read = JsonReader(self.file, self.storage)
-        with self.path.open('rt') as file:
+        with self.path.open('rb') as file:
             managed.return_value = file
             _ = read()
-            managed.assert_called_once_with(self.file, None)
+            managed.assert_called_once_with(self.file, 'infer')
 
     @patch.object(Reader, '_managed')
     def test_managed_called_custom(self, managed):
         read = JsonReader(self.file, self.storage, gzip=True)
-        with self.path.open('rt') as file:
+        with self.path.open('rb') as file:
             managed.return_value = file
             _ = read()
             managed.assert_called_once_with(self.file, Compression.GZIP)
 
     @patch.object(Reader, '_managed')
-    @patch('swak.io.json.json.load')
-    def test_json_load_called_defaults(self, load, managed):
-        read = JsonReader(self.file, self.storage)
-        with self.path.open('rt') as file:
+    @patch('swak.io.json.json.loads')
+    def test_json_loads_called_defaults(self, loads, managed):
+        read = JsonReader(self.file, self.storage, backend='json')
+        with self.path.open('rb') as file:
             managed.return_value = file
-            load.return_value = self.json
+            loads.return_value = self.json
             _ = read()
-            load.assert_called_once_with(file)
+            loads.assert_called_once_with(self.path.read_bytes())
 
     @patch.object(Reader, '_managed')
-    @patch('swak.io.json.json.load')
-    def test_json_load_called_custom(self, load, managed):
+    @patch('swak.io.json.json.loads')
+    def test_json_loads_called_custom(self, loads, managed):
         read = JsonReader(self.file, self.storage, json_kws={'json': 'kws'})
-        with self.path.open('rt') as file:
+        with self.path.open('rb') as file:
             managed.return_value = file
-            load.return_value = self.json
+            loads.return_value = self.json
             _ = read()
-            load.assert_called_once_with(file, json='kws')
+            loads.assert_called_once_with(self.path.read_bytes(), json='kws')
+
+    def test_json_kws_used(self):
+        read = JsonReader(
+            self.file,
+            self.storage,
+            json_kws={'parse_int': float}
+        )
+        actual = read()
+        self.assertIsInstance(actual['baz']['answer'], float)
 
     def test_raises_on_file_not_found(self):
         read = JsonReader('/some/other/file.json', self.storage)
@@ -236,7 +252,7 @@ class TestMisc(unittest.TestCase):
     def test_default_repr(self):
         read = JsonReader()
         expected = ("JsonReader('/', 'file',"
-                    " 32.0, {}, {}, 'raise', None)")
+                    f" 32.0, {{}}, {{}}, 'raise', None, '{BACKEND}')")
         self.assertEqual(expected, repr(read))
 
     def test_custom_repr(self):
@@ -250,7 +266,8 @@ class TestMisc(unittest.TestCase):
                 False
         )
         expected = ("JsonReader('/path/file.json', 'memory', 16.0,"
-                    " {'storage': 'kws'}, {'json': 'kws'}, 'warn', False)")
+                    " {'storage': 'kws'}, {'json': 'kws'}, 'warn', False,"
+                    " 'json')")
         self.assertEqual(expected, repr(read))
 
     def test_pickle_works(self):
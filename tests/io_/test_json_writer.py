@@ -5,6 +5,9 @@ from unittest.mock import patch
 from tempfile import TemporaryDirectory
 from pathlib import Path
 from swak.io import JsonWriter, Writer, Storage, Mode, Compression
+from swak.io import JsonBackend
+
+BACKEND = 'json'
 
 
 class TestInstantiation(unittest.TestCase):
@@ -23,10 +26,13 @@ class TestInstantiation(unittest.TestCase):
             Storage.FILE,
             False,
             False,
-            Mode.WT,
+            Mode.WB,
             32,
             None,
             {},
+            None,
+            BACKEND,
+            None,
             None
         )
 
@@ -40,18 +46,24 @@ class TestInstantiation(unittest.TestCase):
             16,
             {'foo': 'bar'},
             {'answer': 42},
-            False
+            False,
+            'json',
+            5,
+            2
         )
         init.assert_called_once_with(
             '/some/other/file.json',
             Storage.MEMORY,
             True,
             True,
-            Mode.WT,
+            Mode.WB,
             16,
             {'foo': 'bar'},
             {'answer': 42},
-            False
+            False,
+            'json',
+            5,
+            2
         )
 
 
@@ -73,6 +85,32 @@ class TestAttributes(unittest.TestCase):
         self.assertIsInstance(write.gzip, bool)
         self.assertTrue(write.gzip)
 
+    def test_has_level(self):
+        write = JsonWriter(self.path)
+        self.assertTrue(hasattr(write, 'level'))
+
+    def test_default_level(self):
+        write = JsonWriter(self.path)
+        self.assertIsNone(write.level)
+
+    def test_custom_level(self):
+        write = JsonWriter(self.path, level=5.0)
+        self.assertIsInstance(write.level, int)
+        self.assertEqual(5, write.level)
+
+    def test_has_threads(self):
+        write = JsonWriter(self.path)
+        self.assertTrue(hasattr(write, 'threads'))
+
+    def test_default_threads(self):
+        write = JsonWriter(self.path)
+        self.assertIsNone(write.threads)
+
+    def test_custom_threads(self):
+        write = JsonWriter(self.path, threads=-1.0)
+        self.assertIsInstance(write.threads, int)
+        self.assertEqual(-1, write.threads)
+
     def test_has_json_kws(self):
         write = JsonWriter(self.path)
         self.assertTrue(hasattr(write, 'json_kws'))
@@ -85,6 +123,30 @@ class TestAttributes(unittest.TestCase):
         write = JsonWriter(self.path, json_kws={'answer': 42})
         self.assertDictEqual({'answer': 42}, write.json_kws)
 
+    def test_has_backend(self):
+        write = JsonWriter(self.path)
+        self.assertTrue(hasattr(write, 'backend'))
+
+    def test_default_backend(self):
+        write = JsonWriter(self.path)
+        self.assertEqual(BACKEND, write.backend)
+
+    def test_custom_backend(self):
+        write = JsonWriter(self.path, backend=JsonBackend.JSON)
+        self.assertEqual('json', write.backend)
+
+    def test_json_kws_select_json_backend(self):
+        write = JsonWriter(self.path, json_kws={'indent': 2})
+        self.assertEqual('json', write.backend)
+
+    def test_wrong_backend_raises(self):
+        with self.assertRaises(ValueError):
+            _ = JsonWriter(self.path, backend='simplejson')
+
+    def test_has_dumps(self):
+        write = JsonWriter(self.path)
+        self.assertTrue(callable(write.dumps))
+
 
 class TestUsage(unittest.TestCase):
 
@@ -102,6 +164,11 @@ class TestUsage(unittest.TestCase):
         write = JsonWriter(self.file)
         self.assertTrue(callable(write))
 
+    def test_default_backend_allows_int_keys_and_nan(self):
+        write = JsonWriter(self.file)
+        _ = write({1: float('nan')})
+        self.assertEqual('{"1": NaN}', self.path.read_text())
+
     @patch.object(Writer, '_uri_from')
     def test_uri_from_called(self, uri_from):
         uri_from.return_value = self.file
@@ -111,25 +178,25 @@ class TestUsage(unittest.TestCase):
 
     @patch.object(Writer, '_managed')
     def test_managed_called_default(self, managed):
-        with self.path.open('wt') as file:
+        with self.path.open('wb') as file:
             managed.return_value = file
             write = JsonWriter(self.file, self.storage, overwrite=True)
             _ = write(self.json, 'foo', 42)
-        managed.assert_called_once_with(self.file, None)
+        managed.assert_called_once_with(self.file, 'infer', None, None)
 
     @patch.object(Writer, '_managed')
     def test_managed_called_gzip_suffix(self, managed):
         zipped = self.file + '.gz'
-        with Path(zipped).open('wt') as file:
+        with Path(zipped).open('wb') as file:
             managed.return_value = file
             write = JsonWriter(zipped, self.storage, overwrite=True)
             _ = write(self.json, 'foo', 42)
-        managed.assert_called_once_with(zipped, Compression.GZIP)
+        managed.assert_called_once_with(zipped, 'infer', None, None)
 
     @patch.object(Writer, '_managed')
     def test_managed_called_gzip_false(self, managed):
         zipped = self.file + '.gz'
-        with Path(zipped).open('wt') as file:
+        with Path(zipped).open('wb') as file:
             managed.return_value = file
             write = JsonWriter(
                 zipped,
@@ -138,12 +205,12 @@ class TestUsage(unittest.TestCase):
                 gzip=False
             )
             _ = write(self.json, 'foo', 42)
-        managed.assert_called_once_with(zipped, None)
+        managed.assert_called_once_with(zipped, None, None, None)
 
     @patch.object(Writer, '_managed')
     def test_managed_called_gzip_true(self, managed):
         zipped = self.file + '.gz'
-        with Path(zipped).open('wt') as file:
+        with Path(zipped).open('wb') as file:
             managed.return_value = file
             write = JsonWriter(
                 zipped,
@@ -152,7 +219,12 @@ class TestUsage(unittest.TestCase):
                 gzip=True
             )
             _ = write(self.json, 'foo', 42)
-        managed.assert_called_once_with(zipped, Compression.GZIP)
+        managed.assert_called_once_with(
+            zipped,
+            Compression.GZIP,
+            None,
+            None
+        )
 
     @patch.object(Writer, '_managed')
     @patch.object(Writer, '_uri_from')
@@ -162,19 +234,26 @@ class TestUsage(unittest.TestCase):
         _ = write(self.json, 'foo', 42)
         managed.assert_not_called()
 
-    @patch('swak.io.json.json.dump')
+    @patch('swak.io.json.json.dumps')
     @patch.object(Writer, '_managed')
-    def test_dump_called_defaults(self, managed, dump):
-        with self.path.open('wt') as file:
+    def test_dumps_called_defaults(self, managed, dumps):
+        dumps.return_value = '{}'
+        with self.path.open('wb') as file:
             managed.return_value = file
-            write = JsonWriter(self.file, self.storage, overwrite=True)
+            write = JsonWriter(
+                self.file,
+                self.storage,
+                overwrite=True,
+                backend='json'
+            )
             _ = write(self.json)
-            dump.assert_called_once_with(self.json, file)
+            dumps.assert_called_once_with(self.json)
 
-    @patch('swak.io.json.json.dump')
+    @patch('swak.io.json.json.dumps')
     @patch.object(Writer, '_managed')
-    def test_dump_called_custom(self, managed, dump):
-        with self.path.open('wt') as file:
+    def test_dumps_called_custom(self, managed, dumps):
+        dumps.return_value = '{}'
+        with self.path.open('wb') as file:
             managed.return_value = file
             write = JsonWriter(
                 self.file,
@@ -183,11 +262,13 @@ class TestUsage(unittest.TestCase):
                 json_kws={'answer': 42}
             )
             _ = write(self.json)
-            dump.assert_called_once_with(
-                self.json,
-                file,
-                answer=42
-            )
+            dumps.assert_called_once_with(self.json, answer=42)
+
+    def test_json_kws_used(self):
+        write = JsonWriter(self.file, self.storage, json_kws={'indent': 2})
+        _ = write(self.json)
+        expected = json.dumps(self.json, indent=2)
+        self.assertEqual(expected, self.path.read_text())
 
     def test_return_value(self):
         write = JsonWriter(self.file, self.storage)
@@ -226,13 +307,14 @@ class TestMisc(unittest.TestCase):
     def test_default_repr(self):
         write = JsonWriter(self.path)
         expected = ("JsonWriter('/path/file.json', 'file', "
-                    "False, False, 32.0, {}, {}, None)")
+                    f"False, False, 32.0, {{}}, {{}}, None, '{BACKEND}', "
+                    "None, None)")
         self.assertEqual(expected, repr(write))
 
     def test_custom_repr(self):
         write = JsonWriter(self.path, gzip=False, json_kws={'answer': 42})
-        expected = ("JsonWriter('/path/file.json', 'file', False, "
-                    "False, 32.0, {}, {'answer': 42}, False)")
+        expected = ("JsonWriter('/path/file.json', 'file', False, False, "
+                    "32.0, {}, {'answer': 42}, False, 'json', None, None)")
         self.assertEqual(expected, repr(write))
 
     def test_pickle_works(self):
@@ -0,0 +1,185 @@
+import pickle
+import unittest
+import numpy as np
+from unittest.mock import patch
+from tempfile import TemporaryDirectory
+from pathlib import Path
+from swak.io import Npy2Array, Reader, Storage, Mode, DiskCache
+
+
+class TestInstantiation(unittest.TestCase):
+
+    def test_is_reader(self):
+        self.assertTrue(issubclass(Npy2Array, Reader))
+
+    @patch.object(Reader, '__init__')
+    def test_reader_init_called_defaults(self, init):
+        _ = Npy2Array()
+        init.assert_called_once_with(
+            '', Storage.FILE, Mode.RB, 32, None, False, cache=None
+        )
+
+    @patch.object(Reader, '__init__')
+    def test_reader_init_called_custom(self, init):
+        _ = Npy2Array(
+            '/path/to/file.npy',
+            Storage.MEMORY,
+            16,
+            {'storage': 'kws'},
+            True
+        )
+        init.assert_called_once_with(
+            '/path/to/file.npy',
+            Storage.MEMORY,
+            Mode.RB,
+            16,
+            {'storage': 'kws'},
+            True,
+            cache=None
+        )
+
+
+class TestAttributes(unittest.TestCase):
+
+    def test_has_memory_map(self):
+        read = Npy2Array()
+        self.assertTrue(hasattr(read, 'memory_map'))
+
+    def test_default_memory_map(self):
+        read = Npy2Array()
+        self.assertFalse(read.memory_map)
+
+    def test_custom_memory_map(self):
+        read = Npy2Array(memory_map=1)
+        self.assertIsInstance(read.memory_map, bool)
+        self.assertTrue(read.memory_map)
+
+
+class TestUsage(unittest.TestCase):
+
+    def setUp(self):
+        self.storage = Storage.FILE
+        self.dir = TemporaryDirectory()
+        self.file = self.dir.name + '/file.npy'
+        self.archive = self.dir.name + '/file.npz'
+        self.path = Path(self.file)
+        self.array = np.arange(12, dtype=np.float32).reshape(3, 4)
+        np.save(self.file, self.array)
+        np.savez(self.archive, foo=self.array, bar=np.arange(3))
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_callable(self):
+        read = Npy2Array()
+        self.assertTrue(callable(read))
+
+    @patch.object(Reader, '_non_root')
+    def test_non_root_called(self, non_root):
+        non_root.return_value = self.file
+        read = Npy2Array(self.file, self.storage)
+        _ = read('/some/other/file.npy')
+        non_root.assert_called_once_with('/some/other/file.npy')
+
+    @patch.object(Reader, '_managed')
+    def test_managed_called(self, managed):
+        read = Npy2Array(self.file, self.storage)
+        with self.path.open('rb') as file:
+            managed.return_value = file
+            _ = read()
+        managed.assert_called_once_with(self.file)
+
+    def test_return_value_array(self):
+        read = Npy2Array(self.file, self.storage)
+        actual = read()
+        self.assertIsInstance(actual, np.ndarray)
+        self.assertNotIsInstance(actual, np.memmap)
+        np.testing.assert_array_equal(actual, self.array)
+
+    def test_return_value_archive(self):
+        read = Npy2Array(self.archive, self.storage)
+        actual = read()
+        self.assertIsInstance(actual, dict)
+        self.assertSetEqual({'foo', 'bar'}, set(actual))
+        np.testing.assert_array_equal(actual['foo'], self.array)
+        np.testing.assert_array_equal(actual['bar'], np.arange(3))
+
+    def test_return_value_archive_memory(self):
+        read = Npy2Array(self.archive, Storage.MEMORY)
+        read.fs.pipe_file(self.archive, Path(self.archive).read_bytes())
+        actual = read()
+        read.fs.rm(self.dir.name, recursive=True)
+        np.testing.assert_array_equal(actual['foo'], self.array)
+
+    @patch.object(Reader, '_managed')
+    def test_memory_map_skips_managed(self, managed):
+        read = Npy2Array(self.file, self.storage, memory_map=True)
+        _ = read()
+        managed.assert_not_called()
+
+    def test_memory_map_return_value(self):
+        read = Npy2Array(self.file, self.storage, memory_map=True)
+        actual = read()
+        self.assertIsInstance(actual, np.memmap)
+        self.assertFalse(actual.flags.writeable)
+        np.testing.assert_array_equal(actual, self.array)
+
+    def test_memory_map_archive(self):
+        read = Npy2Array(self.archive, self.storage, memory_map=True)
+        actual = read()
+        np.testing.assert_array_equal(actual['foo'], self.array)
+
+    @patch.object(Reader, '_managed')
+    def test_memory_map_ignored_for_remote(self, managed):
+        read = Npy2Array(self.file, Storage.MEMORY, memory_map=True)
+        with self.path.open('rb') as file:
+            managed.return_value = file
+            _ = read()
+        managed.assert_called_once_with(self.file)
+
+    def test_memory_map_through_cache(self):
+        with TemporaryDirectory() as tmp:
+            read = Npy2Array(
+                '/data/file.npy',
+                Storage.MEMORY,
+                memory_map=True,
+                cache=DiskCache(tmp)
+            )
+            read.fs.pipe_file('/data/file.npy', self.path.read_bytes())
+            actual = read()
+            self.assertIsInstance(actual, np.memmap)
+            np.testing.assert_array_equal(actual, self.array)
+            del actual
+            read.fs.rm('/data', recursive=True)
+
+    def test_object_array_raises(self):
+        np.save(self.file, np.array([{}, []], dtype=object))
+        read = Npy2Array(self.file, self.storage)
+        with self.assertRaises(ValueError):
+            _ = read()
+
+    def test_raises_on_file_not_found(self):
+        read = Npy2Array('/some/other/file.npy', self.storage)
+        with self.assertRaises(FileNotFoundError):
+            _ = read()
+
+
+class TestMisc(unittest.TestCase):
+
+    def test_default_repr(self):
+        read = Npy2Array()
+        expected = "Npy2Array('/', 'file', 32.0, {}, False)"
+        self.assertEqual(expected, repr(read))
+
+    def test_custom_repr(self):
+        read = Npy2Array('/path/file.npy', Storage.MEMORY, 16, {}, True)
+        expected = "Npy2Array('/path/file.npy', 'memory', 16.0, {}, True)"
+        self.assertEqual(expected, repr(read))
+
+    def test_pickle_works(self):
+        read = Npy2Array()
+        _ = pickle.loads(pickle.dumps(read))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,198 @@
+import pickle
+import unittest
+import numpy as np
+from unittest.mock import patch
+from tempfile import TemporaryDirectory
+from pathlib import Path
+from swak.io import Array2Npy, Writer, Storage, Mode
+
+
+class TestInstantiation(unittest.TestCase):
+
+    def setUp(self):
+        self.path = '/path/to/file.npy'
+
+    def test_is_writer(self):
+        self.assertTrue(issubclass(Array2Npy, Writer))
+
+    @patch.object(Writer, '__init__')
+    def test_writer_init_called_defaults(self, init):
+        _ = Array2Npy(self.path)
+        init.assert_called_once_with(
+            self.path,
+            Storage.FILE,
+            False,
+            False,
+            Mode.WB,
+            32,
+            None,
+            False
+        )
+
+    @patch.object(Writer, '__init__')
+    def test_writer_init_called_custom(self, init):
+        _ = Array2Npy(
+            '/some/other/file.npz',
+            Storage.MEMORY,
+            True,
+            True,
+            16,
+            {'foo': 'bar'},
+            True
+        )
+        init.assert_called_once_with(
+            '/some/other/file.npz',
+            Storage.MEMORY,
+            True,
+            True,
+            Mode.WB,
+            16,
+            {'foo': 'bar'},
+            True
+        )
+
+
+class TestAttributes(unittest.TestCase):
+
+    def setUp(self):
+        self.path = '/path/to/file.npy'
+
+    def test_has_compress(self):
+        write = Array2Npy(self.path)
+        self.assertTrue(hasattr(write, 'compress'))
+
+    def test_default_compress(self):
+        write = Array2Npy(self.path)
+        self.assertFalse(write.compress)
+
+    def test_custom_compress(self):
+        write = Array2Npy(self.path, compress=1)
+        self.assertIsInstance(write.compress, bool)
+        self.assertTrue(write.compress)
+
+
+class TestUsage(unittest.TestCase):
+
+    def setUp(self):
+        self.storage = Storage.FILE
+        self.dir = TemporaryDirectory()
+        self.file = self.dir.name + '/file.npy'
+        self.path = Path(self.file)
+        self.array = np.arange(12, dtype=np.float32).reshape(3, 4)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_callable(self):
+        write = Array2Npy(self.file)
+        self.assertTrue(callable(write))
+
+    @patch.object(Writer, '_uri_from')
+    def test_uri_from_called(self, uri_from):
+        uri_from.return_value = self.file
+        write = Array2Npy(self.file, self.storage)
+        _ = write(self.array, 'foo', 42)
+        uri_from.assert_called_once_with('foo', 42)
+
+    @patch.object(Writer, '_managed')
+    @patch.object(Writer, '_uri_from')
+    def test_managed_not_called(self, uri_from, managed):
+        uri_from.return_value = ''
+        write = Array2Npy(self.file, self.storage)
+        _ = write(self.array, 'foo', 42)
+        managed.assert_not_called()
+
+    def test_return_value(self):
+        write = Array2Npy(self.file, self.storage)
+        actual = write(self.array)
+        self.assertTupleEqual((), actual)
+
+    def test_actually_saves_array(self):
+        write = Array2Npy(self.file, self.storage)
+        _ = write(self.array)
+        actual = np.load(self.file)
+        np.testing.assert_array_equal(actual, self.array)
+        self.assertEqual(self.array.dtype, actual.dtype)
+
+    def test_actually_saves_dict(self):
+        arrays = {'foo': self.array, 'bar': np.arange(3)}
+        write = Array2Npy(self.dir.name + '/file.npz', self.storage)
+        _ = write(arrays)
+        with np.load(self.dir.name + '/file.npz') as actual:
+            self.assertSetEqual({'foo', 'bar'}, set(actual.files))
+            np.testing.assert_array_equal(actual['foo'], self.array)
+            np.testing.assert_array_equal(actual['bar'], np.arange(3))
+
+    @patch('swak.io.npy.np.savez_compressed')
+    def test_compress_dict(self, save):
+        arrays = {'foo': self.array}
+        write = Array2Npy(self.file, self.storage, compress=True)
+        _ = write(arrays)
+        save.assert_called_once()
+        self.assertDictEqual(
+            {'allow_pickle': False, 'foo': self.array},
+            save.call_args.kwargs
+        )
+
+    def test_object_array_raises(self):
+        write = Array2Npy(self.file, self.storage)
+        with self.assertRaises(ValueError):
+            _ = write(np.array([{}, []], dtype=object))
+        self.assertListEqual([], list(self.path.parent.iterdir()))
+
+    def test_parts_interpolated(self):
+        write = Array2Npy(self.dir.name + '/{}/{}.npy', self.storage)
+        _ = write(self.array, 'sub', 'file')
+        self.assertTrue((Path(self.dir.name) / 'sub' / 'file.npy').exists())
+
+    def test_raises_on_existing(self):
+        write = Array2Npy(self.file, self.storage)
+        _ = write(self.array)
+        with self.assertRaises(FileExistsError):
+            _ = write(self.array)
+
+    def test_skip(self):
+        write = Array2Npy(self.file, self.storage, skip=True)
+        _ = write(self.array)
+        _ = write(np.zeros(2))
+        np.testing.assert_array_equal(np.load(self.file), self.array)
+
+    def test_overwrite(self):
+        write = Array2Npy(self.file, self.storage, overwrite=True)
+        _ = write(np.zeros(2))
+        _ = write(self.array)
+        np.testing.assert_array_equal(np.load(self.file), self.array)
+
+    def test_subdirectory_created_memory(self):
+        path = self.dir.name + '/sub/folder/file.npy'
+        write = Array2Npy(path, 'memory')
+        _ = write(self.array)
+        with write.fs.open(path, 'rb') as file:
+            actual = np.load(file)
+        np.testing.assert_array_equal(actual, self.array)
+
+
+class TestMisc(unittest.TestCase):
+
+    def setUp(self):
+        self.path = '/path/file.npy'
+
+    def test_default_repr(self):
+        write = Array2Npy(self.path)
+        expected = ("Array2Npy('/path/file.npy', 'file', "
+                    "False, False, 32.0, {}, False)")
+        self.assertEqual(expected, repr(write))
+
+    def test_custom_repr(self):
+        write = Array2Npy(self.path, compress=True)
+        expected = ("Array2Npy('/path/file.npy', 'file', "
+                    "False, False, 32.0, {}, True)")
+        self.assertEqual(expected, repr(write))
+
+    def test_pickle_works(self):
+        write = Array2Npy(self.path)
+        _ = pickle.loads(pickle.dumps(write))
+
+
+if __name__ == '__main__':
+    unittest.main()
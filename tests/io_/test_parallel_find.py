@@ -0,0 +1,161 @@
+import pickle
+import unittest
+from collections.abc import Iterator
+from tempfile import TemporaryDirectory
+from pathlib import Path
+from swak.io import ParallelFind, Find, Storage
+
+
+class TestAttributes(unittest.TestCase):
+
+    def test_is_find(self):
+        self.assertTrue(issubclass(ParallelFind, Find))
+
+    def test_defaults(self):
+        find = ParallelFind()
+        self.assertEqual('', find.glob)
+        self.assertIsInstance(find.max_workers, int)
+        self.assertEqual(16, find.max_workers)
+
+    def test_custom(self):
+        find = ParallelFind(glob=' part-*.csv ', max_workers=4.0)
+        self.assertEqual('part-*.csv', find.glob)
+        self.assertIsInstance(find.max_workers, int)
+        self.assertEqual(4, find.max_workers)
+
+    def test_glob_wrong_type_raises(self):
+        with self.assertRaises(TypeError):
+            _ = ParallelFind(glob=42)
+
+    def test_max_workers_wrong_type_raises(self):
+        with self.assertRaises(TypeError):
+            _ = ParallelFind(max_workers='foo')
+
+    def test_max_workers_wrong_value_raises(self):
+        with self.assertRaises(ValueError):
+            _ = ParallelFind(max_workers=0)
+
+
+class TestUsage(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = TemporaryDirectory()
+        self.root = Path(self.dir.name)
+        for sub in ('a', 'b', 'a/c', 'a/c/d'):
+            (self.root / sub).mkdir()
+        self.files = [
+            'part-1.csv',
+            'part-2.txt',
+            'a/part-3.csv',
+            'a/other.csv',
+            'b/part-4.csv',
+            'a/c/part-5.csv',
+            'a/c/d/part-6.csv'
+        ]
+        for file in self.files:
+            (self.root / file).write_text(file)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def expected(self, *files):
+        return sorted(str(self.root / file) for file in files)
+
+    def test_returns_iterator(self):
+        find = ParallelFind(self.dir.name)
+        self.assertIsInstance(find(), Iterator)
+
+    def test_depth_1(self):
+        find = ParallelFind(self.dir.name)
+        actual = sorted(find())
+        self.assertListEqual(self.expected(*self.files[:2]), actual)
+
+    def test_depth_2(self):
+        find = ParallelFind(self.dir.name, max_depth=2)
+        actual = sorted(find())
+        self.assertListEqual(self.expected(*self.files[:5]), actual)
+
+    def test_unlimited_depth(self):
+        find = ParallelFind(self.dir.name, max_depth=None, max_workers=2)
+        actual = sorted(find())
+        self.assertListEqual(self.expected(*self.files), actual)
+
+    def test_same_as_find(self):
+        expected = sorted(Find(self.dir.name, max_depth=3)())
+        actual = sorted(ParallelFind(self.dir.name, max_depth=3)())
+        self.assertListEqual(expected, actual)
+
+    def test_suffix(self):
+        find = ParallelFind(self.dir.name, suffix='txt', max_depth=None)
+        actual = list(find())
+        self.assertListEqual(self.expected('part-2.txt'), actual)
+
+    def test_glob(self):
+        find = ParallelFind(self.dir.name, max_depth=None, glob='part-*')
+        actual = sorted(find())
+        expected = self.expected(*self.files[:3], *self.files[4:])
+        self.assertListEqual(expected, actual)
+
+    def test_glob_and_suffix(self):
+        find = ParallelFind(
+            self.dir.name,
+            suffix='csv',
+            max_depth=None,
+            glob='part-[34]*'
+        )
+        actual = sorted(find())
+        expected = self.expected('a/part-3.csv', 'b/part-4.csv')
+        self.assertListEqual(expected, actual)
+
+    def test_relative_path(self):
+        find = ParallelFind(self.dir.name)
+        actual = sorted(find('a'))
+        expected = self.expected('a/part-3.csv', 'a/other.csv')
+        self.assertListEqual(expected, actual)
+
+    def test_missing_directory(self):
+        find = ParallelFind(self.dir.name)
+        self.assertListEqual([], list(find('missing')))
+
+    def test_stop_early(self):
+        find = ParallelFind(self.dir.name, max_depth=None)
+        files = find()
+        first = next(files)
+        files.close()
+        self.assertIn(first, self.expected(*self.files))
+
+    def test_root_raises(self):
+        find = ParallelFind()
+        with self.assertRaises(ValueError):
+            _ = find()
+
+    def test_memory(self):
+        find = ParallelFind('/parallel', Storage.MEMORY, max_depth=None)
+        find.fs.pipe('/parallel/a.txt', b'a')
+        find.fs.pipe('/parallel/sub/b.txt', b'b')
+        actual = sorted(find())
+        expected = ['/parallel/a.txt', '/parallel/sub/b.txt']
+        self.assertListEqual(expected, actual)
+        find.fs.rm('/parallel', recursive=True)
+
+
+class TestMisc(unittest.TestCase):
+
+    def test_default_repr(self):
+        find = ParallelFind()
+        expected = "ParallelFind('/', 'file', '', 1, {}, '', 16)"
+        self.assertEqual(expected, repr(find))
+
+    def test_custom_repr(self):
+        find = ParallelFind('/path', 'memory', 'csv', 2, {'a': 1}, 'p*', 4)
+        expected = ("ParallelFind('/path', 'memory', '.csv', 2, "
+                    "{'a': 1}, 'p*', 4)")
+        self.assertEqual(expected, repr(find))
+
+    def test_pickle_works(self):
+        find = ParallelFind()
+        _ = pickle.loads(pickle.dumps(find))
+
+
+if __name__ == '__main__':
+    unittest.main()
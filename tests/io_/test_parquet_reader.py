@@ -20,7 +20,8 @@ class TestInstantiation(unittest.TestCase):
     def test_reader_init_called_defaults(self, init):
         _ = Parquet2DataFrame()
         init.assert_called_once_with(
-            '', Storage.FILE, Mode.RB, 32, None, {}, 'pandas'
+            '', Storage.FILE, Mode.RB, 32, None, {}, 'pandas', False,
+            cache=None
         )
 
     @patch.object(Reader, '__init__')
@@ -40,7 +41,9 @@ class TestInstantiation(unittest.TestCase):
             16,
             {'storage': 'kws'},
             {'parquet': 'kws'},
-            'polars'
+            'polars',
+            False,
+            cache=None
         )
 
     @patch.object(Reader, '__init__')
@@ -61,6 +64,8 @@ class TestInstantiation(unittest.TestCase):
             {'storage': 'kws'},
             {'parquet': 'kws'},
             'polars',
+            False,
+            cache=None
         )
 
 
@@ -94,6 +99,19 @@ class TestAttributes(unittest.TestCase):
         with self.assertRaises(ValueError):
             _ = Parquet2DataFrame(bear='grizzly')
 
+    def test_has_memory_map(self):
+        read = Parquet2DataFrame()
+        self.assertTrue(hasattr(read, 'memory_map'))
+
+    def test_default_memory_map(self):
+        read = Parquet2DataFrame()
+        self.assertFalse(read.memory_map)
+
+    def test_custom_memory_map(self):
+        read = Parquet2DataFrame(memory_map=True)
+        self.assertIsInstance(read.memory_map, bool)
+        self.assertTrue(read.memory_map)
+
     def test_has_read(self):
         read = Parquet2DataFrame()
         self.assertTrue(hasattr(read, 'read'))
@@ -197,6 +215,47 @@ class TestUsage(unittest.TestCase):
             _ = read()
             load.assert_called_once_with(file, parquet='kws')
 
+    @patch.object(Reader, '_managed')
+    @patch('swak.io.parquet.pd.read_parquet')
+    def test_memory_map_reads_path(self, load, managed):
+        read = Parquet2DataFrame(
+            self.file,
+            self.storage,
+            parquet_kws={'parquet': 'kws'},
+            memory_map=True
+        )
+        load.return_value = self.pd_df
+        _ = read()
+        managed.assert_not_called()
+        load.assert_called_once_with(
+            self.file,
+            memory_map=True,
+            parquet='kws'
+        )
+
+    @patch.object(Reader, '_managed')
+    def test_memory_map_ignored_for_remote(self, managed):
+        read = Parquet2DataFrame(self.file, Storage.MEMORY, memory_map=True)
+        with self.path.open('rb') as file:
+            managed.return_value = file
+            _ = read()
+        managed.assert_called_once_with(self.file)
+
+    def test_memory_map_return_value_pandas(self):
+        read = Parquet2DataFrame(self.file, self.storage, memory_map=True)
+        actual = read()
+        pd.testing.assert_frame_equal(actual, self.pd_df)
+
+    def test_memory_map_return_value_polars(self):
+        read = Parquet2DataFrame(
+            self.file,
+            self.storage,
+            bear='polars',
+            memory_map=True
+        )
+        actual = read()
+        pl_assert_frame_equal(actual, self.pl_df)
+
     def test_raises_on_file_not_found(self):
         read = Parquet2DataFrame('/some/other/file.parquet', self.storage)
         with self.assertRaises(FileNotFoundError):
@@ -226,7 +285,7 @@ class TestMisc(unittest.TestCase):
     def test_default_repr(self):
         read = Parquet2DataFrame()
         expected = ("Parquet2DataFrame('/', 'file',"
-                    " 32.0, {}, {}, 'pandas')")
+                    " 32.0, {}, {}, 'pandas', False)")
         self.assertEqual(expected, repr(read))
 
     def test_custom_repr(self):
@@ -239,7 +298,8 @@ class TestMisc(unittest.TestCase):
                 'polars'
         )
         expected = ("Parquet2DataFrame('/path/file.parquet', 'memory', 16.0,"
-                    " {'storage': 'kws'}, {'parquet': 'kws'}, 'polars')")
+                    " {'storage': 'kws'}, {'parquet': 'kws'}, 'polars',"
+                    " False)")
         self.assertEqual(expected, repr(read))
 
     def test_pickle_works(self):
@@ -1,7 +1,7 @@
 import unittest
 from unittest.mock import patch
 from swak.io.yaml import YamlParser
-from yaml import SafeLoader, Loader
+from yaml import SafeLoader, CLoader
 
 
 class TestAttributes(unittest.TestCase):
@@ -9,13 +9,25 @@ class TestAttributes(unittest.TestCase):
     def test_default_loader(self):
         y = YamlParser()
         self.assertTrue(hasattr(y, 'loader'))
-        self.assertIs(y.loader, Loader)
+        self.assertIs(y.loader, CLoader)
 
     def test_custom_loader(self):
         y = YamlParser(SafeLoader)
         self.assertTrue(hasattr(y, 'loader'))
         self.assertIs(y.loader, SafeLoader)
 
+    def test_default_memo_size(self):
+        y = YamlParser()
+        self.assertEqual(0, y.memo_size)
+
+    def test_custom_memo_size(self):
+        y = YamlParser(memo_size=3)
+        self.assertEqual(3, y.memo_size)
+
+    def test_memo_size_negative_raises(self):
+        with self.assertRaises(ValueError):
+            _ = YamlParser(memo_size=-1)
+
 
 class TestUsage(unittest.TestCase):
 
@@ -45,7 +57,7 @@ class TestUsage(unittest.TestCase):
     def test_load_called_with_defaults(self, mock):
         y = YamlParser()
         _ = y(self.yml)
-        mock.assert_called_once_with(self.yml, Loader)
+        mock.assert_called_once_with(self.yml, CLoader)
 
     @patch('swak.io.yaml.yaml.load')
     def test_load_called_with_custom(self, mock):
@@ -68,6 +80,22 @@ class TestUsage(unittest.TestCase):
         actual = y('---')
         self.assertDictEqual({}, actual)
 
+    def test_memo_parses_once(self):
+        y = YamlParser(memo_size=1)
+        with patch.object(y, '_parse', wraps=y._parse) as parse:
+            first = y(self.yml)
+            second = y(self.yml)
+        parse.assert_called_once_with(self.yml)
+        self.assertDictEqual(self.expected, first)
+        self.assertDictEqual(self.expected, second)
+        self.assertIsNot(first, second)
+
+    def test_memo_empty_yaml(self):
+        y = YamlParser(memo_size=1)
+        _ = y('')
+        actual = y('')
+        self.assertDictEqual({}, actual)
+
     def test_parse_empty_doc_newline_yaml(self):
         y = YamlParser()
         actual = y('---\n')
@@ -78,11 +106,11 @@ class TestMisc(unittest.TestCase):
 
     def test_default_repr(self):
         y = YamlParser()
-        self.assertEqual("YamlParser(Loader)", repr(y))
+        self.assertEqual("YamlParser(CLoader, 0)", repr(y))
 
     def test_custom_repr(self):
         y = YamlParser(SafeLoader)
-        self.assertEqual("YamlParser(SafeLoader)", repr(y))
+        self.assertEqual("YamlParser(SafeLoader, 0)", repr(y))
 
 
 if __name__ == '__main__':
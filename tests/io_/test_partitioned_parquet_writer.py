@@ -0,0 +1,305 @@
+import pickle
+import unittest
+import polars as pl
+from unittest.mock import patch
+from tempfile import TemporaryDirectory
+from pathlib import Path
+from polars.testing import assert_frame_equal as pl_assert_frame_equal
+from swak.io import DataFrame2PartitionedParquet, Writer, Storage, Mode
+
+
+class TestInstantiation(unittest.TestCase):
+
+    def setUp(self):
+        self.path = '/path/to/dataset'
+
+    def test_is_writer(self):
+        self.assertTrue(issubclass(DataFrame2PartitionedParquet, Writer))
+
+    @patch.object(Writer, '__init__')
+    def test_writer_init_called_defaults(self, init):
+        _ = DataFrame2PartitionedParquet(self.path, 'foo')
+        init.assert_called_once_with(
+            self.path,
+            Storage.FILE,
+            False,
+            False,
+            Mode.WB,
+            32,
+            None,
+            ('foo',),
+            None,
+            16,
+            {}
+        )
+
+    @patch.object(Writer, '__init__')
+    def test_writer_init_called_custom(self, init):
+        _ = DataFrame2PartitionedParquet(
+            '/some/other/dataset',
+            ['foo', 'bar'],
+            Storage.MEMORY,
+            True,
+            True,
+            100,
+            4,
+            16,
+            {'foo': 'bar'},
+            {'answer': 42}
+        )
+        init.assert_called_once_with(
+            '/some/other/dataset',
+            Storage.MEMORY,
+            True,
+            True,
+            Mode.WB,
+            16,
+            {'foo': 'bar'},
+            ('foo', 'bar'),
+            100,
+            4,
+            {'answer': 42}
+        )
+
+
+class TestAttributes(unittest.TestCase):
+
+    def setUp(self):
+        self.path = '/path/to/dataset'
+
+    def test_has_partition_by(self):
+        write = DataFrame2PartitionedParquet(self.path, 'foo')
+        self.assertTrue(hasattr(write, 'partition_by'))
+
+    def test_partition_by_string(self):
+        write = DataFrame2PartitionedParquet(self.path, 'foo')
+        self.assertTupleEqual(('foo',), write.partition_by)
+
+    def test_partition_by_iterable(self):
+        write = DataFrame2PartitionedParquet(self.path, ['foo', 'bar'])
+        self.assertTupleEqual(('foo', 'bar'), write.partition_by)
+
+    def test_partition_by_wrong_type_raises(self):
+        with self.assertRaises(TypeError):
+            _ = DataFrame2PartitionedParquet(self.path, 42)
+
+    def test_partition_by_wrong_element_type_raises(self):
+        with self.assertRaises(TypeError):
+            _ = DataFrame2PartitionedParquet(self.path, ['foo', 42])
+
+    def test_default_max_rows(self):
+        write = DataFrame2PartitionedParquet(self.path, 'foo')
+        self.assertIsNone(write.max_rows)
+
+    def test_custom_max_rows(self):
+        write = DataFrame2PartitionedParquet(self.path, 'foo', max_rows=2.0)
+        self.assertIsInstance(write.max_rows, int)
+        self.assertEqual(2, write.max_rows)
+
+    def test_max_rows_wrong_type_raises(self):
+        with self.assertRaises(TypeError):
+            _ = DataFrame2PartitionedParquet(self.path, 'foo', max_rows='a')
+
+    def test_max_rows_too_small_raises(self):
+        with self.assertRaises(ValueError):
+            _ = DataFrame2PartitionedParquet(self.path, 'foo', max_rows=0)
+
+    def test_default_max_workers(self):
+        write = DataFrame2PartitionedParquet(self.path, 'foo')
+        self.assertEqual(16, write.max_workers)
+
+    def test_max_workers_too_small_raises(self):
+        with self.assertRaises(ValueError):
+            _ = DataFrame2PartitionedParquet(self.path, 'foo', max_workers=0)
+
+    def test_default_parquet_kws(self):
+        write = DataFrame2PartitionedParquet(self.path, 'foo')
+        self.assertDictEqual({}, write.parquet_kws)
+
+
+class TestUsage(unittest.TestCase):
+
+    def setUp(self):
+        self.storage = Storage.FILE
+        self.dir = TemporaryDirectory()
+        self.root = self.dir.name + '/dataset'
+        self.df = pl.DataFrame({
+            'country': ['de', 'de', 'fr', 'de', None],
+            'year': [2024, 2025, 2024, 2024, 2025],
+            'value': [1.0, 2.0, 3.0, 4.0, 5.0]
+        })
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def scanned(self, root):
+        return pl.scan_parquet(
+            root + '/**/*.parquet',
+            hive_partitioning=True
+        ).select('country', 'year', 'value').sort('value').collect()
+
+    def test_manifest(self):
+        write = DataFrame2PartitionedParquet(self.root, 'country')
+        actual = write(self.df)
+        expected = [
+            self.root + '/country=de/part-00000.parquet',
+            self.root + '/country=fr/part-00000.parquet',
+            self.root + '/country=__HIVE_DEFAULT_PARTITION__/part-00000'
+                        '.parquet'
+        ]
+        self.assertListEqual(expected, actual)
+        for uri in actual:
+            self.assertTrue(Path(uri).exists())
+
+    def test_keys_not_in_files(self):
+        write = DataFrame2PartitionedParquet(self.root, 'country')
+        manifest = write(self.df)
+        actual = pl.read_parquet(manifest[0])
+        self.assertListEqual(['year', 'value'], actual.columns)
+
+    def test_round_trip_polars(self):
+        write = DataFrame2PartitionedParquet(self.root, ['country', 'year'])
+        _ = write(self.df)
+        pl_assert_frame_equal(self.scanned(self.root), self.df)
+
+    def test_round_trip_pandas(self):
+        write = DataFrame2PartitionedParquet(self.root, ['country', 'year'])
+        _ = write(self.df.to_pandas())
+        pl_assert_frame_equal(self.scanned(self.root), self.df)
+
+    def test_max_rows(self):
+        write = DataFrame2PartitionedParquet(self.root, 'country', max_rows=2)
+        manifest = write(self.df)
+        self.assertEqual(4, len(manifest))
+        self.assertTrue(manifest[1].endswith('country=de/part-00001.parquet'))
+        pl_assert_frame_equal(self.scanned(self.root), self.df)
+
+    def test_no_partition_columns(self):
+        write = DataFrame2PartitionedParquet(self.root, [], max_rows=2)
+        manifest = write(self.df)
+        self.assertEqual(3, len(manifest))
+        actual = pl.read_parquet(self.root + '/*.parquet')
+        pl_assert_frame_equal(actual, self.df)
+
+    def test_values_escaped(self):
+        df = pl.DataFrame({'key': ['a/b c'], 'value': [1]})
+        write = DataFrame2PartitionedParquet(self.root, 'key')
+        manifest = write(df)
+        expected = [self.root + '/key=a%2Fb%20c/part-00000.parquet']
+        self.assertListEqual(expected, manifest)
+
+    def test_parts_interpolated(self):
+        write = DataFrame2PartitionedParquet(self.dir.name + '/{}', 'country')
+        manifest = write(self.df, 'foo')
+        self.assertTrue(manifest[0].startswith(self.dir.name + '/foo/'))
+
+    def test_empty_dataframe(self):
+        write = DataFrame2PartitionedParquet(self.root, 'country')
+        manifest = write(self.df.clear())
+        self.assertListEqual([], manifest)
+
+    def test_raises_on_existing_without_writing(self):
+        write = DataFrame2PartitionedParquet(self.root, 'country')
+        _ = write(self.df.filter(pl.col('country') == 'fr'))
+        with self.assertRaises(FileExistsError):
+            _ = write(self.df)
+        self.assertFalse(Path(self.root, 'country=de').exists())
+
+    def test_skip(self):
+        write = DataFrame2PartitionedParquet(self.root, 'country', skip=True)
+        _ = write(self.df.filter(pl.col('country') == 'fr'))
+        manifest = write(self.df)
+        self.assertEqual(2, len(manifest))
+        skipped = self.root + '/country=fr/part-00000.parquet'
+        self.assertNotIn(skipped, manifest)
+
+    def test_overwrite(self):
+        write = DataFrame2PartitionedParquet(
+            self.root,
+            'country',
+            overwrite=True
+        )
+        _ = write(self.df.with_columns(pl.col('value') * 2))
+        manifest = write(self.df)
+        self.assertEqual(3, len(manifest))
+        pl_assert_frame_equal(
+            self.scanned(self.root).select('value'),
+            self.df.select('value')
+        )
+
+    def test_overwrite_removes_stale_parts(self):
+        write = DataFrame2PartitionedParquet(
+            self.root,
+            'country',
+            overwrite=True,
+            max_rows=1
+        )
+        _ = write(self.df)
+        write.max_rows = None
+        manifest = write(self.df.filter(pl.col('country') == 'de'))
+        files = [str(path) for path in Path(self.root).rglob('*.parquet')]
+        self.assertEqual(3, len(files))
+        self.assertTrue(set(manifest).issubset(files))
+        self.assertEqual(1, sum('country=de' in file for file in files))
+
+    def test_skip_wins_over_overwrite(self):
+        write = DataFrame2PartitionedParquet(
+            self.root,
+            'country',
+            overwrite=True,
+            skip=True
+        )
+        first = write(self.df)
+        second = write(self.df)
+        self.assertListEqual([], second)
+        for uri in first:
+            self.assertTrue(Path(uri).exists())
+
+    def test_no_temporary_files_left(self):
+        write = DataFrame2PartitionedParquet(self.root, 'country', max_rows=1)
+        manifest = write(self.df)
+        files = [str(path) for path in Path(self.root).rglob('*.*')]
+        self.assertListEqual(sorted(manifest), sorted(files))
+
+    @patch.object(Writer, '_managed')
+    def test_parquet_kws_used(self, managed):
+        df = pl.DataFrame({'country': ['de'], 'value': [1.0]})
+        path = Path(self.dir.name, 'file.parquet')
+        with path.open('wb') as file:
+            managed.return_value.__enter__.return_value = file
+            write = DataFrame2PartitionedParquet(
+                self.root,
+                'country',
+                parquet_kws={'compression': 'zstd'}
+            )
+            with patch.object(pl.DataFrame, 'write_parquet') as save:
+                _ = write(df)
+        save.assert_called_once_with(file, compression='zstd')
+
+    def test_memory(self):
+        write = DataFrame2PartitionedParquet(
+            self.root,
+            'country',
+            Storage.MEMORY
+        )
+        manifest = write(self.df)
+        for uri in manifest:
+            self.assertTrue(write.fs.exists(uri))
+        write.fs.rm(self.dir.name, recursive=True)
+
+
+class TestMisc(unittest.TestCase):
+
+    def test_default_repr(self):
+        write = DataFrame2PartitionedParquet('/path/dataset', 'foo')
+        expected = ("DataFrame2PartitionedParquet('/path/dataset', 'file', "
+                    "False, False, 32.0, {}, ('foo',), None, 16, {})")
+        self.assertEqual(expected, repr(write))
+
+    def test_pickle_works(self):
+        write = DataFrame2PartitionedParquet('/path/dataset', 'foo')
+        _ = pickle.loads(pickle.dumps(write))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,11 @@
 import pickle
 import unittest
+from tempfile import TemporaryDirectory
+from pathlib import Path
 from unittest.mock import Mock, patch, mock_open
 from fsspec.implementations.memory import MemoryFileSystem
 from fsspec.implementations.local import LocalFileSystem
-from swak.io import Reader, Storage, Mode, Compression
+from swak.io import Reader, Storage, Mode, Compression, DiskCache
 
 
 class TestDefaultAttributes(unittest.TestCase):
@@ -218,8 +220,7 @@ class TestMethods(unittest.TestCase):
         mock_fs.open.assert_called_once_with(
             '/test/file.txt',
             'rb',
-            read.chunk_bytes,
-            compression='bz2'
+            read.chunk_bytes
         )
 
     def test_managed_open_raises_invalid_compression(self):
@@ -259,6 +260,159 @@ class TestMethods(unittest.TestCase):
             _ = read._non_root('file.txt')
 
 
+class TestRanges(unittest.TestCase):
+
+    def setUp(self):
+        self.content = bytes(range(256)) * 4
+        self.dir = TemporaryDirectory()
+        self.local = str(Path(self.dir.name, 'file.bin'))
+        Path(self.local).write_bytes(self.content)
+        self.remote = '/ranges/file.bin'
+        self.read = Reader(storage=Storage.MEMORY)
+        self.read.fs.pipe(self.remote, self.content)
+        self.ranges = [
+            (10, 20),
+            (None, 4),
+            (-8, None),
+            (1000, 2000),
+            (15, 30),
+            (-20, -10),
+            (500, 500)
+        ]
+        self.expected = [
+            self.content[slice(start, end)]
+            for start, end in self.ranges
+        ]
+
+    def tearDown(self):
+        self.dir.cleanup()
+        self.read.fs.rm('/ranges', recursive=True)
+
+    def test_absolute(self):
+        self.assertTupleEqual((0, 10), Reader._absolute(None, None, 10))
+        self.assertTupleEqual((7, 9), Reader._absolute(-3, -1, 10))
+        self.assertTupleEqual((0, 10), Reader._absolute(-30, 30, 10))
+        self.assertTupleEqual((8, 8), Reader._absolute(8, 2, 10))
+
+    def test_coalesced(self):
+        ranges = [(50, 60), (0, 10), (5, 20), (25, 30)]
+        actual = Reader._coalesced(ranges, 5)
+        self.assertListEqual([(0, 30), (50, 60)], actual)
+
+    def test_coalesced_no_gap(self):
+        ranges = [(0, 10), (10, 20), (21, 30)]
+        actual = Reader._coalesced(ranges, 0)
+        self.assertListEqual([(0, 20), (21, 30)], actual)
+
+    def test_read_range_local(self):
+        read = Reader(self.dir.name)
+        actual = read.read_range('file.bin', 100, 110)
+        self.assertEqual(self.content[100:110], actual)
+
+    def test_read_range_local_footer(self):
+        read = Reader(self.local)
+        actual = read.read_range(start=-8)
+        self.assertEqual(self.content[-8:], actual)
+
+    def test_read_range_remote(self):
+        actual = self.read.read_range(self.remote, 100, 110)
+        self.assertEqual(self.content[100:110], actual)
+
+    def test_read_range_remote_footer(self):
+        actual = self.read.read_range(self.remote, -8)
+        self.assertEqual(self.content[-8:], actual)
+
+    def test_read_range_remote_cat_file_called(self):
+        with patch.object(self.read.fs, 'cat_file') as cat_file:
+            _ = self.read.read_range(self.remote, 100, 110)
+        cat_file.assert_called_once_with(self.remote, 100, 110)
+
+    def test_read_ranges_local(self):
+        read = Reader(self.local)
+        actual = read.read_ranges(ranges=self.ranges)
+        self.assertListEqual(self.expected, actual)
+
+    def test_read_ranges_remote(self):
+        actual = self.read.read_ranges(self.remote, self.ranges)
+        self.assertListEqual(self.expected, actual)
+
+    def test_read_ranges_remote_no_gap(self):
+        actual = self.read.read_ranges(self.remote, self.ranges, 0)
+        self.assertListEqual(self.expected, actual)
+
+    def test_read_ranges_empty(self):
+        self.assertListEqual([], self.read.read_ranges(self.remote))
+
+    def test_read_ranges_coalesced(self):
+        with patch.object(
+                self.read.fs,
+                'cat_ranges',
+                wraps=self.read.fs.cat_ranges
+        ) as cat_ranges:
+            _ = self.read.read_ranges(self.remote, [(0, 10), (20, 30)], 16)
+        cat_ranges.assert_called_once_with(
+            [self.remote],
+            [0],
+            [30],
+            on_error='raise'
+        )
+
+    def test_read_ranges_not_coalesced(self):
+        with patch.object(
+                self.read.fs,
+                'cat_ranges',
+                wraps=self.read.fs.cat_ranges
+        ) as cat_ranges:
+            _ = self.read.read_ranges(self.remote, [(0, 10), (20, 30)], 8)
+        cat_ranges.assert_called_once_with(
+            [self.remote, self.remote],
+            [0, 20],
+            [10, 30],
+            on_error='raise'
+        )
+
+    def test_read_range_uncached_not_fetched(self):
+        cache = DiskCache(self.dir.name + '/cache')
+        read = Reader(storage=Storage.MEMORY, cache=cache)
+        with patch.object(read.fs, 'get_file') as get_file:
+            actual = read.read_range(self.remote, 100, 110)
+        get_file.assert_not_called()
+        self.assertEqual(self.content[100:110], actual)
+        self.assertEqual(0, cache.stats['files'])
+
+    def test_read_ranges_uncached_not_fetched(self):
+        cache = DiskCache(self.dir.name + '/cache')
+        read = Reader(storage=Storage.MEMORY, cache=cache)
+        with patch.object(read.fs, 'get_file') as get_file:
+            actual = read.read_ranges(self.remote, self.ranges)
+        get_file.assert_not_called()
+        self.assertListEqual(self.expected, actual)
+        self.assertEqual(0, cache.stats['files'])
+
+    def test_read_range_from_cache_hit(self):
+        cache = DiskCache(self.dir.name + '/cache')
+        read = Reader(storage=Storage.MEMORY, cache=cache)
+        _ = read._local(self.remote)
+        with patch.object(read.fs, 'cat_file') as cat_file:
+            actual = read.read_range(self.remote, 100, 110)
+        cat_file.assert_not_called()
+        self.assertEqual(self.content[100:110], actual)
+
+    def test_read_ranges_from_cache_hit(self):
+        cache = DiskCache(self.dir.name + '/cache')
+        read = Reader(storage=Storage.MEMORY, cache=cache)
+        _ = read._local(self.remote)
+        with patch.object(read.fs, 'cat_ranges') as cat_ranges:
+            actual = read.read_ranges(self.remote, self.ranges)
+        cat_ranges.assert_not_called()
+        self.assertListEqual(self.expected, actual)
+
+    def test_read_range_root_raises(self):
+        read = Reader()
+        with self.assertRaises(ValueError):
+            _ = read.read_range('file.bin')
+
+
 class TestMisc(unittest.TestCase):
 
     def setUp(self):
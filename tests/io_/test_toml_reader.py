@@ -17,7 +17,7 @@ class TestInstantiation(unittest.TestCase):
     def test_reader_init_called_defaults(self, init):
         _ = TomlReader()
         init.assert_called_once_with(
-            '', Storage.FILE, Mode.RB, 32, None, {}, 'raise'
+            '', Storage.FILE, Mode.RB, 32, None, {}, 'raise', cache=None
         )
 
     @patch.object(Reader, '__init__')
@@ -37,7 +37,8 @@ class TestInstantiation(unittest.TestCase):
             16,
             {'storage': 'kws'},
             {'toml': 'kwargs'},
-            'warn'
+            'warn',
+            cache=None
         )
 
     @patch.object(Reader, '__init__')
@@ -58,6 +59,7 @@ class TestInstantiation(unittest.TestCase):
             {'storage': 'kws'},
             {'toml': 'kwargs'},
             'ignore',
+            cache=None
         )
 
 
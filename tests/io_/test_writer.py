@@ -1,9 +1,13 @@
+import json
 import pickle
+import shutil
 import unittest
 from unittest.mock import Mock, patch, mock_open
+from tempfile import TemporaryDirectory
+from pathlib import Path
 from fsspec.implementations.memory import MemoryFileSystem
 from fsspec.implementations.local import LocalFileSystem
-from swak.io import Writer, Storage, Mode, Compression
+from swak.io import Writer, Reader, JsonWriter, Storage, Mode, Compression
 
 
 class TestDefaultAttributes(unittest.TestCase):
@@ -311,10 +315,19 @@ class TestMethods(unittest.TestCase):
         mock_fs.open.assert_called_once_with(
             '/test/file.txt.tmp.hex',
             'wb',
-            write.chunk_bytes,
-            compression='bz2'
+            write.chunk_bytes
         )
 
+    def test_managed_write_compressed(self):
+        path = '/path/to/file.txt.gz'
+        write = Writer(path, self.storage, overwrite=True, mode=Mode.WT)
+        with write._managed(path, 'infer', 1) as file:
+            file.write('Hello World')
+        read = Reader(path, self.storage, mode=Mode.RT)
+        with read._managed(path, Compression.GZIP) as file:
+            text = file.read()
+        self.assertEqual('Hello World', text)
+
     def test_managed_open_raises_invalid_compression(self):
         write = Writer(self.path, self.storage, overwrite=True)
 
@@ -379,36 +392,188 @@ class TestMethods(unittest.TestCase):
         mock_fs.rm.assert_called_once_with('/test/file.txt.tmp.hex')
 
 
-class TestMisc(unittest.TestCase):
+class TestDirectories(unittest.TestCase):
 
     def setUp(self):
-        self.path = '/path/to/file.txt'
+        self.dir = TemporaryDirectory()
+        self.path = self.dir.name + '/{}/file-{}.json'
+
+    def tearDown(self):
+        self.dir.cleanup()
 
-    def test_default_repr(self):
+    def test_makedirs_called_once_per_directory(self):
+        write = JsonWriter(self.path, overwrite=True)
+        with patch.object(
+                write.fs,
+                'makedirs',
+                wraps=write.fs.makedirs
+        ) as makedirs:
+            for i in range(3):
+                _ = write({'answer': i}, 'sub', i)
+            _ = write({'answer': 3}, 'other', 3)
+        self.assertEqual(2, makedirs.call_count)
+
+    def test_exists_not_checked_on_overwrite(self):
+        write = JsonWriter(self.path, overwrite=True)
+        with patch.object(write.fs, 'exists') as exists:
+            _ = write({'answer': 1}, 'sub', 1)
+        exists.assert_not_called()
+
+    def test_exists_checked_on_every_call(self):
+        write = JsonWriter(self.path)
+        with patch.object(
+                write.fs,
+                'exists',
+                wraps=write.fs.exists
+        ) as exists:
+            for i in range(3):
+                _ = write({'answer': i}, 'sub', i)
+        self.assertEqual(3, exists.call_count)
+
+    def test_forget(self):
+        write = JsonWriter(self.path, overwrite=True)
+        _ = write({'answer': 1}, 'sub', 1)
+        write.forget()
+        with patch.object(
+                write.fs,
+                'makedirs',
+                wraps=write.fs.makedirs
+        ) as makedirs:
+            _ = write({'answer': 2}, 'sub', 2)
+        makedirs.assert_called_once()
+
+    def test_directories_bounded(self):
+        write = JsonWriter(self.path, overwrite=True)
+        write._directories.size = 2
+        for i in range(3):
+            _ = write({'answer': i}, i, i)
+        self.assertEqual(2, len(write._directories))
+        self.assertNotIn(self.dir.name + '/0', write._directories)
+        self.assertIn(self.dir.name + '/2', write._directories)
+
+    def test_directories_not_pickled(self):
+        write = JsonWriter(self.path, overwrite=True)
+        _ = write({'answer': 1}, 'sub', 1)
+        unpickled = pickle.loads(pickle.dumps(write))
+        self.assertEqual(0, len(unpickled._directories))
+        self.assertEqual(1024, unpickled._directories.size)
+
+    def test_reused_after_directory_removed(self):
+        write = JsonWriter(self.path)
+        _ = write({'answer': 1}, 'sub', 1)
+        shutil.rmtree(self.dir.name + '/sub')
+        _ = write({'answer': 2}, 'sub', 2)
+        self.assertTrue(Path(self.path.format('sub', 2)).exists())
+
+    def test_managed_creates_missing_parent(self):
         write = Writer(self.path)
-        expected = ("Writer('/path/to/file.txt', 'file', "
-                    "False, False, 32.0, {})")
-        self.assertEqual(expected, repr(write))
+        uri = self.path.format('sub', 1)
+        with write._managed(uri) as file:
+            file.write(b'{}')
+        self.assertEqual('{}', Path(uri).read_text())
 
-    def test_custom_repr(self):
-        write = Writer(
-            self.path,
-            'memory',
-            True,
-            True,
-            'wt',
-            16.0,
-            {'answer': 42},
-            'foo',
-            bar='baz'
-        )
-        expected = ("Writer('/path/to/file.txt', 'memory', True, True,"
-                    " 16.0, {'answer': 42}, 'foo', bar='baz')")
-        self.assertEqual(expected, repr(write))
+    def test_ls_normalizes_and_returns_files(self):
+        Path(self.dir.name, 'sub', 'nested').mkdir(parents=True)
+        Path(self.dir.name, 'sub', 'file-1.json').write_text('{}')
+        write = JsonWriter(self.path)
+        actual = write._ls(self.dir.name + '/sub')
+        expected = {self.dir.name + '/sub/file-1.json'}
+        self.assertSetEqual(expected, actual)
 
-    def test_pickle_works(self):
+    def test_ls_missing_directory(self):
+        write = JsonWriter(self.path)
+        self.assertIsNone(write._ls(self.dir.name + '/missing'))
+
+
+class TestBulk(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = TemporaryDirectory()
+        self.path = self.dir.name + '/{}/file-{}.json'
+        self.items = [({'answer': i}, f'sub{i % 2}', i) for i in range(8)]
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_has_bulk(self):
         write = Writer(self.path)
-        _ = pickle.loads(pickle.dumps(write))
+        self.assertTrue(hasattr(write, 'bulk'))
+        self.assertTrue(callable(write.bulk))
+
+    def test_return_value(self):
+        write = JsonWriter(self.path)
+        actual = write.bulk(self.items)
+        self.assertListEqual([()] * 8, actual)
+
+    def test_empty(self):
+        write = JsonWriter(self.path)
+        actual = write.bulk([])
+        self.assertListEqual([], actual)
+
+    def test_writes_all(self):
+        write = JsonWriter(self.path)
+        _ = write.bulk(self.items, max_workers=4)
+        for obj, *parts in self.items:
+            path = Path(self.path.format(*parts))
+            self.assertDictEqual(obj, json.loads(path.read_text()))
+
+    def test_lists_once_and_never_checks_existence(self):
+        write = JsonWriter(self.path)
+        with patch.object(
+                write.fs,
+                'ls',
+                wraps=write.fs.ls
+        ) as ls, patch.object(write.fs, 'exists') as exists:
+            _ = write.bulk(self.items)
+        self.assertEqual(2, ls.call_count)
+        exists.assert_not_called()
+
+    def test_lists_only_target_directories(self):
+        write = JsonWriter(self.path)
+        with patch.object(write.fs, 'ls', wraps=write.fs.ls) as ls:
+            _ = write.bulk(self.items)
+        listed = sorted(call.args[0] for call in ls.call_args_list)
+        expected = [self.dir.name + '/sub0', self.dir.name + '/sub1']
+        self.assertListEqual(expected, listed)
+
+    def test_makedirs_once_per_missing_directory(self):
+        Path(self.dir.name, 'sub0').mkdir()
+        write = JsonWriter(self.path)
+        with patch.object(
+                write.fs,
+                'makedirs',
+                wraps=write.fs.makedirs
+        ) as makedirs:
+            _ = write.bulk(self.items)
+        makedirs.assert_called_once_with(
+            self.dir.name + '/sub1',
+            exist_ok=True
+        )
+
+    def test_raises_on_existing(self):
+        write = JsonWriter(self.path)
+        _ = write.bulk(self.items[:1])
+        with self.assertRaises(FileExistsError):
+            _ = write.bulk(self.items)
+
+    def test_raises_on_duplicates(self):
+        write = JsonWriter(self.path)
+        with self.assertRaises(FileExistsError):
+            _ = write.bulk(self.items[:1] * 2, max_workers=1)
+
+    def test_skips_existing(self):
+        write = JsonWriter(self.path, skip=True)
+        _ = write({'answer': 'first'}, 'sub0', 0)
+        _ = write.bulk(self.items)
+        actual = json.loads(Path(self.path.format('sub0', 0)).read_text())
+        self.assertDictEqual({'answer': 'first'}, actual)
+
+    def test_listing_not_used_after_bulk(self):
+        write = JsonWriter(self.path)
+        _ = write.bulk(self.items)
+        Path(self.path.format('sub0', 'new')).write_text('{}')
+        with self.assertRaises(FileExistsError):
+            _ = write({'answer': 42}, 'sub0', 'new')
 
 
 if __name__ == '__main__':
@@ -4,7 +4,7 @@ import textwrap
 from unittest.mock import patch
 from tempfile import TemporaryDirectory
 from pathlib import Path
-from yaml import Loader, SafeLoader
+from yaml import CLoader, SafeLoader
 from yaml.scanner import ScannerError
 from swak.io import YamlReader, Reader, Storage, Mode, NotFound
 
@@ -18,7 +18,8 @@ class TestInstantiation(unittest.TestCase):
     def test_reader_init_called_defaults(self, init):
         _ = YamlReader()
         init.assert_called_once_with(
-            '', Storage.FILE, Mode.RB, 32, None, Loader, 'raise'
+            '', Storage.FILE, Mode.RB, 32, None, CLoader, 'raise', 0,
+            cache=None
         )
 
     @patch.object(Reader, '__init__')
@@ -38,7 +39,9 @@ class TestInstantiation(unittest.TestCase):
             16,
             {'storage': 'kws'},
             SafeLoader,
-            'warn'
+            'warn',
+            0,
+            cache=None
         )
 
     @patch.object(Reader, '__init__')
@@ -59,6 +62,8 @@ class TestInstantiation(unittest.TestCase):
             {'storage': 'kws'},
             SafeLoader,
             'ignore',
+            0,
+            cache=None
         )
 
 
@@ -70,7 +75,7 @@ class TestAttributes(unittest.TestCase):
 
     def test_default_loader(self):
         read = YamlReader()
-        self.assertIs(Loader, read.loader)
+        self.assertIs(CLoader, read.loader)
 
     def test_custom_loader(self):
         read = YamlReader(loader=SafeLoader)
@@ -92,6 +97,27 @@ class TestAttributes(unittest.TestCase):
         with self.assertRaises(ValueError):
             _ = YamlReader(not_found='wrong')
 
+    def test_has_memo_size(self):
+        read = YamlReader()
+        self.assertTrue(hasattr(read, 'memo_size'))
+
+    def test_default_memo_size(self):
+        read = YamlReader()
+        self.assertEqual(0, read.memo_size)
+
+    def test_custom_memo_size(self):
+        read = YamlReader(memo_size=4.0)
+        self.assertIsInstance(read.memo_size, int)
+        self.assertEqual(4, read.memo_size)
+
+    def test_memo_size_wrong_type_raises(self):
+        with self.assertRaises(TypeError):
+            _ = YamlReader(memo_size='foo')
+
+    def test_memo_size_negative_raises(self):
+        with self.assertRaises(ValueError):
+            _ = YamlReader(memo_size=-1)
+
 
 class TestUsage(unittest.TestCase):
 
@@ -156,7 +182,7 @@ class TestUsage(unittest.TestCase):
             managed.return_value = file
             load.return_value = self.yaml
             _ = read()
-            load.assert_called_once_with(file, Loader)
+            load.assert_called_once_with(file, CLoader)
 
     @patch.object(Reader, '_managed')
     @patch('swak.io.yaml.yaml.load')
@@ -204,13 +230,48 @@ class TestUsage(unittest.TestCase):
         actual = read(self.file)
         self.assertDictEqual(self.yaml, actual)
 
+    def test_memo_return_value(self):
+        read = YamlReader(self.file, self.storage, memo_size=2)
+        first = read()
+        second = read()
+        self.assertDictEqual(self.yaml, first)
+        self.assertDictEqual(self.yaml, second)
+
+    def test_memo_parses_once(self):
+        read = YamlReader(self.file, self.storage, memo_size=2)
+        with patch.object(read, '_parse', wraps=read._parse) as parse:
+            _ = read()
+            _ = read()
+        parse.assert_called_once_with(self.content)
+
+    def test_memo_returns_copies(self):
+        read = YamlReader(self.file, self.storage, memo_size=2)
+        first = read()
+        first['foo'] = 'changed'
+        second = read()
+        self.assertDictEqual(self.yaml, second)
+
+    def test_memo_detects_changed_content(self):
+        read = YamlReader(self.file, self.storage, memo_size=2)
+        _ = read()
+        self.path.write_bytes(b'foo: baz')
+        actual = read()
+        self.assertDictEqual({'foo': 'baz'}, actual)
+
+    def test_memo_bounded(self):
+        read = YamlReader(self.file, self.storage, memo_size=2)
+        for value in range(4):
+            self.path.write_bytes(f'foo: {value}'.encode())
+            _ = read()
+        self.assertEqual(2, len(read._memo))
+
 
 class TestMisc(unittest.TestCase):
 
     def test_default_repr(self):
         read = YamlReader()
         expected = ("YamlReader('/', 'file',"
-                    " 32.0, {}, Loader, 'raise')")
+                    " 32.0, {}, CLoader, 'raise', 0)")
         self.assertEqual(expected, repr(read))
 
     def test_custom_repr(self):
@@ -223,13 +284,18 @@ class TestMisc(unittest.TestCase):
                 'warn'
         )
         expected = ("YamlReader('/path/file.yml', 'memory', 16.0,"
-                    " {'storage': 'kws'}, SafeLoader, 'warn')")
+                    " {'storage': 'kws'}, SafeLoader, 'warn', 0)")
         self.assertEqual(expected, repr(read))
 
     def test_pickle_works(self):
         read = YamlReader()
         _ = pickle.loads(pickle.dumps(read))
 
+    def test_pickle_works_with_memo(self):
+        read = YamlReader(memo_size=2)
+        unpickled = pickle.loads(pickle.dumps(read))
+        self.assertEqual(2, unpickled._memo.size)
+
 
 if __name__ == '__main__':
     unittest.main()
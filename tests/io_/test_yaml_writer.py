@@ -26,7 +26,8 @@ class TestInstantiation(unittest.TestCase):
             Mode.WT,
             32,
             None,
-            {}
+            {},
+            yaml.CDumper
         )
 
     @patch.object(Writer, '__init__')
@@ -48,7 +49,8 @@ class TestInstantiation(unittest.TestCase):
             Mode.WT,
             16,
             {'foo': 'bar'},
-            {'answer': 42}
+            {'answer': 42},
+            yaml.CDumper
         )
 
 
@@ -69,6 +71,18 @@ class TestAttributes(unittest.TestCase):
         write = YamlWriter(self.path, yaml_kws={'answer': 42})
         self.assertDictEqual({'answer': 42}, write.yaml_kws)
 
+    def test_has_dumper(self):
+        write = YamlWriter(self.path)
+        self.assertTrue(hasattr(write, 'dumper'))
+
+    def test_default_dumper(self):
+        write = YamlWriter(self.path)
+        self.assertIs(yaml.CDumper, write.dumper)
+
+    def test_custom_dumper(self):
+        write = YamlWriter(self.path, dumper=yaml.SafeDumper)
+        self.assertIs(yaml.SafeDumper, write.dumper)
+
 
 class TestUsage(unittest.TestCase):
 
@@ -116,7 +130,7 @@ class TestUsage(unittest.TestCase):
             managed.return_value = file
             write = YamlWriter(self.file, self.storage, overwrite=True)
             _ = write(self.yml)
-            dump.assert_called_once_with(self.yml, file)
+            dump.assert_called_once_with(self.yml, file, yaml.CDumper)
 
     @patch('swak.io.yaml.yaml.dump')
     @patch.object(Writer, '_managed')
@@ -133,6 +147,7 @@ class TestUsage(unittest.TestCase):
             dump.assert_called_once_with(
                 self.yml,
                 file,
+                yaml.CDumper,
                 answer=42
             )
 
@@ -173,13 +188,14 @@ class TestMisc(unittest.TestCase):
     def test_default_repr(self):
         write = YamlWriter(self.path)
         expected = ("YamlWriter('/path/file.yml', "
-                    "'file', False, False, 32.0, {}, {})")
+                    "'file', False, False, 32.0, {}, {}, CDumper)")
         self.assertEqual(expected, repr(write))
 
     def test_custom_repr(self):
         write = YamlWriter(self.path, yaml_kws={'answer': 42})
         expected = ("YamlWriter('/path/file.yml', "
-                    "'file', False, False, 32.0, {}, {'answer': 42})")
+                    "'file', False, False, 32.0, {}, {'answer': 42}, "
+                    "CDumper)")
         self.assertEqual(expected, repr(write))
 
     def test_pickle_works(self):
@@ -0,0 +1,157 @@
+import pickle
+import unittest
+import polars as pl
+from unittest.mock import patch, Mock
+from tempfile import TemporaryDirectory
+from pathlib import Path
+import polars.testing
+from swak.pl.io import LazyFrame2Csv, LazyWriter, LazyStorage
+
+
+class TestInstantiation(unittest.TestCase):
+
+    def setUp(self):
+        self.path = '/path/to/file.csv'
+
+    def test_is_writer(self):
+        self.assertTrue(issubclass(LazyFrame2Csv, LazyWriter))
+
+    @patch.object(LazyWriter, '__init__')
+    def test_writer_init_called_defaults(self, init):
+        _ = LazyFrame2Csv(self.path)
+        init.assert_called_once_with(
+            self.path,
+            LazyStorage.FILE,
+            None
+        )
+
+    @patch.object(LazyWriter, '__init__')
+    def test_writer_init_called_custom(self, init):
+        _ = LazyFrame2Csv(
+            '/some/other/file.csv',
+            LazyStorage.AZURE,
+            {'foo': 'bar'},
+            answer=42
+        )
+        init.assert_called_once_with(
+            '/some/other/file.csv',
+            LazyStorage.AZURE,
+            {'foo': 'bar'},
+            answer=42
+        )
+
+
+class TestAttributes(unittest.TestCase):
+
+    def setUp(self):
+        self.path = '/path/to/file.csv'
+
+    def test_has_kwargs(self):
+        write = LazyFrame2Csv(self.path)
+        self.assertTrue(hasattr(write, 'kwargs'))
+
+    def test_default_csv_kws(self):
+        write = LazyFrame2Csv(self.path)
+        self.assertDictEqual({}, write.kwargs)
+
+    def test_custom_csv_kws(self):
+        write = LazyFrame2Csv(self.path, answer=42)
+        self.assertDictEqual({'answer': 42}, write.kwargs)
+
+
+class TestUsage(unittest.TestCase):
+
+    def setUp(self):
+        self.storage = LazyStorage.FILE
+        self.dir = TemporaryDirectory()
+        self.file = self.dir.name + '/file.csv'
+        self.path = Path(self.file)
+        self.df = Mock()
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_callable(self):
+        write = LazyFrame2Csv(self.file)
+        self.assertTrue(callable(write))
+
+    @patch.object(LazyWriter, '_uri_from')
+    def test_uri_from_called(self, uri_from):
+        uri_from.return_value = self.file
+        write = LazyFrame2Csv(self.file, self.storage)
+        _ = write(self.df, 'foo', 42)
+        uri_from.assert_called_once_with('foo', 42)
+
+    def test_to_csv_called_defaults(self):
+        write = LazyFrame2Csv(self.file, self.storage)
+        _ = write(self.df)
+        self.df.sink_csv.assert_called_once_with(
+            self.file,
+            storage_options={}
+        )
+
+    def test_to_csv_called_custom(self):
+        write = LazyFrame2Csv(
+            self.file,
+            storage=LazyStorage.AZURE,
+            storage_kws={'foo': 'bar'},
+            answer=42
+        )
+        _ = write(self.df)
+        self.df.sink_csv.assert_called_once_with(
+            'az:/' + self.file,
+            storage_options={'foo': 'bar'},
+            answer=42
+        )
+
+    def test_return_value(self):
+        write = LazyFrame2Csv(self.file, self.storage)
+        actual = write(self.df)
+        self.assertTupleEqual((), actual)
+
+    def test_actually_saves_polars(self):
+        df = pl.DataFrame([{'foo': 42}, {'bar': 43}])
+        write = LazyFrame2Csv(self.file, self.storage)
+        _ = write(df.lazy())
+        with self.path.open('rb') as file:
+            actual = pl.read_csv(file)
+        pl.testing.assert_frame_equal(actual, df)
+
+    def test_subdirectory_created_file(self):
+        df = pl.DataFrame([{'foo': 42}, {'bar': 43}])
+        path = self.dir.name + '/sub/folder/file.csv'
+        write = LazyFrame2Csv(path, self.storage, mkdir=True)
+        _ = write(df.lazy())
+        with Path(path).open('rb') as file:
+            actual = pl.read_csv(file)
+        pl.testing.assert_frame_equal(actual, df)
+
+
+class TestMisc(unittest.TestCase):
+
+    def setUp(self):
+        self.path = '/path/file.csv'
+
+    def test_default_repr(self):
+        write = LazyFrame2Csv(self.path)
+        expected = "LazyFrame2Csv('/path/file.csv', 'file', {})"
+        self.assertEqual(expected, repr(write))
+
+    def test_custom_repr(self):
+        write = LazyFrame2Csv(
+            self.path,
+            'hf',
+            storage_kws={'foo': 'bar'},
+            answer=42
+        )
+        expected = ("LazyFrame2Csv('/path/file.csv', 'hf', "
+                    "{'foo': 'bar'}, answer=42)")
+        self.assertEqual(expected, repr(write))
+
+    def test_pickle_works(self):
+        write = LazyFrame2Csv(self.path)
+        _ = pickle.loads(pickle.dumps(write))
+
+
+if __name__ == '__main__':
+    unittest.main()
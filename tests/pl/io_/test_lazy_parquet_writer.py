@@ -1,11 +1,12 @@
 import pickle
 import unittest
 import polars as pl
-from unittest.mock import patch, Mock
+from unittest.mock import patch, Mock, ANY
 from tempfile import TemporaryDirectory
 from pathlib import Path
 import polars.testing
 from swak.pl.io import LazyFrame2Parquet, LazyWriter, LazyStorage
+from swak.pl.io.parquet import _CALLBACK
 
 
 class TestInstantiation(unittest.TestCase):
@@ -22,21 +23,40 @@ class TestInstantiation(unittest.TestCase):
         init.assert_called_once_with(
             self.path,
             LazyStorage.FILE,
-            None
+            None,
+            (),
+            None,
+            None,
+            True,
+            None,
+            False
         )
 
+    @patch('swak.pl.io.parquet._CALLBACK', True)
     @patch.object(LazyWriter, '__init__')
     def test_writer_init_called_custom(self, init):
         _ = LazyFrame2Parquet(
             '/some/other/file.parquet',
             LazyStorage.AZURE,
             {'foo': 'bar'},
+            ['year', 'month'],
+            1000,
+            100,
+            'full',
+            'in-memory',
+            True,
             answer=42
         )
         init.assert_called_once_with(
             '/some/other/file.parquet',
             LazyStorage.AZURE,
             {'foo': 'bar'},
+            ('year', 'month'),
+            1000,
+            100,
+            'full',
+            'in-memory',
+            True,
             answer=42
         )
 
@@ -58,6 +78,113 @@ class TestAttributes(unittest.TestCase):
         write = LazyFrame2Parquet(self.path, answer=42)
         self.assertDictEqual({'answer': 42}, write.kwargs)
 
+    def test_default_partition_by(self):
+        write = LazyFrame2Parquet(self.path)
+        self.assertTupleEqual((), write.partition_by)
+
+    def test_custom_partition_by_str(self):
+        write = LazyFrame2Parquet(self.path, partition_by='year')
+        self.assertTupleEqual(('year',), write.partition_by)
+
+    def test_custom_partition_by_list(self):
+        write = LazyFrame2Parquet(self.path, partition_by=['year', 'month'])
+        self.assertTupleEqual(('year', 'month'), write.partition_by)
+
+    def test_partition_by_wrong_type_raises(self):
+        with self.assertRaises(TypeError):
+            _ = LazyFrame2Parquet(self.path, partition_by=42)
+
+    def test_partition_by_wrong_column_type_raises(self):
+        with self.assertRaises(TypeError):
+            _ = LazyFrame2Parquet(self.path, partition_by=['year', 42])
+
+    def test_default_max_rows(self):
+        write = LazyFrame2Parquet(self.path)
+        self.assertIsNone(write.max_rows)
+
+    def test_custom_max_rows(self):
+        write = LazyFrame2Parquet(self.path, max_rows=1000.0)
+        self.assertIsInstance(write.max_rows, int)
+        self.assertEqual(1000, write.max_rows)
+
+    def test_max_rows_wrong_type_raises(self):
+        with self.assertRaises(TypeError):
+            _ = LazyFrame2Parquet(self.path, max_rows='foo')
+
+    def test_max_rows_wrong_value_raises(self):
+        with self.assertRaises(ValueError):
+            _ = LazyFrame2Parquet(self.path, max_rows=0)
+
+    def test_default_row_group_size(self):
+        write = LazyFrame2Parquet(self.path)
+        self.assertIsNone(write.row_group_size)
+
+    def test_custom_row_group_size(self):
+        write = LazyFrame2Parquet(self.path, row_group_size=100.0)
+        self.assertIsInstance(write.row_group_size, int)
+        self.assertEqual(100, write.row_group_size)
+
+    def test_row_group_size_wrong_value_raises(self):
+        with self.assertRaises(ValueError):
+            _ = LazyFrame2Parquet(self.path, row_group_size=-1)
+
+    def test_default_statistics(self):
+        write = LazyFrame2Parquet(self.path)
+        self.assertTrue(write.statistics)
+
+    def test_custom_statistics(self):
+        write = LazyFrame2Parquet(self.path, statistics='full')
+        self.assertEqual('full', write.statistics)
+
+    def test_default_engine(self):
+        write = LazyFrame2Parquet(self.path)
+        self.assertIsNone(write.engine)
+
+    def test_custom_engine(self):
+        write = LazyFrame2Parquet(self.path, engine='in-memory')
+        self.assertEqual('in-memory', write.engine)
+
+    def test_default_manifest(self):
+        write = LazyFrame2Parquet(self.path)
+        self.assertFalse(write.manifest)
+
+    def test_custom_manifest(self):
+        write = LazyFrame2Parquet(self.path, manifest=True)
+        self.assertTrue(write.manifest)
+
+    def test_not_partitioned(self):
+        write = LazyFrame2Parquet(self.path)
+        self.assertFalse(write.partitioned)
+
+    def test_partitioned_by_key(self):
+        write = LazyFrame2Parquet(self.path, partition_by='year')
+        self.assertTrue(write.partitioned)
+
+    def test_partitioned_by_max_rows(self):
+        write = LazyFrame2Parquet(self.path, max_rows=1000)
+        self.assertTrue(write.partitioned)
+
+    @patch('swak.pl.io.parquet._PARTITIONS', False)
+    def test_partitioned_without_partition_by_raises(self):
+        with self.assertRaises(ValueError):
+            _ = LazyFrame2Parquet(self.path, partition_by='year')
+
+    @patch('swak.pl.io.parquet._CALLBACK', False)
+    def test_partitioned_manifest_without_callback_raises(self):
+        with self.assertRaises(ValueError):
+            _ = LazyFrame2Parquet(self.path, max_rows=1000, manifest=True)
+
+    @patch('swak.pl.io.parquet._CALLBACK', False)
+    def test_partitioned_without_callback(self):
+        write = LazyFrame2Parquet(self.path, max_rows=1000)
+        self.assertTrue(write.partitioned)
+
+    @patch('swak.pl.io.parquet._PARTITIONS', False)
+    @patch('swak.pl.io.parquet._CALLBACK', False)
+    def test_single_file_without_features(self):
+        write = LazyFrame2Parquet(self.path)
+        self.assertFalse(write.partitioned)
+
 
 class TestUsage(unittest.TestCase):
 
@@ -87,6 +214,8 @@ class TestUsage(unittest.TestCase):
         _ = write(self.df)
         self.df.sink_parquet.assert_called_once_with(
             self.file,
+            statistics=True,
+            row_group_size=None,
             storage_options={}
         )
 
@@ -95,20 +224,138 @@ class TestUsage(unittest.TestCase):
             self.file,
             storage=LazyStorage.AZURE,
             storage_kws={'foo': 'bar'},
+            engine='streaming',
             answer=42
         )
         _ = write(self.df)
         self.df.sink_parquet.assert_called_once_with(
             'az:/' + self.file,
+            statistics=True,
+            row_group_size=None,
             storage_options={'foo': 'bar'},
+            engine='streaming',
             answer=42
         )
 
+    @unittest.skipUnless(_CALLBACK, 'polars cannot report files written')
+    def test_to_parquet_called_manifest(self):
+        write = LazyFrame2Parquet(self.file, self.storage, manifest=True)
+        _ = write(self.df)
+        self.df.sink_parquet.assert_called_once_with(
+            self.file,
+            statistics=True,
+            row_group_size=None,
+            storage_options={},
+            sinked_paths_callback=ANY
+        )
+
+    def test_to_parquet_called_partitioned(self):
+        write = LazyFrame2Parquet(
+            self.dir.name,
+            self.storage,
+            partition_by='year',
+            max_rows=10,
+            row_group_size=5,
+            statistics='full'
+        )
+        _ = write(self.df)
+        target = self.df.sink_parquet.call_args.args[0]
+        self.assertIsInstance(target, pl.PartitionBy)
+        self.df.sink_parquet.assert_called_once_with(
+            target,
+            statistics='full',
+            row_group_size=5,
+            storage_options={}
+        )
+
     def test_return_value(self):
         write = LazyFrame2Parquet(self.file, self.storage)
         actual = write(self.df)
         self.assertTupleEqual((), actual)
 
+    def test_manifest_single_file(self):
+        df = pl.DataFrame([{'foo': 42}, {'bar': 43}])
+        write = LazyFrame2Parquet(self.file, self.storage, manifest=True)
+        actual = write(df.lazy())
+        self.assertListEqual([self.file], actual)
+
+    @patch('swak.pl.io.parquet._CALLBACK', False)
+    def test_to_parquet_called_without_callback(self):
+        write = LazyFrame2Parquet(self.file, self.storage, manifest=True)
+        actual = write(self.df)
+        self.df.sink_parquet.assert_called_once_with(
+            self.file,
+            statistics=True,
+            row_group_size=None,
+            storage_options={}
+        )
+        self.assertListEqual([self.file], actual)
+
+    @patch('swak.pl.io.parquet._CALLBACK', False)
+    def test_manifest_single_file_without_callback(self):
+        df = pl.DataFrame([{'foo': 42}, {'bar': 43}])
+        write = LazyFrame2Parquet(self.file, self.storage, manifest=True)
+        actual = write(df.lazy())
+        self.assertListEqual([self.file], actual)
+        self.assertTrue(self.path.exists())
+
+    @unittest.skipUnless(_CALLBACK, 'polars cannot report files written')
+    def test_partition_by_key(self):
+        df = pl.DataFrame({'year': [2024, 2025, 2024], 'value': [1, 2, 3]})
+        root = self.dir.name + '/dataset'
+        write = LazyFrame2Parquet(
+            root,
+            self.storage,
+            partition_by='year',
+            manifest=True
+        )
+        actual = write(df.lazy())
+        self.assertEqual(2, len(actual))
+        self.assertTrue(actual[0].startswith(root + '/year=2024/'))
+        self.assertTrue(actual[1].startswith(root + '/year=2025/'))
+        part = pl.read_parquet(actual[0])
+        self.assertListEqual(['value'], part.columns)
+        self.assertListEqual([1, 3], part['value'].to_list())
+
+    @unittest.skipUnless(_CALLBACK, 'polars cannot report files written')
+    def test_partition_by_max_rows(self):
+        df = pl.DataFrame({'value': list(range(10))})
+        root = self.dir.name + '/dataset'
+        write = LazyFrame2Parquet(
+            root,
+            self.storage,
+            max_rows=4,
+            manifest=True
+        )
+        actual = write(df.lazy())
+        self.assertEqual(3, len(actual))
+        for file in actual:
+            self.assertLessEqual(pl.read_parquet(file).height, 4)
+        combined = pl.concat(pl.read_parquet(file) for file in actual)
+        pl.testing.assert_frame_equal(combined, df)
+
+    def test_partitioned_round_trip(self):
+        df = pl.DataFrame({
+            'year': [2024, 2025, 2024, 2025],
+            'value': [1, 2, 3, 4]
+        })
+        root = self.dir.name + '/dataset'
+        write = LazyFrame2Parquet(
+            root,
+            self.storage,
+            partition_by='year',
+            max_rows=1,
+            row_group_size=1
+        )
+        actual = write(df.lazy())
+        self.assertTupleEqual((), actual)
+        scanned = pl.scan_parquet(
+            root + '/**/*.parquet',
+            hive_partitioning=True
+        )
+        result = scanned.select('year', 'value').sort('value').collect()
+        pl.testing.assert_frame_equal(result, df)
+
     def test_actually_saves_polars(self):
         df = pl.DataFrame([{'foo': 42}, {'bar': 43}])
         write = LazyFrame2Parquet(self.file, self.storage)
@@ -134,7 +381,8 @@ class TestMisc(unittest.TestCase):
 
     def test_default_repr(self):
         write = LazyFrame2Parquet(self.path)
-        expected = "LazyFrame2Parquet('/path/file.parquet', 'file', {})"
+        expected = ("LazyFrame2Parquet('/path/file.parquet', 'file', {}, (), "
+                    "None, None, True, None, False)")
         self.assertEqual(expected, repr(write))
 
     def test_custom_repr(self):
@@ -145,7 +393,8 @@ class TestMisc(unittest.TestCase):
             answer=42
         )
         expected = ("LazyFrame2Parquet('/path/file.parquet', 'hf', "
-                    "{'foo': 'bar'}, answer=42)")
+                    "{'foo': 'bar'}, (), None, None, True, None, False, "
+                    "answer=42)")
         self.assertEqual(expected, repr(write))
 
     def test_pickle_works(self):
@@ -17,7 +17,7 @@ class TestInstantiation(unittest.TestCase):
     def test_reader_init_called_defaults(self, init):
         _ = ModelLoader()
         init.assert_called_once_with(
-            '', Storage.FILE, Mode.RB, 32, None, None
+            '', Storage.FILE, Mode.RB, 32, None, None, cache=None
         )
 
     @patch.object(Reader, '__init__')
@@ -35,7 +35,8 @@ class TestInstantiation(unittest.TestCase):
             Mode.RB,
             16,
             {'storage': 'kws'},
-            'cpu'
+            'cpu',
+            cache=None
         )
 
 
@@ -0,0 +1,245 @@
+import pickle
+import unittest
+from unittest.mock import patch
+from importlib.util import find_spec
+from tempfile import TemporaryDirectory
+import torch as pt
+from swak.io import Storage, Reader, Mode, NotFound
+from swak.pt.io import ShardedStateSaver, ShardedStateLoader
+
+HAS_SAFETENSORS = find_spec('safetensors') is not None
+
+
+class Model(pt.nn.Module):
+
+    def __init__(self):
+        super().__init__()
+        self.first = pt.nn.Linear(64, 64)
+        self.second = pt.nn.Linear(64, 64)
+        self.third = pt.nn.Linear(64, 2)
+
+    def forward(self, x):
+        return self.third(self.second(self.first(x)))
+
+
+class TestInstantiation(unittest.TestCase):
+
+    def test_is_reader(self):
+        self.assertTrue(issubclass(ShardedStateLoader, Reader))
+
+    @patch.object(Reader, '__init__')
+    def test_reader_init_called_defaults(self, init):
+        _ = ShardedStateLoader('/path/to/index.json')
+        init.assert_called_once_with(
+            '/path/to/index.json',
+            Storage.FILE,
+            Mode.RB,
+            32,
+            None,
+            None,
+            True,
+            'raise',
+            None,
+            4,
+            cache=None
+        )
+
+    @patch.object(Reader, '__init__')
+    def test_reader_init_called_custom(self, init):
+        _ = ShardedStateLoader(
+            '/path/to/other/index.json',
+            Storage.MEMORY,
+            16,
+            {'storage': 'kws'},
+            'cpu',
+            False,
+            'ignore',
+            ('foo', 'bar'),
+            2
+        )
+        init.assert_called_once_with(
+            '/path/to/other/index.json',
+            Storage.MEMORY,
+            Mode.RB,
+            16,
+            {'storage': 'kws'},
+            'cpu',
+            False,
+            'ignore',
+            ['foo', 'bar'],
+            2,
+            cache=None
+        )
+
+    def test_has_keys(self):
+        load = ShardedStateLoader('/path/to/index.json')
+        self.assertTrue(hasattr(load, 'keys'))
+        self.assertIsNone(load.keys)
+
+    def test_keys_listed(self):
+        load = ShardedStateLoader('/path/to/index.json', keys=('a', 'b'))
+        self.assertListEqual(['a', 'b'], load.keys)
+
+    def test_has_max_workers(self):
+        load = ShardedStateLoader('/path/to/index.json')
+        self.assertTrue(hasattr(load, 'max_workers'))
+        self.assertEqual(4, load.max_workers)
+
+    def test_max_workers_wrong_type_raises(self):
+        with self.assertRaises(TypeError):
+            _ = ShardedStateLoader('/path/to/index.json', max_workers='foo')
+
+    def test_max_workers_not_positive_raises(self):
+        with self.assertRaises(ValueError):
+            _ = ShardedStateLoader('/path/to/index.json', max_workers=0)
+
+
+@unittest.skipUnless(HAS_SAFETENSORS, 'safetensors is not installed')
+class TestUsage(unittest.TestCase):
+
+    def setUp(self):
+        self.saved = Model()
+        self.model = Model()
+        self.dir = TemporaryDirectory()
+        self.file = self.dir.name + '/model/index.json'
+        save = ShardedStateSaver(self.file, shard_size=16.5 / 1024)
+        _ = save(self.saved)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def assert_equal_state(self, expected, actual, keys):
+        for key in keys:
+            pt.testing.assert_close(expected[key], actual[key])
+
+    def test_callable(self):
+        load = ShardedStateLoader(self.file)
+        self.assertTrue(callable(load))
+
+    def test_return_value(self):
+        load = ShardedStateLoader(self.file)
+        actual = load(self.model)
+        self.assertIs(actual, self.model)
+
+    def test_state_loaded(self):
+        load = ShardedStateLoader(self.file)
+        _ = load(self.model)
+        expected = self.saved.state_dict()
+        actual = self.model.state_dict()
+        self.assert_equal_state(expected, actual, expected)
+
+    def test_keys_loaded(self):
+        keys = ['third.weight', 'third.bias']
+        original = {
+            key: value.clone()
+            for key, value in self.model.state_dict().items()
+        }
+        load = ShardedStateLoader(self.file, merge=False, keys=keys)
+        _ = load(self.model)
+        actual = self.model.state_dict()
+        self.assert_equal_state(self.saved.state_dict(), actual, keys)
+        others = [key for key in original if key not in keys]
+        self.assert_equal_state(original, actual, others)
+
+    def test_only_required_shards_read(self):
+        load = ShardedStateLoader(self.file, keys=['first.bias'])
+        with patch.object(
+                ShardedStateLoader,
+                '_read',
+                wraps=load._read
+        ) as read:
+            _ = load(self.model)
+        read.assert_called_once()
+
+    def test_unknown_key_raises(self):
+        load = ShardedStateLoader(self.file, keys=['foo'])
+        with self.assertRaises(KeyError):
+            _ = load(self.model)
+
+    def test_remote_loaded(self):
+        load = ShardedStateLoader(self.file)
+        with patch.object(Reader, '_local', return_value=''):
+            _ = load(self.model)
+        expected = self.saved.state_dict()
+        actual = self.model.state_dict()
+        self.assert_equal_state(expected, actual, expected)
+
+    def test_interpolation(self):
+        load = ShardedStateLoader(self.dir.name + '/{}/index.json')
+        _ = load(self.model, 'model')
+        expected = self.saved.state_dict()
+        actual = self.model.state_dict()
+        self.assert_equal_state(expected, actual, expected)
+
+    def test_not_found_raises(self):
+        load = ShardedStateLoader(self.dir.name + '/missing.json')
+        with self.assertRaises(FileNotFoundError):
+            _ = load(self.model)
+
+    def test_not_found_warns(self):
+        load = ShardedStateLoader(
+            self.dir.name + '/missing.json',
+            not_found=NotFound.WARN
+        )
+        with self.assertWarns(UserWarning):
+            actual = load(self.model)
+        self.assertIs(actual, self.model)
+
+    def test_not_found_ignored(self):
+        load = ShardedStateLoader(
+            self.dir.name + '/missing.json',
+            not_found=NotFound.IGNORE
+        )
+        actual = load(self.model)
+        self.assertIs(actual, self.model)
+
+    def test_not_found_warns_with_keys(self):
+        original = {
+            key: value.clone()
+            for key, value in self.model.state_dict().items()
+        }
+        load = ShardedStateLoader(
+            self.dir.name + '/missing.json',
+            not_found=NotFound.WARN,
+            keys=['first.bias']
+        )
+        with self.assertWarns(UserWarning):
+            actual = load(self.model)
+        self.assertIs(actual, self.model)
+        self.assert_equal_state(original, actual.state_dict(), original)
+
+    def test_not_found_ignored_with_keys(self):
+        load = ShardedStateLoader(
+            self.dir.name + '/missing.json',
+            merge=False,
+            not_found=NotFound.IGNORE,
+            keys=['first.bias']
+        )
+        actual = load(self.model)
+        self.assertIs(actual, self.model)
+
+    def test_not_found_ignored_without_merge(self):
+        load = ShardedStateLoader(
+            self.dir.name + '/missing.json',
+            merge=False,
+            not_found=NotFound.IGNORE
+        )
+        actual = load(self.model)
+        self.assertIs(actual, self.model)
+
+
+class TestMisc(unittest.TestCase):
+
+    def test_default_repr(self):
+        load = ShardedStateLoader('/path/to/index.json')
+        expected = ("ShardedStateLoader('/path/to/index.json', 'file',"
+                    " 32.0, {}, None, True, 'raise', None, 4)")
+        self.assertEqual(expected, repr(load))
+
+    def test_pickle_works(self):
+        load = ShardedStateLoader('/path/to/index.json')
+        _ = pickle.loads(pickle.dumps(load))
+
+
+if __name__ == '__main__':
+    unittest.main()
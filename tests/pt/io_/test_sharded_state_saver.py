@@ -0,0 +1,279 @@
+import json
+import pickle
+import unittest
+from unittest.mock import patch
+from importlib.util import find_spec
+from tempfile import TemporaryDirectory
+from pathlib import Path
+import torch as pt
+from swak.io import Writer, Storage, Mode
+from swak.pt.io import ShardedStateSaver
+
+HAS_SAFETENSORS = find_spec('safetensors') is not None
+
+
+class Model(pt.nn.Module):
+
+    def __init__(self):
+        super().__init__()
+        self.first = pt.nn.Linear(64, 64)
+        self.second = pt.nn.Linear(64, 64)
+        self.third = pt.nn.Linear(64, 2)
+
+    def forward(self, x):
+        return self.third(self.second(self.first(x)))
+
+
+class TestInstantiation(unittest.TestCase):
+
+    def setUp(self):
+        self.path = '/path/to/model.safetensors.index.json'
+
+    def test_is_writer(self):
+        self.assertTrue(issubclass(ShardedStateSaver, Writer))
+
+    @patch.object(Writer, '__init__')
+    def test_writer_init_called_defaults(self, init):
+        _ = ShardedStateSaver(self.path)
+        init.assert_called_once_with(
+            self.path,
+            Storage.FILE,
+            False,
+            False,
+            Mode.WB,
+            32,
+            None,
+            1024,
+            4
+        )
+
+    @patch.object(Writer, '__init__')
+    def test_writer_init_called_custom(self, init):
+        _ = ShardedStateSaver(
+            '/some/other/index.json',
+            Storage.MEMORY,
+            True,
+            True,
+            16,
+            {'foo': 'bar'},
+            0.5,
+            2
+        )
+        init.assert_called_once_with(
+            '/some/other/index.json',
+            Storage.MEMORY,
+            True,
+            True,
+            Mode.WB,
+            16,
+            {'foo': 'bar'},
+            0.5,
+            2
+        )
+
+    def test_has_shard_size(self):
+        save = ShardedStateSaver(self.path)
+        self.assertTrue(hasattr(save, 'shard_size'))
+        self.assertEqual(1024, save.shard_size)
+
+    def test_has_max_workers(self):
+        save = ShardedStateSaver(self.path)
+        self.assertTrue(hasattr(save, 'max_workers'))
+        self.assertEqual(4, save.max_workers)
+
+    def test_shard_size_wrong_type_raises(self):
+        with self.assertRaises(TypeError):
+            _ = ShardedStateSaver(self.path, shard_size='foo')
+
+    def test_shard_size_not_positive_raises(self):
+        with self.assertRaises(ValueError):
+            _ = ShardedStateSaver(self.path, shard_size=0)
+
+    def test_max_workers_wrong_type_raises(self):
+        with self.assertRaises(TypeError):
+            _ = ShardedStateSaver(self.path, max_workers='foo')
+
+    def test_max_workers_not_positive_raises(self):
+        with self.assertRaises(ValueError):
+            _ = ShardedStateSaver(self.path, max_workers=0)
+
+    def test_shard_bytes(self):
+        save = ShardedStateSaver(self.path, shard_size=0.5)
+        self.assertIsInstance(save.shard_bytes, int)
+        self.assertEqual(512 * 1024, save.shard_bytes)
+
+
+@unittest.skipUnless(HAS_SAFETENSORS, 'safetensors is not installed')
+class TestUsage(unittest.TestCase):
+
+    def setUp(self):
+        self.model = Model()
+        self.dir = TemporaryDirectory()
+        self.file = self.dir.name + '/model/index.json'
+        self.path = Path(self.file)
+        # Each layer of 64 outputs takes 16.25 KiB and gets its own shard.
+        self.save = ShardedStateSaver(
+            self.file,
+            overwrite=True,
+            shard_size=16.5 / 1024
+        )
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def shards(self):
+        return sorted(file.name for file in self.path.parent.glob('*.s*'))
+
+    def test_callable(self):
+        self.assertTrue(callable(self.save))
+
+    def test_return_value(self):
+        actual = self.save(self.model)
+        self.assertTupleEqual((), actual)
+
+    def test_index_written(self):
+        _ = self.save(self.model)
+        index = json.loads(self.path.read_text())
+        self.assertSetEqual({'metadata', 'weight_map'}, set(index))
+        self.assertListEqual(
+            list(self.model.state_dict()),
+            list(index['weight_map'])
+        )
+
+    def test_total_size(self):
+        _ = self.save(self.model)
+        index = json.loads(self.path.read_text())
+        expected = sum(
+            tensor.numel() * tensor.element_size()
+            for tensor in self.model.state_dict().values()
+        )
+        self.assertEqual(expected, index['metadata']['total_size'])
+
+    def test_shards_written(self):
+        _ = self.save(self.model)
+        index = json.loads(self.path.read_text())
+        shards = sorted(set(index['weight_map'].values()))
+        self.assertEqual(3, len(shards))
+        self.assertListEqual(shards, self.shards())
+
+    def test_one_shard(self):
+        save = ShardedStateSaver(self.file)
+        _ = save(self.model)
+        self.assertEqual(1, len(self.shards()))
+
+    def test_unchanged_shards_not_rewritten(self):
+        _ = self.save(self.model)
+        before = {
+            name: (self.path.parent / name).stat().st_mtime_ns
+            for name in self.shards()
+        }
+        with pt.no_grad():
+            self.model.third.bias.add_(1.0)
+        with patch.object(Writer, '_managed', wraps=self.save._managed) as m:
+            _ = self.save(self.model)
+        # Only the changed shard and the index are written again.
+        self.assertEqual(2, m.call_count)
+        after = self.shards()
+        self.assertEqual(3, len(after))
+        unchanged = set(before) & set(after)
+        self.assertEqual(2, len(unchanged))
+        for name in unchanged:
+            mtime = (self.path.parent / name).stat().st_mtime_ns
+            self.assertEqual(before[name], mtime)
+
+    def test_stale_shards_removed(self):
+        _ = self.save(self.model)
+        before = set(self.shards())
+        with pt.no_grad():
+            self.model.first.weight.mul_(2.0)
+        _ = self.save(self.model)
+        after = set(self.shards())
+        self.assertEqual(3, len(after))
+        self.assertEqual(1, len(before - after))
+
+    def test_shards_named_after_index(self):
+        _ = self.save(self.model)
+        for name in self.shards():
+            self.assertTrue(name.startswith('index-'))
+
+    def test_other_index_shards_kept(self):
+        other = ShardedStateSaver(
+            self.dir.name + '/model/other.json',
+            overwrite=True,
+            shard_size=16.5 / 1024
+        )
+        _ = other(self.model)
+        _ = self.save(self.model)
+        with pt.no_grad():
+            self.model.first.weight.mul_(2.0)
+        _ = self.save(self.model)
+        index = json.loads((self.path.parent / 'other.json').read_text())
+        for name in set(index['weight_map'].values()):
+            self.assertTrue((self.path.parent / name).exists())
+        self.assertEqual(6, len(self.shards()))
+
+    def test_tied_weights(self):
+        self.model.second.weight = self.model.first.weight
+        _ = self.save(self.model)
+        self.assertTrue(self.path.exists())
+
+    def test_raises_on_exists(self):
+        save = ShardedStateSaver(self.file)
+        _ = save(self.model)
+        with self.assertRaises(FileExistsError):
+            _ = save(self.model)
+
+    def test_skip(self):
+        _ = self.save(self.model)
+        save = ShardedStateSaver(self.file, skip=True)
+        with patch.object(Writer, '_managed') as managed:
+            _ = save(self.model)
+        managed.assert_not_called()
+
+    def test_interpolation(self):
+        save = ShardedStateSaver(self.dir.name + '/{}/index.json')
+        _ = save(self.model, 'interpolated')
+        path = Path(self.dir.name) / 'interpolated' / 'index.json'
+        self.assertTrue(path.exists())
+
+    def test_raises_on_non_model(self):
+        with self.assertRaises(TypeError):
+            _ = self.save(42)
+
+    def test_raises_on_non_tensor(self):
+        model = Model()
+        model.state_dict = lambda: {'answer': 42}
+        with self.assertRaises(TypeError):
+            _ = self.save(model)
+
+
+class TestMisc(unittest.TestCase):
+
+    def test_default_repr(self):
+        save = ShardedStateSaver('/path/to/index.json')
+        expected = ("ShardedStateSaver('/path/to/index.json', 'file', False,"
+                    " False, 32.0, {}, 1024.0, 4)")
+        self.assertEqual(expected, repr(save))
+
+    def test_custom_repr(self):
+        save = ShardedStateSaver(
+            '/path/to/index.json',
+            Storage.MEMORY,
+            True,
+            True,
+            16,
+            {'foo': 'bar'},
+            0.5,
+            2
+        )
+        expected = ("ShardedStateSaver('/path/to/index.json', 'memory', True,"
+                    " True, 16.0, {'foo': 'bar'}, 0.5, 2)")
+        self.assertEqual(expected, repr(save))
+
+    def test_pickle_works(self):
+        save = ShardedStateSaver('/path/to/index.json')
+        _ = pickle.loads(pickle.dumps(save))
+
+
+if __name__ == '__main__':
+    unittest.main()
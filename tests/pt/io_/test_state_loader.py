@@ -24,7 +24,8 @@ class TestInstantiation(unittest.TestCase):
             None,
             None,
             True,
-            'raise'
+            'raise',
+            cache=None
         )
 
     @patch.object(Reader, '__init__')
@@ -46,7 +47,8 @@ class TestInstantiation(unittest.TestCase):
             {'storage': 'kws'},
             'cpu',
             False,
-            'ignore'
+            'ignore',
+            cache=None
         )
 
 
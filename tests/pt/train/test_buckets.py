@@ -0,0 +1,167 @@
+import pickle
+import unittest
+import torch as pt
+from swak.pt.train import Buckets
+
+
+class TestAttributes(unittest.TestCase):
+
+    def test_defaults(self):
+        buckets = Buckets()
+        self.assertIsNone(buckets.sizes)
+        self.assertListEqual([], buckets.lengths)
+        self.assertEqual(0.0, buckets.pad_value)
+
+    def test_custom(self):
+        buckets = Buckets((16, 4, 8, 4), (32, 16), -1)
+        self.assertListEqual([4, 8, 16], buckets.sizes)
+        self.assertListEqual([16, 32], buckets.lengths)
+        self.assertEqual(-1, buckets.pad_value)
+
+
+class TestSizes(unittest.TestCase):
+
+    def test_powers_of_two(self):
+        buckets = Buckets()
+        expected = {1: 1, 2: 2, 3: 4, 4: 4, 5: 8, 8: 8, 9: 16, 64: 64}
+        for n, size in expected.items():
+            with self.subTest(n=n):
+                self.assertEqual(size, buckets.size(n))
+
+    def test_custom_sizes(self):
+        buckets = Buckets([10, 20])
+        expected = {1: 10, 10: 10, 11: 20, 20: 20, 21: 21}
+        for n, size in expected.items():
+            with self.subTest(n=n):
+                self.assertEqual(size, buckets.size(n))
+
+    def test_lengths(self):
+        buckets = Buckets(lengths=[16, 32])
+        expected = {1: 16, 16: 16, 17: 32, 33: 33}
+        for length, padded in expected.items():
+            with self.subTest(length=length):
+                self.assertEqual(padded, buckets.length(length))
+
+    def test_no_lengths(self):
+        self.assertEqual(7, Buckets().length(7))
+
+    def test_up_to_powers_of_two(self):
+        buckets = Buckets()
+        self.assertListEqual([1], buckets.up_to(1))
+        self.assertListEqual([1, 2, 4, 8], buckets.up_to(8))
+        self.assertListEqual([1, 2, 4, 8, 16], buckets.up_to(9))
+
+    def test_up_to_custom_sizes(self):
+        buckets = Buckets([4, 8, 16])
+        self.assertListEqual([4, 8], buckets.up_to(6))
+        self.assertListEqual([4, 8], buckets.up_to(8))
+        self.assertListEqual([4, 8, 16, 20], buckets.up_to(20))
+
+
+class TestPadding(unittest.TestCase):
+
+    def setUp(self):
+        self.tokens = pt.arange(15).view(3, 5)
+        self.dense = pt.ones(3, 2)
+
+    def test_batch_padded(self):
+        buckets = Buckets()
+        tokens, dense = buckets((self.tokens, self.dense))
+        self.assertTupleEqual((4, 5), tuple(tokens.shape))
+        self.assertTupleEqual((4, 2), tuple(dense.shape))
+        pt.testing.assert_close(self.tokens, tokens[:3])
+        self.assertTrue((tokens[3] == 0).all())
+
+    def test_full_batch_untouched(self):
+        buckets = Buckets()
+        features = (pt.ones(4, 3),)
+        actual = buckets(features)
+        self.assertEqual(features[0].data_ptr(), actual[0].data_ptr())
+
+    def test_sequence_padded(self):
+        buckets = Buckets(lengths=[8], pad_value=-1)
+        tokens, dense = buckets((self.tokens, self.dense))
+        self.assertTupleEqual((4, 8), tuple(tokens.shape))
+        self.assertTupleEqual((4, 2), tuple(dense.shape))
+        pt.testing.assert_close(self.tokens, tokens[:3, :5])
+        self.assertTrue((tokens[:, 5:] == -1).all())
+        self.assertTrue((dense[3] == -1).all())
+
+    def test_dtype_kept(self):
+        buckets = Buckets(lengths=[8])
+        tokens, dense = buckets((self.tokens, self.dense))
+        self.assertIs(pt.long, tokens.dtype)
+        self.assertIs(pt.float, dense.dtype)
+
+    def test_crop(self):
+        buckets = Buckets(lengths=[8])
+        features = (self.tokens, self.dense)
+        outputs = (pt.ones(4, 8, 6), pt.ones(4, 1))
+        sequence, scalar = buckets.crop(outputs, features)
+        self.assertTupleEqual((3, 5, 6), tuple(sequence.shape))
+        self.assertTupleEqual((3, 1), tuple(scalar.shape))
+
+    def test_crop_without_lengths(self):
+        buckets = Buckets()
+        outputs = (pt.ones(4, 5),)
+        actual, = buckets.crop(outputs, (self.tokens,))
+        self.assertTupleEqual((3, 5), tuple(actual.shape))
+
+    def test_variants(self):
+        buckets = Buckets([2, 4], [4, 8])
+        target = pt.ones(3, 5)
+        variants = list(buckets.variants((self.tokens,), target, 4))
+        self.assertEqual(4, len(variants))
+        shapes = [
+            (tuple(features[0].shape), tuple(target.shape))
+            for features, target in variants
+        ]
+        expected = [
+            ((2, 4), (2, 4)),
+            ((2, 8), (2, 8)),
+            ((4, 4), (4, 4)),
+            ((4, 8), (4, 8))
+        ]
+        self.assertListEqual(expected, shapes)
+
+    def test_variants_without_sequence(self):
+        buckets = Buckets(lengths=[4, 8])
+        features = (pt.ones(3),)
+        variants = list(buckets.variants(features, pt.ones(3), 4))
+        self.assertListEqual(
+            [1, 2, 4],
+            [features[0].size(0) for features, _ in variants]
+        )
+
+    def test_variants_are_no_views(self):
+        buckets = Buckets()
+        features = (pt.ones(4, 3),)
+        for features, target in buckets.variants(features, pt.ones(4), 4):
+            self.assertIsNone(features[0]._base)
+            self.assertIsNone(target._base)
+
+    def test_variants_keep_inference(self):
+        buckets = Buckets()
+        with pt.inference_mode():
+            features = (pt.ones(4, 3),)
+            target = pt.ones(4)
+        for features, target in buckets.variants(features, target, 4):
+            self.assertTrue(features[0].is_inference())
+            self.assertTrue(target.is_inference())
+
+
+class TestMisc(unittest.TestCase):
+
+    def test_default_repr(self):
+        self.assertEqual('Buckets(None, [], 0.0)', repr(Buckets()))
+
+    def test_custom_repr(self):
+        buckets = Buckets((8, 4), (16,), -1)
+        self.assertEqual('Buckets([4, 8], [16], -1)', repr(buckets))
+
+    def test_pickle_works(self):
+        _ = pickle.loads(pickle.dumps(Buckets([4], [8])))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -189,19 +189,25 @@ class TestUsage(unittest.TestCase):
         self.scheduler.state_dict = Mock(
             return_value=self.scheduler_state_dict
         )
+        self.scaler_state_dict = {'scaler': 'scaler_state_dict'}
+        self.scaler = Mock()
+        self.scaler.state_dict = Mock(return_value=self.scaler_state_dict)
+        self.scaler.is_enabled = Mock(return_value=True)
         self.state = {
             'epoch': self.epoch,
             'loss': self.loss,
             'model': self.model_state_dict,
             'optimizer': {},
             'scheduler': {},
+            'scaler': {}
         }
         self.empty = {
             'epoch': 0,
             'loss': float('inf'),
             'model': OrderedDict(),
             'optimizer': {},
-            'scheduler': {}
+            'scheduler': {},
+            'scaler': {}
         }
         self.dir = TemporaryDirectory()
         self.file = self.dir.name + '/checkpoint.pt'
@@ -322,6 +328,19 @@ class TestUsage(unittest.TestCase):
         expected = expected | {'scheduler': self.scheduler_state_dict}
         self.assertDictEqual(expected, actual)
 
+    def test_save_model_scaler(self):
+        check = Checkpoint(self.file, self.storage)
+        check.save(
+            self.epoch,
+            self.loss,
+            self.model,
+            scaler=self.scaler
+        )
+        with self.path.open('rb') as file:
+            actual = pt.load(file, weights_only=True)
+        expected = self.state | {'scaler': self.scaler_state_dict}
+        self.assertDictEqual(expected, actual)
+
     def test_counter_counts(self):
         check = Checkpoint(self.file, self.storage)
         check.save(self.epoch, self.loss, self.model)
@@ -445,6 +464,35 @@ class TestUsage(unittest.TestCase):
         expected = self.scheduler_state_dict | other
         self.scheduler.load_state_dict.assert_called_once_with(expected)
 
+    def test_merge_scaler(self):
+        other = {'other': 'other_state_dict'}
+        state = self.state | {'scaler': other}
+        with self.path.open('wb') as file:
+            pt.save(state, file)
+        check = Checkpoint(self.file, self.storage)
+        _ = check.load(self.model, scaler=self.scaler)
+        expected = self.scaler_state_dict | other
+        self.scaler.load_state_dict.assert_called_once_with(expected)
+
+    def test_merge_scaler_missing(self):
+        state = dict(self.state)
+        del state['scaler']
+        with self.path.open('wb') as file:
+            pt.save(state, file)
+        check = Checkpoint(self.file, self.storage)
+        _ = check.load(self.model, scaler=self.scaler)
+        self.scaler.load_state_dict.assert_called_once_with(
+            self.scaler_state_dict
+        )
+
+    def test_disabled_scaler_not_loaded(self):
+        self.scaler.is_enabled.return_value = False
+        with self.path.open('wb') as file:
+            pt.save(self.state, file)
+        check = Checkpoint(self.file, self.storage)
+        _ = check.load(self.model, scaler=self.scaler)
+        self.scaler.load_state_dict.assert_not_called()
+
     def test_return_values(self):
         with self.path.open('wb') as file:
             pt.save(self.state, file)
@@ -454,11 +502,134 @@ class TestUsage(unittest.TestCase):
         self.assertEqual(self.loss, loss)
 
 
+class TestInProcess(unittest.TestCase):
+
+    def setUp(self):
+        self.model = pt.nn.Linear(3, 2)
+        self.optimizer = pt.optim.AdamW(self.model.parameters())
+        self.model(pt.ones(4, 3)).sum().backward()
+        self.optimizer.step()
+        self.check = Checkpoint(in_process=True)
+
+    def test_defaults(self):
+        check = Checkpoint()
+        self.assertFalse(check.in_process)
+        self.assertFalse(check.background)
+        self.assertFalse(check.pin_memory)
+
+    def test_no_file_system_used(self):
+        with patch.object(Checkpoint, 'fs') as fs, patch(
+                'swak.pt.train.checkpoint.pt.save'
+        ) as save:
+            self.check.save(1, 0.5, self.model, self.optimizer)
+            _ = self.check.load(self.model, self.optimizer)
+            self.check.reset_parameters()
+        fs.open.assert_not_called()
+        save.assert_not_called()
+
+    def test_load_empty(self):
+        expected = self.model.weight.clone()
+        epoch, loss = self.check.load(self.model, self.optimizer)
+        self.assertEqual(0, epoch)
+        self.assertEqual(float('inf'), loss)
+        pt.testing.assert_close(self.model.weight, expected)
+
+    def test_round_trip(self):
+        self.check.save(3, 0.5, self.model, self.optimizer)
+        expected = self.model.weight.detach().clone()
+        with pt.no_grad():
+            self.model.weight.add_(1.0)
+        epoch, loss = self.check.load(self.model, self.optimizer)
+        self.assertEqual(3, epoch)
+        self.assertEqual(0.5, loss)
+        pt.testing.assert_close(self.model.weight.detach(), expected)
+
+    def test_snapshot_detached(self):
+        self.check.save(3, 0.5, self.model, self.optimizer)
+        expected = self.model.weight.detach().clone()
+        with pt.no_grad():
+            self.model.weight.add_(1.0)
+        _ = self.check.load(self.model)
+        pt.testing.assert_close(self.model.weight.detach(), expected)
+
+    def test_optimizer_state_not_aliased(self):
+        self.check.save(3, 0.5, self.model, self.optimizer)
+        _ = self.check.load(self.model, self.optimizer)
+        expected = self.optimizer.state_dict()['state'][0]['exp_avg'].clone()
+        self.model(pt.ones(4, 3)).sum().backward()
+        self.optimizer.step()
+        _ = self.check.load(self.model, self.optimizer)
+        actual = self.optimizer.state_dict()['state'][0]['exp_avg']
+        pt.testing.assert_close(actual, expected)
+
+    def test_reset_parameters(self):
+        self.check.save(3, 0.5, self.model, self.optimizer)
+        self.check.reset_parameters()
+        self.assertEqual(0, self.check.counter)
+        epoch, loss = self.check.load(self.model)
+        self.assertEqual(0, epoch)
+        self.assertEqual(float('inf'), loss)
+
+
+class TestBackground(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = TemporaryDirectory()
+        self.file = self.dir.name + '/checkpoint.pt'
+        self.model = pt.nn.Linear(3, 2)
+        self.check = Checkpoint(self.file, 'file', background=True)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_written_after_flush(self):
+        self.check.save(3, 0.5, self.model)
+        self.check.flush()
+        with Path(self.file).open('rb') as file:
+            state = pt.load(file, weights_only=True)
+        self.assertEqual(3, state['epoch'])
+        pt.testing.assert_close(state['model']['weight'], self.model.weight)
+
+    def test_snapshot_taken_before_return(self):
+        expected = self.model.weight.detach().clone()
+        self.check.save(3, 0.5, self.model)
+        with pt.no_grad():
+            self.model.weight.add_(1.0)
+        _ = self.check.load(self.model)
+        pt.testing.assert_close(self.model.weight.detach(), expected)
+
+    def test_write_on_other_thread(self):
+        with patch.object(
+                self.check,
+                '_save_state',
+                wraps=self.check._save_state
+        ) as save_state, patch.object(
+            self.check._executor,
+            'submit',
+            wraps=self.check._executor.submit
+        ) as submit:
+            self.check.save(3, 0.5, self.model)
+            self.check.flush()
+        submit.assert_called_once()
+        save_state.assert_called_once()
+
+    def test_error_raised_on_flush(self):
+        with patch.object(
+                self.check,
+                '_save_state',
+                side_effect=OSError('Disk full!')
+        ):
+            self.check.save(3, 0.5, self.model)
+            with self.assertRaises(OSError):
+                self.check.flush()
+
+
 class TestMisc(unittest.TestCase):
 
     def test_default_repr(self):
         check = Checkpoint()
-        expected = "Checkpoint('/tmp/checkpoint.pt', 'memory', 32.0, {})"
+        expected = ("Checkpoint('/tmp/checkpoint.pt', 'memory', 32.0, {},"
+                    " False, False, False)")
         self.assertEqual(expected, repr(check))
 
     def test_custom_repr(self):
@@ -466,9 +637,13 @@ class TestMisc(unittest.TestCase):
             '/path/to/file.pt',
             'file',
             16,
-            {'foo': 'bar'}
+            {'foo': 'bar'},
+            True,
+            True,
+            True
         )
-        exp = "Checkpoint('/path/to/file.pt', 'file', 16.0, {'foo': 'bar'})"
+        exp = ("Checkpoint('/path/to/file.pt', 'file', 16.0, {'foo': 'bar'},"
+               " True, True, True)")
         self.assertEqual(exp, repr(check))
 
     def test_pickle_works(self):
@@ -480,6 +655,12 @@ class TestMisc(unittest.TestCase):
         )
         _ = pickle.loads(pickle.dumps(check))
 
+    def test_pickle_works_after_background_save(self):
+        with TemporaryDirectory() as tmp:
+            check = Checkpoint(tmp + '/check.pt', 'file', background=True)
+            check.save(1, 1.0, pt.nn.Linear(2, 1))
+            _ = pickle.loads(pickle.dumps(check))
+
 
 if __name__ == '__main__':
     unittest.main()
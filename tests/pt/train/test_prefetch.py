@@ -0,0 +1,221 @@
+import time
+import threading
+import unittest
+from unittest.mock import patch
+import torch as pt
+from swak.pt import train
+from swak.pt.types import Batches
+
+
+class Data(train.TrainDataBase):
+
+    def __init__(self, n: int = 10, fail: bool = False) -> None:
+        self.__n = n
+        self.fail = fail
+        self.calls = []
+
+    @property
+    def n(self) -> int:
+        return self.__n
+
+    def batches(self, n: int) -> Batches:
+        for i in range(n):
+            if self.fail and i == 3:
+                raise RuntimeError('Failed!')
+            yield (pt.tensor([i]),), pt.tensor([float(i)])
+
+    def sample(self, batch_size: int, max_n: int | None = None) -> Batches:
+        self.calls.append(('sample', batch_size, max_n))
+        return self.batches(self.n if max_n is None else max_n)
+
+    def __call__(
+            self,
+            batch_size: int,
+            step_freq: int = 1,
+            epoch: int = 0
+    ) -> tuple[int | None, Batches]:
+        self.calls.append(('call', batch_size, step_freq, epoch))
+        return self.n, self.batches(self.n)
+
+
+def transform(batch: tuple, generator: pt.Generator) -> tuple:
+    (x,), y = batch
+    return (x,), y + pt.rand(1, generator=generator)
+
+
+class TestAttributes(unittest.TestCase):
+
+    def test_is_train_data(self):
+        self.assertTrue(issubclass(train.Prefetch, train.TrainDataBase))
+
+    def test_defaults(self):
+        data = Data()
+        prefetch = train.Prefetch(data)
+        self.assertIs(data, prefetch.data)
+        self.assertEqual(2, prefetch.depth)
+        self.assertFalse(prefetch.pin_memory)
+        self.assertIsNone(prefetch.transform)
+        self.assertEqual(1, prefetch.workers)
+        self.assertEqual(42, prefetch.seed)
+
+    def test_custom(self):
+        prefetch = train.Prefetch(Data(), 4.0, True, transform, 3.0, 1)
+        self.assertIsInstance(prefetch.depth, int)
+        self.assertEqual(4, prefetch.depth)
+        self.assertTrue(prefetch.pin_memory)
+        self.assertIs(transform, prefetch.transform)
+        self.assertIsInstance(prefetch.workers, int)
+        self.assertEqual(3, prefetch.workers)
+        self.assertEqual(1, prefetch.seed)
+
+    def test_workers_wrong_type_raises(self):
+        with self.assertRaises(TypeError):
+            _ = train.Prefetch(Data(), workers='foo')
+
+    def test_workers_wrong_value_raises(self):
+        with self.assertRaises(ValueError):
+            _ = train.Prefetch(Data(), workers=0)
+
+    def test_depth_wrong_type_raises(self):
+        with self.assertRaises(TypeError):
+            _ = train.Prefetch(Data(), 'foo')
+
+    def test_depth_wrong_value_raises(self):
+        with self.assertRaises(ValueError):
+            _ = train.Prefetch(Data(), 0)
+
+    def test_n(self):
+        self.assertEqual(7, train.Prefetch(Data(7)).n)
+
+
+class TestUsage(unittest.TestCase):
+
+    def test_call_forwarded(self):
+        data = Data()
+        n_batches, _ = train.Prefetch(data)(4, 2, 3)
+        self.assertEqual(10, n_batches)
+        self.assertListEqual([('call', 4, 2, 3)], data.calls)
+
+    def test_call_in_order(self):
+        _, batches = train.Prefetch(Data(), 1)(4)
+        actual = [target.item() for _, target in batches]
+        self.assertListEqual([float(i) for i in range(10)], actual)
+
+    def test_sample_forwarded(self):
+        data = Data()
+        batches = train.Prefetch(data).sample(4, 5)
+        actual = [target.item() for _, target in batches]
+        self.assertListEqual([('sample', 4, 5)], data.calls)
+        self.assertListEqual([0.0, 1.0, 2.0, 3.0, 4.0], actual)
+
+    def test_produced_on_other_thread(self):
+        threads = []
+
+        def batches():
+            for i in range(3):
+                threads.append(threading.current_thread())
+                yield (pt.tensor([i]),), pt.tensor([i])
+
+        prefetch = train.Prefetch(Data())
+        _ = list(prefetch._prefetched(batches()))
+        self.assertEqual(3, len(threads))
+        for thread in threads:
+            self.assertIsNot(threading.current_thread(), thread)
+
+    def test_exception_reraised(self):
+        _, batches = train.Prefetch(Data(fail=True))(4)
+        with self.assertRaises(RuntimeError):
+            _ = list(batches)
+
+    def test_stop_early(self):
+        _, batches = train.Prefetch(Data(1000), 1)(4)
+        _ = next(batches)
+        start = time.perf_counter()
+        batches.close()
+        self.assertLess(time.perf_counter() - start, 1.0)
+
+    def test_transform_applied_in_order(self):
+        prefetch = train.Prefetch(Data(), 4, transform=transform, workers=3)
+        _, batches = prefetch(4)
+        actual = [target.item() for _, target in batches]
+        self.assertEqual(10, len(actual))
+        for i, value in enumerate(actual):
+            self.assertTrue(i <= value < i + 1)
+
+    def test_transform_on_worker_threads(self):
+        threads = set()
+
+        def record(batch: tuple, _: pt.Generator) -> tuple:
+            threads.add(threading.current_thread().name)
+            time.sleep(0.01)
+            return batch
+
+        prefetch = train.Prefetch(Data(), 4, transform=record, workers=3)
+        _ = list(prefetch.sample(4))
+        self.assertGreater(len(threads), 1)
+        for name in threads:
+            self.assertTrue(name.startswith('prefetch'))
+
+    def test_transform_independent_of_workers(self):
+        one = train.Prefetch(Data(), 4, transform=transform, workers=1)
+        three = train.Prefetch(Data(), 4, transform=transform, workers=3)
+        expected = [target for _, target in one(4, epoch=2)[1]]
+        actual = [target for _, target in three(4, epoch=2)[1]]
+        for want, got in zip(expected, actual, strict=True):
+            pt.testing.assert_close(got, want)
+
+    def test_transform_seeded_per_epoch(self):
+        prefetch = train.Prefetch(Data(), transform=transform)
+        first = [target for _, target in prefetch(4, epoch=1)[1]]
+        again = [target for _, target in prefetch(4, epoch=1)[1]]
+        second = [target for _, target in prefetch(4, epoch=2)[1]]
+        self.assertTrue(all(pt.equal(a, b) for a, b in zip(first, again)))
+        self.assertFalse(all(pt.equal(a, b) for a, b in zip(first, second)))
+
+    def test_transform_seeded_by_seed(self):
+        first = train.Prefetch(Data(), transform=transform, seed=1)
+        second = train.Prefetch(Data(), transform=transform, seed=2)
+        one = [target for _, target in first.sample(4)]
+        two = [target for _, target in second.sample(4)]
+        self.assertFalse(all(pt.equal(a, b) for a, b in zip(one, two)))
+
+    def test_transform_exception_reraised(self):
+
+        def fail(batch: tuple, _: pt.Generator) -> tuple:
+            raise ValueError('Failed!')
+
+        prefetch = train.Prefetch(Data(), transform=fail, workers=2)
+        with self.assertRaises(ValueError):
+            _ = list(prefetch.sample(4))
+
+    def test_test_data_call_raises(self):
+        data = train.TestData(pt.ones(4, 2), pt.ones(4))
+        with self.assertRaises(TypeError):
+            _ = train.Prefetch(data)(2)
+
+    def test_test_data_sample(self):
+        data = train.TestData(pt.ones(4, 2), pt.ones(4))
+        actual = list(train.Prefetch(data).sample(2))
+        self.assertEqual(2, len(actual))
+
+    @patch('swak.pt.train.data.pt.cuda.is_available', return_value=False)
+    def test_no_pinning_without_cuda(self, _):
+        prefetch = train.Prefetch(Data(), pin_memory=True)
+        with patch.object(prefetch, '_pinned') as pinned:
+            _ = list(prefetch.sample(4))
+        pinned.assert_not_called()
+
+    @patch('swak.pt.train.data.pt.cuda.is_available', return_value=True)
+    def test_pinning_with_cuda(self, _):
+        prefetch = train.Prefetch(Data(3), pin_memory=True)
+        with patch.object(
+                prefetch,
+                '_pinned',
+                side_effect=lambda batch: batch
+        ) as pinned:
+            _ = list(prefetch.sample(4))
+        self.assertEqual(3, pinned.call_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
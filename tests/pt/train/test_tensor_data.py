@@ -0,0 +1,129 @@
+import unittest
+import torch as pt
+import pandas as pd
+import polars as pl
+from swak.pt import train
+
+
+class TestTestData(unittest.TestCase):
+
+    def setUp(self):
+        self.x = pt.arange(20.0).reshape(10, 2)
+        self.z = pt.arange(10)
+        self.y = pt.arange(10.0).unsqueeze(-1)
+        self.data = train.TestData([self.x, self.z], self.y)
+
+    def test_is_test_data(self):
+        self.assertTrue(issubclass(train.TestData, train.TestDataBase))
+
+    def test_n(self):
+        self.assertIsInstance(self.data.n, int)
+        self.assertEqual(10, self.data.n)
+
+    def test_single_feature(self):
+        data = train.TestData(self.x, self.y)
+        self.assertIsInstance(data.features, tuple)
+        self.assertEqual(1, len(data.features))
+        self.assertIs(self.x, data.features[0])
+
+    def test_dataframes(self):
+        df = pd.DataFrame({'a': [1.0, 2.0], 'b': [3.0, 4.0]})
+        target = pl.DataFrame({'y': [5.0, 6.0]})
+        data = train.TestData(df, target)
+        expected = pt.tensor([[1.0, 3.0], [2.0, 4.0]], dtype=pt.float64)
+        pt.testing.assert_close(data.features[0], expected)
+        expected = pt.tensor([[5.0], [6.0]], dtype=pt.float64)
+        pt.testing.assert_close(data.target, expected)
+
+    def test_no_features_raises(self):
+        with self.assertRaises(ValueError):
+            _ = train.TestData([], self.y)
+
+    def test_wrong_size_raises(self):
+        with self.assertRaises(ValueError):
+            _ = train.TestData([self.x, self.z[:5]], self.y)
+
+    def test_sample_all_are_views(self):
+        batches = list(self.data.sample(4))
+        self.assertEqual(3, len(batches))
+        for features, target in batches:
+            self.assertIsInstance(features, tuple)
+            self.assertEqual(2, len(features))
+            storage = target.untyped_storage()
+            self.assertEqual(self.y.data_ptr(), storage.data_ptr())
+        self.assertEqual(2, batches[-1][1].shape[0])
+
+    def test_sample_all_in_order(self):
+        targets = [target for _, target in self.data.sample(3)]
+        pt.testing.assert_close(pt.cat(targets), self.y)
+
+    def test_sample_max_n(self):
+        batches = list(self.data.sample(2, 5))
+        self.assertEqual(3, len(batches))
+        target = pt.cat([target for _, target in batches])
+        self.assertEqual(5, target.shape[0])
+        x = pt.cat([features[0] for features, _ in batches])
+        pt.testing.assert_close(x, self.x[target.squeeze(-1).long()])
+
+    def test_sample_reproducible(self):
+        first = pt.cat([target for _, target in self.data.sample(2, 5)])
+        second = pt.cat([target for _, target in self.data.sample(2, 5)])
+        pt.testing.assert_close(first, second)
+
+
+class TestTrainData(unittest.TestCase):
+
+    def setUp(self):
+        self.x = pt.arange(20.0).reshape(10, 2)
+        self.y = pt.arange(10.0)
+        self.data = train.TrainData(self.x, self.y)
+
+    def test_is_train_data(self):
+        self.assertTrue(issubclass(train.TrainData, train.TrainDataBase))
+        self.assertTrue(issubclass(train.TrainData, train.TestData))
+
+    def test_defaults(self):
+        self.assertEqual(42, self.data.seed)
+        self.assertTrue(self.data.shuffle)
+
+    def test_n_batches(self):
+        n_batches, batches = self.data(3)
+        self.assertEqual(4, n_batches)
+        self.assertEqual(4, len(list(batches)))
+
+    def test_step_freq(self):
+        n_batches, batches = self.data(3, 2)
+        batches = list(batches)
+        self.assertEqual(2, n_batches)
+        self.assertEqual(2, len(batches))
+        for _, target in batches:
+            self.assertEqual(3, target.shape[0])
+
+    def test_shuffled_permutation(self):
+        _, batches = self.data(4, epoch=1)
+        batches = list(batches)
+        target = pt.cat([target for _, target in batches])
+        x = pt.cat([features[0] for features, _ in batches])
+        self.assertFalse(pt.equal(target, self.y))
+        pt.testing.assert_close(target.sort().values, self.y)
+        pt.testing.assert_close(x, self.x[target.long()])
+
+    def test_epochs_differ(self):
+        _, first = self.data(10, epoch=1)
+        _, second = self.data(10, epoch=2)
+        self.assertFalse(pt.equal(next(first)[1], next(second)[1]))
+
+    def test_epoch_reproducible(self):
+        _, first = train.TrainData(self.x, self.y, 1)(10, epoch=3)
+        _, second = train.TrainData(self.x, self.y, 1)(10, epoch=3)
+        pt.testing.assert_close(next(first)[1], next(second)[1])
+
+    def test_no_shuffle(self):
+        data = train.TrainData(self.x, self.y, shuffle=False)
+        _, batches = data(4, 2)
+        target = pt.cat([target for _, target in batches])
+        pt.testing.assert_close(target, self.y[:8])
+
+
+if __name__ == '__main__':
+    unittest.main()
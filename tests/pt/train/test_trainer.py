@@ -0,0 +1,584 @@
+import math
+import pickle
+import unittest
+import warnings
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from unittest.mock import patch
+import torch as pt
+from torch.optim.lr_scheduler import StepLR
+from swak.funcflow import Curry
+from swak.pt.misc import Compile
+from swak.pt import train
+from swak.pt.train.trainer import _Counted
+
+
+class Model(pt.nn.Module):
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.linear = pt.nn.Linear(3, 1)
+
+    def reset_parameters(self) -> None:
+        pt.manual_seed(0)
+        self.linear.reset_parameters()
+
+    def forward(self, x: pt.Tensor) -> tuple[pt.Tensor]:
+        return (self.linear(x),)
+
+
+class Recorder(train.StepCallback):
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    def __call__(self, *args) -> None:
+        self.calls.append(args)
+
+    def close(self) -> None:
+        pass
+
+
+class Base(unittest.TestCase):
+
+    def setUp(self):
+        generator = pt.Generator().manual_seed(1)
+        self.x = pt.randn(64, 3, generator=generator)
+        self.y = self.x @ pt.tensor([[1.0], [2.0], [3.0]]) + 0.1
+        self.train = train.TrainData(self.x, self.y)
+        self.test = train.TestData(self.x[:16], self.y[:16])
+
+    def trainer(self, **kwargs):
+        return train.Trainer(
+            pt.nn.MSELoss(),
+            **({
+                'batch_size': 8,
+                'max_epochs': 3,
+                'epoch_cbs': (),
+                'train_cbs': (),
+                'show_progress': False
+            } | kwargs)
+        )
+
+
+class TestSync(Base):
+
+    def test_default_sync_freq(self):
+        trainer = train.Trainer(pt.nn.MSELoss())
+        self.assertEqual(16, trainer.sync_freq)
+
+    def test_history(self):
+        trainer = self.trainer()
+        _ = trainer.train(Model(), self.train, self.test)
+        for key in ('train_loss', 'test_loss', 'lr'):
+            self.assertEqual(3, len(trainer.history[key]))
+            for value in trainer.history[key]:
+                self.assertIsInstance(value, float)
+        self.assertLess(
+            trainer.history['train_loss'][-1],
+            trainer.history['train_loss'][0]
+        )
+
+    def test_train_loss_is_mean_over_data(self):
+        trainer = self.trainer(max_epochs=1)
+        model = trainer.train(Model(), self.train)
+        with pt.inference_mode():
+            expected = pt.nn.MSELoss()(*model(self.x), self.y).item()
+        actual = trainer.history['train_loss'][0]
+        self.assertAlmostEqual(expected, actual, 5)
+
+    def test_step_callbacks_get_floats(self):
+        recorder = Recorder()
+        trainer = self.trainer(step_cbs=[recorder], cb_freq=3)
+        _ = trainer.train(Model(), self.train)
+        self.assertEqual(6, len(recorder.calls))
+        for call in recorder.calls:
+            self.assertEqual(3, len(call))
+            for value in call:
+                self.assertIsInstance(value, float)
+
+    def test_in_process_checkpoint(self):
+        checkpoint = train.Checkpoint(in_process=True)
+        trainer = self.trainer(checkpoint=checkpoint)
+        _ = trainer.train(Model(), self.train, self.test)
+        self.assertEqual(3, checkpoint.counter)
+
+    @patch('swak.pt.train.trainer.tqdm.set_postfix')
+    def test_progress_updated_every_sync_freq(self, set_postfix):
+        trainer = self.trainer(max_epochs=1, show_progress=True, sync_freq=3)
+        _ = trainer.train(Model(), self.train)
+        # 8 train batches: 3, 6, and last; 8 eval batches: 3, 6, and last
+        self.assertEqual(6, set_postfix.call_count)
+
+    @patch('swak.pt.train.trainer.tqdm.set_postfix')
+    def test_progress_not_updated_if_hidden(self, set_postfix):
+        trainer = self.trainer(max_epochs=1, sync_freq=1)
+        _ = trainer.train(Model(), self.train)
+        set_postfix.assert_not_called()
+
+
+class TestPrecision(Base):
+
+    def test_default_precision(self):
+        trainer = train.Trainer(pt.nn.MSELoss())
+        self.assertIsNone(trainer.precision)
+
+    def test_precision_names(self):
+        expected = {
+            'bfloat16': pt.bfloat16,
+            'bf16': pt.bfloat16,
+            'float16': pt.float16,
+            'fp16': pt.float16,
+            pt.bfloat16: pt.bfloat16
+        }
+        for precision, dtype in expected.items():
+            with self.subTest(precision=precision):
+                trainer = self.trainer(precision=precision)
+                self.assertIs(dtype, trainer.precision)
+
+    def test_wrong_precision_raises(self):
+        for precision in ('float64', pt.float32, 'foo'):
+            with (
+                self.subTest(precision=precision),
+                self.assertRaises(ValueError)
+            ):
+                _ = self.trainer(precision=precision)
+
+    @patch('swak.pt.train.trainer.pt.autocast')
+    def test_autocast_called(self, autocast):
+        trainer = self.trainer(max_epochs=1, precision='bfloat16')
+        _ = trainer.train(Model(), self.train, self.test)
+        autocast.assert_called_with('cpu', pt.bfloat16, enabled=True)
+        # 8 train batches, 2 batches each for train and test evaluation
+        self.assertEqual(12, autocast.call_count)
+
+    @patch('swak.pt.train.trainer.pt.autocast')
+    def test_autocast_disabled(self, autocast):
+        trainer = self.trainer(max_epochs=1)
+        _ = trainer.train(Model(), self.train)
+        autocast.assert_called_with('cpu', None, enabled=False)
+
+    def test_bfloat16(self):
+        trainer = self.trainer(precision='bfloat16')
+        _ = trainer.train(Model(), self.train, self.test)
+        for value in trainer.history['train_loss']:
+            self.assertIsInstance(value, float)
+        self.assertLess(
+            trainer.history['train_loss'][-1],
+            trainer.history['train_loss'][0]
+        )
+
+    def test_float16_scaler_checkpointed(self):
+        trainer = self.trainer(precision='float16', step_freq=2)
+        _ = trainer.train(Model(), self.train, self.test)
+        with trainer.checkpoint.fs.open(trainer.checkpoint.path) as file:
+            state = pt.load(file, weights_only=True)
+        self.assertIn('scale', state['scaler'])
+
+
+class SyncModel(Model):
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.synced = []
+        self.syncing = True
+
+    @contextmanager
+    def no_sync(self):
+        self.syncing = False
+        try:
+            yield
+        finally:
+            self.syncing = True
+
+    def forward(self, x: pt.Tensor) -> tuple[pt.Tensor]:
+        if self.training:
+            self.synced.append(self.syncing)
+        return super().forward(x)
+
+
+class TestAccumulation(Base):
+
+    @patch('swak.pt.train.trainer.clip_grad_norm_')
+    def test_clip_once_per_step(self, clip):
+        clip.return_value = pt.tensor(0.5)
+        trainer = self.trainer(max_epochs=1, step_freq=4)
+        _ = trainer.train(Model(), self.train)
+        # 8 train batches, accumulated over 4 each, are 2 steps
+        self.assertEqual(2, clip.call_count)
+
+    @patch('swak.pt.train.trainer.clip_grad_norm_')
+    def test_clip_every_batch_without_accumulation(self, clip):
+        clip.return_value = pt.tensor(0.5)
+        trainer = self.trainer(max_epochs=1)
+        _ = trainer.train(Model(), self.train)
+        self.assertEqual(8, clip.call_count)
+
+    def test_step_callbacks_get_norm_of_last_step(self):
+        recorder = Recorder()
+        trainer = self.trainer(
+            max_epochs=1,
+            step_freq=4,
+            step_cbs=[recorder]
+        )
+        _ = trainer.train(Model(), self.train)
+        norms = [call[2] for call in recorder.calls]
+        self.assertEqual(8, len(norms))
+        for norm in norms[:3]:
+            self.assertTrue(math.isnan(norm))
+        self.assertFalse(math.isnan(norms[3]))
+        self.assertListEqual(norms[3:7], [norms[3]] * 4)
+
+    def test_no_sync_on_intermediate_batches(self):
+        model = SyncModel()
+        trainer = self.trainer(max_epochs=1, step_freq=4)
+        _ = trainer.train(model, self.train)
+        expected = [False, False, False, True] * 2
+        self.assertListEqual(expected, model.synced)
+
+    def test_always_synced_without_accumulation(self):
+        model = SyncModel()
+        trainer = self.trainer(max_epochs=1)
+        _ = trainer.train(model, self.train)
+        self.assertListEqual([True] * 8, model.synced)
+
+    def test_no_sync_is_null_context_without_method(self):
+        trainer = self.trainer(step_freq=4)
+        context = trainer._no_sync(Model(), 1)
+        self.assertIsInstance(context, nullcontext)
+
+    def test_same_result_as_larger_batches(self):
+        small = self.trainer(batch_size=4, step_freq=2, clip_grad=1e9)
+        large = self.trainer(batch_size=8, clip_grad=1e9)
+        _ = small.train(Model(), self.train)
+        _ = large.train(Model(), self.train)
+        for expected, actual in zip(
+                large.history['train_loss'],
+                small.history['train_loss']
+        ):
+            self.assertAlmostEqual(expected, actual, 5)
+
+
+class Keeper(train.EpochCallback):
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    def __call__(self, epoch, train_loss, test_loss, lr, model, data):
+        self.calls.append((epoch, train_loss, test_loss, data))
+
+    def close(self) -> None:
+        pass
+
+
+class TestEvaluation(Base):
+
+    def test_defaults(self):
+        trainer = train.Trainer(pt.nn.MSELoss())
+        self.assertEqual(1, trainer.eval_freq)
+        self.assertFalse(trainer.estimate_train)
+
+    def test_eval_freq(self):
+        keeper = Keeper()
+        trainer = self.trainer(max_epochs=5, eval_freq=2, epoch_cbs=[keeper])
+        _ = trainer.train(Model(), self.train, self.test)
+        epochs = [call[0] for call in keeper.calls]
+        self.assertListEqual([2, 4, 5], epochs)
+        for key in ('train_loss', 'test_loss', 'lr'):
+            self.assertEqual(3, len(trainer.history[key]))
+
+    def test_scheduler_stepped_every_epoch(self):
+        scheduler = Curry[StepLR](StepLR, step_size=1, gamma=0.5)
+        trainer = self.trainer(
+            max_epochs=4,
+            eval_freq=3,
+            scheduler=scheduler
+        )
+        _ = trainer.train(Model(), self.train)
+        expected = [0.001 * 0.5 ** 2, 0.001 * 0.5 ** 3]
+        for value, lr in zip(expected, trainer.history['lr']):
+            self.assertAlmostEqual(value, lr, 12)
+
+    @patch('swak.pt.train.Checkpoint.save')
+    def test_checkpoint_only_on_evaluation(self, save):
+        trainer = self.trainer(max_epochs=4, eval_freq=2)
+        _ = trainer.train(Model(), self.train)
+        self.assertEqual(2, save.call_count)
+
+    def test_estimate_train_skips_pass(self):
+        trainer = self.trainer(max_epochs=2, estimate_train=True)
+        with patch.object(
+                self.train,
+                'sample',
+                wraps=self.train.sample
+        ) as sample:
+            _ = trainer.train(Model(), self.train, self.test)
+        sample.assert_not_called()
+
+    def test_estimate_train_is_mean_of_batch_losses(self):
+        recorder = Recorder()
+        trainer = self.trainer(
+            max_epochs=1,
+            estimate_train=True,
+            step_cbs=[recorder]
+        )
+        with patch('swak.pt.train.trainer.Trainer._Trainer__accumulate',
+                   wraps=trainer._Trainer__accumulate) as accumulate:
+            _ = trainer.train(Model(), self.train)
+        losses = [call.args[2].item() for call in accumulate.call_args_list]
+        self.assertEqual(8, len(losses))
+        expected = sum(losses) / len(losses)
+        actual = trainer.history['train_loss'][0]
+        self.assertAlmostEqual(expected, actual, 10)
+
+    def test_estimate_train_differs_from_evaluation(self):
+        estimated = self.trainer(max_epochs=1, estimate_train=True)
+        evaluated = self.trainer(max_epochs=1)
+        _ = estimated.train(Model(), self.train)
+        _ = evaluated.train(Model(), self.train)
+        self.assertNotAlmostEqual(
+            estimated.history['train_loss'][0],
+            evaluated.history['train_loss'][0]
+        )
+
+    def test_callbacks_get_evaluated_test_batches(self):
+        keeper = Keeper()
+        trainer = self.trainer(max_epochs=1, epoch_cbs=[keeper])
+        _ = trainer.train(Model(), self.train, self.test)
+        data = keeper.calls[0][3]
+        self.assertIsInstance(data, Iterator)
+        data = list(data)
+        self.assertEqual(2, len(data))
+        features = pt.cat([batch[0][0] for batch in data])
+        pt.testing.assert_close(self.x[:16], features)
+
+    def test_callbacks_get_evaluated_train_batches(self):
+        keeper = Keeper()
+        trainer = self.trainer(max_epochs=1, epoch_cbs=[keeper], max_n=24)
+        _ = trainer.train(Model(), self.train)
+        data = keeper.calls[0][3]
+        self.assertIsInstance(data, Iterator)
+        self.assertEqual(3, len(list(data)))
+
+    def test_callbacks_get_train_sample_when_estimated(self):
+        keeper = Keeper()
+        trainer = self.trainer(
+            max_epochs=1,
+            epoch_cbs=[keeper],
+            estimate_train=True
+        )
+        _ = trainer.train(Model(), self.train)
+        data = list(keeper.calls[0][3])
+        self.assertEqual(8, len(data))
+
+    def test_sample_drawn_once_per_evaluation(self):
+        keeper = Keeper()
+        trainer = self.trainer(max_epochs=1, epoch_cbs=[keeper])
+        with patch.object(
+                train.TestData,
+                'sample',
+                wraps=self.test.sample
+        ) as sample:
+            _ = trainer.train(Model(), self.train, self.test)
+        # Once for the train and once for the test loss.
+        self.assertEqual(2, sample.call_count)
+
+    def test_sample_not_drawn_for_callbacks_ignoring_it(self):
+        trainer = self.trainer(max_epochs=1, estimate_train=True)
+        with patch.object(
+                train.TestData,
+                'sample',
+                wraps=self.test.sample
+        ) as sample:
+            _ = trainer.train(Model(), self.train, self.test)
+        # Only once for the test loss, but not for the EpochPrinter.
+        self.assertEqual(1, sample.call_count)
+
+
+class TestDataParallel(Base):
+
+    def test_default_n_procs(self):
+        trainer = train.Trainer(pt.nn.MSELoss())
+        self.assertEqual(1, trainer.n_procs)
+
+    def test_picklable(self):
+        trainer = self.trainer(n_procs=2)
+        _ = pickle.loads(pickle.dumps(trainer))
+
+    @patch('swak.pt.train.trainer.pt.multiprocessing.spawn')
+    def test_no_spawn_for_one_proc(self, spawn):
+        trainer = self.trainer(max_epochs=1)
+        _ = trainer.train(Model(), self.train)
+        spawn.assert_not_called()
+
+    def assert_same_as_larger_batches(self, loss):
+        single = train.Trainer(loss, batch_size=8, **self.kwargs)
+        parallel = train.Trainer(loss, batch_size=4, n_procs=2, **self.kwargs)
+        expected = single.train(Model(), self.train, self.test)
+        actual = parallel.train(Model(), self.train, self.test)
+        pt.testing.assert_close(expected.state_dict(), actual.state_dict())
+        for key in ('train_loss', 'test_loss', 'lr'):
+            self.assertEqual(2, len(parallel.history[key]))
+            for value, other in zip(
+                    single.history[key],
+                    parallel.history[key]
+            ):
+                self.assertAlmostEqual(value, other, delta=1e-6 * value)
+
+    def test_mean_loss_same_as_larger_batches(self):
+        self.kwargs = {
+            'max_epochs': 2,
+            'epoch_cbs': (),
+            'train_cbs': (),
+            'show_progress': False
+        }
+        self.assert_same_as_larger_batches(pt.nn.MSELoss())
+
+    def test_sum_loss_same_as_larger_batches(self):
+        self.kwargs = {
+            'max_epochs': 2,
+            'epoch_cbs': (),
+            'train_cbs': (),
+            'show_progress': False,
+            'clip_grad': 1e9
+        }
+        self.assert_same_as_larger_batches(pt.nn.MSELoss(reduction='sum'))
+
+
+class NormModel(Model):
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.norm = pt.nn.BatchNorm1d(3)
+
+    def forward(self, x: pt.Tensor) -> tuple[pt.Tensor]:
+        return (self.linear(self.norm(x)),)
+
+
+class TestCompile(Base):
+
+    def setUp(self):
+        super().setUp()
+        pt.compiler.reset()
+        self.compiler = Compile(backend='eager')
+        # 60 data points and 12 test points give partial batches.
+        self.train = train.TrainData(self.x[:60], self.y[:60])
+        self.test = train.TestData(self.x[:12], self.y[:12])
+
+    def test_defaults(self):
+        trainer = train.Trainer(pt.nn.MSELoss())
+        self.assertIsNone(trainer.compiler)
+        self.assertIsNone(trainer.buckets)
+        self.assertEqual(0, trainer.recompiles)
+
+    def test_same_history(self):
+        expected = self.trainer()
+        actual = self.trainer(compiler=self.compiler, buckets=train.Buckets())
+        _ = expected.train(Model(), self.train, self.test)
+        _ = actual.train(Model(), self.train, self.test)
+        for key in ('train_loss', 'test_loss'):
+            for value, other in zip(
+                    expected.history[key],
+                    actual.history[key]
+            ):
+                self.assertAlmostEqual(value, other, 5)
+
+    def test_buckets_without_compiler(self):
+        expected = self.trainer()
+        actual = self.trainer(buckets=train.Buckets())
+        _ = expected.train(Model(), self.train, self.test)
+        _ = actual.train(Model(), self.train, self.test)
+        for value, other in zip(
+                expected.history['train_loss'],
+                actual.history['train_loss']
+        ):
+            self.assertAlmostEqual(value, other, 5)
+        self.assertEqual(0, actual.recompiles)
+
+    def test_no_recompiles_with_buckets(self):
+        trainer = self.trainer(compiler=self.compiler, buckets=train.Buckets())
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            _ = trainer.train(Model(), self.train, self.test)
+        messages = [str(warning.message) for warning in caught]
+        self.assertFalse(any('warm-up' in msg for msg in messages))
+        self.assertEqual(0, trainer.recompiles)
+
+    def test_recompiles_without_buckets_warn(self):
+        trainer = self.trainer(compiler=self.compiler)
+        with self.assertWarns(UserWarning):
+            _ = trainer.train(Model(), self.train, self.test)
+        self.assertGreater(trainer.recompiles, 0)
+
+    def test_model_and_loss_not_compiled_in_place(self):
+        trainer = self.trainer(
+            compiler=Compile(True, backend='eager'),
+            buckets=train.Buckets()
+        )
+        model = Model()
+        _ = trainer.train(model, self.train, self.test)
+        self.assertIsNone(model._compiled_call_impl)
+        self.assertIsNone(trainer.loss._compiled_call_impl)
+
+    def test_compiler_kwargs_used(self):
+        trainer = self.trainer(
+            compiler=Compile(backend='eager', fullgraph=True),
+            max_epochs=1
+        )
+        with patch(
+                'swak.pt.train.trainer.pt.compile',
+                side_effect=lambda module, **_: module
+        ) as compile_:
+            _ = trainer.train(Model(), self.train)
+        self.assertEqual(2, compile_.call_count)
+        model_kws = compile_.call_args_list[0].kwargs
+        loss_kws = compile_.call_args_list[1].kwargs
+        self.assertTrue(model_kws['fullgraph'])
+        self.assertNotIn('dynamic', model_kws)
+        self.assertTrue(loss_kws['dynamic'])
+        self.assertIsInstance(model_kws['backend'], _Counted)
+
+    def test_counted_counts_graphs(self):
+        backend = _Counted('eager')
+        compiled = pt.compile(pt.nn.Linear(3, 1), backend=backend)
+        _ = compiled(pt.ones(4, 3))
+        _ = compiled(pt.ones(4, 3))
+        self.assertEqual(1, backend.graphs)
+
+    def test_counted_inductor_mode(self):
+        backend = _Counted(mode='max-autotune-no-cudagraphs')
+        self.assertIsInstance(backend.backend, pt._TorchCompileInductorWrapper)
+        self.assertTrue(backend.backend.config['max_autotune'])
+
+    def test_counted_custom_backend_kwargs(self):
+        backend = _Counted('eager', 'max-autotune', {'foo': 'bar'})
+        expected = {'mode': 'max-autotune', 'options': {'foo': 'bar'}}
+        self.assertIsInstance(backend.backend, pt._TorchCompileWrapper)
+        self.assertDictEqual(expected, backend.backend.kwargs)
+
+    def test_counted_reset(self):
+        backend = _Counted('eager')
+        with patch.object(backend.backend, 'reset') as reset:
+            backend.reset()
+        reset.assert_called_once_with()
+
+    def test_warmup_leaves_no_traces(self):
+        trainer = self.trainer(
+            compiler=self.compiler,
+            buckets=train.Buckets([4, 8]),
+            max_epochs=0
+        )
+        model = NormModel()
+        model.reset_parameters()
+        expected = {
+            key: value.clone()
+            for key, value in model.state_dict().items()
+        }
+        _ = trainer.train(model, self.train)
+        pt.testing.assert_close(expected, model.state_dict())
+        for parameter in model.parameters():
+            self.assertIsNone(parameter.grad)
+
+
+if __name__ == '__main__':
+    unittest.main()